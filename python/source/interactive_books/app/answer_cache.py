@@ -0,0 +1,107 @@
+import uuid
+from array import array
+from dataclasses import dataclass
+
+import numpy as np
+
+from interactive_books.domain.book import Book
+from interactive_books.domain.cached_answer import (
+    DEFAULT_PAGE_BUCKET_SIZE,
+    CachedAnswer,
+    page_bucket,
+)
+from interactive_books.domain.protocols import AnswerCacheRepository, EmbeddingProvider
+
+DEFAULT_ANSWER_SIMILARITY = 0.92
+DEFAULT_MAX_ANSWERS_PER_BOOK = 500
+
+
+@dataclass(frozen=True)
+class AnswerLookup:
+    question_embedding: array[float]
+    page_bucket: int
+    answer: CachedAnswer | None = None
+    similarity: float = 0.0
+
+
+class AnswerCache:
+    """Stored answers to earlier questions about a book, matched by embedding.
+
+    Answers are only shared between readers in the same reading-position bucket,
+    and only served when every page they cite is within the reader's position.
+    """
+
+    def __init__(
+        self,
+        *,
+        embedding_provider: EmbeddingProvider,
+        repo: AnswerCacheRepository,
+        similarity_threshold: float = DEFAULT_ANSWER_SIMILARITY,
+        max_answers_per_book: int = DEFAULT_MAX_ANSWERS_PER_BOOK,
+        bucket_size: int = DEFAULT_PAGE_BUCKET_SIZE,
+    ) -> None:
+        self._embedding = embedding_provider
+        self._repo = repo
+        self._similarity_threshold = similarity_threshold
+        self._max_answers_per_book = max_answers_per_book
+        self._bucket_size = bucket_size
+
+    def lookup(self, book: Book, question: str) -> AnswerLookup:
+        embedding = self._embedding.embed([question])[0]
+        bucket = page_bucket(book.current_page, self._bucket_size)
+
+        candidates = [
+            c
+            for c in self._repo.get_candidates(book.id, bucket)
+            if c.is_visible_at(book.current_page)
+            and len(c.question_embedding) == len(embedding)
+        ]
+        similarities = _cosine_similarities(
+            embedding, [c.question_embedding for c in candidates]
+        )
+        best_similarity = float(similarities.max(initial=0.0))
+        if best_similarity <= 0.0 or best_similarity < self._similarity_threshold:
+            return AnswerLookup(embedding, bucket, similarity=best_similarity)
+
+        best = candidates[int(np.argmax(similarities))]
+        best.record_hit()
+        self._repo.save(best)
+        return AnswerLookup(embedding, bucket, best, best_similarity)
+
+    def store(
+        self,
+        book_id: str,
+        question: str,
+        lookup: AnswerLookup,
+        answer: str,
+        max_cited_page: int,
+    ) -> None:
+        if not answer.strip():
+            return
+        self._repo.save(
+            CachedAnswer(
+                id=str(uuid.uuid4()),
+                book_id=book_id,
+                page_bucket=lookup.page_bucket,
+                question=question,
+                question_embedding=lookup.question_embedding,
+                answer=answer,
+                max_cited_page=max_cited_page,
+            )
+        )
+        self._repo.evict(book_id, self._max_answers_per_book)
+
+
+def _cosine_similarities(
+    query: array[float], embeddings: list[array[float]]
+) -> np.ndarray:
+    """Cosine similarity of ``query`` to each embedding, in one matrix product."""
+    if not embeddings:
+        return np.empty(0, dtype=np.float32)
+    vector = np.frombuffer(query, dtype=np.float32)
+    matrix = np.frombuffer(
+        b"".join(e.tobytes() for e in embeddings), dtype=np.float32
+    ).reshape(len(embeddings), len(vector))
+    dots = matrix @ vector
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(vector)
+    return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
@@ -2,11 +2,22 @@ import uuid
 from collections.abc import Callable
 from pathlib import Path
 
+from interactive_books.app.answer_cache import AnswerCache, AnswerLookup
 from interactive_books.app.conversations import ManageConversationsUseCase
-from interactive_books.app.search import SearchBooksUseCase
+from interactive_books.app.passage_cache import ConversationPassageCache
+from interactive_books.app.search import DEFAULT_TOP_K, SearchBooksUseCase
 from interactive_books.domain.chat import ChatMessage, MessageRole
-from interactive_books.domain.chat_event import ChatEvent
+from interactive_books.domain.chat_event import (
+    AnswerCacheHitEvent,
+    ChatEvent,
+    DegradationEvent,
+    ToolResultEvent,
+)
+from interactive_books.domain.conversation import Conversation
+from interactive_books.domain.deadline import Deadline
 from interactive_books.domain.errors import BookError, BookErrorCode
+from interactive_books.domain.passage_packing import format_passages, pack_passages
+from interactive_books.domain.passage_reference import PassageReference
 from interactive_books.domain.prompt_message import PromptMessage
 from interactive_books.domain.protocols import (
     BookRepository,
@@ -34,6 +45,21 @@ SEARCH_BOOK_TOOL = ToolDefinition(
     },
 )
 
+FIND_QUOTE_TOOL = ToolDefinition(
+    name="find_quote",
+    description="Find the passages that contain an exact phrase, such as a quotation or a character or place name. Use this instead of search_book when the reader asks where specific words appear.",
+    parameters={
+        "type": "object",
+        "properties": {
+            "phrase": {
+                "type": "string",
+                "description": "The exact words to look for. Case and punctuation are ignored.",
+            }
+        },
+        "required": ["phrase"],
+    },
+)
+
 SET_PAGE_TOOL = ToolDefinition(
     name="set_page",
     description="Update the reader's current page position in the book. Use this when the reader tells you what page they are on. Set to 0 to reset (show all content).",
@@ -55,10 +81,33 @@ NO_CONTEXT_MESSAGE = "No relevant passages found in the book for this query."
 def _format_search_results(results: list[SearchResult]) -> str:
     if not results:
         return NO_CONTEXT_MESSAGE
-    passages = [
-        f"[Pages {r.start_page}-{r.end_page}]:\n{r.content}" for r in results
-    ]
-    return "\n\n".join(passages)
+    return format_passages(pack_passages(results))
+
+
+def _format_page_ranges(pages: list[tuple[int, int]]) -> str:
+    return ", ".join(
+        str(start) if start == end else f"{start}–{end}" for start, end in pages
+    )
+
+
+def _search_tool_result(
+    query: str,
+    results: list[SearchResult],
+    repeated_pages: list[tuple[int, int]] | None = None,
+) -> ToolResult:
+    text = _format_search_results(results) if results or not repeated_pages else ""
+    if repeated_pages:
+        note = (
+            "Already provided earlier in this turn, see pages "
+            f"{_format_page_ranges(repeated_pages)}."
+        )
+        text = f"{text}\n\n{note}" if text else note
+    return ToolResult(
+        formatted_text=text,
+        query=query,
+        result_count=len(results),
+        results=list(results),
+    )
 
 
 def _parse_page_argument(arguments: dict[str, object]) -> int | None:
@@ -68,6 +117,15 @@ def _parse_page_argument(arguments: dict[str, object]) -> int | None:
         return None
 
 
+def _parse_top_k_argument(arguments: dict[str, object]) -> int:
+    # Set by retrieval strategies, not the model, when a turn deadline is close.
+    try:
+        top_k = int(arguments.get("top_k", DEFAULT_TOP_K))  # type: ignore[arg-type]
+    except (ValueError, TypeError):
+        return DEFAULT_TOP_K
+    return max(1, min(top_k, DEFAULT_TOP_K))
+
+
 def _error_tool_result(message: str) -> ToolResult:
     return ToolResult(formatted_text=f"Error: {message}", query="", result_count=0)
 
@@ -90,6 +148,8 @@ class ChatWithBookUseCase:
         prompts_dir: Path,
         on_event: Callable[[ChatEvent], None] | None = None,
         summary_context: str | None = None,
+        answer_cache: AnswerCache | None = None,
+        turn_deadline_seconds: float | None = None,
     ) -> None:
         self._chat = chat_provider
         self._retrieval = retrieval_strategy
@@ -101,8 +161,13 @@ class ChatWithBookUseCase:
         self._prompts_dir = prompts_dir
         self._on_event = on_event
         self._summary_context = summary_context
+        self._answer_cache = answer_cache
+        self._turn_deadline_seconds = turn_deadline_seconds
 
     def execute(self, conversation_id: str, user_message: str) -> str:
+        return self.open_session(conversation_id).send(user_message)
+
+    def open_session(self, conversation_id: str) -> "ChatSession":
         conversation = self._conversation_repo.get(conversation_id)
         if conversation is None:
             raise BookError(
@@ -110,33 +175,114 @@ class ChatWithBookUseCase:
                 f"Conversation '{conversation_id}' not found",
             )
 
-        history = self._message_repo.get_by_conversation(conversation_id)
-        context_window = self._context.build_context(history)
-
-        system_prompt = self._load_template("conversation_system_prompt.md")
-
-        if not history and self._summary_context:
-            system_prompt += f"\n\nBook structure overview:\n{self._summary_context}"
-
-        prompt_messages: list[PromptMessage] = [
-            PromptMessage(role="system", content=system_prompt),
-            *[PromptMessage(role=msg.role.value, content=msg.content) for msg in context_window],
-            PromptMessage(role="user", content=user_message),
-        ]
-
+        history_limit = self._context.history_limit
         book_id = conversation.book_id
+        passage_cache = ConversationPassageCache()
+        return ChatSession(
+            conversation=conversation,
+            history=self._message_repo.get_recent(conversation_id, history_limit),
+            history_limit=history_limit,
+            system_prompt=self._load_template("conversation_system_prompt.md"),
+            summary_context=self._summary_context,
+            chat_provider=self._chat,
+            retrieval_strategy=self._retrieval,
+            context_strategy=self._context,
+            conversation_repo=self._conversation_repo,
+            message_repo=self._message_repo,
+            book_repo=self._book_repo,
+            passage_cache=passage_cache,
+            tool_handlers={
+                "search_book": self._search_book_handler(book_id, passage_cache),
+                "find_quote": self._find_quote_handler(book_id, passage_cache),
+                "set_page": self._set_page_handler(book_id, passage_cache),
+            },
+            batch_tool_handlers={
+                "search_book": self._search_book_batch_handler(book_id, passage_cache),
+            },
+            on_event=self._on_event,
+            answer_cache=self._answer_cache,
+            turn_deadline_seconds=self._turn_deadline_seconds,
+        )
 
+    def _search_book_handler(
+        self, book_id: str, passage_cache: ConversationPassageCache
+    ) -> Callable[[dict[str, object]], ToolResult]:
         def search_book_handler(arguments: dict[str, object]) -> ToolResult:
             query = str(arguments.get("query", ""))
-            results = self._search.execute(book_id, query)
-            formatted = _format_search_results(results)
-            return ToolResult(
-                formatted_text=formatted,
-                query=query,
-                result_count=len(results),
-                results=list(results),
+            top_k = _parse_top_k_argument(arguments)
+            results = passage_cache.lookup(query)
+            if results is None:
+                generation = passage_cache.generation
+                results = self._search.execute(book_id, query, top_k=top_k)
+                if top_k == DEFAULT_TOP_K:
+                    passage_cache.store(query, results, generation=generation)
+            return _search_tool_result(query, *passage_cache.split_new(results[:top_k]))
+
+        return search_book_handler
+
+    def _search_book_batch_handler(
+        self, book_id: str, passage_cache: ConversationPassageCache
+    ) -> Callable[[list[dict[str, object]]], list[ToolResult]]:
+        def search_book_batch_handler(
+            arguments_list: list[dict[str, object]],
+        ) -> list[ToolResult]:
+            queries = [str(arguments.get("query", "")) for arguments in arguments_list]
+            top_k = min(
+                (_parse_top_k_argument(arguments) for arguments in arguments_list),
+                default=DEFAULT_TOP_K,
+            )
+            generation = passage_cache.generation
+            cached = [passage_cache.lookup(query) for query in queries]
+            missing = [
+                query
+                for query, hits in zip(queries, cached, strict=True)
+                if hits is None
+            ]
+            fetched = iter(
+                self._search.execute_many(book_id, missing, top_k=top_k)
+                if missing
+                else []
             )
 
+            # A batch's results reach the model together, so a hit returned for
+            # an earlier query of the batch counts as provided too.
+            batch_pages: dict[str, tuple[int, int]] = {}
+            tool_results: list[ToolResult] = []
+            for query, hits in zip(queries, cached, strict=True):
+                if hits is None:
+                    hits = next(fetched)
+                    if top_k == DEFAULT_TOP_K:
+                        passage_cache.store(query, hits, generation=generation)
+                new, repeated = passage_cache.split_new(hits[:top_k])
+                repeated += [
+                    batch_pages[r.chunk_id] for r in new if r.chunk_id in batch_pages
+                ]
+                new = [r for r in new if r.chunk_id not in batch_pages]
+                batch_pages.update(
+                    (r.chunk_id, (r.start_page, r.end_page)) for r in new
+                )
+                tool_results.append(
+                    _search_tool_result(query, new, sorted(set(repeated)))
+                )
+            return tool_results
+
+        return search_book_batch_handler
+
+    def _find_quote_handler(
+        self, book_id: str, passage_cache: ConversationPassageCache
+    ) -> Callable[[dict[str, object]], ToolResult]:
+        def find_quote_handler(arguments: dict[str, object]) -> ToolResult:
+            phrase = str(arguments.get("phrase", "")).strip()
+            if not phrase:
+                return _error_tool_result("phrase must not be empty")
+            results = self._search.find_quote(book_id, phrase)
+            return _search_tool_result(phrase, *passage_cache.split_new(results))
+
+        return find_quote_handler
+
+    def _set_page_handler(
+        self, book_id: str, passage_cache: ConversationPassageCache
+    ) -> Callable[[dict[str, object]], ToolResult]:
         def set_page_handler(arguments: dict[str, object]) -> ToolResult:
             page = _parse_page_argument(arguments)
             if page is None:
@@ -152,6 +298,8 @@ class ChatWithBookUseCase:
                 return _error_tool_result(e.message)
 
             self._book_repo.save(book)
+            # Cached hits were filtered by the old reading position.
+            passage_cache.clear_queries()
 
             if page == 0:
                 return _info_tool_result(
@@ -159,51 +307,213 @@ class ChatWithBookUseCase:
                 )
             return _info_tool_result(f"Reading position set to page {page}.")
 
-        tool_handlers = {
-            "search_book": search_book_handler,
-            "set_page": set_page_handler,
-        }
+        return set_page_handler
 
-        response_text, new_messages = self._retrieval.execute(
-            self._chat,
-            prompt_messages,
-            [SEARCH_BOOK_TOOL, SET_PAGE_TOOL],
-            tool_handlers,
-            on_event=self._on_event,
-        )
+    def _load_template(self, filename: str) -> str:
+        return (self._prompts_dir / filename).read_text().strip()
+
+
+class ChatSession:
+    """An open conversation that keeps its recent history, system prompt, tool
+    handlers and passage cache in memory, so a turn costs one retrieval call and
+    one write.
+
+    Obtain one from ``ChatWithBookUseCase.open_session``. Each turn's messages are
+    appended to the in-memory history and saved together in a single
+    transaction; the session assumes it is the only writer to the conversation.
+    """
 
+    def __init__(
+        self,
+        *,
+        conversation: Conversation,
+        history: list[ChatMessage],
+        history_limit: int,
+        system_prompt: str,
+        summary_context: str | None,
+        chat_provider: ChatProvider,
+        retrieval_strategy: RetrievalStrategy,
+        context_strategy: ConversationContextStrategy,
+        conversation_repo: ConversationRepository,
+        message_repo: ChatMessageRepository,
+        book_repo: BookRepository,
+        passage_cache: ConversationPassageCache,
+        tool_handlers: dict[str, Callable[[dict[str, object]], ToolResult]],
+        batch_tool_handlers: dict[
+            str, Callable[[list[dict[str, object]]], list[ToolResult]]
+        ],
+        on_event: Callable[[ChatEvent], None] | None = None,
+        answer_cache: AnswerCache | None = None,
+        turn_deadline_seconds: float | None = None,
+    ) -> None:
+        self._conversation = conversation
+        self._history = list(history)
+        self._history_limit = history_limit
+        self._system_prompt = system_prompt
+        self._opening_system_prompt = system_prompt
+        if summary_context:
+            self._opening_system_prompt += (
+                f"\n\nBook structure overview:\n{summary_context}"
+            )
+        self._chat = chat_provider
+        self._retrieval = retrieval_strategy
+        self._context = context_strategy
+        self._conversation_repo = conversation_repo
+        self._message_repo = message_repo
+        self._book_repo = book_repo
+        self._passage_cache = passage_cache
+        self._tool_handlers = tool_handlers
+        self._batch_tool_handlers = batch_tool_handlers
+        self._on_event = on_event
+        self._answer_cache = answer_cache
+        self._turn_deadline_seconds = turn_deadline_seconds
+        self._degraded = False
+
+    @property
+    def conversation(self) -> Conversation:
+        return self._conversation
+
+    @property
+    def history(self) -> list[ChatMessage]:
+        return list(self._history)
+
+    def send(self, user_message: str) -> str:
+        deadline = (
+            Deadline(self._turn_deadline_seconds)
+            if self._turn_deadline_seconds is not None
+            else None
+        )
+        is_first_turn = not self._history
+        conversation_id = self._conversation.id
         user_chat_message = ChatMessage(
             id=str(uuid.uuid4()),
             conversation_id=conversation_id,
             role=MessageRole.USER,
             content=user_message,
         )
-        self._message_repo.save(user_chat_message)
 
-        for msg in new_messages:
-            self._message_repo.save(
+        # Earlier tool results are not sent again, so only passages that reach
+        # the model during this turn count as provided.
+        self._passage_cache.clear_provided()
+        context_window = self._context.build_context(self._history)
+        system_prompt = (
+            self._opening_system_prompt if is_first_turn else self._system_prompt
+        )
+        prompt_messages: list[PromptMessage] = [
+            PromptMessage(role="system", content=system_prompt),
+            *[
+                PromptMessage(role=msg.role.value, content=msg.content)
+                for msg in context_window
+            ],
+            PromptMessage(role="user", content=user_message),
+        ]
+
+        # Only opening questions are cached: later turns depend on the
+        # conversation so far, which a shared answer cannot account for.
+        lookup = self._lookup_answer(user_message) if is_first_turn else None
+        new_messages: list[ChatMessage]
+        if lookup is not None and lookup.answer is not None:
+            response_text, new_messages = lookup.answer.answer, []
+        else:
+            self._degraded = False
+            response_text, new_messages = self._retrieval.execute(
+                self._chat,
+                prompt_messages,
+                [SEARCH_BOOK_TOOL, FIND_QUOTE_TOOL, SET_PAGE_TOOL],
+                self._tool_handlers,
+                on_event=self._on_retrieval_event,
+                batch_tool_handlers=self._batch_tool_handlers,
+                deadline=deadline,
+            )
+            # An answer cut short by the deadline is not worth reusing.
+            if lookup is not None and not self._degraded:
+                self._remember_answer(user_message, lookup, response_text, new_messages)
+
+        turn = [
+            user_chat_message,
+            *[
                 ChatMessage(
                     id=msg.id,
                     conversation_id=conversation_id,
                     role=msg.role,
                     content=msg.content,
+                    created_at=msg.created_at,
                 )
+                for msg in new_messages
+            ],
+            ChatMessage(
+                id=str(uuid.uuid4()),
+                conversation_id=conversation_id,
+                role=MessageRole.ASSISTANT,
+                content=response_text,
+            ),
+        ]
+        self._message_repo.save_many(turn)
+        self._history.extend(turn)
+        del self._history[: -self._history_limit]
+
+        if is_first_turn:
+            self._conversation.rename(
+                ManageConversationsUseCase.auto_title(user_message)
             )
+            self._conversation_repo.save(self._conversation)
 
-        assistant_chat_message = ChatMessage(
-            id=str(uuid.uuid4()),
-            conversation_id=conversation_id,
-            role=MessageRole.ASSISTANT,
-            content=response_text,
-        )
-        self._message_repo.save(assistant_chat_message)
+        return response_text
 
-        if not history:
-            auto_title = ManageConversationsUseCase.auto_title(user_message)
-            conversation.rename(auto_title)
-            self._conversation_repo.save(conversation)
+    def _on_retrieval_event(self, event: ChatEvent) -> None:
+        # A result event means its passages were handed to the model; a
+        # discarded speculative search never emits one.
+        if isinstance(event, ToolResultEvent):
+            self._passage_cache.mark_provided(event.results)
+        elif isinstance(event, DegradationEvent):
+            self._degraded = True
+        if self._on_event:
+            self._on_event(event)
+
+    def _lookup_answer(self, question: str) -> AnswerLookup | None:
+        if self._answer_cache is None:
+            return None
+        book = self._book_repo.get(self._conversation.book_id)
+        if book is None:
+            return None
+        lookup = self._answer_cache.lookup(book, question)
+        if lookup.answer is not None and self._on_event:
+            self._on_event(
+                AnswerCacheHitEvent(
+                    question=question,
+                    cached_question=lookup.answer.question,
+                    similarity=lookup.similarity,
+                    hit_count=lookup.answer.hit_count,
+                )
+            )
+        return lookup
 
-        return response_text
+    def _remember_answer(
+        self,
+        question: str,
+        lookup: AnswerLookup,
+        answer: str,
+        new_messages: list[ChatMessage],
+    ) -> None:
+        if self._answer_cache is None:
+            return
+        max_cited_page = _max_cited_page(new_messages)
+        if max_cited_page is None:
+            return
+        self._answer_cache.store(
+            self._conversation.book_id, question, lookup, answer, max_cited_page
+        )
 
-    def _load_template(self, filename: str) -> str:
-        return (self._prompts_dir / filename).read_text().strip()
+
+def _max_cited_page(messages: list[ChatMessage]) -> int | None:
+    """Highest page the turn's search results cite, or ``None`` when the turn
+    used any other tool (such as ``set_page``) and should not be cached."""
+    max_page = 0
+    for message in messages:
+        if message.role != MessageRole.TOOL_RESULT:
+            continue
+        reference = PassageReference.from_content(message.content)
+        if reference is None:
+            return None
+        max_page = max([max_page, *(end for _, end in reference.pages)])
+    return max_page
@@ -5,10 +5,15 @@ from interactive_books.domain.protocols import BookRepository, EmbeddingReposito
 
 class DeleteBookUseCase:
     def __init__(
-        self, *, book_repo: BookRepository, embedding_repo: EmbeddingRepository
+        self,
+        *,
+        book_repo: BookRepository,
+        embedding_repo: EmbeddingRepository,
+        section_embedding_repo: EmbeddingRepository | None = None,
     ) -> None:
         self._book_repo = book_repo
         self._embedding_repo = embedding_repo
+        self._section_embedding_repo = section_embedding_repo
 
     def execute(self, book_id: str) -> Book:
         book = self._book_repo.get(book_id)
@@ -19,6 +24,13 @@ class DeleteBookUseCase:
             self._embedding_repo.delete_by_book(
                 book.embedding_provider, book.embedding_dimension, book_id
             )
+            if self._section_embedding_repo is not None:
+                self._section_embedding_repo.ensure_table(
+                    book.embedding_provider, book.embedding_dimension
+                )
+                self._section_embedding_repo.delete_by_book(
+                    book.embedding_provider, book.embedding_dimension, book_id
+                )
 
         self._book_repo.delete(book_id)
         return book
@@ -1,14 +1,17 @@
 from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
 
 from interactive_books.domain.book import Book
-from interactive_books.domain.chunk import Chunk
+from interactive_books.domain.chunk_batch import ChunkBatch
 from interactive_books.domain.embedding_vector import EmbeddingVector
 from interactive_books.domain.errors import BookError, BookErrorCode
 from interactive_books.domain.protocols import (
+    AnswerCacheRepository,
     BookRepository,
     ChunkRepository,
     EmbeddingProvider,
     EmbeddingRepository,
+    UnitOfWork,
 )
 
 DEFAULT_BATCH_SIZE = 100
@@ -24,6 +27,8 @@ class EmbedBookUseCase:
         embedding_repo: EmbeddingRepository,
         batch_size: int = DEFAULT_BATCH_SIZE,
         on_progress: Callable[[int, int, int], None] | None = None,
+        answer_cache_repo: AnswerCacheRepository | None = None,
+        unit_of_work: UnitOfWork | None = None,
     ) -> None:
         self._provider = embedding_provider
         self._book_repo = book_repo
@@ -31,13 +36,15 @@ class EmbedBookUseCase:
         self._embedding_repo = embedding_repo
         self._batch_size = batch_size
         self._on_progress = on_progress
+        self._answer_cache_repo = answer_cache_repo
+        self._unit_of_work = unit_of_work
 
     def execute(self, book_id: str) -> Book:
         book = self._book_repo.get(book_id)
         if book is None:
             raise BookError(BookErrorCode.NOT_FOUND, f"Book '{book_id}' not found")
 
-        chunks = self._chunk_repo.get_by_book(book_id)
+        chunks = self._chunk_repo.get_batch(book_id)
         if not chunks:
             raise BookError(
                 BookErrorCode.INVALID_STATE,
@@ -48,40 +55,52 @@ class EmbedBookUseCase:
         dimension = self._provider.dimension
 
         self._embedding_repo.ensure_table(provider_name, dimension)
-        self._embedding_repo.delete_by_book(provider_name, dimension, book_id)
+        # Vectors are fetched before any rows are written, so the provider's
+        # network calls never hold the write transaction open.
+        vectors = self._embed_in_batches(chunks)
 
-        try:
-            vectors = self._embed_in_batches(chunks)
-            self._embedding_repo.save_embeddings(
-                provider_name, dimension, book_id, vectors
-            )
-        except Exception:
+        with self._bulk_load():
             self._embedding_repo.delete_by_book(provider_name, dimension, book_id)
-            raise
+            try:
+                self._embedding_repo.save_embeddings(
+                    provider_name, dimension, book_id, vectors
+                )
+            except Exception:
+                self._embedding_repo.delete_by_book(provider_name, dimension, book_id)
+                raise
 
-        book.embedding_provider = provider_name
-        book.embedding_dimension = dimension
-        self._book_repo.save(book)
+            book.embedding_provider = provider_name
+            book.embedding_dimension = dimension
+            self._book_repo.save(book)
+
+            # Cached answers were grounded in the previous embeddings' search hits.
+            if self._answer_cache_repo is not None:
+                self._answer_cache_repo.delete_by_book(book_id)
 
         return book
 
-    def _embed_in_batches(self, chunks: list[Chunk]) -> list[EmbeddingVector]:
+    def _bulk_load(self) -> AbstractContextManager[None]:
+        if self._unit_of_work is None:
+            return nullcontext()
+        return self._unit_of_work.bulk_load()
+
+    def _embed_in_batches(self, chunks: ChunkBatch) -> list[EmbeddingVector]:
         all_vectors: list[EmbeddingVector] = []
         total_batches = (len(chunks) + self._batch_size - 1) // self._batch_size
-        for i in range(0, len(chunks), self._batch_size):
-            batch = chunks[i : i + self._batch_size]
-            batch_num = i // self._batch_size + 1
+        for start in range(0, len(chunks), self._batch_size):
+            rows = range(start, min(start + self._batch_size, len(chunks)))
+            batch_num = start // self._batch_size + 1
             if self._on_progress:
-                self._on_progress(batch_num, total_batches, len(batch))
-            texts = [c.content for c in batch]
+                self._on_progress(batch_num, total_batches, len(rows))
+            texts = list(chunks.contents[rows.start : rows.stop])
             vectors = self._provider.embed(texts)
             all_vectors.extend(
                 EmbeddingVector(
-                    chunk_id=chunk.id,
+                    chunk_id=chunks.ids[i],
                     vector=vec,
-                    start_page=chunk.start_page,
-                    end_page=chunk.end_page,
+                    start_page=chunks.start_pages[i],
+                    end_page=chunks.end_pages[i],
                 )
-                for chunk, vec in zip(batch, vectors)
+                for i, vec in zip(rows, vectors)
             )
         return all_vectors
@@ -0,0 +1,81 @@
+from interactive_books.domain.embedding_vector import EmbeddingVector
+from interactive_books.domain.errors import BookError, BookErrorCode
+from interactive_books.domain.protocols import (
+    BookRepository,
+    EmbeddingProvider,
+    EmbeddingRepository,
+    SummaryRepository,
+)
+from interactive_books.domain.section_summary import SectionSummary
+
+
+class EmbedSectionsUseCase:
+    """Embeds a book's section summaries and key statements for search routing.
+
+    Vectors go to their own table, next to the chunk vectors and in the same
+    space, so a query embedding can rank sections before chunks. Every row
+    carries its section's page range.
+    """
+
+    def __init__(
+        self,
+        *,
+        embedding_provider: EmbeddingProvider,
+        book_repo: BookRepository,
+        summary_repo: SummaryRepository,
+        section_embedding_repo: EmbeddingRepository,
+    ) -> None:
+        self._provider = embedding_provider
+        self._book_repo = book_repo
+        self._summary_repo = summary_repo
+        self._section_embedding_repo = section_embedding_repo
+
+    def execute(self, book_id: str) -> int:
+        """Replace the book's section vectors; returns how many were stored.
+
+        Stores nothing for a book without summaries, or one whose chunks were
+        embedded by another provider, since queries could not be routed.
+        """
+        book = self._book_repo.get(book_id)
+        if book is None:
+            raise BookError(BookErrorCode.NOT_FOUND, f"Book '{book_id}' not found")
+
+        provider_name = self._provider.provider_name
+        if book.embedding_provider != provider_name:
+            return 0
+        dimension = self._provider.dimension
+        self._section_embedding_repo.ensure_table(provider_name, dimension)
+        self._section_embedding_repo.delete_by_book(provider_name, dimension, book_id)
+
+        summaries = self._summary_repo.get_by_book(book_id)
+        if not summaries or book.embedding_dimension != dimension:
+            return 0
+
+        rows = [
+            (row_id, text, summary)
+            for summary in summaries
+            for row_id, text in _section_rows(summary)
+        ]
+        vectors = self._provider.embed([text for _, text, _ in rows])
+        self._section_embedding_repo.save_embeddings(
+            provider_name,
+            dimension,
+            book_id,
+            [
+                EmbeddingVector(
+                    chunk_id=row_id,
+                    vector=vector,
+                    start_page=summary.start_page,
+                    end_page=summary.end_page,
+                )
+                for (row_id, _, summary), vector in zip(rows, vectors, strict=True)
+            ],
+        )
+        return len(rows)
+
+
+def _section_rows(summary: SectionSummary) -> list[tuple[str, str]]:
+    return [(summary.id, f"{summary.title}\n{summary.summary}")] + [
+        (f"{summary.id}:{i}", statement.statement)
+        for i, statement in enumerate(summary.key_statements)
+    ]
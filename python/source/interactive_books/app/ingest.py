@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import uuid
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from interactive_books.domain.book import Book
-from interactive_books.domain.chunk import Chunk
+from interactive_books.domain.chunk_batch import ChunkBatch
 from interactive_books.domain.errors import BookError, BookErrorCode
 from interactive_books.domain.page_content import PageContent
 from interactive_books.domain.protocols import (
@@ -13,6 +15,7 @@ from interactive_books.domain.protocols import (
     BookRepository,
     ChunkRepository,
     TextChunker,
+    UnitOfWork,
     UrlParser,
 )
 
@@ -37,6 +40,7 @@ class IngestBookUseCase:
         book_repo: BookRepository,
         chunk_repo: ChunkRepository,
         embed_use_case: EmbedBookUseCase | None = None,
+        unit_of_work: UnitOfWork | None = None,
     ) -> None:
         self._parsers: dict[str, BookParser] = {
             ".pdf": pdf_parser,
@@ -51,10 +55,9 @@ class IngestBookUseCase:
         self._book_repo = book_repo
         self._chunk_repo = chunk_repo
         self._embed_use_case = embed_use_case
+        self._unit_of_work = unit_of_work
 
-    def execute(
-        self, source: Path | str, title: str
-    ) -> tuple[Book, Exception | None]:
+    def execute(self, source: Path | str, title: str) -> tuple[Book, Exception | None]:
         self._validate_source(source)
 
         book = Book(id=str(uuid.uuid4()), title=title)
@@ -65,26 +68,28 @@ class IngestBookUseCase:
             pages = self._parse_source(source)
             chunk_data_list = self._chunker.chunk(pages)
 
-            chunks = [
-                Chunk(
-                    id=str(uuid.uuid4()),
-                    book_id=book.id,
-                    content=chunk_data.content,
-                    start_page=chunk_data.start_page,
-                    end_page=chunk_data.end_page,
-                    chunk_index=chunk_data.chunk_index,
+            with self._bulk_load():
+                self._chunk_repo.save_batch(
+                    ChunkBatch(
+                        book_id=book.id,
+                        ids=[str(uuid.uuid4()) for _ in chunk_data_list],
+                        contents=[data.content for data in chunk_data_list],
+                        start_pages=[data.start_page for data in chunk_data_list],
+                        end_pages=[data.end_page for data in chunk_data_list],
+                        chunk_indexes=[data.chunk_index for data in chunk_data_list],
+                    )
                 )
-                for chunk_data in chunk_data_list
-            ]
-
-            self._chunk_repo.save_chunks(book.id, chunks)
-            book.complete_ingestion()
+                # Completed on a copy: if the save or the commit fails, the
+                # rollback leaves the row ingesting and ``book`` must match it.
+                completed = replace(book)
+                completed.complete_ingestion()
+                self._book_repo.save(completed)
         except Exception:
+            # Saved after the bulk load has rolled back, so the failure sticks.
             book.fail_ingestion()
             self._book_repo.save(book)
             raise
-
-        self._book_repo.save(book)
+        book = completed
 
         embed_error = self._auto_embed(book)
         return book, embed_error
@@ -106,6 +111,11 @@ class IngestBookUseCase:
         file_path = Path(source) if isinstance(source, str) else source
         return self._parsers[file_path.suffix.lower()].parse(file_path)
 
+    def _bulk_load(self) -> AbstractContextManager[None]:
+        if self._unit_of_work is None:
+            return nullcontext()
+        return self._unit_of_work.bulk_load()
+
     def _auto_embed(self, book: Book) -> Exception | None:
         if self._embed_use_case is None:
             return None
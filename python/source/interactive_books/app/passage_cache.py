@@ -0,0 +1,101 @@
+import threading
+from collections import OrderedDict
+
+from interactive_books.domain.query_similarity import query_similarity
+from interactive_books.domain.search_result import SearchResult
+
+# Queries this close are treated as the same search; matching is lexical, so a
+# cache hit costs neither an embedding call nor a vector search.
+DEFAULT_QUERY_SIMILARITY = 0.8
+DEFAULT_MAX_CACHED_QUERIES = 16
+
+
+class ConversationPassageCache:
+    """What one conversation's searches have already found and handed over.
+
+    Tracks the chunks given to the model during the current turn, so repeat
+    hits can be replaced by a page reference, and keeps a small LRU of recent
+    queries and their hits. Tool results from earlier turns are not sent to the
+    model again, so their chunks do not count as provided.
+
+    Speculative and concurrent searches use the cache from worker threads, so
+    every method holds a lock.
+    """
+
+    def __init__(
+        self,
+        *,
+        similarity_threshold: float = DEFAULT_QUERY_SIMILARITY,
+        max_queries: int = DEFAULT_MAX_CACHED_QUERIES,
+    ) -> None:
+        self._similarity_threshold = similarity_threshold
+        self._max_queries = max_queries
+        self._lock = threading.Lock()
+        self._provided: dict[str, tuple[int, int]] = {}
+        self._queries: OrderedDict[str, list[SearchResult]] = OrderedDict()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Bumped by ``clear_queries``; read it before searching and pass it to
+        ``store`` so results found before a reading-position change are dropped.
+        """
+        with self._lock:
+            return self._generation
+
+    def clear_provided(self) -> None:
+        with self._lock:
+            self._provided = {}
+
+    def mark_provided(self, results: list[SearchResult]) -> None:
+        """Record hits that reached the model."""
+        with self._lock:
+            for r in results:
+                self._provided[r.chunk_id] = (r.start_page, r.end_page)
+
+    def lookup(self, query: str) -> list[SearchResult] | None:
+        key = _normalize(query)
+        with self._lock:
+            if key in self._queries:
+                self._queries.move_to_end(key)
+                return self._queries[key]
+            for cached, results in reversed(self._queries.items()):
+                if query_similarity(cached, key) >= self._similarity_threshold:
+                    self._queries.move_to_end(cached)
+                    return results
+        return None
+
+    def store(
+        self, query: str, results: list[SearchResult], *, generation: int
+    ) -> None:
+        key = _normalize(query)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._queries[key] = list(results)
+            self._queries.move_to_end(key)
+            while len(self._queries) > self._max_queries:
+                self._queries.popitem(last=False)
+
+    def clear_queries(self) -> None:
+        with self._lock:
+            self._queries.clear()
+            self._generation += 1
+
+    def split_new(
+        self, results: list[SearchResult]
+    ) -> tuple[list[SearchResult], list[tuple[int, int]]]:
+        """Split hits into ones not yet provided and page ranges of repeats."""
+        new: list[SearchResult] = []
+        repeated: list[tuple[int, int]] = []
+        with self._lock:
+            for r in results:
+                if r.chunk_id in self._provided:
+                    repeated.append(self._provided[r.chunk_id])
+                else:
+                    new.append(r)
+        return new, sorted(set(repeated))
+
+
+def _normalize(query: str) -> str:
+    return " ".join(query.lower().split())
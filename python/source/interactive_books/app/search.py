@@ -1,78 +1,377 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from enum import Enum
+
+from interactive_books.domain.book import Book
 from interactive_books.domain.errors import BookError, BookErrorCode
+from interactive_books.domain.library_search_result import LibrarySearchResult
 from interactive_books.domain.protocols import (
     BookRepository,
     ChunkRepository,
     EmbeddingProvider,
     EmbeddingRepository,
 )
+from interactive_books.domain.rank_fusion import reciprocal_rank_fusion
 from interactive_books.domain.search_result import SearchResult
+from interactive_books.domain.section_routing import (
+    DEFAULT_ROUTED_SECTIONS,
+    route_sections,
+)
 
+DEFAULT_TOP_K = 5
 OVER_FETCH_MULTIPLIER = 3
+DEFAULT_PER_BOOK_LIMIT = 3
+MAX_PARALLEL_BOOKS = 8
+# Enough for every summary and key statement of a fully summarized book.
+SECTION_FETCH_K = 256
+
+
+class SearchMode(Enum):
+    """How chunks are ranked. ``SearchResult.distance`` is always lower-is-better:
+    the vector distance, the BM25 score, or the negated fused RRF score."""
+
+    VECTOR = "vector"
+    LEXICAL = "lexical"
+    HYBRID = "hybrid"
 
 
 class SearchBooksUseCase:
     def __init__(
         self,
         *,
-        embedding_provider: EmbeddingProvider,
+        embedding_provider: EmbeddingProvider | None,
         book_repo: BookRepository,
         chunk_repo: ChunkRepository,
-        embedding_repo: EmbeddingRepository,
+        embedding_repo: EmbeddingRepository | None,
+        mode: SearchMode = SearchMode.VECTOR,
+        section_embedding_repo: EmbeddingRepository | None = None,
+        routed_sections: int = DEFAULT_ROUTED_SECTIONS,
     ) -> None:
         self._provider = embedding_provider
         self._book_repo = book_repo
         self._chunk_repo = chunk_repo
         self._embedding_repo = embedding_repo
+        self._mode = mode
+        self._section_embedding_repo = section_embedding_repo
+        self._routed_sections = routed_sections
+
+    @property
+    def mode(self) -> SearchMode:
+        return self._mode
 
     def execute(
         self,
         book_id: str,
         query: str,
-        top_k: int = 5,
+        top_k: int = DEFAULT_TOP_K,
         page_override: int | None = None,
     ) -> list[SearchResult]:
+        return self.execute_many(
+            book_id, [query], top_k=top_k, page_override=page_override
+        )[0]
+
+    def execute_many(
+        self,
+        book_id: str,
+        queries: list[str],
+        top_k: int = DEFAULT_TOP_K,
+        page_override: int | None = None,
+    ) -> list[list[SearchResult]]:
+        book = self._get_book(book_id)
+        effective_page = _effective_page(book, page_override)
+
+        query_vectors = None
+        if self._mode != SearchMode.LEXICAL:
+            _require_embeddings(book)
+            if not queries:
+                return []
+            query_vectors = self._check_provider(book).embed(queries)
+
+        return self._search_book(book, queries, query_vectors, top_k, effective_page)
+
+    def execute_library(
+        self,
+        query: str,
+        top_k: int = DEFAULT_TOP_K,
+        book_ids: list[str] | None = None,
+        per_book_limit: int = DEFAULT_PER_BOOK_LIMIT,
+        page_override: int | None = None,
+    ) -> list[LibrarySearchResult]:
+        """Search several books with one query and merge the rankings.
+
+        Searches ``book_ids``, or else every book the current mode can search:
+        all of them for lexical search, only those embedded with this provider
+        otherwise. The query is embedded once, books are searched in parallel,
+        each under its own reading position, and no book contributes more than
+        ``per_book_limit`` of the ``top_k`` results.
+        """
+        if book_ids is None:
+            books = [b for b in self._book_repo.get_all() if self._can_search(b)]
+        else:
+            books = [self._get_book(book_id) for book_id in book_ids]
+            if self._mode != SearchMode.LEXICAL:
+                for book in books:
+                    _require_embeddings(book)
+                    self._check_provider(book)
+        if not books:
+            return []
+
+        query_vectors = None
+        if self._mode != SearchMode.LEXICAL:
+            query_vectors = self._require_provider().embed([query])
+        book_k = min(top_k, per_book_limit)
+
+        def search_book(book: Book) -> list[SearchResult]:
+            return self._search_book(
+                book,
+                [query],
+                query_vectors,
+                book_k,
+                _effective_page(book, page_override),
+            )[0]
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(books), MAX_PARALLEL_BOOKS)
+        ) as executor:
+            per_book = list(executor.map(search_book, books))
+
+        merged = [
+            LibrarySearchResult(book_id=book.id, book_title=book.title, result=result)
+            for book, results in zip(books, per_book, strict=True)
+            for result in results
+        ]
+        merged.sort(key=lambda hit: hit.result.distance)
+        return merged[:top_k]
+
+    def find_quote(
+        self,
+        book_id: str,
+        phrase: str,
+        top_k: int = DEFAULT_TOP_K,
+        page_override: int | None = None,
+    ) -> list[SearchResult]:
+        """Chunks that contain ``phrase`` verbatim, in reading order."""
+        book = self._get_book(book_id)
+        chunks = self._chunk_repo.find_phrase(
+            book_id, phrase, top_k, max_page=_effective_page(book, page_override)
+        )
+        return [
+            SearchResult(
+                chunk_id=chunk.id,
+                content=chunk.content,
+                start_page=chunk.start_page,
+                end_page=chunk.end_page,
+                distance=0.0,
+                chunk_index=chunk.chunk_index,
+            )
+            for chunk in chunks
+        ]
+
+    def _get_book(self, book_id: str) -> Book:
         book = self._book_repo.get(book_id)
         if book is None:
             raise BookError(BookErrorCode.NOT_FOUND, f"Book '{book_id}' not found")
+        return book
+
+    def _can_search(self, book: Book) -> bool:
+        if self._mode == SearchMode.LEXICAL:
+            return True
+        return (
+            self._provider is not None
+            and book.embedding_provider == self._provider.provider_name
+            and book.embedding_dimension == self._provider.dimension
+        )
+
+    def _require_provider(self) -> EmbeddingProvider:
+        if self._provider is None or self._embedding_repo is None:
+            raise BookError(
+                BookErrorCode.INVALID_STATE,
+                f"{self._mode.value.capitalize()} search needs an embedding provider",
+            )
+        return self._provider
 
-        if not book.embedding_provider or not book.embedding_dimension:
+    def _check_provider(self, book: Book) -> EmbeddingProvider:
+        provider = self._require_provider()
+        if (
+            provider.provider_name != book.embedding_provider
+            or provider.dimension != book.embedding_dimension
+        ):
             raise BookError(
                 BookErrorCode.INVALID_STATE,
-                f"Book '{book_id}' has no embeddings",
+                f"Book '{book.id}' was embedded with {book.embedding_provider} "
+                f"({book.embedding_dimension}d), not {provider.provider_name} "
+                f"({provider.dimension}d); re-embed it to search",
             )
+        return provider
 
-        provider_name = book.embedding_provider
-        dimension = book.embedding_dimension
-        effective_page = page_override if page_override is not None else book.current_page
-        page_filtering = effective_page > 0
-        fetch_k = top_k * OVER_FETCH_MULTIPLIER if page_filtering else top_k
+    def _search_book(
+        self,
+        book: Book,
+        queries: list[str],
+        query_vectors: list[array[float]] | None,
+        top_k: int,
+        effective_page: int,
+    ) -> list[list[SearchResult]]:
+        if self._mode == SearchMode.LEXICAL or query_vectors is None:
+            return [
+                self._lexical_search(book.id, query, top_k, effective_page)
+                for query in queries
+            ]
 
-        query_vector = self._provider.embed([query])[0]
+        if self._mode == SearchMode.VECTOR:
+            fetch_k = top_k * OVER_FETCH_MULTIPLIER if effective_page > 0 else top_k
+            vector_results = self._vector_search(
+                book, query_vectors, fetch_k, effective_page
+            )
+            return [results[:top_k] for results in vector_results]
 
-        hits = self._embedding_repo.search(
-            provider_name, dimension, book_id, query_vector, fetch_k
+        # Both rankings are fetched deeper than top_k so fusion can promote
+        # chunks that only one of them placed highly.
+        fetch_k = top_k * OVER_FETCH_MULTIPLIER
+        vector_results = self._vector_search(
+            book, query_vectors, fetch_k, effective_page
         )
+        return [
+            _fuse(
+                vector,
+                self._lexical_search(book.id, query, fetch_k, effective_page),
+            )[:top_k]
+            for query, vector in zip(queries, vector_results, strict=True)
+        ]
 
-        if not hits:
-            return []
+    def _lexical_search(
+        self, book_id: str, query: str, top_k: int, effective_page: int
+    ) -> list[SearchResult]:
+        return [
+            SearchResult(
+                chunk_id=chunk.id,
+                content=chunk.content,
+                start_page=chunk.start_page,
+                end_page=chunk.end_page,
+                distance=score,
+                chunk_index=chunk.chunk_index,
+            )
+            for chunk, score in self._chunk_repo.search_text(
+                book_id, query, top_k, max_page=effective_page
+            )
+        ]
 
-        chunk_map = {c.id: c for c in self._chunk_repo.get_by_book(book_id)}
+    def _chunk_hits(
+        self,
+        book: Book,
+        query_vectors: list[array[float]],
+        fetch_k: int,
+        effective_page: int,
+    ) -> list[list[tuple[str, float, int, int]]]:
+        """Chunk KNN, restricted to the routed sections where routing is confident."""
+        provider_name: str = book.embedding_provider  # type: ignore[assignment]
+        dimension: int = book.embedding_dimension  # type: ignore[assignment]
+        embedding_repo: EmbeddingRepository = self._embedding_repo  # type: ignore[assignment]
 
-        results: list[SearchResult] = []
-        for chunk_id, distance, start_page, end_page in hits:
-            if page_filtering and start_page > effective_page:
+        hits: dict[int, list[tuple[str, float, int, int]]] = {}
+        routes = self._route(book, query_vectors, effective_page)
+        for i, page_ranges in enumerate(routes):
+            if page_ranges is None:
                 continue
-            chunk = chunk_map.get(chunk_id)
-            if chunk is None:
-                continue
-            results.append(
-                SearchResult(
-                    chunk_id=chunk_id,
-                    content=chunk.content,
-                    start_page=start_page,
-                    end_page=end_page,
-                    distance=distance,
-                )
+            [routed] = embedding_repo.search_many(
+                provider_name,
+                dimension,
+                book.id,
+                [query_vectors[i]],
+                fetch_k,
+                max_page=effective_page,
+                page_ranges=page_ranges,
+            )
+            # Too little in the routed sections: search the whole book instead.
+            if len(routed) >= fetch_k:
+                hits[i] = routed
+
+        flat = [i for i in range(len(query_vectors)) if i not in hits]
+        if flat:
+            flat_hits = embedding_repo.search_many(
+                provider_name,
+                dimension,
+                book.id,
+                [query_vectors[i] for i in flat],
+                fetch_k,
+                max_page=effective_page,
             )
+            hits.update(zip(flat, flat_hits, strict=True))
+        return [hits[i] for i in range(len(query_vectors))]
+
+    def _route(
+        self, book: Book, query_vectors: list[array[float]], effective_page: int
+    ) -> list[list[tuple[int, int]] | None]:
+        if self._section_embedding_repo is None:
+            return [None] * len(query_vectors)
+        section_hits = self._section_embedding_repo.search_many(
+            book.embedding_provider,  # type: ignore[arg-type]
+            book.embedding_dimension,  # type: ignore[arg-type]
+            book.id,
+            query_vectors,
+            SECTION_FETCH_K,
+            max_page=effective_page,
+        )
+        return [
+            route_sections(query_hits, self._routed_sections)
+            for query_hits in section_hits
+        ]
+
+    def _vector_search(
+        self,
+        book: Book,
+        query_vectors: list[array[float]],
+        fetch_k: int,
+        effective_page: int,
+    ) -> list[list[SearchResult]]:
+        hits_per_query = self._chunk_hits(book, query_vectors, fetch_k, effective_page)
+
+        wanted_ids = {chunk_id for hits in hits_per_query for chunk_id, *_ in hits}
+        if not wanted_ids:
+            return [[] for _ in query_vectors]
+
+        chunk_map = {c.id: c for c in self._chunk_repo.get_by_ids(sorted(wanted_ids))}
+
+        all_results: list[list[SearchResult]] = []
+        for hits in hits_per_query:
+            results: list[SearchResult] = []
+            for chunk_id, distance, start_page, end_page in hits:
+                chunk = chunk_map.get(chunk_id)
+                if chunk is None:
+                    continue
+                results.append(
+                    SearchResult(
+                        chunk_id=chunk_id,
+                        content=chunk.content,
+                        start_page=start_page,
+                        end_page=end_page,
+                        distance=distance,
+                        chunk_index=chunk.chunk_index,
+                    )
+                )
+            all_results.append(results)
+
+        return all_results
+
+
+def _require_embeddings(book: Book) -> None:
+    if not book.embedding_provider or not book.embedding_dimension:
+        raise BookError(
+            BookErrorCode.INVALID_STATE,
+            f"Book '{book.id}' has no embeddings",
+        )
+
+
+def _effective_page(book: Book, page_override: int | None) -> int:
+    return page_override if page_override is not None else book.current_page
+
 
-        return results[:top_k]
+def _fuse(
+    vector: list[SearchResult], lexical: list[SearchResult]
+) -> list[SearchResult]:
+    by_id = {r.chunk_id: r for r in (*lexical, *vector)}
+    fused = reciprocal_rank_fusion(
+        [[r.chunk_id for r in vector], [r.chunk_id for r in lexical]]
+    )
+    return [replace(by_id[chunk_id], distance=-score) for chunk_id, score in fused]
@@ -6,7 +6,13 @@ from pathlib import Path
 from typing import Any
 
 from interactive_books.domain.chunk import Chunk
-from interactive_books.domain.errors import BookError, BookErrorCode, LLMError, LLMErrorCode
+from interactive_books.domain.errors import (
+    BookError,
+    BookErrorCode,
+    LLMError,
+    LLMErrorCode,
+)
+from interactive_books.domain.model_route import CallPurpose
 from interactive_books.domain.prompt_message import PromptMessage
 from interactive_books.domain.protocols import (
     BookRepository,
@@ -75,55 +81,62 @@ class SummarizeBookUseCase:
             if self._on_progress:
                 self._on_progress(i + 1, len(sections))
 
-            prompt = self._build_prompt(template, section)
-            parsed = self._summarize_section(prompt)
+            prompt = build_section_prompt(template, section)
+            parsed = summarize_section(self._chat, prompt)
             summaries.append(
-                _build_section_summary(book_id, i, section, parsed)
+                build_section_summary(book_id, i, section, parsed)
             )
 
         self._summary_repo.save_all(book_id, summaries)
         return summaries
 
-    @staticmethod
-    def _build_prompt(template: str, section: Section) -> str:
-        content = _truncate_to_token_budget(section.content)
-        return (
-            template.replace("{{start_page}}", str(section.start_page))
-            .replace("{{end_page}}", str(section.end_page))
-            .replace("{{content}}", content)
-        )
+    def _load_template(self, filename: str) -> str:
+        return (self._prompts_dir / filename).read_text().strip()
 
-    def _summarize_section(self, prompt: str) -> dict[str, Any]:
-        messages = [PromptMessage(role="user", content=prompt)]
-        response = self._chat.chat(messages)
-
-        parsed = _try_parse_json(response)
-        if parsed is not None:
-            return parsed
-
-        messages.append(PromptMessage(role="assistant", content=response))
-        messages.append(
-            PromptMessage(
-                role="user",
-                content=(
-                    f"Your previous response was not valid JSON:\n{response}\n\n"
-                    "Please respond with ONLY valid JSON matching the requested format."
-                ),
-            ),
-        )
-        retry_response = self._chat.chat(messages)
 
-        parsed = _try_parse_json(retry_response)
-        if parsed is not None:
-            return parsed
+def build_section_prompt(template: str, section: Section) -> str:
+    content = _truncate_to_token_budget(section.content)
+    return (
+        template.replace("{{start_page}}", str(section.start_page))
+        .replace("{{end_page}}", str(section.end_page))
+        .replace("{{content}}", content)
+    )
 
-        raise LLMError(
-            LLMErrorCode.API_CALL_FAILED,
-            f"Failed to parse LLM response as JSON after retry: {retry_response[:200]}",
-        )
 
-    def _load_template(self, filename: str) -> str:
-        return (self._prompts_dir / filename).read_text().strip()
+def summarize_section(
+    chat: ChatProvider, prompt: str, first_response: str | None = None
+) -> dict[str, Any]:
+    messages = [PromptMessage(role="user", content=prompt)]
+    response = (
+        first_response
+        if first_response is not None
+        else chat.chat(messages, purpose=CallPurpose.SUMMARIZATION)
+    )
+
+    parsed = _try_parse_json(response)
+    if parsed is not None:
+        return parsed
+
+    messages.append(PromptMessage(role="assistant", content=response))
+    messages.append(
+        PromptMessage(
+            role="user",
+            content=(
+                f"Your previous response was not valid JSON:\n{response}\n\n"
+                "Please respond with ONLY valid JSON matching the requested format."
+            ),
+        ),
+    )
+    retry_response = chat.chat(messages, purpose=CallPurpose.SUMMARIZATION)
+
+    parsed = _try_parse_json(retry_response)
+    if parsed is not None:
+        return parsed
+
+    raise LLMError(
+        LLMErrorCode.API_CALL_FAILED,
+        f"Failed to parse LLM response as JSON after retry: {retry_response[:200]}",
+    )
 
 
 def group_chunks_into_sections(chunks: list[Chunk]) -> list[Section]:
@@ -165,7 +178,7 @@ def group_chunks_into_sections(chunks: list[Chunk]) -> list[Section]:
 MAX_KEY_STATEMENTS = 3
 
 
-def _build_section_summary(
+def build_section_summary(
     book_id: str,
     index: int,
     section: Section,
@@ -0,0 +1,216 @@
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+from interactive_books.app.summarize import (
+    MAX_SECTIONS,
+    Section,
+    build_section_prompt,
+    build_section_summary,
+    group_chunks_into_sections,
+    summarize_section,
+)
+from interactive_books.domain.errors import BookError, BookErrorCode
+from interactive_books.domain.prompt_message import PromptMessage
+from interactive_books.domain.protocols import (
+    BatchChatProvider,
+    BookRepository,
+    ChatProvider,
+    ChunkRepository,
+    SummaryBatchRepository,
+    SummaryRepository,
+)
+from interactive_books.domain.section_summary import SectionSummary
+from interactive_books.domain.summary_batch import (
+    SummaryBatch,
+    SummaryBatchSection,
+    SummaryBatchStatus,
+)
+
+DEFAULT_POLL_INTERVAL = 30.0
+# Message Batches finish or expire within a day.
+DEFAULT_MAX_WAIT = 24 * 60 * 60.0
+
+
+class BatchSummarizeBooksUseCase:
+    def __init__(
+        self,
+        *,
+        batch_provider: BatchChatProvider,
+        chat_provider: ChatProvider,
+        book_repo: BookRepository,
+        chunk_repo: ChunkRepository,
+        summary_repo: SummaryRepository,
+        batch_repo: SummaryBatchRepository,
+        prompts_dir: Path,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        sleep: Callable[[float], None] = time.sleep,
+        on_poll: Callable[[int], None] | None = None,
+    ) -> None:
+        self._batch = batch_provider
+        self._chat = chat_provider
+        self._book_repo = book_repo
+        self._chunk_repo = chunk_repo
+        self._summary_repo = summary_repo
+        self._batch_repo = batch_repo
+        self._prompts_dir = prompts_dir
+        self._poll_interval = poll_interval
+        self._max_wait = max_wait
+        self._sleep = sleep
+        self._on_poll = on_poll
+
+    def execute(
+        self, book_ids: list[str], *, regenerate: bool = False
+    ) -> dict[str, list[SectionSummary]]:
+        batch = self.submit(book_ids, regenerate=regenerate)
+        if batch is None:
+            return {
+                book_id: self._summary_repo.get_by_book(book_id)
+                for book_id in dict.fromkeys(book_ids)
+            }
+        return self.resume(batch.id)
+
+    def resume(self, batch_id: str) -> dict[str, list[SectionSummary]]:
+        self.wait(batch_id)
+        return self.ingest(batch_id)
+
+    def submit(
+        self, book_ids: list[str], *, regenerate: bool = False
+    ) -> SummaryBatch | None:
+        template = self._load_template("summarization_prompt.md")
+        requests: dict[str, list[PromptMessage]] = {}
+        sections: list[SummaryBatchSection] = []
+
+        for book_id in dict.fromkeys(book_ids):
+            if self._book_repo.get(book_id) is None:
+                raise BookError(BookErrorCode.NOT_FOUND, f"Book '{book_id}' not found")
+            if not regenerate and self._summary_repo.get_by_book(book_id):
+                continue
+
+            for i, section in enumerate(self._sections_for(book_id)):
+                custom_id = f"{book_id}-{i}"
+                prompt = build_section_prompt(template, section)
+                requests[custom_id] = [PromptMessage(role="user", content=prompt)]
+                sections.append(
+                    SummaryBatchSection(
+                        custom_id=custom_id,
+                        book_id=book_id,
+                        section_index=i,
+                        start_page=section.start_page,
+                        end_page=section.end_page,
+                    )
+                )
+
+        if not requests:
+            return None
+
+        provider_batch_id = self._batch.submit_batch(requests)
+        batch = SummaryBatch(
+            id=str(uuid.uuid4()),
+            provider_batch_id=provider_batch_id,
+            sections=sections,
+        )
+        self._batch_repo.save(batch)
+        return batch
+
+    def wait(self, batch_id: str) -> SummaryBatch:
+        """Poll until the batch ends, giving up after ``max_wait`` seconds.
+
+        The batch stays stored when the wait gives up, so it can be resumed.
+        """
+        batch = self._get_batch(batch_id)
+        polls = 0
+        while batch.status == SummaryBatchStatus.SUBMITTED:
+            if self._batch.is_batch_ended(batch.provider_batch_id):
+                batch.mark_ended()
+                self._batch_repo.save(batch)
+                break
+            if polls * self._poll_interval >= self._max_wait:
+                raise BookError(
+                    BookErrorCode.INVALID_STATE,
+                    f"Batch '{batch.id}' is still processing; "
+                    f"resume later with summarize --batch-id {batch.id}",
+                )
+            polls += 1
+            if self._on_poll:
+                self._on_poll(polls)
+            self._sleep(self._poll_interval)
+        return batch
+
+    def ingest(self, batch_id: str) -> dict[str, list[SectionSummary]]:
+        batch = self._get_batch(batch_id)
+        if batch.status == SummaryBatchStatus.SUBMITTED:
+            raise BookError(
+                BookErrorCode.INVALID_STATE,
+                f"Batch '{batch.id}' has not finished processing",
+            )
+        if batch.status == SummaryBatchStatus.INGESTED:
+            return {
+                book_id: self._summary_repo.get_by_book(book_id)
+                for book_id in batch.book_ids
+            }
+
+        # Sections of deleted books are gone; with none left there is nothing
+        # to fetch.
+        responses = (
+            self._batch.get_batch_results(batch.provider_batch_id)
+            if batch.sections
+            else {}
+        )
+        template = self._load_template("summarization_prompt.md")
+        summaries_by_book: dict[str, list[SectionSummary]] = {}
+
+        for book_id in batch.book_ids:
+            sections = self._sections_for(book_id)
+            summaries: list[SectionSummary] = []
+            for entry in (s for s in batch.sections if s.book_id == book_id):
+                section = self._match_section(sections, entry)
+                parsed = summarize_section(
+                    self._chat,
+                    build_section_prompt(template, section),
+                    first_response=responses.get(entry.custom_id),
+                )
+                summaries.append(
+                    build_section_summary(book_id, entry.section_index, section, parsed)
+                )
+            self._summary_repo.save_all(book_id, summaries)
+            summaries_by_book[book_id] = summaries
+
+        batch.mark_ingested()
+        self._batch_repo.save(batch)
+        return summaries_by_book
+
+    def _sections_for(self, book_id: str) -> list[Section]:
+        chunks = self._chunk_repo.get_by_book(book_id)
+        if not chunks:
+            raise BookError(
+                BookErrorCode.INVALID_STATE,
+                f"Book '{book_id}' has no chunks to summarize",
+            )
+        return group_chunks_into_sections(chunks)[:MAX_SECTIONS]
+
+    @staticmethod
+    def _match_section(sections: list[Section], entry: SummaryBatchSection) -> Section:
+        if entry.section_index < len(sections):
+            section = sections[entry.section_index]
+            if (section.start_page, section.end_page) == (
+                entry.start_page,
+                entry.end_page,
+            ):
+                return section
+        raise BookError(
+            BookErrorCode.INVALID_STATE,
+            f"Book '{entry.book_id}' changed since batch submission; "
+            "re-run summarize --batch to resubmit",
+        )
+
+    def _get_batch(self, batch_id: str) -> SummaryBatch:
+        batch = self._batch_repo.get(batch_id)
+        if batch is None:
+            raise BookError(BookErrorCode.NOT_FOUND, f"Batch '{batch_id}' not found")
+        return batch
+
+    def _load_template(self, filename: str) -> str:
+        return (self._prompts_dir / filename).read_text().strip()
@@ -0,0 +1,44 @@
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from interactive_books.domain._time import utc_now
+from interactive_books.domain.errors import BookError, BookErrorCode
+
+DEFAULT_PAGE_BUCKET_SIZE = 25
+
+
+def page_bucket(current_page: int, bucket_size: int = DEFAULT_PAGE_BUCKET_SIZE) -> int:
+    """Reading-position bucket: 0 for an unrestricted reader, else 1-based."""
+    if current_page <= 0:
+        return 0
+    return (current_page - 1) // bucket_size + 1
+
+
+@dataclass
+class CachedAnswer:
+    id: str
+    book_id: str
+    page_bucket: int
+    question: str
+    question_embedding: array[float] = field(repr=False)
+    answer: str
+    max_cited_page: int = 0
+    hit_count: int = 0
+    created_at: datetime = field(default_factory=utc_now)
+    last_used_at: datetime = field(default_factory=utc_now)
+
+    def __post_init__(self) -> None:
+        if not self.answer.strip():
+            raise BookError(
+                BookErrorCode.INVALID_STATE,
+                "CachedAnswer answer cannot be empty",
+            )
+
+    def is_visible_at(self, current_page: int) -> bool:
+        """Whether every page the answer cites is within the reader's position."""
+        return current_page == 0 or self.max_cited_page <= current_page
+
+    def record_hit(self) -> None:
+        self.hit_count += 1
+        self.last_used_at = utc_now()
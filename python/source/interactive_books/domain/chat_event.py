@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from enum import Enum
 
 from interactive_books.domain.search_result import SearchResult
 
@@ -20,6 +21,33 @@ class ToolResultEvent:
 class TokenUsageEvent:
     input_tokens: int
     output_tokens: int
+    model: str | None = None
 
 
-ChatEvent = ToolInvocationEvent | ToolResultEvent | TokenUsageEvent
+@dataclass(frozen=True)
+class AnswerCacheHitEvent:
+    question: str
+    cached_question: str
+    similarity: float
+    hit_count: int
+
+
+class DegradationKind(Enum):
+    SKIP_REFORMULATION = "skip_reformulation"
+    REDUCE_TOP_K = "reduce_top_k"
+    FORCE_FINAL_ANSWER = "force_final_answer"
+
+
+@dataclass(frozen=True)
+class DegradationEvent:
+    kind: DegradationKind
+    remaining_seconds: float
+
+
+ChatEvent = (
+    ToolInvocationEvent
+    | ToolResultEvent
+    | TokenUsageEvent
+    | AnswerCacheHitEvent
+    | DegradationEvent
+)
@@ -5,7 +5,7 @@ from interactive_books.domain._time import utc_now
 from interactive_books.domain.errors import BookError, BookErrorCode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Chunk:
     id: str
     book_id: str
@@ -0,0 +1,39 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from interactive_books.domain.errors import BookError, BookErrorCode
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkBatch:
+    """One book's chunks as parallel columns, for paths that touch every chunk.
+
+    Ingest and embed handle whole books at once; columns spare them a
+    validated ``Chunk``, with its own timestamp, per row. Row ``i`` of the
+    batch is ``ids[i]``, ``contents[i]``, ``start_pages[i]`` and so on, in
+    reading order.
+    """
+
+    book_id: str
+    ids: Sequence[str]
+    contents: Sequence[str]
+    start_pages: Sequence[int]
+    end_pages: Sequence[int]
+    chunk_indexes: Sequence[int]
+
+    def __post_init__(self) -> None:
+        lengths = {
+            len(self.ids),
+            len(self.contents),
+            len(self.start_pages),
+            len(self.end_pages),
+            len(self.chunk_indexes),
+        }
+        if len(lengths) > 1:
+            raise BookError(
+                BookErrorCode.INVALID_STATE,
+                "ChunkBatch columns must all have the same length",
+            )
+
+    def __len__(self) -> int:
+        return len(self.ids)
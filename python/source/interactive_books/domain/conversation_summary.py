@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from interactive_books.domain._time import utc_now
+from interactive_books.domain.errors import BookError, BookErrorCode
+
+
+@dataclass(frozen=True)
+class ConversationSummary:
+    conversation_id: str
+    content: str
+    covered_message_id: str
+    covered_until: datetime
+    updated_at: datetime = field(default_factory=utc_now)
+
+    def __post_init__(self) -> None:
+        if not self.content.strip():
+            raise BookError(
+                BookErrorCode.INVALID_STATE,
+                "ConversationSummary content cannot be empty",
+            )
+
+    def covers(self, created_at: datetime, message_id: str) -> bool:
+        return (created_at, message_id) <= (self.covered_until, self.covered_message_id)
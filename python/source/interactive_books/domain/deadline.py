@@ -0,0 +1,62 @@
+import time
+from collections.abc import Callable
+
+# Shares of the turn budget that must remain for each optional step to run.
+REFORMULATION_MIN_FRACTION = 0.75
+FULL_SEARCH_MIN_FRACTION = 0.5
+TOOL_ROUND_MIN_FRACTION = 0.3
+DEGRADED_TOP_K = 2
+# Every provider request gets at least this long, so the forced final answer of
+# a nearly spent turn still has a chance to complete.
+MIN_DEADLINE_TIMEOUT = 5.0
+
+
+class Deadline:
+    """Latency budget for one chat turn, measured on a monotonic clock.
+
+    Retrieval strategies consult it to drop optional work as the budget runs
+    out; providers bound each request by ``for_request()``.
+
+    The budget is a soft bound. A request started near the end still gets
+    ``MIN_DEADLINE_TIMEOUT``, so a turn can overrun by that much, and a request
+    that times out fails with an ``LLMError`` rather than a degraded answer.
+    """
+
+    def __init__(
+        self,
+        budget_seconds: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._budget = budget_seconds
+        self._clock = clock
+        self._expires_at = clock() + budget_seconds
+
+    @property
+    def budget_seconds(self) -> float:
+        return self._budget
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires_at - self._clock())
+
+    def fraction_remaining(self) -> float:
+        if self._budget <= 0:
+            return 0.0
+        return self.remaining() / self._budget
+
+    def expired(self) -> bool:
+        return self.remaining() == 0.0
+
+    def for_request(self) -> "Deadline":
+        """Budget for one provider request: the time left, but no less than
+        ``MIN_DEADLINE_TIMEOUT``."""
+        return Deadline(max(self.remaining(), MIN_DEADLINE_TIMEOUT), clock=self._clock)
+
+    def allows_reformulation(self) -> bool:
+        return self.fraction_remaining() >= REFORMULATION_MIN_FRACTION
+
+    def allows_full_search(self) -> bool:
+        return self.fraction_remaining() >= FULL_SEARCH_MIN_FRACTION
+
+    def allows_tool_round(self) -> bool:
+        return self.fraction_remaining() >= TOOL_ROUND_MIN_FRACTION
@@ -1,12 +1,21 @@
+from array import array
 from dataclasses import dataclass
 
 from interactive_books.domain.errors import BookError, BookErrorCode
 
+# Embeddings travel as contiguous float32 buffers, which storage writes as-is.
+VECTOR_TYPECODE = "f"
 
-@dataclass(frozen=True)
+
+def float32_vector(values: bytes | list[float]) -> array[float]:
+    """A float32 vector from raw float32 bytes or a list of floats."""
+    return array(VECTOR_TYPECODE, values)
+
+
+@dataclass(frozen=True, slots=True)
 class EmbeddingVector:
     chunk_id: str
-    vector: list[float]
+    vector: array[float]
     start_page: int
     end_page: int
 
@@ -16,6 +25,11 @@ class EmbeddingVector:
                 BookErrorCode.EMBEDDING_FAILED,
                 "EmbeddingVector vector cannot be empty",
             )
+        if self.vector.typecode != VECTOR_TYPECODE:
+            raise BookError(
+                BookErrorCode.EMBEDDING_FAILED,
+                f"EmbeddingVector vector must hold float32, got {self.vector.typecode!r}",
+            )
         if self.start_page < 1:
             raise BookError(
                 BookErrorCode.EMBEDDING_FAILED,
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from interactive_books.domain.search_result import SearchResult
+
+
+@dataclass(frozen=True)
+class LibrarySearchResult:
+    """A search hit together with the book it came from."""
+
+    book_id: str
+    book_title: str
+    result: SearchResult
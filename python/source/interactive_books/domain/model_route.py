@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class CallPurpose(Enum):
+    ANSWER = "answer"
+    TOOL_PLANNING = "tool_planning"
+    REFORMULATION = "reformulation"
+    SUMMARIZATION = "summarization"
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    model: str
+    max_tokens: int
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from interactive_books.domain.errors import BookError, BookErrorCode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageContent:
     page_number: int
     text: str
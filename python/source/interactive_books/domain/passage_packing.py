@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+
+from interactive_books.domain.search_result import SearchResult
+
+# Tokens are counted as whitespace-separated words, matching the chunker.
+DEFAULT_CONTEXT_TOKEN_BUDGET = 2500
+NEAR_DUPLICATE_THRESHOLD = 0.8
+_SHINGLE_SIZE = 5
+
+
+@dataclass(frozen=True)
+class Passage:
+    content: str
+    start_page: int
+    end_page: int
+    chunk_ids: tuple[str, ...]
+
+    @property
+    def token_count(self) -> int:
+        return len(self.content.split())
+
+
+def pack_passages(
+    results: list[SearchResult],
+    token_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET,
+) -> list[Passage]:
+    """Turn ranked search hits into de-duplicated passages that fit the budget.
+
+    Hits with consecutive ``chunk_index`` values are merged into one passage with
+    the chunker overlap removed; passages whose text is mostly contained in a
+    better-ranked one are dropped. Passages keep the rank of their best hit and
+    are added in that order while they fit in ``token_budget``.
+    """
+    kept: list[tuple[Passage, set[tuple[str, ...]]]] = []
+    used = 0
+    for passage in _merge_adjacent(results):
+        shingles = _shingles(passage.content)
+        if any(
+            _containment(shingles, other) >= NEAR_DUPLICATE_THRESHOLD
+            for _, other in kept
+        ):
+            continue
+        remaining = token_budget - used
+        if passage.token_count > remaining:
+            if kept or remaining <= 0:
+                continue
+            passage = _truncate(passage, remaining)
+        kept.append((passage, shingles))
+        used += passage.token_count
+    return [passage for passage, _ in kept]
+
+
+def format_passages(passages: list[Passage]) -> str:
+    return "\n\n".join(
+        f"[Pages {p.start_page}-{p.end_page}]:\n{p.content}" for p in passages
+    )
+
+
+def _merge_adjacent(results: list[SearchResult]) -> list[Passage]:
+    rank = {r.chunk_id: i for i, r in reversed(list(enumerate(results)))}
+    unique = [r for i, r in enumerate(results) if rank[r.chunk_id] == i]
+
+    indexed = sorted(
+        ((r.chunk_index, r) for r in unique if r.chunk_index is not None),
+        key=lambda pair: pair[0],
+    )
+    runs: list[list[SearchResult]] = []
+    last_index: int | None = None
+    for chunk_index, r in indexed:
+        if last_index is not None and chunk_index - last_index <= 1:
+            runs[-1].append(r)
+        else:
+            runs.append([r])
+        last_index = chunk_index
+    runs.extend([r] for r in unique if r.chunk_index is None)
+
+    runs.sort(key=lambda run: min(rank[r.chunk_id] for r in run))
+    return [_merge_run(run) for run in runs]
+
+
+def _merge_run(run: list[SearchResult]) -> Passage:
+    words = run[0].content.split()
+    for r in run[1:]:
+        next_words = r.content.split()
+        words.extend(next_words[_overlap_length(words, next_words) :])
+    return Passage(
+        content=" ".join(words),
+        start_page=min(r.start_page for r in run),
+        end_page=max(r.end_page for r in run),
+        chunk_ids=tuple(r.chunk_id for r in run),
+    )
+
+
+def _overlap_length(left: list[str], right: list[str]) -> int:
+    """Length of the longest suffix of ``left`` that is a prefix of ``right``."""
+    if not left or not right:
+        return 0
+    longest = min(len(left), len(right))
+    first = right[0]
+    for size in range(longest, 0, -1):
+        if left[-size] == first and left[-size:] == right[:size]:
+            return size
+    return 0
+
+
+def _truncate(passage: Passage, token_budget: int) -> Passage:
+    words = passage.content.split()[:token_budget]
+    return Passage(
+        content=" ".join(words) + "…",
+        start_page=passage.start_page,
+        end_page=passage.end_page,
+        chunk_ids=passage.chunk_ids,
+    )
+
+
+def _shingles(text: str) -> set[tuple[str, ...]]:
+    words = text.lower().split()
+    if len(words) < _SHINGLE_SIZE:
+        return {tuple(words)} if words else set()
+    return {
+        tuple(words[i : i + _SHINGLE_SIZE])
+        for i in range(len(words) - _SHINGLE_SIZE + 1)
+    }
+
+
+def _containment(candidate: set[tuple[str, ...]], kept: set[tuple[str, ...]]) -> float:
+    if not candidate:
+        return 1.0
+    return len(candidate & kept) / len(candidate)
@@ -0,0 +1,52 @@
+import json
+from dataclasses import dataclass
+
+from interactive_books.domain.search_result import SearchResult
+
+_KIND = "passage_reference"
+
+
+@dataclass(frozen=True)
+class PassageReference:
+    """What a search tool call returned, stored in place of the passage text."""
+
+    query: str
+    chunk_ids: tuple[str, ...]
+    pages: tuple[tuple[int, int], ...]
+
+    @classmethod
+    def from_results(
+        cls, query: str, results: list[SearchResult]
+    ) -> "PassageReference":
+        return cls(
+            query=query,
+            chunk_ids=tuple(r.chunk_id for r in results),
+            pages=tuple((r.start_page, r.end_page) for r in results),
+        )
+
+    def to_content(self) -> str:
+        return json.dumps(
+            {
+                "kind": _KIND,
+                "query": self.query,
+                "chunk_ids": list(self.chunk_ids),
+                "pages": [list(p) for p in self.pages],
+            }
+        )
+
+    @classmethod
+    def from_content(cls, content: str) -> "PassageReference | None":
+        """Parse stored message content; ``None`` for plain-text (legacy) results."""
+        if not content.startswith("{"):
+            return None
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict) or data.get("kind") != _KIND:
+            return None
+        return cls(
+            query=str(data.get("query", "")),
+            chunk_ids=tuple(str(c) for c in data.get("chunk_ids", [])),
+            pages=tuple((int(p[0]), int(p[1])) for p in data.get("pages", [])),
+        )
@@ -1,20 +1,33 @@
+from array import array
 from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import datetime
 from pathlib import Path
 from typing import Protocol
 
 from interactive_books.domain.book import Book
+from interactive_books.domain.cached_answer import CachedAnswer
 from interactive_books.domain.chat import ChatMessage
 from interactive_books.domain.chat_event import ChatEvent
 from interactive_books.domain.chunk import Chunk
+from interactive_books.domain.chunk_batch import ChunkBatch
 from interactive_books.domain.chunk_data import ChunkData
 from interactive_books.domain.conversation import Conversation
+from interactive_books.domain.conversation_summary import ConversationSummary
+from interactive_books.domain.deadline import Deadline
 from interactive_books.domain.embedding_vector import EmbeddingVector
+from interactive_books.domain.model_route import CallPurpose
 from interactive_books.domain.page_content import PageContent
 from interactive_books.domain.prompt_message import PromptMessage
 from interactive_books.domain.section_summary import SectionSummary
+from interactive_books.domain.summary_batch import SummaryBatch
 from interactive_books.domain.tool import ChatResponse, ToolDefinition, ToolResult
 
 
+class UnitOfWork(Protocol):
+    def bulk_load(self) -> AbstractContextManager[None]: ...
+
+
 class BookRepository(Protocol):
     def save(self, book: Book) -> None: ...
     def get(self, book_id: str) -> Book | None: ...
@@ -24,12 +37,21 @@ class BookRepository(Protocol):
 
 class ChunkRepository(Protocol):
     def save_chunks(self, book_id: str, chunks: list[Chunk]) -> None: ...
+    def save_batch(self, batch: ChunkBatch) -> None: ...
     def get_by_book(self, book_id: str) -> list[Chunk]: ...
+    def get_batch(self, book_id: str) -> ChunkBatch: ...
+    def get_by_ids(self, chunk_ids: list[str]) -> list[Chunk]: ...
     def get_by_page_range(
         self, book_id: str, start_page: int, end_page: int
     ) -> list[Chunk]: ...
     def count_by_book(self, book_id: str) -> int: ...
     def delete_by_book(self, book_id: str) -> None: ...
+    def search_text(
+        self, book_id: str, query: str, top_k: int, max_page: int = 0
+    ) -> list[tuple[Chunk, float]]: ...
+    def find_phrase(
+        self, book_id: str, phrase: str, top_k: int, max_page: int = 0
+    ) -> list[Chunk]: ...
 
 
 class BookParser(Protocol):
@@ -47,20 +69,35 @@ class TextChunker(Protocol):
 class ChatProvider(Protocol):
     @property
     def model_name(self) -> str: ...
-    def chat(self, messages: list[PromptMessage]) -> str: ...
+    def chat(
+        self,
+        messages: list[PromptMessage],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> str: ...
     def chat_with_tools(
         self,
         messages: list[PromptMessage],
         tools: list[ToolDefinition],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
     ) -> ChatResponse: ...
 
 
+class BatchChatProvider(Protocol):
+    def submit_batch(self, requests: dict[str, list[PromptMessage]]) -> str: ...
+    def is_batch_ended(self, batch_id: str) -> bool: ...
+    def get_batch_results(self, batch_id: str) -> dict[str, str]: ...
+
+
 class EmbeddingProvider(Protocol):
     @property
     def provider_name(self) -> str: ...
     @property
     def dimension(self) -> int: ...
-    def embed(self, texts: list[str]) -> list[list[float]]: ...
+    def embed(self, texts: list[str]) -> list[array[float]]: ...
 
 
 class EmbeddingRepository(Protocol):
@@ -83,9 +120,23 @@ class EmbeddingRepository(Protocol):
         provider_name: str,
         dimension: int,
         book_id: str,
-        query_vector: list[float],
+        query_vector: array[float],
         top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
     ) -> list[tuple[str, float, int, int]]: ...
+    def search_many(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        query_vectors: list[array[float]],
+        top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
+    ) -> list[list[tuple[str, float, int, int]]]: ...
 
 
 class ConversationRepository(Protocol):
@@ -97,7 +148,12 @@ class ConversationRepository(Protocol):
 
 class ChatMessageRepository(Protocol):
     def save(self, message: ChatMessage) -> None: ...
+    def save_many(self, messages: list[ChatMessage]) -> None: ...
     def get_by_conversation(self, conversation_id: str) -> list[ChatMessage]: ...
+    def get_recent(self, conversation_id: str, limit: int) -> list[ChatMessage]: ...
+    def get_after(
+        self, conversation_id: str, created_at: datetime, message_id: str
+    ) -> list[ChatMessage]: ...
     def delete_by_conversation(self, conversation_id: str) -> None: ...
 
 
@@ -109,6 +165,11 @@ class RetrievalStrategy(Protocol):
         tools: list[ToolDefinition],
         tool_handlers: dict[str, Callable[[dict[str, object]], ToolResult]],
         on_event: Callable[[ChatEvent], None] | None = None,
+        batch_tool_handlers: dict[
+            str, Callable[[list[dict[str, object]]], list[ToolResult]]
+        ]
+        | None = None,
+        deadline: Deadline | None = None,
     ) -> tuple[str, list[ChatMessage]]: ...
 
 
@@ -118,7 +179,27 @@ class SummaryRepository(Protocol):
     def delete_by_book(self, book_id: str) -> None: ...
 
 
+class SummaryBatchRepository(Protocol):
+    def save(self, batch: SummaryBatch) -> None: ...
+    def get(self, batch_id: str) -> SummaryBatch | None: ...
+    def get_pending(self) -> list[SummaryBatch]: ...
+
+
+class AnswerCacheRepository(Protocol):
+    def save(self, answer: CachedAnswer) -> None: ...
+    def get_candidates(self, book_id: str, page_bucket: int) -> list[CachedAnswer]: ...
+    def evict(self, book_id: str, keep: int) -> int: ...
+    def delete_by_book(self, book_id: str) -> None: ...
+
+
+class ConversationSummaryRepository(Protocol):
+    def save(self, summary: ConversationSummary) -> None: ...
+    def get(self, conversation_id: str) -> ConversationSummary | None: ...
+
+
 class ConversationContextStrategy(Protocol):
+    @property
+    def history_limit(self) -> int: ...
     def build_context(
         self,
         history: list[ChatMessage],
@@ -0,0 +1,25 @@
+import re
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a about an and are book did do does for from how in is it me of on or "
+    "tell that the this to was what when where which who why with".split()
+)
+
+
+def query_similarity(first: str, second: str) -> float:
+    """Jaccard overlap of the content words of two queries, in ``[0, 1]``."""
+    first_tokens = _content_tokens(first)
+    second_tokens = _content_tokens(second)
+    if not first_tokens or not second_tokens:
+        return 1.0 if first.strip().lower() == second.strip().lower() else 0.0
+    shared = first_tokens & second_tokens
+    return len(shared) / len(first_tokens | second_tokens)
+
+
+def _content_tokens(text: str) -> set[str]:
+    return {
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in _STOPWORDS
+    }
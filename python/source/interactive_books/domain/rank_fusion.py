@@ -0,0 +1,18 @@
+# Standard damping constant from the original RRF paper; it keeps a single
+# first-place ranking from outweighing agreement across lists.
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[str]], k: int = RRF_K
+) -> list[tuple[str, float]]:
+    """Merge ranked id lists into one, scoring each id by ``sum(1 / (k + rank))``.
+
+    Ranks start at 1. Ids are returned best first; ties keep the order in which
+    the ids were first seen.
+    """
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(dict.fromkeys(ranking), start=1):
+            scores[item] = scores.get(item, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda pair: pair[1], reverse=True)
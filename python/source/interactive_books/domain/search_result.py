@@ -8,3 +8,4 @@ class SearchResult:
     start_page: int
     end_page: int
     distance: float
+    chunk_index: int | None = None
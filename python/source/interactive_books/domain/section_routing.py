@@ -0,0 +1,36 @@
+DEFAULT_ROUTED_SECTIONS = 3
+# Routing is trusted only when the best section is this much closer to the
+# query than the median section; otherwise the query is too generic to route.
+MIN_ROUTING_MARGIN = 0.05
+# Stands in for "the end of the book" in an open page range.
+LAST_PAGE = 2**31 - 1
+
+
+def route_sections(
+    section_hits: list[tuple[str, float, int, int]],
+    top_sections: int = DEFAULT_ROUTED_SECTIONS,
+    min_margin: float = MIN_ROUTING_MARGIN,
+) -> list[tuple[int, int]] | None:
+    """Page ranges worth searching for a query, or ``None`` to search flat.
+
+    ``section_hits`` are ``(id, distance, start_page, end_page)`` rows for a
+    section's summary or key statements; a section scores its closest row.
+    The ``top_sections`` closest sections are kept, plus everything after the
+    last summarized page, which no summary covers. ``None`` means routing
+    would not narrow the search or cannot tell the sections apart.
+    """
+    best: dict[tuple[int, int], float] = {}
+    for _, distance, start_page, end_page in section_hits:
+        pages = (start_page, end_page)
+        best[pages] = min(distance, best.get(pages, distance))
+    if len(best) <= top_sections:
+        return None
+
+    ranked = sorted(best, key=lambda pages: best[pages])
+    distances = sorted(best.values())
+    median = distances[len(distances) // 2]
+    if median <= 0 or (median - distances[0]) / median < min_margin:
+        return None
+
+    covered_through = max(end_page for _, end_page in best)
+    return sorted(ranked[:top_sections]) + [(covered_through + 1, LAST_PAGE)]
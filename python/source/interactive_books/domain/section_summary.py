@@ -5,7 +5,7 @@ from interactive_books.domain._time import utc_now
 from interactive_books.domain.errors import BookError, BookErrorCode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeyStatement:
     statement: str
     page: int
@@ -23,7 +23,7 @@ class KeyStatement:
             )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectionSummary:
     id: str
     book_id: str
@@ -0,0 +1,56 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+
+from interactive_books.domain._time import utc_now
+from interactive_books.domain.errors import BookError, BookErrorCode
+
+
+class SummaryBatchStatus(Enum):
+    SUBMITTED = "submitted"
+    ENDED = "ended"
+    INGESTED = "ingested"
+
+
+@dataclass(frozen=True)
+class SummaryBatchSection:
+    custom_id: str
+    book_id: str
+    section_index: int
+    start_page: int
+    end_page: int
+
+
+@dataclass
+class SummaryBatch:
+    """One submitted batch of section-summary requests.
+
+    Deleting a book removes its sections, so a stored batch may come back with
+    none; ingesting it then only marks it done.
+    """
+
+    id: str
+    provider_batch_id: str
+    sections: list[SummaryBatchSection]
+    status: SummaryBatchStatus = SummaryBatchStatus.SUBMITTED
+    created_at: datetime = field(default_factory=utc_now)
+
+    @property
+    def book_ids(self) -> list[str]:
+        return list(dict.fromkeys(s.book_id for s in self.sections))
+
+    def mark_ended(self) -> None:
+        if self.status != SummaryBatchStatus.SUBMITTED:
+            raise BookError(
+                BookErrorCode.INVALID_STATE,
+                f"Cannot end batch from '{self.status.value}' status",
+            )
+        self.status = SummaryBatchStatus.ENDED
+
+    def mark_ingested(self) -> None:
+        if self.status != SummaryBatchStatus.ENDED:
+            raise BookError(
+                BookErrorCode.INVALID_STATE,
+                f"Cannot ingest batch from '{self.status.value}' status",
+            )
+        self.status = SummaryBatchStatus.INGESTED
@@ -19,6 +19,7 @@ class ToolInvocation:
 class TokenUsage:
     input_tokens: int
     output_tokens: int
+    model: str | None = None
 
 
 @dataclass(frozen=True)
@@ -7,5 +7,9 @@ class ConversationContextStrategy:
     def __init__(self, max_messages: int = DEFAULT_MAX_MESSAGES) -> None:
         self._max_messages = max_messages
 
+    @property
+    def history_limit(self) -> int:
+        return self._max_messages
+
     def build_context(self, history: list[ChatMessage]) -> list[ChatMessage]:
         return list(history[-self._max_messages :])
@@ -0,0 +1,162 @@
+import uuid
+from pathlib import Path
+
+from interactive_books.domain.chat import ChatMessage, MessageRole
+from interactive_books.domain.conversation_summary import ConversationSummary
+from interactive_books.domain.model_route import CallPurpose
+from interactive_books.domain.prompt_message import PromptMessage
+from interactive_books.domain.protocols import (
+    ChatMessageRepository,
+    ChatProvider,
+    ConversationSummaryRepository,
+)
+
+# Tokens are counted as whitespace-separated words, like the chunker does.
+DEFAULT_TOKEN_BUDGET = 3000
+DEFAULT_HISTORY_LIMIT = 60
+# After folding, the verbatim tail is trimmed to this share of the budget so
+# the next few turns fit without another summarization call.
+FOLD_TARGET_RATIO = 0.6
+SUMMARY_PREFIX = "Summary of the earlier conversation:"
+
+
+class ConversationContextStrategy:
+    """Keeps recent turns verbatim within a token budget; older turns are folded
+    into a stored rolling summary that is extended only with newly evicted turns.
+
+    The session holds at most ``history_limit`` messages. Once its window is full
+    and reaches back past the summary, turns may already have left it unfolded,
+    so the messages after the summary are reloaded from ``message_repo`` and
+    folded together with the older half of the window.
+    """
+
+    def __init__(
+        self,
+        *,
+        chat_provider: ChatProvider,
+        summary_repo: ConversationSummaryRepository,
+        message_repo: ChatMessageRepository,
+        prompts_dir: Path,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        history_limit: int = DEFAULT_HISTORY_LIMIT,
+    ) -> None:
+        self._chat = chat_provider
+        self._summary_repo = summary_repo
+        self._message_repo = message_repo
+        self._prompts_dir = prompts_dir
+        self._token_budget = token_budget
+        self._history_limit = history_limit
+
+    @property
+    def history_limit(self) -> int:
+        return self._history_limit
+
+    def build_context(self, history: list[ChatMessage]) -> list[ChatMessage]:
+        turns = [m for m in history if m.role != MessageRole.TOOL_RESULT]
+        if not turns:
+            return []
+
+        conversation_id = turns[-1].conversation_id
+        summary = self._summary_repo.get(conversation_id)
+        window_full = len(history) >= self._history_limit and not _covers(
+            summary, history[0]
+        )
+        if window_full:
+            turns = [
+                m
+                for m in self._unsummarized(conversation_id, summary)
+                if m.role != MessageRole.TOOL_RESULT
+            ]
+        if summary is not None:
+            turns = [m for m in turns if not summary.covers(m.created_at, m.id)]
+
+        evicted: list[ChatMessage] = []
+        if window_full:
+            # Folding the older half too keeps the next turns from reloading.
+            middle = history[len(history) // 2]
+            evicted = [m for m in turns if _is_before(m, middle)]
+            turns = [m for m in turns if not _is_before(m, middle)]
+        if sum(_token_count(m) for m in turns) > self._token_budget:
+            over_budget, turns = self._split_for_fold(turns)
+            evicted += over_budget
+        summary = self._fold(conversation_id, summary, evicted)
+
+        if summary is None:
+            return turns
+        return [
+            ChatMessage(
+                id=str(uuid.uuid4()),
+                conversation_id=conversation_id,
+                role=MessageRole.USER,
+                content=f"{SUMMARY_PREFIX}\n{summary.content}",
+                created_at=summary.covered_until,
+            ),
+            *turns,
+        ]
+
+    def _unsummarized(
+        self, conversation_id: str, summary: ConversationSummary | None
+    ) -> list[ChatMessage]:
+        if summary is None:
+            # Only before the first fold; afterwards just the tail is read.
+            return self._message_repo.get_by_conversation(conversation_id)
+        return self._message_repo.get_after(
+            conversation_id, summary.covered_until, summary.covered_message_id
+        )
+
+    def _split_for_fold(
+        self, turns: list[ChatMessage]
+    ) -> tuple[list[ChatMessage], list[ChatMessage]]:
+        target = int(self._token_budget * FOLD_TARGET_RATIO)
+        kept_tokens = 0
+        split = len(turns)
+        # Always keep the latest message, even if it alone exceeds the target.
+        while split > 0:
+            tokens = _token_count(turns[split - 1])
+            if split < len(turns) and kept_tokens + tokens > target:
+                break
+            kept_tokens += tokens
+            split -= 1
+        return turns[:split], turns[split:]
+
+    def _fold(
+        self,
+        conversation_id: str,
+        summary: ConversationSummary | None,
+        evicted: list[ChatMessage],
+    ) -> ConversationSummary | None:
+        if not evicted:
+            return summary
+        template = self._load_template("conversation_summary_prompt.md")
+        transcript = "\n".join(f"{m.role.value}: {m.content}" for m in evicted)
+        prompt = template.format(
+            summary=summary.content if summary else "(none yet)",
+            messages=transcript,
+        )
+        content = self._chat.chat(
+            [PromptMessage(role="user", content=prompt)],
+            purpose=CallPurpose.SUMMARIZATION,
+        )
+        updated = ConversationSummary(
+            conversation_id=conversation_id,
+            content=content.strip() or (summary.content if summary else transcript),
+            covered_message_id=evicted[-1].id,
+            covered_until=evicted[-1].created_at,
+        )
+        self._summary_repo.save(updated)
+        return updated
+
+    def _load_template(self, filename: str) -> str:
+        return (self._prompts_dir / filename).read_text().strip()
+
+
+def _covers(summary: ConversationSummary | None, message: ChatMessage) -> bool:
+    return summary is not None and summary.covers(message.created_at, message.id)
+
+
+def _is_before(message: ChatMessage, other: ChatMessage) -> bool:
+    return (message.created_at, message.id) < (other.created_at, other.id)
+
+
+def _token_count(message: ChatMessage) -> int:
+    return len(message.content.split())
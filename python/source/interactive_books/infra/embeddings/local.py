@@ -0,0 +1,89 @@
+import hashlib
+import math
+import re
+from array import array
+from collections import Counter
+from functools import lru_cache
+from itertools import pairwise
+
+import numpy as np
+from interactive_books.domain.embedding_vector import float32_vector
+from interactive_books.domain.protocols import (
+    EmbeddingProvider as EmbeddingProviderPort,
+)
+
+DIMENSION = 384
+# Words carry most of the signal; word pairs add phrase matches, and character
+# n-grams let inflected forms ("whale", "whaling") land near each other.
+WORD_WEIGHT = 1.0
+BIGRAM_WEIGHT = 0.5
+CHAR_NGRAM_WEIGHT = 0.2
+CHAR_NGRAM_SIZE = 4
+
+_WORD = re.compile(r"\w+")
+
+
+class EmbeddingProvider(EmbeddingProviderPort):
+    """In-process embeddings from hashed text features; no network or model files.
+
+    Each text becomes a bag of words, word pairs and character n-grams with
+    sublinear term frequencies. Features are hashed into ``dimension`` signed
+    buckets, which acts as a sparse random projection, and rows are L2
+    normalized. Vectors depend only on the text, so they are stable across
+    processes and ingest and query embeddings always agree.
+    """
+
+    def __init__(self, dimension: int = DIMENSION) -> None:
+        self._dimension = dimension
+
+    @property
+    def provider_name(self) -> str:
+        return "local"
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def embed(self, texts: list[str]) -> list[array[float]]:
+        # Flat (row, bucket) cell indices, summed in one vectorized pass.
+        cells: list[int] = []
+        values: list[float] = []
+        for row, text in enumerate(texts):
+            for (feature, weight), count in Counter(_features(text)).items():
+                column, sign = _bucket(feature, self._dimension)
+                cells.append(row * self._dimension + column)
+                values.append(sign * weight * (1.0 + math.log(count)))
+
+        matrix = np.bincount(
+            np.asarray(cells, dtype=np.int64),
+            weights=np.asarray(values, dtype=np.float64),
+            minlength=len(texts) * self._dimension,
+        ).reshape(len(texts), self._dimension)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        rows = (matrix / norms).astype(np.float32)
+        return [float32_vector(row.tobytes()) for row in rows]
+
+
+def _features(text: str) -> list[tuple[str, float]]:
+    words = _WORD.findall(text.lower())
+    features = [(f"w:{word}", WORD_WEIGHT) for word in words]
+    features.extend(
+        (f"b:{first} {second}", BIGRAM_WEIGHT) for first, second in pairwise(words)
+    )
+    for word in words:
+        padded = f"<{word}>"
+        features.extend(
+            (f"c:{padded[i : i + CHAR_NGRAM_SIZE]}", CHAR_NGRAM_WEIGHT)
+            for i in range(len(padded) - CHAR_NGRAM_SIZE + 1)
+        )
+    return features
+
+
+@lru_cache(maxsize=1 << 18)
+def _bucket(feature: str, dimension: int) -> tuple[int, float]:
+    # Stable across processes, unlike the per-process salted built-in hash().
+    digest = int.from_bytes(
+        hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little"
+    )
+    return digest % dimension, 1.0 if digest >> 63 else -1.0
@@ -0,0 +1,80 @@
+import re
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from interactive_books.domain.embedding_vector import float32_vector
+from interactive_books.domain.errors import BookError, BookErrorCode
+from interactive_books.domain.protocols import (
+    EmbeddingProvider as EmbeddingProviderPort,
+)
+from interactive_books.infra.ollama_client import OllamaClient
+
+MODEL = "nomic-embed-text"
+# Texts per /api/embed request; sub-batches run concurrently up to the
+# client's concurrency limit.
+REQUEST_BATCH_SIZE = 16
+
+
+class EmbeddingProvider(EmbeddingProviderPort):
+    """Embeddings from a local Ollama server's batched ``/api/embed`` endpoint.
+
+    Each model gets its own ``provider_name`` (and so its own vector table).
+    The dimension is learned from the server on first use unless given.
+    """
+
+    def __init__(
+        self,
+        client: OllamaClient,
+        *,
+        model: str = MODEL,
+        dimension: int | None = None,
+    ) -> None:
+        self._client = client
+        self._model = model
+        self._dimension = dimension
+
+    @property
+    def provider_name(self) -> str:
+        return "ollama_" + re.sub(r"\W", "_", self._model).lower()
+
+    @property
+    def dimension(self) -> int:
+        if self._dimension is None:
+            self.embed(["dimension probe"])
+        return self._dimension  # type: ignore[return-value]
+
+    def embed(self, texts: list[str]) -> list[array[float]]:
+        batches = [
+            texts[i : i + REQUEST_BATCH_SIZE]
+            for i in range(0, len(texts), REQUEST_BATCH_SIZE)
+        ]
+        if len(batches) <= 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            workers = min(len(batches), self._client.max_concurrency)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._embed_batch, batches))
+
+        vectors = [vector for batch in results for vector in batch]
+        if vectors and self._dimension is None:
+            self._dimension = len(vectors[0])
+        return vectors
+
+    def _embed_batch(self, texts: list[str]) -> list[array[float]]:
+        try:
+            response = self._client.post(
+                "/api/embed", {"model": self._model, "input": texts}
+            )
+        except httpx.HTTPError as e:
+            raise BookError(
+                BookErrorCode.EMBEDDING_FAILED,
+                f"Ollama embedding failed: {e}",
+            ) from e
+        embeddings = response.get("embeddings", [])
+        if len(embeddings) != len(texts):
+            raise BookError(
+                BookErrorCode.EMBEDDING_FAILED,
+                f"Ollama returned {len(embeddings)} embeddings for {len(texts)} texts",
+            )
+        return [float32_vector(embedding) for embedding in embeddings]
@@ -1,5 +1,9 @@
+import base64
+from array import array
 from collections.abc import Callable
+from typing import cast
 
+from interactive_books.domain.embedding_vector import float32_vector
 from interactive_books.domain.errors import BookError, BookErrorCode
 from interactive_books.domain.protocols import (
     EmbeddingProvider as EmbeddingProviderPort,
@@ -35,10 +39,12 @@ class EmbeddingProvider(EmbeddingProviderPort):
     def dimension(self) -> int:
         return DIMENSION
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
+    def embed(self, texts: list[str]) -> list[array[float]]:
         try:
             response = retry_with_backoff(
-                lambda: self._client.embeddings.create(model=MODEL, input=texts),
+                lambda: self._client.embeddings.create(
+                    model=MODEL, input=texts, encoding_format="base64"
+                ),
                 retryable_errors=(RateLimitError,),
                 max_retries=self._max_retries,
                 base_delay=self._base_delay,
@@ -52,4 +58,10 @@ class EmbeddingProvider(EmbeddingProviderPort):
             ) from e
 
         sorted_data = sorted(response.data, key=lambda d: d.index)
-        return [d.embedding for d in sorted_data]
+        # An explicit base64 request comes back undecoded, though the SDK types
+        # it as a float list; decoding it straight into a float32 buffer avoids
+        # a Python float per component.
+        return [
+            float32_vector(base64.b64decode(cast(str, d.embedding)))
+            for d in sorted_data
+        ]
@@ -1,9 +1,15 @@
+from collections.abc import Mapping
 from typing import Any
 
 from anthropic import Anthropic, APIError
 from anthropic.types import Message
+from interactive_books.domain.deadline import Deadline
 from interactive_books.domain.errors import LLMError, LLMErrorCode
+from interactive_books.domain.model_route import CallPurpose, ModelRoute
 from interactive_books.domain.prompt_message import PromptMessage
+from interactive_books.domain.protocols import (
+    BatchChatProvider as BatchChatProviderPort,
+)
 from interactive_books.domain.protocols import ChatProvider as ChatProviderPort
 from interactive_books.domain.tool import (
     ChatResponse,
@@ -13,20 +19,47 @@ from interactive_books.domain.tool import (
 )
 
 MODEL = "claude-sonnet-4-5-20250929"
+FAST_MODEL = "claude-haiku-4-5-20251001"
 MAX_TOKENS = 4096
+# Answers and tool planning (which may answer directly) stay on the flagship
+# model; the auxiliary calls only rewrite a query or fill in a JSON template.
+DEFAULT_ROUTES: dict[CallPurpose, ModelRoute] = {
+    CallPurpose.ANSWER: ModelRoute(model=MODEL, max_tokens=MAX_TOKENS),
+    CallPurpose.TOOL_PLANNING: ModelRoute(model=MODEL, max_tokens=MAX_TOKENS),
+    CallPurpose.REFORMULATION: ModelRoute(model=FAST_MODEL, max_tokens=256),
+    CallPurpose.SUMMARIZATION: ModelRoute(model=FAST_MODEL, max_tokens=MAX_TOKENS),
+}
 
 
 class ChatProvider(ChatProviderPort):
-    def __init__(self, api_key: str) -> None:
-        self._client = Anthropic(api_key=api_key)
-        self._model = MODEL
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        base_url: str | None = None,
+        routes: Mapping[CallPurpose, ModelRoute] | None = None,
+    ) -> None:
+        self._client = Anthropic(api_key=api_key, base_url=base_url)
+        # Retries back off for seconds at a time, which a turn deadline cannot
+        # absorb; deadline-bound requests fail fast instead.
+        self._deadline_client = self._client.with_options(max_retries=0)
+        self._routes = {**DEFAULT_ROUTES, **(routes or {})}
 
     @property
     def model_name(self) -> str:
-        return self._model
+        return self._routes[CallPurpose.ANSWER].model
 
-    def chat(self, messages: list[PromptMessage]) -> str:
-        response = self._call_api(messages)
+    def route_for(self, purpose: CallPurpose) -> ModelRoute:
+        return self._routes[purpose]
+
+    def chat(
+        self,
+        messages: list[PromptMessage],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> str:
+        response = self._call_api(messages, deadline=deadline, purpose=purpose)
         first_block = response.content[0]
         return first_block.text  # type: ignore[union-attr]
 
@@ -34,6 +67,9 @@ class ChatProvider(ChatProviderPort):
         self,
         messages: list[PromptMessage],
         tools: list[ToolDefinition],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
     ) -> ChatResponse:
         api_tools = [
             {
@@ -43,7 +79,9 @@ class ChatProvider(ChatProviderPort):
             }
             for t in tools
         ]
-        response = self._call_api(messages, tools=api_tools)
+        response = self._call_api(
+            messages, tools=api_tools, deadline=deadline, purpose=purpose
+        )
 
         text = None
         invocations: list[ToolInvocation] = []
@@ -65,6 +103,7 @@ class ChatProvider(ChatProviderPort):
         usage = TokenUsage(
             input_tokens=response.usage.input_tokens,
             output_tokens=response.usage.output_tokens,
+            model=response.model,
         )
         return ChatResponse(text=text, tool_invocations=invocations, usage=usage)
 
@@ -73,21 +112,19 @@ class ChatProvider(ChatProviderPort):
         messages: list[PromptMessage],
         *,
         tools: list[dict[str, Any]] | None = None,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
     ) -> Message:
-        system_text, api_messages = self._split_messages(messages)
-
-        kwargs: dict[str, Any] = {
-            "model": self._model,
-            "max_tokens": MAX_TOKENS,
-            "messages": api_messages,
-        }
-        if system_text:
-            kwargs["system"] = system_text
+        kwargs = _message_params(self._routes[purpose], messages)
         if tools:
             kwargs["tools"] = tools
+        client = self._client
+        if deadline is not None:
+            client = self._deadline_client
+            kwargs["timeout"] = deadline.for_request().budget_seconds
 
         try:
-            return self._client.messages.create(**kwargs)
+            return client.messages.create(**kwargs)
         except APIError as e:
             raise LLMError(
                 LLMErrorCode.API_CALL_FAILED,
@@ -105,18 +142,16 @@ class ChatProvider(ChatProviderPort):
             if m.role == "system":
                 system_text = m.content
             elif m.role == "tool_result" and m.tool_use_id:
-                api_messages.append(
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": m.tool_use_id,
-                                "content": m.content,
-                            }
-                        ],
-                    }
-                )
+                block = {
+                    "type": "tool_result",
+                    "tool_use_id": m.tool_use_id,
+                    "content": m.content,
+                }
+                # All results for one assistant turn share a single user message.
+                if api_messages and _is_tool_result_message(api_messages[-1]):
+                    api_messages[-1]["content"].append(block)
+                else:
+                    api_messages.append({"role": "user", "content": [block]})
             elif m.role == "tool_result":
                 # History-loaded tool_result without tool_use_id —
                 # drop it. The assistant's next message already
@@ -141,3 +176,87 @@ class ChatProvider(ChatProviderPort):
                 api_messages.append({"role": m.role, "content": m.content})
 
         return system_text, api_messages
+
+
+class BatchChatProvider(BatchChatProviderPort):
+    """Message Batches adapter; ``base_url`` can point at a local stand-in server.
+
+    Batches only carry section summaries, so every request uses the
+    summarization route.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        base_url: str | None = None,
+        routes: Mapping[CallPurpose, ModelRoute] | None = None,
+    ) -> None:
+        self._client = Anthropic(api_key=api_key, base_url=base_url)
+        self._route = {**DEFAULT_ROUTES, **(routes or {})}[CallPurpose.SUMMARIZATION]
+
+    def submit_batch(self, requests: dict[str, list[PromptMessage]]) -> str:
+        api_requests: list[Any] = [
+            {"custom_id": custom_id, "params": _message_params(self._route, messages)}
+            for custom_id, messages in requests.items()
+        ]
+        try:
+            batch = self._client.messages.batches.create(requests=api_requests)
+        except APIError as e:
+            raise LLMError(
+                LLMErrorCode.API_CALL_FAILED,
+                f"Anthropic batch submission failed: {e}",
+            ) from e
+        return batch.id
+
+    def is_batch_ended(self, batch_id: str) -> bool:
+        try:
+            batch = self._client.messages.batches.retrieve(batch_id)
+        except APIError as e:
+            raise LLMError(
+                LLMErrorCode.API_CALL_FAILED,
+                f"Anthropic batch status check failed: {e}",
+            ) from e
+        return batch.processing_status == "ended"
+
+    def get_batch_results(self, batch_id: str) -> dict[str, str]:
+        results: dict[str, str] = {}
+        try:
+            for entry in self._client.messages.batches.results(batch_id):
+                if entry.result.type != "succeeded":
+                    continue
+                results[entry.custom_id] = "".join(
+                    block.text
+                    for block in entry.result.message.content
+                    if block.type == "text"
+                )
+        except APIError as e:
+            raise LLMError(
+                LLMErrorCode.API_CALL_FAILED,
+                f"Anthropic batch results download failed: {e}",
+            ) from e
+        return results
+
+
+def _is_tool_result_message(message: dict[str, Any]) -> bool:
+    content = message["content"]
+    return (
+        message["role"] == "user"
+        and isinstance(content, list)
+        and all(block.get("type") == "tool_result" for block in content)
+    )
+
+
+def _message_params(
+    route: ModelRoute, messages: list[PromptMessage]
+) -> dict[str, Any]:
+    system_text, api_messages = ChatProvider._split_messages(messages)
+    params: dict[str, Any] = {
+        "model": route.model,
+        "max_tokens": route.max_tokens,
+        "messages": api_messages,
+    }
+    if system_text:
+        params["system"] = system_text
+    return params
+
@@ -0,0 +1,120 @@
+from collections.abc import Mapping
+from typing import Any
+
+import httpx
+from interactive_books.domain.deadline import Deadline
+from interactive_books.domain.errors import LLMError, LLMErrorCode
+from interactive_books.domain.model_route import CallPurpose, ModelRoute
+from interactive_books.domain.prompt_message import PromptMessage
+from interactive_books.domain.protocols import ChatProvider as ChatProviderPort
+from interactive_books.domain.tool import ChatResponse, ToolDefinition
+from interactive_books.infra.ollama_client import OllamaClient
+
+MODEL = "llama3.2"
+MAX_TOKENS = 4096
+REFORMULATION_MAX_TOKENS = 256
+
+
+def default_routes(model: str = MODEL) -> dict[CallPurpose, ModelRoute]:
+    """Every purpose on one model: swapping local models means reloading them."""
+    return {
+        purpose: ModelRoute(
+            model=model,
+            max_tokens=REFORMULATION_MAX_TOKENS
+            if purpose == CallPurpose.REFORMULATION
+            else MAX_TOKENS,
+        )
+        for purpose in CallPurpose
+    }
+
+
+class ChatProvider(ChatProviderPort):
+    """Chat over a local Ollama server's streaming ``/api/chat`` endpoint.
+
+    Tool use is not supported, so this provider must be paired with the
+    always-retrieve ``RetrievalStrategy``.
+    """
+
+    def __init__(
+        self,
+        client: OllamaClient,
+        *,
+        routes: Mapping[CallPurpose, ModelRoute] | None = None,
+    ) -> None:
+        self._client = client
+        self._routes = {**default_routes(), **(routes or {})}
+
+    @property
+    def model_name(self) -> str:
+        return self._routes[CallPurpose.ANSWER].model
+
+    def route_for(self, purpose: CallPurpose) -> ModelRoute:
+        return self._routes[purpose]
+
+    def chat(
+        self,
+        messages: list[PromptMessage],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> str:
+        route = self._routes[purpose]
+        payload = {
+            "model": route.model,
+            "messages": _api_messages(messages),
+            "stream": True,
+            "options": {"num_predict": route.max_tokens},
+        }
+        # The stream's timeout applies to each read, so the request's total
+        # budget is checked as every chunk arrives.
+        request = deadline.for_request() if deadline is not None else None
+        timeout = request.budget_seconds if request is not None else None
+
+        parts: list[str] = []
+        try:
+            for chunk in self._client.stream("/api/chat", payload, timeout=timeout):
+                if "error" in chunk:
+                    raise LLMError(
+                        LLMErrorCode.API_CALL_FAILED,
+                        f"Ollama chat error: {chunk['error']}",
+                    )
+                parts.append(chunk.get("message", {}).get("content", ""))
+                if request is not None and request.expired():
+                    raise LLMError(
+                        LLMErrorCode.TIMEOUT,
+                        f"Ollama chat ran past its {timeout:.1f}s deadline",
+                    )
+        except httpx.TimeoutException as e:
+            raise LLMError(
+                LLMErrorCode.TIMEOUT,
+                f"Ollama chat timed out: {e}",
+            ) from e
+        except httpx.HTTPError as e:
+            raise LLMError(
+                LLMErrorCode.API_CALL_FAILED,
+                f"Ollama chat failed: {e}",
+            ) from e
+        return "".join(parts)
+
+    def chat_with_tools(
+        self,
+        messages: list[PromptMessage],
+        tools: list[ToolDefinition],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> ChatResponse:
+        raise LLMError(
+            LLMErrorCode.UNSUPPORTED_FEATURE,
+            "Ollama chat does not support tool use; use always-retrieve retrieval",
+        )
+
+
+def _api_messages(messages: list[PromptMessage]) -> list[dict[str, Any]]:
+    # Tool results only exist in histories recorded by a tool-use provider;
+    # the assistant reply that follows already reflects them.
+    return [
+        {"role": m.role, "content": m.content}
+        for m in messages
+        if m.role != "tool_result" and (m.content or not m.tool_invocations)
+    ]
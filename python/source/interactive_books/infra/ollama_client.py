@@ -0,0 +1,95 @@
+import json
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+
+DEFAULT_BASE_URL = "http://localhost:11434"
+# Ollama serves up to OLLAMA_NUM_PARALLEL requests per loaded model (4 by
+# default); anything beyond that only queues on the server.
+DEFAULT_MAX_CONCURRENCY = 4
+CONNECT_TIMEOUT = 5.0
+# Generous read timeout: the first request after a model is evicted waits for
+# it to load from disk before any bytes come back.
+READ_TIMEOUT = 300.0
+
+
+class OllamaClient:
+    """Keep-alive HTTP client shared by the Ollama chat and embedding adapters.
+
+    The connection pool and an in-flight semaphore are both sized to
+    ``max_concurrency``, so threads wait locally for a free slot instead of
+    piling requests onto the server or timing out on the pool. Non-2xx
+    responses raise ``httpx.HTTPStatusError`` carrying Ollama's error text.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        self._client = httpx.Client(
+            base_url=base_url,
+            timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            transport=transport,
+        )
+        self._max_concurrency = max_concurrency
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    def post(
+        self, path: str, payload: dict[str, Any], *, timeout: float | None = None
+    ) -> dict[str, Any]:
+        with self._slots:
+            response = self._client.post(path, json=payload, timeout=_timeout(timeout))
+            _raise_for_status(response)
+            return response.json()
+
+    def stream(
+        self, path: str, payload: dict[str, Any], *, timeout: float | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """POST ``payload`` and yield each NDJSON object as it arrives."""
+        with (
+            self._slots,
+            self._client.stream(
+                "POST", path, json=payload, timeout=_timeout(timeout)
+            ) as response,
+        ):
+            _raise_for_status(response)
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def _timeout(seconds: float | None) -> Any:
+    if seconds is None:
+        return httpx.USE_CLIENT_DEFAULT
+    return httpx.Timeout(seconds, connect=CONNECT_TIMEOUT)
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    if response.is_success:
+        return
+    response.read()
+    try:
+        detail = response.json().get("error") or response.text
+    except ValueError:
+        detail = response.text
+    raise httpx.HTTPStatusError(
+        f"{response.status_code}: {detail}",
+        request=response.request,
+        response=response,
+    )
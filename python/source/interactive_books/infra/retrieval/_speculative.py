@@ -0,0 +1,47 @@
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from interactive_books.domain.query_similarity import query_similarity
+from interactive_books.domain.tool import ToolResult
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.5
+
+
+class SpeculativeSearch:
+    """A search for the raw user message started before the model picks a query.
+
+    ``take`` hands the result over once, and only when the real query is close
+    enough to the speculative one; otherwise the caller searches as usual.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[dict[str, object]], ToolResult],
+        query: str,
+        *,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> None:
+        self._query = query
+        self._threshold = threshold
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._future: Future[ToolResult] | None = self._executor.submit(
+            handler, {"query": query}
+        )
+        self._executor.shutdown(wait=False)
+
+    @property
+    def query(self) -> str:
+        return self._query
+
+    def take(self, query: str) -> ToolResult | None:
+        if (
+            self._future is None
+            or query_similarity(self._query, query) < self._threshold
+        ):
+            return None
+        future, self._future = self._future, None
+        try:
+            return future.result()
+        except Exception:
+            # The regular search path will hit and report the same failure.
+            return None
@@ -2,18 +2,38 @@ from collections.abc import Callable
 from pathlib import Path
 
 from interactive_books.domain.chat import ChatMessage
-from interactive_books.domain.chat_event import ChatEvent, ToolResultEvent
+from interactive_books.domain.chat_event import (
+    ChatEvent,
+    DegradationEvent,
+    DegradationKind,
+    ToolResultEvent,
+)
+from interactive_books.domain.deadline import DEGRADED_TOP_K, Deadline
+from interactive_books.domain.model_route import CallPurpose
+from interactive_books.domain.passage_packing import format_passages, pack_passages
 from interactive_books.domain.prompt_message import PromptMessage
 from interactive_books.domain.protocols import ChatProvider
 from interactive_books.domain.search_result import SearchResult
 from interactive_books.domain.tool import ToolDefinition, ToolResult
+from interactive_books.infra.retrieval._speculative import (
+    DEFAULT_SIMILARITY_THRESHOLD,
+    SpeculativeSearch,
+)
 
 NO_CONTEXT_MESSAGE = "No relevant passages found in the book for this query."
 
 
 class RetrievalStrategy:
-    def __init__(self, prompts_dir: Path) -> None:
+    def __init__(
+        self,
+        prompts_dir: Path,
+        *,
+        speculative: bool = False,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> None:
         self._prompts_dir = prompts_dir
+        self._speculative = speculative
+        self._similarity_threshold = similarity_threshold
 
     def execute(
         self,
@@ -22,17 +42,43 @@ class RetrievalStrategy:
         tools: list[ToolDefinition],
         tool_handlers: dict[str, Callable[[dict[str, object]], ToolResult]],
         on_event: Callable[[ChatEvent], None] | None = None,
+        batch_tool_handlers: dict[
+            str, Callable[[list[dict[str, object]]], list[ToolResult]]
+        ] | None = None,
+        deadline: Deadline | None = None,
     ) -> tuple[str, list[ChatMessage]]:
         search_handler = tool_handlers.get("search_book")
 
+        def degrade(kind: DegradationKind) -> None:
+            if on_event and deadline is not None:
+                on_event(
+                    DegradationEvent(kind=kind, remaining_seconds=deadline.remaining())
+                )
+
         def search_fn(query: str) -> list[SearchResult]:
             if search_handler is None:
                 return []
-            result = search_handler({"query": query})
+            arguments: dict[str, object] = {"query": query}
+            if deadline is not None and not deadline.allows_full_search():
+                degrade(DegradationKind.REDUCE_TOP_K)
+                arguments["top_k"] = DEGRADED_TOP_K
+            result = search_handler(arguments)
             return [r for r in result.results if isinstance(r, SearchResult)]
 
-        query = self._reformulate_query(chat_provider, messages)
-        results = search_fn(query)
+        prefetched = self._start_speculative_search(messages, search_handler)
+        if deadline is not None and not deadline.allows_reformulation():
+            query = self._latest_user_message(messages)
+            if self._needs_reformulation(messages):
+                degrade(DegradationKind.SKIP_REFORMULATION)
+        else:
+            query = self._reformulate_query(chat_provider, messages, deadline)
+        speculative_result = prefetched.take(query) if prefetched else None
+        if speculative_result is not None:
+            results = [
+                r for r in speculative_result.results if isinstance(r, SearchResult)
+            ]
+        else:
+            results = search_fn(query)
 
         if on_event:
             on_event(
@@ -54,17 +100,33 @@ class RetrievalStrategy:
                 content=f"Relevant passages:\n\n{context}\n\nUser question: {original.content}",
             )
 
-        response_text = chat_provider.chat(augmented_messages)
+        response_text = chat_provider.chat(augmented_messages, deadline=deadline)
         return response_text, []
 
+    def _start_speculative_search(
+        self,
+        messages: list[PromptMessage],
+        search_handler: Callable[[dict[str, object]], ToolResult] | None,
+    ) -> SpeculativeSearch | None:
+        user_messages = [m for m in messages if m.role == "user"]
+        # A first message is searched verbatim, so there is nothing to overlap.
+        if not self._speculative or search_handler is None or len(user_messages) <= 1:
+            return None
+        return SpeculativeSearch(
+            search_handler,
+            user_messages[-1].content,
+            threshold=self._similarity_threshold,
+        )
+
     def _reformulate_query(
         self,
         chat_provider: ChatProvider,
         messages: list[PromptMessage],
+        deadline: Deadline | None = None,
     ) -> str:
+        if not self._needs_reformulation(messages):
+            return self._latest_user_message(messages)
         user_messages = [m for m in messages if m.role == "user"]
-        if len(user_messages) <= 1:
-            return user_messages[-1].content if user_messages else ""
 
         template = self._load_template("reformulation_prompt.md")
 
@@ -79,10 +141,22 @@ class RetrievalStrategy:
         prompt_text = template.format(history=history, message=latest)
 
         reformulated = chat_provider.chat(
-            [PromptMessage(role="user", content=prompt_text)]
+            [PromptMessage(role="user", content=prompt_text)],
+            deadline=deadline,
+            purpose=CallPurpose.REFORMULATION,
         )
         return reformulated.strip()
 
+    @staticmethod
+    def _needs_reformulation(messages: list[PromptMessage]) -> bool:
+        # A first message is searched verbatim; later ones may lean on history.
+        return sum(1 for m in messages if m.role == "user") > 1
+
+    @staticmethod
+    def _latest_user_message(messages: list[PromptMessage]) -> str:
+        user_messages = [m.content for m in messages if m.role == "user"]
+        return user_messages[-1] if user_messages else ""
+
     def _load_template(self, filename: str) -> str:
         return (self._prompts_dir / filename).read_text().strip()
 
@@ -90,10 +164,7 @@ class RetrievalStrategy:
     def _format_context(results: list[SearchResult]) -> str:
         if not results:
             return NO_CONTEXT_MESSAGE
-        passages = [
-            f"[Pages {r.start_page}-{r.end_page}]:\n{r.content}" for r in results
-        ]
-        return "\n\n".join(passages)
+        return format_passages(pack_passages(results))
 
     @staticmethod
     def _find_last_user_message_index(messages: list[PromptMessage]) -> int:
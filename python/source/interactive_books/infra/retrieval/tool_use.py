@@ -1,26 +1,49 @@
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from interactive_books.domain.chat import ChatMessage, MessageRole
 from interactive_books.domain.chat_event import (
     ChatEvent,
+    DegradationEvent,
+    DegradationKind,
     TokenUsageEvent,
     ToolInvocationEvent,
     ToolResultEvent,
 )
+from interactive_books.domain.deadline import DEGRADED_TOP_K, Deadline
+from interactive_books.domain.model_route import CallPurpose
+from interactive_books.domain.passage_reference import PassageReference
 from interactive_books.domain.prompt_message import PromptMessage
 from interactive_books.domain.protocols import ChatProvider
 from interactive_books.domain.search_result import SearchResult
 from interactive_books.domain.tool import ChatResponse, ToolDefinition, ToolInvocation, ToolResult
+from interactive_books.infra.retrieval._speculative import (
+    DEFAULT_SIMILARITY_THRESHOLD,
+    SpeculativeSearch,
+)
 
 MAX_TOOL_ITERATIONS = 3
 EMPTY_RESPONSE_FALLBACK = (
     "I'm sorry, I wasn't able to find an answer. Could you try rephrasing your question?"
 )
 _PLACEHOLDER_CONVERSATION_ID = ""
+_SEARCH_TOOL_NAME = "search_book"
+# Tools that only read the book; every other tool may change what they see.
+_READ_ONLY_TOOLS = frozenset({_SEARCH_TOOL_NAME, "find_quote"})
 
 
 class RetrievalStrategy:
+    def __init__(
+        self,
+        *,
+        speculative: bool = False,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> None:
+        self._speculative = speculative
+        self._similarity_threshold = similarity_threshold
+
     def execute(
         self,
         chat_provider: ChatProvider,
@@ -28,71 +51,189 @@ class RetrievalStrategy:
         tools: list[ToolDefinition],
         tool_handlers: dict[str, Callable[[dict[str, object]], ToolResult]],
         on_event: Callable[[ChatEvent], None] | None = None,
+        batch_tool_handlers: dict[
+            str, Callable[[list[dict[str, object]]], list[ToolResult]]
+        ] | None = None,
+        deadline: Deadline | None = None,
     ) -> tuple[str, list[ChatMessage]]:
         current_messages = list(messages)
         new_chat_messages: list[ChatMessage] = []
+        prefetched = self._start_speculative_search(messages, tool_handlers)
+        top_k: int | None = None
 
         for _ in range(MAX_TOOL_ITERATIONS):
-            response = chat_provider.chat_with_tools(current_messages, tools)
+            if deadline is not None and not deadline.allows_tool_round():
+                _emit_degradation(
+                    DegradationKind.FORCE_FINAL_ANSWER, deadline, on_event
+                )
+                break
+            response = chat_provider.chat_with_tools(
+                current_messages,
+                tools,
+                deadline=deadline,
+                purpose=CallPurpose.TOOL_PLANNING,
+            )
             self._emit_token_usage(response, on_event)
 
             if not response.tool_invocations:
                 return response.text or EMPTY_RESPONSE_FALLBACK, new_chat_messages
 
-            for invocation in response.tool_invocations:
-                tool_result_content = self._process_invocation(
-                    invocation, tool_handlers, on_event,
-                )
-                current_messages.append(PromptMessage(
-                    role="assistant",
-                    content=response.text or "",
-                    tool_invocations=[invocation],
-                ))
+            if (
+                top_k is None
+                and deadline is not None
+                and not deadline.allows_full_search()
+            ):
+                top_k = DEGRADED_TOP_K
+                _emit_degradation(DegradationKind.REDUCE_TOP_K, deadline, on_event)
+            if any(
+                invocation.tool_name not in _READ_ONLY_TOOLS
+                for invocation in response.tool_invocations
+            ):
+                # The prefetch searched from the reading position before the turn.
+                prefetched = None
+            tool_results = self._process_invocations(
+                response.tool_invocations,
+                tool_handlers,
+                batch_tool_handlers or {},
+                on_event,
+                prefetched,
+                top_k,
+            )
+            current_messages.append(PromptMessage(
+                role="assistant",
+                content=response.text or "",
+                tool_invocations=list(response.tool_invocations),
+            ))
+            for invocation, tool_result in zip(
+                response.tool_invocations, tool_results, strict=True,
+            ):
                 current_messages.append(PromptMessage(
                     role="tool_result",
-                    content=tool_result_content,
+                    content=tool_result.formatted_text,
                     tool_use_id=invocation.tool_use_id,
                 ))
                 new_chat_messages.append(ChatMessage(
                     id=str(uuid.uuid4()),
                     conversation_id=_PLACEHOLDER_CONVERSATION_ID,
                     role=MessageRole.TOOL_RESULT,
-                    content=tool_result_content,
+                    content=self._stored_content(tool_result),
                 ))
 
         current_messages.append(PromptMessage(
             role="user",
             content="Please answer based on the passages you have already retrieved.",
         ))
-        final_response = chat_provider.chat_with_tools(current_messages, tools=[])
+        final_response = chat_provider.chat_with_tools(
+            current_messages, tools=[], deadline=deadline
+        )
         self._emit_token_usage(final_response, on_event)
         return final_response.text or EMPTY_RESPONSE_FALLBACK, new_chat_messages
 
     @staticmethod
-    def _process_invocation(
-        invocation: ToolInvocation,
+    def _process_invocations(
+        invocations: list[ToolInvocation],
         tool_handlers: dict[str, Callable[[dict[str, object]], ToolResult]],
+        batch_tool_handlers: dict[
+            str, Callable[[list[dict[str, object]]], list[ToolResult]]
+        ],
         on_event: Callable[[ChatEvent], None] | None,
-    ) -> str:
+        prefetched: SpeculativeSearch | None = None,
+        top_k: int | None = None,
+    ) -> list[ToolResult]:
         if on_event:
-            on_event(ToolInvocationEvent(
-                tool_name=invocation.tool_name,
-                arguments=dict(invocation.arguments),
-            ))
+            for invocation in invocations:
+                on_event(ToolInvocationEvent(
+                    tool_name=invocation.tool_name,
+                    arguments=dict(invocation.arguments),
+                ))
+
+        results: list[ToolResult | None] = [None] * len(invocations)
+        # Tools that change state, such as set_page, run first, one at a time
+        # and in the order asked, so the searches see the state they leave.
+        for i, invocation in enumerate(invocations):
+            if invocation.tool_name in _READ_ONLY_TOOLS:
+                continue
+            handler = tool_handlers.get(invocation.tool_name)
+            if handler is not None:
+                results[i] = handler(dict(invocation.arguments))
+
+        # One task per batchable tool (all of its invocations together) and one
+        # per remaining search; tasks run concurrently so a turn costs roughly
+        # as much as its slowest search.
+        grouped: dict[str, list[int]] = {}
+        tasks: list[tuple[list[int], Callable[[], Sequence[ToolResult | None]]]] = []
+        for i, invocation in enumerate(invocations):
+            if invocation.tool_name not in _READ_ONLY_TOOLS:
+                continue
+            if prefetched and invocation.tool_name == _SEARCH_TOOL_NAME:
+                results[i] = prefetched.take(str(invocation.arguments.get("query", "")))
+                if results[i] is not None:
+                    continue
+            if invocation.tool_name in batch_tool_handlers:
+                grouped.setdefault(invocation.tool_name, []).append(i)
+                continue
+            handler = tool_handlers.get(invocation.tool_name)
+            if handler is not None:
+                arguments = _handler_arguments(invocation, top_k)
+                tasks.append(([i], partial(_call_single, handler, arguments)))
+        for tool_name, indices in grouped.items():
+            batch_handler = batch_tool_handlers[tool_name]
+            arguments_list = [
+                _handler_arguments(invocations[i], top_k) for i in indices
+            ]
+            tasks.append((indices, partial(batch_handler, arguments_list)))
+
+        if len(tasks) == 1:
+            indices, task = tasks[0]
+            for i, result in zip(indices, task(), strict=True):
+                results[i] = result
+        elif tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = [(indices, executor.submit(task)) for indices, task in tasks]
+                for indices, future in futures:
+                    for i, result in zip(indices, future.result(), strict=True):
+                        results[i] = result
 
-        handler = tool_handlers.get(invocation.tool_name)
-        if handler is None:
-            return f"Unknown tool: {invocation.tool_name}"
+        processed: list[ToolResult] = []
+        for invocation, result in zip(invocations, results, strict=True):
+            if result is None:
+                processed.append(ToolResult(
+                    formatted_text=f"Unknown tool: {invocation.tool_name}",
+                    query="",
+                    result_count=0,
+                ))
+                continue
+            search_results = [r for r in result.results if isinstance(r, SearchResult)]
+            if on_event and search_results:
+                on_event(ToolResultEvent(
+                    query=result.query,
+                    result_count=result.result_count,
+                    results=search_results,
+                ))
+            processed.append(result)
+        return processed
 
-        result = handler(dict(invocation.arguments))
+    @staticmethod
+    def _stored_content(result: ToolResult) -> str:
+        # Passages are persisted by reference; the chunk text already lives in
+        # the chunks table and can be reloaded on demand.
         search_results = [r for r in result.results if isinstance(r, SearchResult)]
-        if on_event and search_results:
-            on_event(ToolResultEvent(
-                query=result.query,
-                result_count=result.result_count,
-                results=search_results,
-            ))
-        return result.formatted_text
+        if not search_results:
+            return result.formatted_text
+        return PassageReference.from_results(result.query, search_results).to_content()
+
+    def _start_speculative_search(
+        self,
+        messages: list[PromptMessage],
+        tool_handlers: dict[str, Callable[[dict[str, object]], ToolResult]],
+    ) -> SpeculativeSearch | None:
+        handler = tool_handlers.get(_SEARCH_TOOL_NAME)
+        user_messages = [m.content for m in messages if m.role == "user"]
+        if not self._speculative or handler is None or not user_messages:
+            return None
+        return SpeculativeSearch(
+            handler, user_messages[-1], threshold=self._similarity_threshold
+        )
 
     @staticmethod
     def _emit_token_usage(
@@ -103,4 +244,30 @@ class RetrievalStrategy:
             on_event(TokenUsageEvent(
                 input_tokens=response.usage.input_tokens,
                 output_tokens=response.usage.output_tokens,
+                model=response.usage.model,
             ))
+
+
+def _call_single(
+    handler: Callable[[dict[str, object]], ToolResult],
+    arguments: dict[str, object],
+) -> list[ToolResult | None]:
+    return [handler(arguments)]
+
+
+def _handler_arguments(
+    invocation: ToolInvocation, top_k: int | None
+) -> dict[str, object]:
+    arguments = dict(invocation.arguments)
+    if top_k is not None and invocation.tool_name == _SEARCH_TOOL_NAME:
+        arguments["top_k"] = top_k
+    return arguments
+
+
+def _emit_degradation(
+    kind: DegradationKind,
+    deadline: Deadline,
+    on_event: Callable[[ChatEvent], None] | None,
+) -> None:
+    if on_event:
+        on_event(DegradationEvent(kind=kind, remaining_seconds=deadline.remaining()))
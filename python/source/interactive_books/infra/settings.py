@@ -1,3 +1,5 @@
+from functools import cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -7,4 +9,7 @@ class Settings(BaseSettings):
     ollama_base_url: str | None = None
 
 
-settings = Settings()  # type: ignore[call-arg]
+@cache
+def get_settings() -> Settings:
+    """Settings read from the environment on first use, not at import."""
+    return Settings()  # type: ignore[call-arg]
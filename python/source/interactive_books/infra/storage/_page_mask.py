@@ -0,0 +1,24 @@
+import numpy as np
+
+
+def page_mask(
+    start_pages: np.ndarray,
+    end_pages: np.ndarray,
+    max_page: int,
+    page_ranges: list[tuple[int, int]] | None,
+) -> np.ndarray | None:
+    """Rows readable at ``max_page`` that overlap one of ``page_ranges``.
+
+    ``None`` means every row qualifies.
+    """
+    if max_page <= 0 and page_ranges is None:
+        return None
+    mask = np.ones(len(start_pages), dtype=bool)
+    if max_page > 0:
+        mask &= start_pages <= max_page
+    if page_ranges is not None:
+        in_ranges = np.zeros(len(start_pages), dtype=bool)
+        for start, end in page_ranges:
+            in_ranges |= (start_pages <= end) & (end_pages >= start)
+        mask &= in_ranges
+    return mask
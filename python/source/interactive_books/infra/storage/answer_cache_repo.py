@@ -0,0 +1,88 @@
+import sqlite3
+from datetime import datetime, timezone
+
+from interactive_books.domain.cached_answer import CachedAnswer
+from interactive_books.domain.embedding_vector import float32_vector
+from interactive_books.domain.protocols import (
+    AnswerCacheRepository as AnswerCacheRepositoryPort,
+)
+from interactive_books.infra.storage.database import Database
+
+_COLUMNS = (
+    "id, book_id, page_bucket, question, question_embedding, answer, "
+    "max_cited_page, hit_count, created_at, last_used_at"
+)
+
+
+class AnswerCacheRepository(AnswerCacheRepositoryPort):
+    def __init__(self, db: Database) -> None:
+        self._db = db
+        self._conn = db.connection
+
+    def save(self, answer: CachedAnswer) -> None:
+        self._conn.execute(
+            f"""
+            INSERT INTO answer_cache ({_COLUMNS})
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                answer = excluded.answer,
+                max_cited_page = excluded.max_cited_page,
+                hit_count = excluded.hit_count,
+                last_used_at = excluded.last_used_at
+            """,
+            (
+                answer.id,
+                answer.book_id,
+                answer.page_bucket,
+                answer.question,
+                answer.question_embedding,
+                answer.answer,
+                answer.max_cited_page,
+                answer.hit_count,
+                answer.created_at.isoformat(),
+                answer.last_used_at.isoformat(),
+            ),
+        )
+        self._conn.commit()
+
+    def get_candidates(self, book_id: str, page_bucket: int) -> list[CachedAnswer]:
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM answer_cache "
+                "WHERE book_id = ? AND page_bucket = ?",
+                (book_id, page_bucket),
+            ).fetchall()
+        return [self._row_to_answer(row) for row in rows]
+
+    def evict(self, book_id: str, keep: int) -> int:
+        cursor = self._conn.execute(
+            """
+            DELETE FROM answer_cache WHERE id IN (
+                SELECT id FROM answer_cache WHERE book_id = ?
+                ORDER BY last_used_at DESC, id DESC
+                LIMIT -1 OFFSET ?
+            )
+            """,
+            (book_id, keep),
+        )
+        self._conn.commit()
+        return cursor.rowcount
+
+    def delete_by_book(self, book_id: str) -> None:
+        self._conn.execute("DELETE FROM answer_cache WHERE book_id = ?", (book_id,))
+        self._conn.commit()
+
+    @staticmethod
+    def _row_to_answer(row: sqlite3.Row | tuple) -> CachedAnswer:  # type: ignore[type-arg]
+        return CachedAnswer(
+            id=row[0],
+            book_id=row[1],
+            page_bucket=row[2],
+            question=row[3],
+            question_embedding=float32_vector(row[4]),
+            answer=row[5],
+            max_cited_page=row[6],
+            hit_count=row[7],
+            created_at=datetime.fromisoformat(row[8]).replace(tzinfo=timezone.utc),
+            last_used_at=datetime.fromisoformat(row[9]).replace(tzinfo=timezone.utc),
+        )
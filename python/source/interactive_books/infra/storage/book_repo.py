@@ -10,6 +10,7 @@ _BOOK_COLUMNS = "id, title, status, current_page, embedding_provider, embedding_
 
 class BookRepository(BookRepositoryPort):
     def __init__(self, db: Database) -> None:
+        self._db = db
         self._conn = db.connection
 
     def save(self, book: Book) -> None:
@@ -40,18 +41,19 @@ class BookRepository(BookRepositoryPort):
         self._conn.commit()
 
     def get(self, book_id: str) -> Book | None:
-        cursor = self._conn.execute(
-            f"SELECT {_BOOK_COLUMNS} FROM books WHERE id = ?",
-            (book_id,),
-        )
-        row = cursor.fetchone()
+        with self._db.reader() as conn:
+            row = conn.execute(
+                f"SELECT {_BOOK_COLUMNS} FROM books WHERE id = ?",
+                (book_id,),
+            ).fetchone()
         if row is None:
             return None
         return self._row_to_book(row)
 
     def get_all(self) -> list[Book]:
-        cursor = self._conn.execute(f"SELECT {_BOOK_COLUMNS} FROM books")
-        return [self._row_to_book(row) for row in cursor.fetchall()]
+        with self._db.reader() as conn:
+            rows = conn.execute(f"SELECT {_BOOK_COLUMNS} FROM books").fetchall()
+        return [self._row_to_book(row) for row in rows]
 
     def delete(self, book_id: str) -> None:
         self._conn.execute("DELETE FROM books WHERE id = ?", (book_id,))
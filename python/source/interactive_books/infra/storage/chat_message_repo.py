@@ -12,30 +12,63 @@ _COLUMNS = "id, conversation_id, role, content, created_at"
 
 class ChatMessageRepository(ChatMessageRepositoryPort):
     def __init__(self, db: Database) -> None:
+        self._db = db
         self._conn = db.connection
 
     def save(self, message: ChatMessage) -> None:
-        self._conn.execute(
-            f"""
-            INSERT INTO chat_messages ({_COLUMNS})
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                message.id,
-                message.conversation_id,
-                message.role.value,
-                message.content,
-                message.created_at.isoformat(),
-            ),
-        )
+        self.save_many([message])
+
+    def save_many(self, messages: list[ChatMessage]) -> None:
+        try:
+            self._conn.executemany(
+                f"""
+                INSERT INTO chat_messages ({_COLUMNS})
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        message.id,
+                        message.conversation_id,
+                        message.role.value,
+                        message.content,
+                        message.created_at.isoformat(),
+                    )
+                    for message in messages
+                ],
+            )
+        except sqlite3.Error:
+            self._conn.rollback()
+            raise
         self._conn.commit()
 
     def get_by_conversation(self, conversation_id: str) -> list[ChatMessage]:
-        cursor = self._conn.execute(
-            f"SELECT {_COLUMNS} FROM chat_messages WHERE conversation_id = ? ORDER BY created_at ASC",
-            (conversation_id,),
-        )
-        return [self._row_to_message(row) for row in cursor.fetchall()]
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM chat_messages WHERE conversation_id = ? ORDER BY created_at ASC",
+                (conversation_id,),
+            ).fetchall()
+        return [self._row_to_message(row) for row in rows]
+
+    def get_recent(self, conversation_id: str, limit: int) -> list[ChatMessage]:
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM chat_messages WHERE conversation_id = ? "
+                "ORDER BY created_at DESC, id DESC LIMIT ?",
+                (conversation_id, limit),
+            ).fetchall()
+        return [self._row_to_message(row) for row in reversed(rows)]
+
+    def get_after(
+        self, conversation_id: str, created_at: datetime, message_id: str
+    ) -> list[ChatMessage]:
+        """Messages after ``(created_at, message_id)``, read by keyset."""
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM chat_messages WHERE conversation_id = ? "
+                "AND (created_at, id) > (?, ?) ORDER BY created_at ASC, id ASC",
+                (conversation_id, created_at.isoformat(), message_id),
+            ).fetchall()
+        return [self._row_to_message(row) for row in rows]
 
     def delete_by_conversation(self, conversation_id: str) -> None:
         self._conn.execute(
@@ -1,23 +1,30 @@
+import re
 import sqlite3
+from array import array
+from contextlib import closing
 from datetime import datetime, timezone
+from itertools import repeat
 
+from interactive_books.domain._time import utc_now
 from interactive_books.domain.chunk import Chunk
+from interactive_books.domain.chunk_batch import ChunkBatch
 from interactive_books.domain.protocols import ChunkRepository as ChunkRepositoryPort
 from interactive_books.infra.storage.database import Database
 
 _CHUNK_COLUMNS = "id, book_id, content, start_page, end_page, chunk_index, created_at"
+_INSERT_CHUNK = f"INSERT INTO chunks ({_CHUNK_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+_QUALIFIED_COLUMNS = ", ".join(f"c.{column}" for column in _CHUNK_COLUMNS.split(", "))
+_WORD = re.compile(r"\w+")
 
 
 class ChunkRepository(ChunkRepositoryPort):
     def __init__(self, db: Database) -> None:
+        self._db = db
         self._conn = db.connection
 
     def save_chunks(self, book_id: str, chunks: list[Chunk]) -> None:
         self._conn.executemany(
-            f"""
-            INSERT INTO chunks ({_CHUNK_COLUMNS})
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+            _INSERT_CHUNK,
             [
                 (
                     chunk.id,
@@ -34,33 +41,152 @@ class ChunkRepository(ChunkRepositoryPort):
         self._conn.commit()
 
     def get_by_book(self, book_id: str) -> list[Chunk]:
-        cursor = self._conn.execute(
-            f"SELECT {_CHUNK_COLUMNS} FROM chunks WHERE book_id = ? ORDER BY chunk_index",
-            (book_id,),
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT {_CHUNK_COLUMNS} FROM chunks WHERE book_id = ? ORDER BY chunk_index",
+                (book_id,),
+            ).fetchall()
+        return [self._row_to_chunk(row) for row in rows]
+
+    def save_batch(self, batch: ChunkBatch) -> None:
+        # Rows written together share one timestamp, formatted once.
+        self._conn.executemany(
+            _INSERT_CHUNK,
+            zip(
+                batch.ids,
+                repeat(batch.book_id),
+                batch.contents,
+                batch.start_pages,
+                batch.end_pages,
+                batch.chunk_indexes,
+                repeat(utc_now().isoformat()),
+            ),
+        )
+        self._conn.commit()
+
+    def get_batch(self, book_id: str) -> ChunkBatch:
+        """Every chunk of a book in reading order, without per-row objects."""
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                "SELECT id, content, start_page, end_page, chunk_index FROM chunks "
+                "WHERE book_id = ? ORDER BY chunk_index",
+                (book_id,),
+            ).fetchall()
+        ids, contents, start_pages, end_pages, chunk_indexes = (
+            zip(*rows, strict=True) if rows else ((), (), (), (), ())
+        )
+        return ChunkBatch(
+            book_id=book_id,
+            ids=ids,
+            contents=contents,
+            start_pages=array("i", start_pages),
+            end_pages=array("i", end_pages),
+            chunk_indexes=array("i", chunk_indexes),
         )
-        return [self._row_to_chunk(row) for row in cursor.fetchall()]
+
+    def get_by_ids(self, chunk_ids: list[str]) -> list[Chunk]:
+        if not chunk_ids:
+            return []
+        placeholders = ", ".join("?" for _ in chunk_ids)
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT {_CHUNK_COLUMNS} FROM chunks WHERE id IN ({placeholders}) "
+                "ORDER BY chunk_index",
+                chunk_ids,
+            ).fetchall()
+        return [self._row_to_chunk(row) for row in rows]
 
     def get_by_page_range(
         self, book_id: str, start_page: int, end_page: int
     ) -> list[Chunk]:
-        cursor = self._conn.execute(
-            f"SELECT {_CHUNK_COLUMNS} FROM chunks "
-            "WHERE book_id = ? AND start_page <= ? AND end_page >= ? "
-            "ORDER BY chunk_index",
-            (book_id, end_page, start_page),
-        )
-        return [self._row_to_chunk(row) for row in cursor.fetchall()]
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT {_CHUNK_COLUMNS} FROM chunks "
+                "WHERE book_id = ? AND start_page <= ? AND end_page >= ? "
+                "ORDER BY chunk_index",
+                (book_id, end_page, start_page),
+            ).fetchall()
+        return [self._row_to_chunk(row) for row in rows]
 
     def count_by_book(self, book_id: str) -> int:
-        cursor = self._conn.execute(
-            "SELECT COUNT(*) FROM chunks WHERE book_id = ?", (book_id,)
-        )
-        return cursor.fetchone()[0]
+        with self._db.reader() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM chunks WHERE book_id = ?", (book_id,)
+            ).fetchone()
+        return row[0]
 
     def delete_by_book(self, book_id: str) -> None:
         self._conn.execute("DELETE FROM chunks WHERE book_id = ?", (book_id,))
         self._conn.commit()
 
+    def search_text(
+        self, book_id: str, query: str, top_k: int, max_page: int = 0
+    ) -> list[tuple[Chunk, float]]:
+        """BM25-ranked chunks matching any query word; lower scores rank higher.
+
+        ``max_page`` drops chunks starting after that page; 0 means no limit.
+        """
+        words = _words(query)
+        if not words or top_k < 1:
+            return []
+        # Quoting every word keeps FTS5 operators in user text from parsing.
+        match = " OR ".join(f'"{word}"' for word in words)
+        with self._db.reader() as conn:
+            rows = self._match(
+                conn,
+                book_id,
+                match,
+                max_page,
+                "ORDER BY bm25(chunks_fts) LIMIT ?",
+                top_k,
+            ).fetchall()
+        return [(self._row_to_chunk(row), row[7]) for row in rows]
+
+    def find_phrase(
+        self, book_id: str, phrase: str, top_k: int, max_page: int = 0
+    ) -> list[Chunk]:
+        """Chunks containing ``phrase`` word for word, in reading order.
+
+        Case and punctuation are ignored. The index matches stemmed words, so
+        each candidate is checked against the exact word sequence.
+        """
+        words = _words(phrase)
+        if not words or top_k < 1:
+            return []
+        match = '"' + " ".join(words) + '"'
+        found: list[Chunk] = []
+        with (
+            self._db.reader() as conn,
+            closing(
+                self._match(conn, book_id, match, max_page, "ORDER BY c.chunk_index")
+            ) as cursor,
+        ):
+            for row in cursor:
+                if _contains_sequence(_words(row[2]), words):
+                    found.append(self._row_to_chunk(row))
+                    if len(found) == top_k:
+                        break
+        return found
+
+    @staticmethod
+    def _match(
+        conn: sqlite3.Connection,
+        book_id: str,
+        match: str,
+        max_page: int,
+        order: str,
+        *params: object,
+    ) -> sqlite3.Cursor:
+        page_clause = "AND c.start_page <= ? " if max_page > 0 else ""
+        page_params = (max_page,) if max_page > 0 else ()
+        return conn.execute(
+            f"SELECT {_QUALIFIED_COLUMNS}, bm25(chunks_fts) FROM chunks_fts "
+            "JOIN chunks c ON c.id = chunks_fts.chunk_id "
+            f"WHERE chunks_fts MATCH ? AND chunks_fts.book_id = ? {page_clause}"
+            f"{order}",
+            (match, book_id, *page_params, *params),
+        )
+
     @staticmethod
     def _row_to_chunk(row: sqlite3.Row | tuple) -> Chunk:  # type: ignore[type-arg]
         return Chunk(
@@ -72,3 +198,16 @@ class ChunkRepository(ChunkRepositoryPort):
             chunk_index=row[5],
             created_at=datetime.fromisoformat(row[6]).replace(tzinfo=timezone.utc),
         )
+
+
+def _words(text: str) -> list[str]:
+    return _WORD.findall(text.lower())
+
+
+def _contains_sequence(words: list[str], sequence: list[str]) -> bool:
+    size = len(sequence)
+    first = sequence[0]
+    return any(
+        words[i] == first and words[i : i + size] == sequence
+        for i in range(len(words) - size + 1)
+    )
@@ -12,6 +12,7 @@ _COLUMNS = "id, book_id, title, created_at"
 
 class ConversationRepository(ConversationRepositoryPort):
     def __init__(self, db: Database) -> None:
+        self._db = db
         self._conn = db.connection
 
     def save(self, conversation: Conversation) -> None:
@@ -32,21 +33,22 @@ class ConversationRepository(ConversationRepositoryPort):
         self._conn.commit()
 
     def get(self, conversation_id: str) -> Conversation | None:
-        cursor = self._conn.execute(
-            f"SELECT {_COLUMNS} FROM conversations WHERE id = ?",
-            (conversation_id,),
-        )
-        row = cursor.fetchone()
+        with self._db.reader() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM conversations WHERE id = ?",
+                (conversation_id,),
+            ).fetchone()
         if row is None:
             return None
         return self._row_to_conversation(row)
 
     def get_by_book(self, book_id: str) -> list[Conversation]:
-        cursor = self._conn.execute(
-            f"SELECT {_COLUMNS} FROM conversations WHERE book_id = ? ORDER BY created_at DESC",
-            (book_id,),
-        )
-        return [self._row_to_conversation(row) for row in cursor.fetchall()]
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM conversations WHERE book_id = ? ORDER BY created_at DESC",
+                (book_id,),
+            ).fetchall()
+        return [self._row_to_conversation(row) for row in rows]
 
     def delete(self, conversation_id: str) -> None:
         self._conn.execute("DELETE FROM conversations WHERE id = ?", (conversation_id,))
@@ -0,0 +1,57 @@
+import sqlite3
+from datetime import datetime, timezone
+
+from interactive_books.domain.conversation_summary import ConversationSummary
+from interactive_books.domain.protocols import (
+    ConversationSummaryRepository as ConversationSummaryRepositoryPort,
+)
+from interactive_books.infra.storage.database import Database
+
+_COLUMNS = "conversation_id, content, covered_message_id, covered_until, updated_at"
+
+
+class ConversationSummaryRepository(ConversationSummaryRepositoryPort):
+    def __init__(self, db: Database) -> None:
+        self._db = db
+        self._conn = db.connection
+
+    def save(self, summary: ConversationSummary) -> None:
+        self._conn.execute(
+            f"""
+            INSERT INTO conversation_summaries ({_COLUMNS})
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(conversation_id) DO UPDATE SET
+                content = excluded.content,
+                covered_message_id = excluded.covered_message_id,
+                covered_until = excluded.covered_until,
+                updated_at = excluded.updated_at
+            """,
+            (
+                summary.conversation_id,
+                summary.content,
+                summary.covered_message_id,
+                summary.covered_until.isoformat(),
+                summary.updated_at.isoformat(),
+            ),
+        )
+        self._conn.commit()
+
+    def get(self, conversation_id: str) -> ConversationSummary | None:
+        with self._db.reader() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM conversation_summaries WHERE conversation_id = ?",
+                (conversation_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return self._row_to_summary(row)
+
+    @staticmethod
+    def _row_to_summary(row: sqlite3.Row | tuple) -> ConversationSummary:  # type: ignore[type-arg]
+        return ConversationSummary(
+            conversation_id=row[0],
+            content=row[1],
+            covered_message_id=row[2],
+            covered_until=datetime.fromisoformat(row[3]).replace(tzinfo=timezone.utc),
+            updated_at=datetime.fromisoformat(row[4]).replace(tzinfo=timezone.utc),
+        )
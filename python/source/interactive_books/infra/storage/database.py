@@ -1,38 +1,194 @@
+import queue
 import re
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from interactive_books.domain.errors import StorageError, StorageErrorCode
 
 MIGRATION_PATTERN = re.compile(r"^(\d{3,})_.+\.sql$")
 
+# Every connection maps the file instead of copying hot pages into a cache
+# of its own, and waits out a busy lock instead of failing at once.
+_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA mmap_size=268435456",
+)
+DEFAULT_READERS = 4
+
+
+class _Connection(sqlite3.Connection):
+    """A connection whose commits wait for the enclosing bulk load, if any."""
+
+    bulk_depth = 0
+    vec_loaded = False
+
+    def commit(self) -> None:
+        if self.bulk_depth == 0:
+            super().commit()
+
+
+def _connect(path: str) -> _Connection:
+    # Pooled connections move between threads, one at a time; the sqlite3
+    # module is built threadsafe, so that is allowed.
+    connection = sqlite3.connect(path, check_same_thread=False, factory=_Connection)
+    for pragma in _PRAGMAS:
+        connection.execute(pragma)
+    return connection
+
+
+def _load_vec(connection: _Connection) -> None:
+    import sqlite_vec
+
+    connection.enable_load_extension(True)
+    sqlite_vec.load(connection)
+    connection.enable_load_extension(False)
+    connection.vec_loaded = True
+
 
 class Database:
-    def __init__(self, path: str | Path, *, enable_vec: bool = False) -> None:
-        self._connection = sqlite3.connect(str(path))
-        self._connection.execute("PRAGMA journal_mode=WAL")
-        self._connection.execute("PRAGMA foreign_keys=ON")
-        if enable_vec:
-            import sqlite_vec
+    """One write connection plus a pool of read-only connections.
 
-            self._connection.enable_load_extension(True)
-            sqlite_vec.load(self._connection)
-            self._connection.enable_load_extension(False)
+    Under WAL, readers see the last committed state and never wait for the
+    writer, so searches and chats can run alongside an ingest. An in-memory
+    database cannot be shared between connections; it reads through the
+    writer instead.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        enable_vec: bool = False,
+        readers: int = DEFAULT_READERS,
+    ) -> None:
+        self._path = str(path)
+        self._vec_enabled = False
+        self._connection = _connect(self._path)
+        wal = self._connection.execute("PRAGMA journal_mode=WAL").fetchone()[0] == "wal"
+        if wal:
+            # A commit under WAL skips the fsync but cannot tear the
+            # database; a power loss drops at most the latest transactions.
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._max_readers = readers if wal else 0
+        self._idle_readers: queue.LifoQueue[_Connection] = queue.LifoQueue()
+        self._all_readers: list[_Connection] = []
+        self._readers_lock = threading.Lock()
+        self._bulk_thread: int | None = None
+        if enable_vec:
+            self.load_vec()
 
     @property
     def connection(self) -> sqlite3.Connection:
         return self._connection
 
+    def load_vec(self) -> None:
+        """Load sqlite-vec, once, for repositories that store vectors.
+
+        Loading it takes longer than opening the database, so commands that
+        never touch vectors skip it. Readers load it as they are checked out.
+        """
+        self._vec_enabled = True
+        if not self._connection.vec_loaded:
+            _load_vec(self._connection)
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Check out a read-only connection for one repository operation.
+
+        Waits when every reader is busy. Inside this thread's bulk load the
+        writer is returned instead, so the load reads its own writes.
+        """
+        if self._max_readers == 0 or self._bulk_thread == threading.get_ident():
+            yield self._connection
+            return
+        connection = self._checkout_reader()
+        if self._vec_enabled and not connection.vec_loaded:
+            _load_vec(connection)
+        try:
+            yield connection
+        finally:
+            self._idle_readers.put(connection)
+
+    def _checkout_reader(self) -> _Connection:
+        try:
+            return self._idle_readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._readers_lock:
+            if len(self._all_readers) < self._max_readers:
+                connection = _connect(self._path)
+                connection.execute("PRAGMA query_only=ON")
+                self._all_readers.append(connection)
+                return connection
+        return self._idle_readers.get()
+
     def close(self) -> None:
+        with self._readers_lock:
+            for connection in self._all_readers:
+                connection.close()
+            self._all_readers.clear()
         self._connection.close()
 
-    def run_migrations(self, schema_dir: Path) -> None:
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        """Run every write in the block as one transaction.
+
+        Repositories commit after each save; inside the block those commits
+        wait for its end, so a whole ingest or embed costs one commit rather
+        than one per save. An exception rolls all of it back. Nested blocks
+        join the outermost one.
+        """
+        connection = self._connection
+        if connection.bulk_depth:
+            connection.bulk_depth += 1
+            try:
+                yield
+            finally:
+                connection.bulk_depth -= 1
+            return
+
+        connection.commit()
+        connection.execute("BEGIN IMMEDIATE")
+        connection.bulk_depth = 1
+        self._bulk_thread = threading.get_ident()
+        try:
+            yield
+        except BaseException:
+            connection.bulk_depth = 0
+            connection.rollback()
+            raise
+        else:
+            connection.bulk_depth = 0
+            connection.commit()
+        finally:
+            self._bulk_thread = None
+
+    def run_migrations(self, schema_dir: Path, *, expected_version: int = 0) -> None:
+        """Apply every migration in ``schema_dir`` not yet recorded.
+
+        The newest applied version is mirrored into ``PRAGMA user_version``.
+        When that already reaches ``expected_version``, the database is
+        current and neither the directory nor ``schema_migrations`` is read.
+        """
+        user_version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if expected_version and user_version >= expected_version:
+            return
+
         self._ensure_migration_table()
         applied = self._get_applied_versions()
 
         for path, version in self._sorted_migration_files(schema_dir):
             if version not in applied:
                 self._apply_migration(path, version)
+                applied.add(version)
+
+        if applied and max(applied) != user_version:
+            self._connection.execute(f"PRAGMA user_version={max(applied)}")
 
     def _ensure_migration_table(self) -> None:
         self._connection.execute(
@@ -1,4 +1,4 @@
-import struct
+from array import array
 
 from interactive_books.domain.embedding_vector import EmbeddingVector
 from interactive_books.domain.protocols import (
@@ -7,20 +7,30 @@ from interactive_books.domain.protocols import (
 from interactive_books.infra.storage.database import Database
 
 
-def _table_name(provider_name: str, dimension: int) -> str:
-    return f"embeddings_{provider_name}_{dimension}"
+def _within_page(start_page: int, max_page: int) -> bool:
+    # vec0 cannot filter auxiliary columns inside a KNN query, so the page
+    # limit is applied to the k hits afterwards; callers over-fetch for it.
+    return max_page <= 0 or start_page <= max_page
 
 
-def _serialize_f32(vector: list[float]) -> bytes:
-    return struct.pack(f"{len(vector)}f", *vector)
+class EmbeddingRepository(EmbeddingRepositoryPort):
+    """One vec0 table per provider and dimension, partitioned by book.
 
+    ``table_prefix`` keeps unrelated vectors, such as embedded section
+    summaries, in tables of their own.
+    """
 
-class EmbeddingRepository(EmbeddingRepositoryPort):
-    def __init__(self, db: Database) -> None:
+    def __init__(self, db: Database, *, table_prefix: str = "embeddings") -> None:
+        self._db = db
+        db.load_vec()
         self._conn = db.connection
+        self._table_prefix = table_prefix
+
+    def _table(self, provider_name: str, dimension: int) -> str:
+        return f"{self._table_prefix}_{provider_name}_{dimension}"
 
     def ensure_table(self, provider_name: str, dimension: int) -> None:
-        table = _table_name(provider_name, dimension)
+        table = self._table(provider_name, dimension)
         self._conn.execute(
             f"""
             CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING vec0(
@@ -40,7 +50,7 @@ class EmbeddingRepository(EmbeddingRepositoryPort):
         book_id: str,
         embeddings: list[EmbeddingVector],
     ) -> None:
-        table = _table_name(provider_name, dimension)
+        table = self._table(provider_name, dimension)
         self._conn.executemany(
             f"INSERT INTO {table}(book_id, chunk_id, start_page, end_page, vector) "
             "VALUES (?, ?, ?, ?, ?)",
@@ -50,7 +60,7 @@ class EmbeddingRepository(EmbeddingRepositoryPort):
                     ev.chunk_id,
                     ev.start_page,
                     ev.end_page,
-                    _serialize_f32(ev.vector),
+                    ev.vector,
                 )
                 for ev in embeddings
             ],
@@ -58,7 +68,7 @@ class EmbeddingRepository(EmbeddingRepositoryPort):
         self._conn.commit()
 
     def delete_by_book(self, provider_name: str, dimension: int, book_id: str) -> None:
-        table = _table_name(provider_name, dimension)
+        table = self._table(provider_name, dimension)
         self._conn.execute(f"DELETE FROM {table} WHERE book_id = ?", (book_id,))
         self._conn.commit()
 
@@ -67,20 +77,164 @@ class EmbeddingRepository(EmbeddingRepositoryPort):
         provider_name: str,
         dimension: int,
         book_id: str,
-        query_vector: list[float],
+        query_vector: array[float],
         top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
     ) -> list[tuple[str, float, int, int]]:
-        table = _table_name(provider_name, dimension)
-        cursor = self._conn.execute(
-            f"SELECT chunk_id, distance, start_page, end_page FROM {table} "
-            "WHERE vector MATCH ? AND k = ? AND book_id = ?",
-            (_serialize_f32(query_vector), top_k, book_id),
+        if page_ranges is not None:
+            return self._search_ranges(
+                provider_name,
+                dimension,
+                book_id,
+                query_vector,
+                top_k,
+                max_page,
+                page_ranges,
+            )
+        table = self._table(provider_name, dimension)
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT chunk_id, distance, start_page, end_page FROM {table} "
+                "WHERE vector MATCH ? AND k = ? AND book_id = ?",
+                (query_vector, top_k, book_id),
+            ).fetchall()
+        return [
+            (row[0], row[1], row[2], row[3])
+            for row in rows
+            if _within_page(row[2], max_page)
+        ]
+
+    def search_many(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        query_vectors: list[array[float]],
+        top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
+    ) -> list[list[tuple[str, float, int, int]]]:
+        if not query_vectors:
+            return []
+        if page_ranges is not None:
+            return [
+                self._search_ranges(
+                    provider_name,
+                    dimension,
+                    book_id,
+                    vector,
+                    top_k,
+                    max_page,
+                    page_ranges,
+                )
+                for vector in query_vectors
+            ]
+        table = self._table(provider_name, dimension)
+        # vec0 accepts a KNN constraint per joined row, so every query runs
+        # in a single statement.
+        values = ", ".join("(?, ?)" for _ in query_vectors)
+        params: list[object] = []
+        for i, vector in enumerate(query_vectors):
+            params.extend((i, vector))
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"WITH queries(idx, vector) AS (VALUES {values}) "
+                f"SELECT q.idx, v.chunk_id, v.distance, v.start_page, v.end_page "
+                f"FROM queries q JOIN {table} v "
+                "ON v.vector MATCH q.vector AND v.k = ? AND v.book_id = ? "
+                "ORDER BY q.idx, v.distance",
+                (*params, top_k, book_id),
+            ).fetchall()
+        hits: list[list[tuple[str, float, int, int]]] = [[] for _ in query_vectors]
+        for row in rows:
+            if _within_page(row[3], max_page):
+                hits[row[0]].append((row[1], row[2], row[3], row[4]))
+        return hits
+
+    def _search_ranges(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        query_vector: array[float],
+        top_k: int,
+        max_page: int,
+        page_ranges: list[tuple[int, int]],
+    ) -> list[tuple[str, float, int, int]]:
+        if not page_ranges:
+            return []
+        # A KNN query would rank the whole partition before the page filter
+        # applies, so rows in the ranges are scanned and ranked directly.
+        overlaps = " OR ".join(
+            "(start_page <= ? AND end_page >= ?)" for _ in page_ranges
         )
-        return [(row[0], row[1], row[2], row[3]) for row in cursor.fetchall()]
+        params: list[object] = [query_vector, book_id]
+        for start, end in page_ranges:
+            params.extend((end, start))
+        page_limit = ""
+        if max_page > 0:
+            page_limit = " AND start_page <= ?"
+            params.append(max_page)
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                "SELECT chunk_id, vec_distance_l2(vector, ?) AS distance, "
+                f"start_page, end_page FROM {self._table(provider_name, dimension)} "
+                f"WHERE book_id = ? AND ({overlaps}){page_limit} "
+                "ORDER BY distance LIMIT ?",
+                (*params, top_k),
+            ).fetchall()
+        return [(row[0], row[1], row[2], row[3]) for row in rows]
+
+    def fingerprint(
+        self, provider_name: str, dimension: int, book_id: str
+    ) -> tuple[int, int]:
+        """Row count and newest rowid: changes with every write to the book.
+
+        vec0 assigns rowids with AUTOINCREMENT, so re-embedded rows never get
+        the ids of the rows they replace.
+        """
+        table = self._table(provider_name, dimension)
+        with self._db.reader() as conn:
+            row = conn.execute(
+                f"SELECT count(*), max(rowid) FROM {table} WHERE book_id = ?",
+                (book_id,),
+            ).fetchone()
+        return row[0], row[1] or 0
+
+    def read_book(
+        self, provider_name: str, dimension: int, book_id: str
+    ) -> list[tuple[str, int, int, bytes]]:
+        """Every ``(chunk_id, start_page, end_page, float32 vector bytes)`` row."""
+        table = self._table(provider_name, dimension)
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT chunk_id, start_page, end_page, vector FROM {table} "
+                "WHERE book_id = ?",
+                (book_id,),
+            ).fetchall()
+        return [(row[0], row[1], row[2], row[3]) for row in rows]
+
+    def count(self, provider_name: str, dimension: int) -> int:
+        table = self._table(provider_name, dimension)
+        with self._db.reader() as conn:
+            return conn.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+
+    def sample_vectors(self, provider_name: str, dimension: int, limit: int) -> bytes:
+        """Up to ``limit`` vectors from across all books, as float32 bytes."""
+        table = self._table(provider_name, dimension)
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT vector FROM {table} ORDER BY random() LIMIT ?", (limit,)
+            ).fetchall()
+        return b"".join(row[0] for row in rows)
 
     def has_embeddings(self, book_id: str, provider_name: str, dimension: int) -> bool:
-        table = _table_name(provider_name, dimension)
-        cursor = self._conn.execute(
-            f"SELECT 1 FROM {table} WHERE book_id = ? LIMIT 1", (book_id,)
-        )
-        return cursor.fetchone() is not None
+        table = self._table(provider_name, dimension)
+        with self._db.reader() as conn:
+            row = conn.execute(
+                f"SELECT 1 FROM {table} WHERE book_id = ? LIMIT 1", (book_id,)
+            ).fetchone()
+        return row is not None
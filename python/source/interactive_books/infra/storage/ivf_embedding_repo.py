@@ -0,0 +1,433 @@
+import math
+import os
+import threading
+from array import array
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+from interactive_books.domain.embedding_vector import EmbeddingVector
+from interactive_books.domain.protocols import (
+    EmbeddingRepository as EmbeddingRepositoryPort,
+)
+from interactive_books.infra.storage._page_mask import page_mask
+from interactive_books.infra.storage.database import Database
+from interactive_books.infra.storage.embedding_repo import (
+    EmbeddingRepository as Vec0EmbeddingRepository,
+)
+
+# A book with fewer vectors than this is searched exactly on vec0: with sqrt(n)
+# lists, probing DEFAULT_NPROBE of them would read an eighth of it or more,
+# which saves too little to pay for the index.
+DEFAULT_MIN_INDEXED_ROWS = 4096
+# Probing more lists raises recall and costs proportionally more distance work.
+DEFAULT_NPROBE = 8
+MAX_TRAINING_POINTS_PER_LIST = 256
+KMEANS_ITERATIONS = 20
+_ASSIGN_BATCH = 65_536
+
+_Hit = tuple[str, float, int, int]
+
+
+@dataclass(frozen=True)
+class _Segment:
+    """One book's vectors sorted by inverted list.
+
+    Rows assigned to list ``i`` (centroid ``centroids[i]``) are
+    ``offsets[i]:offsets[i + 1]``. ``fingerprint`` is vec0's for the book when
+    its rows were read.
+    """
+
+    fingerprint: tuple[int, int]
+    centroids: np.ndarray
+    matrix: np.ndarray
+    squared_norms: np.ndarray
+    offsets: np.ndarray
+    chunk_ids: np.ndarray
+    start_pages: np.ndarray
+    end_pages: np.ndarray
+
+
+def _build_segment(
+    rows: list[tuple[str, int, int, bytes]],
+    dimension: int,
+    fingerprint: tuple[int, int],
+) -> _Segment:
+    """Cluster one book's vec0 rows into about sqrt(n) inverted lists.
+
+    Searches are always scoped to one book, so each book gets centroids of its
+    own, sized to its vector count, and every list holds about sqrt(n) rows.
+    """
+    matrix = np.frombuffer(b"".join(row[3] for row in rows), dtype=np.float32)
+    matrix = matrix.reshape(len(rows), dimension)
+    nlist = max(1, round(math.sqrt(len(rows))))
+    rng = np.random.default_rng(0)
+    sample_size = min(len(rows), nlist * MAX_TRAINING_POINTS_PER_LIST)
+    centroids = _kmeans(
+        matrix[rng.choice(len(rows), sample_size, replace=False)], nlist, rng
+    )
+    assignment = _nearest(matrix, centroids)
+    order = np.argsort(assignment, kind="stable")
+    matrix = matrix[order]
+    return _Segment(
+        fingerprint=fingerprint,
+        centroids=centroids,
+        matrix=matrix,
+        squared_norms=np.einsum("ij,ij->i", matrix, matrix),
+        offsets=np.concatenate(
+            ([0], np.cumsum(np.bincount(assignment, minlength=nlist)))
+        ),
+        chunk_ids=np.array([row[0] for row in rows], dtype=np.str_)[order],
+        start_pages=np.array([row[1] for row in rows], dtype=np.int32)[order],
+        end_pages=np.array([row[2] for row in rows], dtype=np.int32)[order],
+    )
+
+
+class IvfIndex:
+    """Inverted-file (IVF-Flat) segments for the books of one vec0 table.
+
+    Each book is stored as its own segment with its own centroids, so
+    embedding or deleting a book rewrites only that book's files. A query
+    scans the ``nprobe`` lists whose centroids are closest to it and computes
+    exact L2 distances inside them.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._segments: dict[str, _Segment] = {}
+
+    def store(self, book_id: str, segment: _Segment) -> None:
+        """Replace the book's segment."""
+        self._write_segment(book_id, segment)
+        self._segments[book_id] = segment
+
+    def remove(self, book_id: str) -> None:
+        self._segments.pop(book_id, None)
+        for path in self._paths(book_id):
+            path.unlink(missing_ok=True)
+
+    def segment(self, book_id: str) -> _Segment | None:
+        segment = self._segments.get(book_id)
+        if segment is None:
+            segment = self._load_segment(book_id)
+            if segment is not None:
+                self._segments[book_id] = segment
+        return segment
+
+    def search(
+        self,
+        segment: _Segment,
+        queries: np.ndarray,
+        top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
+        nprobe: int = DEFAULT_NPROBE,
+    ) -> list[list[_Hit]]:
+        list_order = np.argsort(
+            _squared_distances(queries, segment.centroids), axis=1, kind="stable"
+        )
+        eligible = page_mask(
+            segment.start_pages, segment.end_pages, max_page, page_ranges
+        )
+        return [
+            _scan(segment, query, order, eligible, top_k, nprobe)
+            for query, order in zip(queries, list_order, strict=True)
+        ]
+
+    def _paths(self, book_id: str) -> tuple[Path, Path]:
+        stem = self._directory / book_id
+        return stem.with_suffix(".npy"), stem.with_suffix(".meta.npz")
+
+    def _write_segment(self, book_id: str, segment: _Segment) -> None:
+        matrix_path, meta_path = self._paths(book_id)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        _write_atomically(matrix_path, lambda f: np.save(f, segment.matrix))
+        _write_atomically(
+            meta_path,
+            lambda f: np.savez(
+                f,
+                fingerprint=np.array(segment.fingerprint, dtype=np.int64),
+                centroids=segment.centroids,
+                squared_norms=segment.squared_norms,
+                offsets=segment.offsets,
+                chunk_ids=segment.chunk_ids,
+                start_pages=segment.start_pages,
+                end_pages=segment.end_pages,
+            ),
+        )
+
+    def _load_segment(self, book_id: str) -> _Segment | None:
+        matrix_path, meta_path = self._paths(book_id)
+        if not matrix_path.exists() or not meta_path.exists():
+            return None
+        try:
+            matrix = np.load(matrix_path, mmap_mode="r", allow_pickle=False)
+            with np.load(meta_path, allow_pickle=False) as meta:
+                count, last_rowid = meta["fingerprint"].tolist()
+                segment = _Segment(
+                    fingerprint=(count, last_rowid),
+                    centroids=meta["centroids"],
+                    matrix=matrix,
+                    squared_norms=meta["squared_norms"],
+                    offsets=meta["offsets"],
+                    chunk_ids=meta["chunk_ids"],
+                    start_pages=meta["start_pages"],
+                    end_pages=meta["end_pages"],
+                )
+        except (OSError, ValueError, KeyError):
+            return None
+        if len(segment.offsets) != len(segment.centroids) + 1:
+            return None
+        return segment
+
+
+class EmbeddingRepository(EmbeddingRepositoryPort):
+    """vec0 storage searched through a per-book IVF index for large books.
+
+    vec0 stays the source of truth: every write goes there first, then the
+    book's segment is rebuilt from it, or removed if the book now has fewer
+    than ``min_rows`` vectors. Clustering therefore happens at embed time and
+    always matches the book's current vectors; searches never train. Books
+    without a segment, including ones embedded before the index was enabled,
+    are searched exactly on vec0.
+
+    Queries probe ``nprobe`` lists, widening the probe while it has found
+    fewer than ``top_k`` rows on readable pages. Raise ``nprobe`` for recall,
+    lower it for latency. Index files live under ``index_dir`` and are checked
+    against vec0 the first time a book is used in a process; a stale segment
+    is dropped.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        index_dir: Path,
+        *,
+        min_rows: int = DEFAULT_MIN_INDEXED_ROWS,
+        nprobe: int = DEFAULT_NPROBE,
+    ) -> None:
+        self._vec0 = Vec0EmbeddingRepository(db)
+        self._index_dir = index_dir
+        self._min_rows = min_rows
+        self._nprobe = nprobe
+        self._lock = threading.Lock()
+        self._indexes: dict[tuple[str, int], IvfIndex] = {}
+        self._verified: set[tuple[str, int, str]] = set()
+
+    @property
+    def nprobe(self) -> int:
+        return self._nprobe
+
+    def ensure_table(self, provider_name: str, dimension: int) -> None:
+        self._vec0.ensure_table(provider_name, dimension)
+
+    def save_embeddings(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        embeddings: list[EmbeddingVector],
+    ) -> None:
+        self._vec0.save_embeddings(provider_name, dimension, book_id, embeddings)
+        key = (provider_name, dimension, book_id)
+        fingerprint = self._vec0.fingerprint(*key)
+        rows = self._vec0.read_book(*key)
+        # Clustered outside the lock so searches of other books are not held up.
+        segment = (
+            _build_segment(rows, dimension, fingerprint)
+            if len(rows) >= self._min_rows
+            else None
+        )
+        with self._lock:
+            index = self._index(provider_name, dimension)
+            if segment is None:
+                index.remove(book_id)
+            else:
+                index.store(book_id, segment)
+            self._verified.add(key)
+
+    def delete_by_book(self, provider_name: str, dimension: int, book_id: str) -> None:
+        self._vec0.delete_by_book(provider_name, dimension, book_id)
+        with self._lock:
+            self._index(provider_name, dimension).remove(book_id)
+            self._verified.discard((provider_name, dimension, book_id))
+
+    def has_embeddings(self, book_id: str, provider_name: str, dimension: int) -> bool:
+        return self._vec0.has_embeddings(book_id, provider_name, dimension)
+
+    def search(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        query_vector: array[float],
+        top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
+    ) -> list[tuple[str, float, int, int]]:
+        return self.search_many(
+            provider_name,
+            dimension,
+            book_id,
+            [query_vector],
+            top_k,
+            max_page=max_page,
+            page_ranges=page_ranges,
+        )[0]
+
+    def search_many(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        query_vectors: list[array[float]],
+        top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
+    ) -> list[list[tuple[str, float, int, int]]]:
+        if not query_vectors:
+            return []
+        found = self._segment_for((provider_name, dimension, book_id))
+        if found is None:
+            return self._vec0.search_many(
+                provider_name,
+                dimension,
+                book_id,
+                query_vectors,
+                top_k,
+                max_page=max_page,
+                page_ranges=page_ranges,
+            )
+        index, segment = found
+        return index.search(
+            segment,
+            np.asarray(query_vectors, np.float32),
+            top_k,
+            max_page=max_page,
+            page_ranges=page_ranges,
+            nprobe=self._nprobe,
+        )
+
+    def _index(self, provider_name: str, dimension: int) -> IvfIndex:
+        index = self._indexes.get((provider_name, dimension))
+        if index is None:
+            index = IvfIndex(
+                self._index_dir / f"embeddings_{provider_name}_{dimension}"
+            )
+            self._indexes[(provider_name, dimension)] = index
+        return index
+
+    def _segment_for(
+        self, key: tuple[str, int, str]
+    ) -> tuple[IvfIndex, _Segment] | None:
+        provider_name, dimension, book_id = key
+        with self._lock:
+            index = self._index(provider_name, dimension)
+            segment = index.segment(book_id)
+            if segment is not None and key not in self._verified:
+                if segment.fingerprint != self._vec0.fingerprint(*key):
+                    # Re-embedded by a process without the index; the next
+                    # save through this repository rebuilds it.
+                    index.remove(book_id)
+                    segment = None
+                self._verified.add(key)
+            if segment is None:
+                return None
+            return index, segment
+
+
+def _scan(
+    segment: _Segment,
+    query: np.ndarray,
+    list_order: np.ndarray,
+    eligible: np.ndarray | None,
+    top_k: int,
+    nprobe: int,
+) -> list[_Hit]:
+    # Probe the nprobe nearest lists, then keep going while they hold fewer
+    # than top_k usable rows, so searches limited to a few pages still fill top_k.
+    ranges: list[np.ndarray] = []
+    found = 0
+    for probed, list_id in enumerate(list_order):
+        if probed >= nprobe and found >= top_k:
+            break
+        start, end = int(segment.offsets[list_id]), int(segment.offsets[list_id + 1])
+        if start == end:
+            continue
+        rows = np.arange(start, end)
+        if eligible is not None:
+            rows = rows[eligible[start:end]]
+        ranges.append(rows)
+        found += len(rows)
+    if not found or top_k <= 0:
+        return []
+
+    candidates = np.concatenate(ranges)
+    squared = (
+        segment.squared_norms[candidates]
+        - 2.0 * (segment.matrix[candidates] @ query)
+        + float(query @ query)
+    )
+    distances = np.sqrt(np.maximum(squared, 0.0))
+    k = min(top_k, len(candidates))
+    nearest = np.argpartition(distances, k - 1)[:k]
+    nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+    return [
+        (
+            str(segment.chunk_ids[candidates[i]]),
+            float(distances[i]),
+            int(segment.start_pages[candidates[i]]),
+            int(segment.end_pages[candidates[i]]),
+        )
+        for i in nearest
+    ]
+
+
+def _squared_distances(x: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    # ||x||^2 is the same for every centroid, so it is left out of the ranking.
+    return np.einsum("ij,ij->i", centroids, centroids)[None, :] - 2.0 * (
+        x @ centroids.T
+    )
+
+
+def _nearest(x: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    return np.concatenate(
+        [
+            np.argmin(_squared_distances(x[i : i + _ASSIGN_BATCH], centroids), axis=1)
+            for i in range(0, len(x), _ASSIGN_BATCH)
+        ]
+        or [np.empty(0, dtype=np.intp)]
+    )
+
+
+def _kmeans(sample: np.ndarray, nlist: int, rng: np.random.Generator) -> np.ndarray:
+    sample = np.asarray(sample, dtype=np.float32)
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+    for _ in range(KMEANS_ITERATIONS):
+        assignment = _nearest(sample, centroids)
+        counts = np.bincount(assignment, minlength=nlist)
+        filled = counts > 0
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[filled]
+        sums = np.add.reduceat(
+            sample[np.argsort(assignment, kind="stable")], starts, axis=0
+        )
+        centroids[filled] = sums / counts[filled, None]
+        # Re-seed empty cells on random points so every list stays in use.
+        empty = int((~filled).sum())
+        if empty:
+            centroids[~filled] = sample[rng.choice(len(sample), empty)]
+    return centroids
+
+
+def _write_atomically(path: Path, write: Callable[[BinaryIO], None]) -> None:
+    # Written under a temporary name and renamed, so readers in other
+    # processes never map a half-written file.
+    tmp = path.with_name(f"{path.name}.tmp")
+    with tmp.open("wb") as f:
+        write(f)
+    os.replace(tmp, path)
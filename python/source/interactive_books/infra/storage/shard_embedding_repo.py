@@ -0,0 +1,241 @@
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from interactive_books.domain.embedding_vector import EmbeddingVector
+from interactive_books.domain.protocols import (
+    EmbeddingRepository as EmbeddingRepositoryPort,
+)
+from interactive_books.infra.storage.database import Database
+from interactive_books.infra.storage.embedding_repo import (
+    EmbeddingRepository as Vec0EmbeddingRepository,
+)
+
+# Each open shard holds a file handle and page cache; idle ones beyond this
+# are closed, least recently used first.
+DEFAULT_MAX_OPEN = 8
+_SIDECAR_SUFFIXES = ("", "-wal", "-shm")
+
+
+@dataclass(slots=True)
+class _Shard:
+    db: Database
+    users: int = 0
+    tables: set[str] = field(default_factory=set)
+
+
+class ShardPool:
+    """One SQLite file of vectors per book under ``shard_dir``, opened on demand.
+
+    At most ``max_open`` shards stay open; opening another closes the least
+    recently used idle one. A shard in use is never closed, so a wide
+    fan-out may briefly hold more.
+    """
+
+    def __init__(self, shard_dir: Path, *, max_open: int = DEFAULT_MAX_OPEN) -> None:
+        self._shard_dir = shard_dir
+        self._max_open = max_open
+        self._lock = threading.Lock()
+        self._open: OrderedDict[str, _Shard] = OrderedDict()
+
+    def path(self, book_id: str) -> Path:
+        return self._shard_dir / f"{book_id}.db"
+
+    @property
+    def open_count(self) -> int:
+        return len(self._open)
+
+    @contextmanager
+    def checkout(self, book_id: str) -> Iterator[_Shard]:
+        """The book's shard, created if it has none yet."""
+        shard = self._acquire(book_id)
+        with self._held(shard):
+            yield shard
+
+    @contextmanager
+    def checkout_existing(self, book_id: str) -> Iterator[_Shard | None]:
+        """The book's shard, or None when it has none."""
+        shard = self._acquire_existing(book_id)
+        with self._held(shard):
+            yield shard
+
+    def remove(self, book_id: str) -> None:
+        """Close the book's shard and unlink its files, unless it is in use."""
+        with self._lock:
+            shard = self._open.get(book_id)
+            if shard is not None:
+                if shard.users:
+                    return
+                shard.db.close()
+                del self._open[book_id]
+            path = self.path(book_id)
+            for suffix in _SIDECAR_SUFFIXES:
+                path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        with self._lock:
+            for shard in self._open.values():
+                shard.db.close()
+            self._open.clear()
+
+    @contextmanager
+    def _held(self, shard: _Shard | None) -> Iterator[None]:
+        try:
+            yield
+        finally:
+            if shard is not None:
+                with self._lock:
+                    shard.users -= 1
+
+    def _acquire(self, book_id: str) -> _Shard:
+        with self._lock:
+            shard = self._open.get(book_id) or self._open_shard(book_id)
+            return self._use(book_id, shard)
+
+    def _acquire_existing(self, book_id: str) -> _Shard | None:
+        with self._lock:
+            shard = self._open.get(book_id)
+            if shard is None:
+                if not self.path(book_id).exists():
+                    return None
+                shard = self._open_shard(book_id)
+            return self._use(book_id, shard)
+
+    def _open_shard(self, book_id: str) -> _Shard:
+        self._shard_dir.mkdir(parents=True, exist_ok=True)
+        shard = _Shard(Database(self.path(book_id), enable_vec=True))
+        self._open[book_id] = shard
+        return shard
+
+    def _use(self, book_id: str, shard: _Shard) -> _Shard:
+        self._open.move_to_end(book_id)
+        shard.users += 1
+        self._evict_idle()
+        return shard
+
+    def _evict_idle(self) -> None:
+        excess = len(self._open) - self._max_open
+        for book_id in [b for b, s in self._open.items() if s.users == 0][:excess]:
+            self._open.pop(book_id).db.close()
+
+
+class EmbeddingRepository(EmbeddingRepositoryPort):
+    """vec0 tables kept in a per-book shard instead of the library database.
+
+    A book's shard holds every provider's table under ``table_prefix``, so
+    repositories with different prefixes can share one pool. Deleting the
+    last vectors in a shard unlinks its file, returning the space at once,
+    and each book's vectors can be copied or backed up on their own. Books
+    live in separate files, so a library-wide search reads them in parallel.
+    """
+
+    def __init__(self, pool: ShardPool, *, table_prefix: str = "embeddings") -> None:
+        self._pool = pool
+        self._table_prefix = table_prefix
+
+    def ensure_table(self, provider_name: str, dimension: int) -> None:
+        # Tables are created in each shard as it is first used.
+        pass
+
+    def save_embeddings(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        embeddings: list[EmbeddingVector],
+    ) -> None:
+        with self._pool.checkout(book_id) as shard:
+            vec0 = self._vec0(shard, provider_name, dimension)
+            vec0.save_embeddings(provider_name, dimension, book_id, embeddings)
+
+    def delete_by_book(self, provider_name: str, dimension: int, book_id: str) -> None:
+        with self._pool.checkout_existing(book_id) as shard:
+            if shard is None:
+                return
+            vec0 = self._vec0(shard, provider_name, dimension)
+            vec0.delete_by_book(provider_name, dimension, book_id)
+            empty = _is_empty(shard.db)
+        if empty:
+            self._pool.remove(book_id)
+
+    def has_embeddings(self, book_id: str, provider_name: str, dimension: int) -> bool:
+        with self._pool.checkout_existing(book_id) as shard:
+            if shard is None:
+                return False
+            vec0 = self._vec0(shard, provider_name, dimension)
+            return vec0.has_embeddings(book_id, provider_name, dimension)
+
+    def search(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        query_vector: array[float],
+        top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
+    ) -> list[tuple[str, float, int, int]]:
+        return self.search_many(
+            provider_name,
+            dimension,
+            book_id,
+            [query_vector],
+            top_k,
+            max_page=max_page,
+            page_ranges=page_ranges,
+        )[0]
+
+    def search_many(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        query_vectors: list[array[float]],
+        top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
+    ) -> list[list[tuple[str, float, int, int]]]:
+        with self._pool.checkout_existing(book_id) as shard:
+            if shard is None:
+                return [[] for _ in query_vectors]
+            vec0 = self._vec0(shard, provider_name, dimension)
+            return vec0.search_many(
+                provider_name,
+                dimension,
+                book_id,
+                query_vectors,
+                top_k,
+                max_page=max_page,
+                page_ranges=page_ranges,
+            )
+
+    def _vec0(
+        self, shard: _Shard, provider_name: str, dimension: int
+    ) -> Vec0EmbeddingRepository:
+        vec0 = Vec0EmbeddingRepository(shard.db, table_prefix=self._table_prefix)
+        table = f"{self._table_prefix}_{provider_name}_{dimension}"
+        if table not in shard.tables:
+            vec0.ensure_table(provider_name, dimension)
+            shard.tables.add(table)
+        return vec0
+
+
+def _is_empty(db: Database) -> bool:
+    with db.reader() as conn:
+        tables = [
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'table' AND sql LIKE '%USING vec0%'"
+            ).fetchall()
+        ]
+        return not any(
+            conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone()
+            for table in tables
+        )
@@ -0,0 +1,267 @@
+import os
+import threading
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from interactive_books.domain.embedding_vector import EmbeddingVector
+from interactive_books.domain.protocols import (
+    EmbeddingRepository as EmbeddingRepositoryPort,
+)
+from interactive_books.infra.storage._page_mask import page_mask
+from interactive_books.infra.storage.database import Database
+from interactive_books.infra.storage.embedding_repo import (
+    EmbeddingRepository as Vec0EmbeddingRepository,
+)
+
+# Below this many vectors a vec0 scan is already sub-millisecond and a sidecar
+# file is not worth keeping.
+MIN_SNAPSHOT_VECTORS = 256
+# Building a snapshot reads every vector once, about what one vec0 query costs,
+# so it pays off from the second query of a session.
+MIN_SESSION_QUERIES = 2
+
+
+def should_snapshot(vector_count: int, session_queries: int) -> bool:
+    """Plan for a book without a usable snapshot: build one, or stay on vec0."""
+    return (
+        vector_count >= MIN_SNAPSHOT_VECTORS and session_queries >= MIN_SESSION_QUERIES
+    )
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """A book's vectors, tagged with the vec0 fingerprint they were read at."""
+
+    fingerprint: tuple[int, int]
+    matrix: np.ndarray
+    squared_norms: np.ndarray
+    chunk_ids: np.ndarray
+    start_pages: np.ndarray
+    end_pages: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.chunk_ids)
+
+
+class EmbeddingRepository(EmbeddingRepositoryPort):
+    """vec0 storage with an in-memory NumPy index for books searched repeatedly.
+
+    Writes go to vec0 and drop the book's snapshot. Searches run on vec0 until
+    ``should_snapshot`` says a snapshot pays off; then the book's vectors are
+    copied into one contiguous float32 matrix, saved as ``.npy`` sidecars in
+    ``snapshot_dir`` and answered with a matrix product and ``argpartition``.
+    Sidecars are memory-mapped on later opens and are checked against vec0's
+    row count and newest rowid, so re-embedding elsewhere invalidates them.
+    Distances are L2, matching vec0.
+    """
+
+    def __init__(self, db: Database, snapshot_dir: Path) -> None:
+        self._vec0 = Vec0EmbeddingRepository(db)
+        self._snapshot_dir = snapshot_dir
+        self._lock = threading.Lock()
+        self._snapshots: dict[tuple[str, int, str], _Snapshot] = {}
+        self._fingerprints: dict[tuple[str, int, str], tuple[int, int]] = {}
+        self._queries: dict[tuple[str, int, str], int] = {}
+
+    def ensure_table(self, provider_name: str, dimension: int) -> None:
+        self._vec0.ensure_table(provider_name, dimension)
+
+    def save_embeddings(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        embeddings: list[EmbeddingVector],
+    ) -> None:
+        self._vec0.save_embeddings(provider_name, dimension, book_id, embeddings)
+        self._drop_snapshot((provider_name, dimension, book_id))
+
+    def delete_by_book(self, provider_name: str, dimension: int, book_id: str) -> None:
+        self._vec0.delete_by_book(provider_name, dimension, book_id)
+        self._drop_snapshot((provider_name, dimension, book_id))
+
+    def has_embeddings(self, book_id: str, provider_name: str, dimension: int) -> bool:
+        return self._vec0.has_embeddings(book_id, provider_name, dimension)
+
+    def search(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        query_vector: array[float],
+        top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
+    ) -> list[tuple[str, float, int, int]]:
+        return self.search_many(
+            provider_name,
+            dimension,
+            book_id,
+            [query_vector],
+            top_k,
+            max_page=max_page,
+            page_ranges=page_ranges,
+        )[0]
+
+    def search_many(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        query_vectors: list[array[float]],
+        top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
+    ) -> list[list[tuple[str, float, int, int]]]:
+        if not query_vectors:
+            return []
+        snapshot = self._snapshot_for((provider_name, dimension, book_id))
+        if snapshot is None:
+            return self._vec0.search_many(
+                provider_name,
+                dimension,
+                book_id,
+                query_vectors,
+                top_k,
+                max_page=max_page,
+                page_ranges=page_ranges,
+            )
+        return _knn(
+            snapshot,
+            np.asarray(query_vectors, np.float32),
+            top_k,
+            page_mask(snapshot.start_pages, snapshot.end_pages, max_page, page_ranges),
+        )
+
+    def _snapshot_for(self, key: tuple[str, int, str]) -> _Snapshot | None:
+        with self._lock:
+            self._queries[key] = self._queries.get(key, 0) + 1
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None:
+                return snapshot
+
+            fingerprint = self._fingerprints.get(key)
+            if fingerprint is None:
+                fingerprint = self._vec0.fingerprint(*key)
+                self._fingerprints[key] = fingerprint
+
+            snapshot = self._load_sidecars(key)
+            if snapshot is not None and snapshot.fingerprint != fingerprint:
+                snapshot = None
+            if snapshot is None and should_snapshot(fingerprint[0], self._queries[key]):
+                snapshot = self._build_snapshot(key, fingerprint)
+            if snapshot is not None:
+                self._snapshots[key] = snapshot
+            return snapshot
+
+    def _build_snapshot(
+        self, key: tuple[str, int, str], fingerprint: tuple[int, int]
+    ) -> _Snapshot:
+        provider_name, dimension, book_id = key
+        rows = self._vec0.read_book(provider_name, dimension, book_id)
+        matrix = np.frombuffer(
+            b"".join(row[3] for row in rows), dtype=np.float32
+        ).reshape(len(rows), dimension)
+        snapshot = _Snapshot(
+            fingerprint=fingerprint,
+            matrix=matrix,
+            squared_norms=np.einsum("ij,ij->i", matrix, matrix),
+            chunk_ids=np.array([row[0] for row in rows], dtype=np.str_),
+            start_pages=np.array([row[1] for row in rows], dtype=np.int32),
+            end_pages=np.array([row[2] for row in rows], dtype=np.int32),
+        )
+        self._write_sidecars(key, snapshot)
+        return snapshot
+
+    def _paths(self, key: tuple[str, int, str]) -> tuple[Path, Path]:
+        provider_name, dimension, book_id = key
+        stem = self._snapshot_dir / f"embeddings_{provider_name}_{dimension}_{book_id}"
+        return stem.with_suffix(".npy"), stem.with_suffix(".meta.npz")
+
+    def _write_sidecars(self, key: tuple[str, int, str], snapshot: _Snapshot) -> None:
+        matrix_path, meta_path = self._paths(key)
+        self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+        # Written under temporary names and renamed, so readers in other
+        # processes never map a half-written file.
+        for path, write in (
+            (matrix_path, lambda f: np.save(f, snapshot.matrix)),
+            (
+                meta_path,
+                lambda f: np.savez(
+                    f,
+                    fingerprint=np.array(snapshot.fingerprint, dtype=np.int64),
+                    squared_norms=snapshot.squared_norms,
+                    chunk_ids=snapshot.chunk_ids,
+                    start_pages=snapshot.start_pages,
+                    end_pages=snapshot.end_pages,
+                ),
+            ),
+        ):
+            tmp = path.with_name(f"{path.name}.tmp")
+            with tmp.open("wb") as f:
+                write(f)
+            os.replace(tmp, path)
+
+    def _load_sidecars(self, key: tuple[str, int, str]) -> _Snapshot | None:
+        matrix_path, meta_path = self._paths(key)
+        if not matrix_path.exists() or not meta_path.exists():
+            return None
+        try:
+            matrix = np.load(matrix_path, mmap_mode="r", allow_pickle=False)
+            with np.load(meta_path, allow_pickle=False) as meta:
+                count, last_rowid = meta["fingerprint"].tolist()
+                return _Snapshot(
+                    fingerprint=(count, last_rowid),
+                    matrix=matrix,
+                    squared_norms=meta["squared_norms"],
+                    chunk_ids=meta["chunk_ids"],
+                    start_pages=meta["start_pages"],
+                    end_pages=meta["end_pages"],
+                )
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _drop_snapshot(self, key: tuple[str, int, str]) -> None:
+        with self._lock:
+            self._snapshots.pop(key, None)
+            self._fingerprints.pop(key, None)
+            for path in self._paths(key):
+                path.unlink(missing_ok=True)
+
+
+def _knn(
+    snapshot: _Snapshot, queries: np.ndarray, top_k: int, mask: np.ndarray | None
+) -> list[list[tuple[str, float, int, int]]]:
+    rows = np.arange(len(snapshot)) if mask is None else np.flatnonzero(mask)
+    k = min(top_k, len(rows))
+    if k <= 0:
+        return [[] for _ in queries]
+    matrix = snapshot.matrix if mask is None else snapshot.matrix[rows]
+    # ||x - q||^2 = ||x||^2 - 2 x.q + ||q||^2, for every row and query at once.
+    squared = (
+        snapshot.squared_norms[rows][None, :]
+        - 2.0 * (queries @ matrix.T)
+        + np.einsum("ij,ij->i", queries, queries)[:, None]
+    )
+    distances = np.sqrt(np.maximum(squared, 0.0))
+
+    nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+    hits: list[list[tuple[str, float, int, int]]] = []
+    for row, candidates in zip(distances, nearest, strict=True):
+        ordered = candidates[np.argsort(row[candidates], kind="stable")]
+        hits.append(
+            [
+                (
+                    str(snapshot.chunk_ids[rows[i]]),
+                    float(row[i]),
+                    int(snapshot.start_pages[rows[i]]),
+                    int(snapshot.end_pages[rows[i]]),
+                )
+                for i in ordered
+            ]
+        )
+    return hits
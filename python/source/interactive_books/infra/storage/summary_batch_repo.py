@@ -0,0 +1,95 @@
+import sqlite3
+from datetime import datetime, timezone
+
+from interactive_books.domain.protocols import (
+    SummaryBatchRepository as SummaryBatchRepositoryPort,
+)
+from interactive_books.domain.summary_batch import (
+    SummaryBatch,
+    SummaryBatchSection,
+    SummaryBatchStatus,
+)
+from interactive_books.infra.storage.database import Database
+
+_COLUMNS = "id, provider_batch_id, status, created_at"
+_SECTION_COLUMNS = "batch_id, custom_id, book_id, section_index, start_page, end_page"
+
+
+class SummaryBatchRepository(SummaryBatchRepositoryPort):
+    def __init__(self, db: Database) -> None:
+        self._conn = db.connection
+
+    def save(self, batch: SummaryBatch) -> None:
+        self._conn.execute(
+            f"""
+            INSERT INTO summary_batches ({_COLUMNS})
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                status = excluded.status
+            """,
+            (
+                batch.id,
+                batch.provider_batch_id,
+                batch.status.value,
+                batch.created_at.isoformat(),
+            ),
+        )
+        self._conn.executemany(
+            f"""
+            INSERT OR IGNORE INTO summary_batch_sections ({_SECTION_COLUMNS})
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    batch.id,
+                    s.custom_id,
+                    s.book_id,
+                    s.section_index,
+                    s.start_page,
+                    s.end_page,
+                )
+                for s in batch.sections
+            ],
+        )
+        self._conn.commit()
+
+    def get(self, batch_id: str) -> SummaryBatch | None:
+        cursor = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM summary_batches WHERE id = ? OR provider_batch_id = ?",
+            (batch_id, batch_id),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return self._row_to_batch(row)
+
+    def get_pending(self) -> list[SummaryBatch]:
+        cursor = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM summary_batches WHERE status != ? ORDER BY created_at",
+            (SummaryBatchStatus.INGESTED.value,),
+        )
+        return [self._row_to_batch(row) for row in cursor.fetchall()]
+
+    def _row_to_batch(self, row: sqlite3.Row | tuple) -> SummaryBatch:  # type: ignore[type-arg]
+        cursor = self._conn.execute(
+            f"SELECT {_SECTION_COLUMNS} FROM summary_batch_sections "
+            "WHERE batch_id = ? ORDER BY book_id, section_index",
+            (row[0],),
+        )
+        sections = [
+            SummaryBatchSection(
+                custom_id=s[1],
+                book_id=s[2],
+                section_index=s[3],
+                start_page=s[4],
+                end_page=s[5],
+            )
+            for s in cursor.fetchall()
+        ]
+        return SummaryBatch(
+            id=row[0],
+            provider_batch_id=row[1],
+            sections=sections,
+            status=SummaryBatchStatus(row[2]),
+            created_at=datetime.fromisoformat(row[3]).replace(tzinfo=timezone.utc),
+        )
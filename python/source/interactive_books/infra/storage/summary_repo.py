@@ -2,7 +2,9 @@ import json
 import sqlite3
 from datetime import datetime, timezone
 
-from interactive_books.domain.protocols import SummaryRepository as SummaryRepositoryPort
+from interactive_books.domain.protocols import (
+    SummaryRepository as SummaryRepositoryPort,
+)
 from interactive_books.domain.section_summary import KeyStatement, SectionSummary
 from interactive_books.infra.storage.database import Database
 
@@ -11,6 +13,7 @@ _COLUMNS = "id, book_id, title, start_page, end_page, summary, key_statements, s
 
 class SummaryRepository(SummaryRepositoryPort):
     def __init__(self, db: Database) -> None:
+        self._db = db
         self._conn = db.connection
 
     def save_all(self, book_id: str, summaries: list[SectionSummary]) -> None:
@@ -45,11 +48,12 @@ class SummaryRepository(SummaryRepositoryPort):
         self._conn.commit()
 
     def get_by_book(self, book_id: str) -> list[SectionSummary]:
-        cursor = self._conn.execute(
-            f"SELECT {_COLUMNS} FROM section_summaries WHERE book_id = ? ORDER BY section_index",
-            (book_id,),
-        )
-        return [self._row_to_summary(row) for row in cursor.fetchall()]
+        with self._db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM section_summaries WHERE book_id = ? ORDER BY section_index",
+                (book_id,),
+            ).fetchall()
+        return [self._row_to_summary(row) for row in rows]
 
     def delete_by_book(self, book_id: str) -> None:
         self._conn.execute(
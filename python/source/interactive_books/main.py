@@ -8,28 +8,45 @@ if TYPE_CHECKING:
     from interactive_books.app.conversations import ManageConversationsUseCase
     from interactive_books.domain.conversation import Conversation
     from interactive_books.domain.section_summary import SectionSummary
+    from interactive_books.infra.ollama_client import OllamaClient
+    from interactive_books.infra.storage.shard_embedding_repo import ShardPool
 
 app = typer.Typer()
 
 VERSION = "0.1.0"
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 SCHEMA_DIR = PROJECT_ROOT / "shared" / "schema"
+# The newest migration in SCHEMA_DIR; bump it with every new migration file.
+SCHEMA_VERSION = 7
 PROMPTS_DIR = PROJECT_ROOT / "shared" / "prompts"
 DB_PATH = PROJECT_ROOT / "data" / "books.db"
+SNAPSHOT_DIR = PROJECT_ROOT / "data" / "snapshots"
+ANN_INDEX_DIR = PROJECT_ROOT / "data" / "ann"
+SHARD_DIR = PROJECT_ROOT / "data" / "shards"
 CONTENT_PREVIEW_LENGTH = 200
 
 _verbose: bool = False
 
 
-def _open_db(enable_vec: bool = False):  # type: ignore[no-untyped-def]
+def _open_db():  # type: ignore[no-untyped-def]
+    """The library database, migrated; sqlite-vec loads with the first vector repo."""
     from interactive_books.infra.storage.database import Database
 
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    db = Database(DB_PATH, enable_vec=enable_vec)
-    db.run_migrations(SCHEMA_DIR)
+    db = Database(DB_PATH)
+    db.run_migrations(SCHEMA_DIR, expected_version=SCHEMA_VERSION)
     return db
 
 
+def _close_db(db) -> None:  # type: ignore[no-untyped-def]
+    """Close the library database and any book shards opened alongside it."""
+    global _shards  # noqa: PLW0603
+    if _shards is not None:
+        _shards.close()
+        _shards = None
+    db.close()
+
+
 def _require_env(name: str) -> str:
     value = os.environ.get(name, "")
     if not value:
@@ -38,6 +55,234 @@ def _require_env(name: str) -> str:
     return value
 
 
+def _local_embedding_provider(on_retry=None):  # type: ignore[no-untyped-def]
+    from interactive_books.infra.embeddings.local import EmbeddingProvider
+
+    return EmbeddingProvider()
+
+
+def _ollama_embedding_provider(on_retry=None):  # type: ignore[no-untyped-def]
+    from interactive_books.infra.embeddings import ollama
+
+    return ollama.EmbeddingProvider(
+        _ollama_client(),
+        model=os.environ.get("OLLAMA_EMBED_MODEL", "") or ollama.MODEL,
+    )
+
+
+def _openai_embedding_provider(on_retry=None):  # type: ignore[no-untyped-def]
+    from interactive_books.infra.embeddings.openai import EmbeddingProvider
+
+    return EmbeddingProvider(api_key=_require_env("OPENAI_API_KEY"), on_retry=on_retry)
+
+
+# Factories import their SDKs when called, so only the selected one is loaded.
+_EMBEDDING_PROVIDERS = {
+    "openai": _openai_embedding_provider,
+    "local": _local_embedding_provider,
+    "ollama": _ollama_embedding_provider,
+}
+
+
+def _embedding_provider_name() -> str:
+    name = os.environ.get("EMBEDDING_PROVIDER", "") or "openai"
+    if name not in _EMBEDDING_PROVIDERS:
+        typer.echo(
+            f"Error: Unknown EMBEDDING_PROVIDER '{name}' "
+            "(expected openai, local or ollama)",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    return name
+
+
+def _embedding_provider(on_retry=None):  # type: ignore[no-untyped-def]
+    """The provider named by EMBEDDING_PROVIDER ("openai", "local" or "ollama")."""
+    return _EMBEDDING_PROVIDERS[_embedding_provider_name()](on_retry)
+
+
+def _optional_embedding_provider():  # type: ignore[no-untyped-def]
+    """The embedding provider, or None when OpenAI is selected without
+    OPENAI_API_KEY, for commands that can do without embeddings."""
+    if _embedding_provider_name() == "openai" and not os.environ.get("OPENAI_API_KEY"):
+        return None
+    return _embedding_provider()
+
+
+def _vector_index() -> str:
+    name = os.environ.get("VECTOR_INDEX", "") or "snapshot"
+    if name not in ("snapshot", "ivf", "shards"):
+        typer.echo(
+            f"Error: Unknown VECTOR_INDEX '{name}' (expected snapshot, ivf or shards)",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    return name
+
+
+_shards: "ShardPool | None" = None
+
+
+def _shard_pool() -> "ShardPool":
+    """One pool per process, shared by chunk and section embeddings."""
+    global _shards  # noqa: PLW0603
+    if _shards is None:
+        from interactive_books.infra.storage.shard_embedding_repo import ShardPool
+
+        _shards = ShardPool(SHARD_DIR)
+    return _shards
+
+
+def _embedding_repo(db):  # type: ignore[no-untyped-def]
+    """vec0 storage behind the index named by VECTOR_INDEX.
+
+    "snapshot" (default) keeps per-book NumPy snapshots for repeated searches;
+    "ivf" adds an approximate inverted-file index for large libraries, probing
+    IVF_NPROBE lists per query; "shards" keeps each book's vectors in a file
+    of its own.
+    """
+    name = _vector_index()
+    if name == "shards":
+        from interactive_books.infra.storage import shard_embedding_repo
+
+        return shard_embedding_repo.EmbeddingRepository(_shard_pool())
+    if name == "snapshot":
+        from interactive_books.infra.storage.snapshot_embedding_repo import (
+            EmbeddingRepository,
+        )
+
+        return EmbeddingRepository(db, SNAPSHOT_DIR)
+
+    from interactive_books.infra.storage import ivf_embedding_repo
+
+    nprobe = os.environ.get("IVF_NPROBE", "")
+    if nprobe and (not nprobe.isdigit() or int(nprobe) < 1):
+        typer.echo("Error: IVF_NPROBE must be a positive integer", err=True)
+        raise typer.Exit(code=1)
+    return ivf_embedding_repo.EmbeddingRepository(
+        db,
+        ANN_INDEX_DIR,
+        nprobe=int(nprobe) if nprobe else ivf_embedding_repo.DEFAULT_NPROBE,
+    )
+
+
+def _section_embedding_repo(db, provider=None):  # type: ignore[no-untyped-def]
+    """vec0 tables of embedded section summaries, used to route vector searches.
+
+    With a provider, its table is created so searches can read it. Under
+    VECTOR_INDEX=shards they live in each book's shard.
+    """
+    if _vector_index() == "shards":
+        from interactive_books.infra.storage import shard_embedding_repo
+
+        return shard_embedding_repo.EmbeddingRepository(
+            _shard_pool(), table_prefix="section_embeddings"
+        )
+
+    from interactive_books.infra.storage.embedding_repo import EmbeddingRepository
+
+    repo = EmbeddingRepository(db, table_prefix="section_embeddings")
+    if provider is not None:
+        repo.ensure_table(provider.provider_name, provider.dimension)
+    return repo
+
+
+def _embed_sections(db, book_id: str, provider) -> int:  # type: ignore[no-untyped-def]
+    from interactive_books.app.embed_sections import EmbedSectionsUseCase
+    from interactive_books.infra.storage.book_repo import BookRepository
+    from interactive_books.infra.storage.summary_repo import SummaryRepository
+
+    return EmbedSectionsUseCase(
+        embedding_provider=provider,
+        book_repo=BookRepository(db),
+        summary_repo=SummaryRepository(db),
+        section_embedding_repo=_section_embedding_repo(db),
+    ).execute(book_id)
+
+
+_ollama: "OllamaClient | None" = None
+
+
+def _ollama_client() -> "OllamaClient":
+    """One keep-alive client per process, shared by Ollama chat and embeddings."""
+    global _ollama  # noqa: PLW0603
+    if _ollama is None:
+        from interactive_books.infra.ollama_client import (
+            DEFAULT_BASE_URL,
+            OllamaClient,
+        )
+
+        _ollama = OllamaClient(
+            os.environ.get("OLLAMA_BASE_URL", "") or DEFAULT_BASE_URL
+        )
+    return _ollama
+
+
+def _anthropic_chat_provider():  # type: ignore[no-untyped-def]
+    from interactive_books.infra.llm.anthropic import DEFAULT_ROUTES, ChatProvider
+
+    return ChatProvider(
+        api_key=_require_env("ANTHROPIC_API_KEY"),
+        routes=_chat_model_routes(DEFAULT_ROUTES),
+    )
+
+
+def _ollama_chat_provider():  # type: ignore[no-untyped-def]
+    from interactive_books.infra.llm.ollama import MODEL, ChatProvider, default_routes
+
+    defaults = default_routes(os.environ.get("OLLAMA_MODEL", "") or MODEL)
+    return ChatProvider(_ollama_client(), routes=_chat_model_routes(defaults))
+
+
+_CHAT_PROVIDERS = {
+    "anthropic": _anthropic_chat_provider,
+    "ollama": _ollama_chat_provider,
+}
+
+
+def _chat_provider_name() -> str:
+    name = os.environ.get("CHAT_PROVIDER", "") or "anthropic"
+    if name not in _CHAT_PROVIDERS:
+        typer.echo(
+            f"Error: Unknown CHAT_PROVIDER '{name}' (expected anthropic or ollama)",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    return name
+
+
+def _chat_provider():  # type: ignore[no-untyped-def]
+    """The provider named by CHAT_PROVIDER ("anthropic" or "ollama")."""
+    return _CHAT_PROVIDERS[_chat_provider_name()]()
+
+
+def _chat_model_routes(defaults):  # type: ignore[no-untyped-def]
+    """Per-purpose model overrides from CHAT_MODEL_<PURPOSE> and
+    CHAT_MAX_TOKENS_<PURPOSE>, e.g. CHAT_MODEL_REFORMULATION, applied on top of
+    the provider's ``defaults``."""
+    from interactive_books.domain.model_route import CallPurpose, ModelRoute
+
+    routes: dict[CallPurpose, ModelRoute] = {}
+    for purpose, default in defaults.items():
+        suffix = purpose.name
+        model = os.environ.get(f"CHAT_MODEL_{suffix}", "") or default.model
+        max_tokens_env = os.environ.get(f"CHAT_MAX_TOKENS_{suffix}", "")
+        max_tokens = default.max_tokens
+        if max_tokens_env:
+            try:
+                max_tokens = int(max_tokens_env)
+            except ValueError:
+                max_tokens = 0
+            if max_tokens < 1:
+                typer.echo(
+                    f"Error: CHAT_MAX_TOKENS_{suffix} must be a positive integer",
+                    err=True,
+                )
+                raise typer.Exit(code=1)
+        routes[purpose] = ModelRoute(model=model, max_tokens=max_tokens)
+    return routes
+
+
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
@@ -84,16 +329,17 @@ def ingest(
     if not title:
         title = source.split("/")[-1] if is_url else Path(source).stem
 
-    openai_key = os.environ.get("OPENAI_API_KEY", "")
-    has_embed = bool(openai_key)
-    db = _open_db(enable_vec=has_embed)
+    embedding_provider = _optional_embedding_provider()
+    has_embed = embedding_provider is not None
+    db = _open_db()
     book_repo = BookRepository(db)
     chunk_repo = ChunkRepository(db)
 
     embed_use_case: EmbedBookUseCase | None = None
-    if has_embed:
-        from interactive_books.infra.embeddings.openai import EmbeddingProvider
-        from interactive_books.infra.storage.embedding_repo import EmbeddingRepository
+    if embedding_provider is not None:
+        from interactive_books.infra.storage.answer_cache_repo import (
+            AnswerCacheRepository,
+        )
 
         def _log_embed_progress(
             batch_num: int, total_batches: int, batch_size: int
@@ -103,11 +349,13 @@ def ingest(
             )
 
         embed_use_case = EmbedBookUseCase(
-            embedding_provider=EmbeddingProvider(api_key=openai_key),
+            embedding_provider=embedding_provider,
             book_repo=book_repo,
             chunk_repo=chunk_repo,
-            embedding_repo=EmbeddingRepository(db),
+            embedding_repo=_embedding_repo(db),
             on_progress=_log_embed_progress if _verbose else None,
+            answer_cache_repo=AnswerCacheRepository(db),
+            unit_of_work=db,
         )
 
     use_case = IngestBookUseCase(
@@ -122,6 +370,7 @@ def ingest(
         book_repo=book_repo,
         chunk_repo=chunk_repo,
         embed_use_case=embed_use_case,
+        unit_of_work=db,
     )
 
     try:
@@ -143,19 +392,22 @@ def ingest(
             typer.echo(f"Embedded:    {book.embedding_provider}")
         else:
             typer.echo(
-                "Tip: Set OPENAI_API_KEY to auto-embed, or run 'embed <book-id>' manually."
+                "Tip: Set OPENAI_API_KEY (or EMBEDDING_PROVIDER=local) to auto-embed, "
+                "or run 'embed <book-id>' manually."
             )
     except BookError as e:
         typer.echo(f"Error: {e.message}", err=True)
         raise typer.Exit(code=1)
     finally:
-        db.close()
+        _close_db(db)
 
 
 @app.command()
 def search(
-    book_id: str = typer.Argument(..., help="ID of the book to search"),
-    query: str = typer.Argument(..., help="Search query text"),
+    book_id: str = typer.Argument(
+        ..., help="ID of the book to search (the query, with --all or --book)"
+    ),
+    query: str | None = typer.Argument(None, help="Search query text"),
     top_k: int = typer.Option(5, "--top-k", "-k", help="Number of results to return"),
     page: int | None = typer.Option(
         None, "--page", "-p", help="Temporary page limit (overrides set-page)"
@@ -163,41 +415,120 @@ def search(
     all_pages: bool = typer.Option(
         False, "--all-pages", help="Search all pages, ignoring set-page"
     ),
+    mode: str | None = typer.Option(
+        None,
+        "--mode",
+        "-m",
+        help="hybrid, vector or lexical (default: hybrid, or lexical when "
+        "no embedding provider is configured)",
+    ),
+    all_books: bool = typer.Option(
+        False, "--all", help="Search every book in the library"
+    ),
+    books: list[str] | None = typer.Option(
+        None, "--book", "-b", help="Search this book; repeat for several"
+    ),
+    per_book: int = typer.Option(
+        3, "--per-book", help="Most results from one book (with --all or --book)"
+    ),
 ) -> None:
-    """Search a book's chunks using vector similarity."""
+    """Search a book's chunks by keywords and vector similarity.
+
+    With --all or --book, searches several books at once:
+    ``search --all "surveillance"``.
+    """
     if page is not None and all_pages:
         typer.echo("Error: --page and --all-pages are mutually exclusive.", err=True)
         raise typer.Exit(code=1)
+    library = all_books or bool(books)
+    if all_books and books:
+        typer.echo("Error: --all and --book are mutually exclusive.", err=True)
+        raise typer.Exit(code=1)
+    if library:
+        if query is not None:
+            typer.echo("Error: Give only the query with --all or --book.", err=True)
+            raise typer.Exit(code=1)
+        if page is not None:
+            typer.echo(
+                "Error: --page applies to one book; each book uses its own "
+                "reading position (or --all-pages).",
+                err=True,
+            )
+            raise typer.Exit(code=1)
+        query = book_id
+    elif query is None:
+        typer.echo("Error: Missing argument 'QUERY'.", err=True)
+        raise typer.Exit(code=2)
 
     page_override = 0 if all_pages else page
 
     import time
 
-    from interactive_books.app.search import SearchBooksUseCase
+    from interactive_books.app.search import SearchBooksUseCase, SearchMode
     from interactive_books.domain.errors import BookError
-    from interactive_books.infra.embeddings.openai import EmbeddingProvider
     from interactive_books.infra.storage.book_repo import BookRepository
     from interactive_books.infra.storage.chunk_repo import ChunkRepository
-    from interactive_books.infra.storage.embedding_repo import EmbeddingRepository
 
-    api_key = _require_env("OPENAI_API_KEY")
-    db = _open_db(enable_vec=True)
+    provider = None
+    if mode is None:
+        provider = _optional_embedding_provider()
+        search_mode = SearchMode.HYBRID if provider else SearchMode.LEXICAL
+    else:
+        try:
+            search_mode = SearchMode(mode.lower())
+        except ValueError:
+            typer.echo(
+                f"Error: Unknown search mode '{mode}' "
+                "(expected hybrid, vector or lexical).",
+                err=True,
+            )
+            raise typer.Exit(code=1)
+
+    if search_mode == SearchMode.LEXICAL:
+        provider = None
+    elif provider is None:
+        provider = _embedding_provider()
+    db = _open_db()
+    embedding_repo = None if provider is None else _embedding_repo(db)
 
-    provider = EmbeddingProvider(api_key=api_key)
     use_case = SearchBooksUseCase(
         embedding_provider=provider,
         book_repo=BookRepository(db),
         chunk_repo=ChunkRepository(db),
-        embedding_repo=EmbeddingRepository(db),
+        embedding_repo=embedding_repo,
+        mode=search_mode,
+        section_embedding_repo=(
+            _section_embedding_repo(db, provider) if embedding_repo else None
+        ),
+    )
+    # Lexical and hybrid rankings are reported as higher-is-better scores.
+    score_sign, score_label = (
+        (1, "distance") if search_mode == SearchMode.VECTOR else (-1, "score")
     )
 
     try:
         if _verbose:
-            typer.echo(
-                f"[verbose] Provider: {provider.provider_name}, Dimension: {provider.dimension}"
-            )
+            typer.echo(f"[verbose] Search mode: {search_mode.value}")
+            if provider is not None:
+                typer.echo(
+                    f"[verbose] Provider: {provider.provider_name}, "
+                    f"Dimension: {provider.dimension}"
+                )
         t0 = time.monotonic()
-        results = use_case.execute(book_id, query, top_k=top_k, page_override=page_override)
+        if library:
+            hits = use_case.execute_library(
+                query,
+                top_k=top_k,
+                book_ids=books or None,
+                per_book_limit=per_book,
+                page_override=page_override,
+            )
+            results = [hit.result for hit in hits]
+        else:
+            hits = None
+            results = use_case.execute(
+                book_id, query, top_k=top_k, page_override=page_override
+            )
         elapsed = time.monotonic() - t0
         if _verbose:
             typer.echo(
@@ -207,8 +538,14 @@ def search(
             typer.echo("No results found.")
             raise typer.Exit()
         for i, result in enumerate(results, 1):
+            source = (
+                f"{hits[i - 1].book_title} ({hits[i - 1].book_id}), "
+                if hits is not None
+                else ""
+            )
             typer.echo(
-                f"[{i}] pages {result.start_page}-{result.end_page}  (distance: {result.distance:.4f})"
+                f"[{i}] {source}pages {result.start_page}-{result.end_page}  "
+                f"({score_label}: {score_sign * result.distance:.4f})"
             )
             preview = result.content[:CONTENT_PREVIEW_LENGTH].replace("\n", " ")
             typer.echo(f"    {preview}")
@@ -217,42 +554,70 @@ def search(
         typer.echo(f"Error: {e.message}", err=True)
         raise typer.Exit(code=1)
     finally:
-        db.close()
+        _close_db(db)
 
 
 @app.command()
 def chat(
     book_id: str = typer.Argument(..., help="ID of the book to chat about"),
     no_summary: bool = typer.Option(
-        False, "--no-summary", help="Skip automatic summary display on new conversations"
+        False,
+        "--no-summary",
+        help="Skip automatic summary display on new conversations",
+    ),
+    speculative: bool = typer.Option(
+        False,
+        "--speculative",
+        help="Search the raw message while the model decides on its own query",
+    ),
+    context_budget: int | None = typer.Option(
+        None,
+        "--context-budget",
+        help="Fit history to this many tokens, folding older turns into a summary",
+    ),
+    answer_cache: bool = typer.Option(
+        False,
+        "--answer-cache",
+        help="Reuse stored answers to near-identical opening questions",
+    ),
+    deadline: float | None = typer.Option(
+        None,
+        "--deadline",
+        help="Latency budget per turn in seconds; retrieval is cut back to meet it",
     ),
 ) -> None:
     """Start a conversation about a book."""
 
+    from interactive_books.app.answer_cache import AnswerCache
     from interactive_books.app.chat import ChatWithBookUseCase
     from interactive_books.app.conversations import ManageConversationsUseCase
-    from interactive_books.app.search import SearchBooksUseCase
+    from interactive_books.app.search import SearchBooksUseCase, SearchMode
     from interactive_books.domain.chat_event import (
+        AnswerCacheHitEvent,
         ChatEvent,
+        DegradationEvent,
         TokenUsageEvent,
         ToolInvocationEvent,
         ToolResultEvent,
     )
     from interactive_books.domain.errors import BookError, LLMError
+    from interactive_books.domain.model_route import CallPurpose
+    from interactive_books.domain.protocols import (
+        ConversationContextStrategy as ContextStrategyPort,
+    )
+    from interactive_books.domain.protocols import (
+        RetrievalStrategy as RetrievalStrategyPort,
+    )
     from interactive_books.infra.context.full_history import ConversationContextStrategy
-    from interactive_books.infra.embeddings.openai import EmbeddingProvider
-    from interactive_books.infra.llm.anthropic import ChatProvider
-    from interactive_books.infra.retrieval.tool_use import RetrievalStrategy
     from interactive_books.infra.storage.book_repo import BookRepository
     from interactive_books.infra.storage.chat_message_repo import ChatMessageRepository
     from interactive_books.infra.storage.chunk_repo import ChunkRepository
     from interactive_books.infra.storage.conversation_repo import ConversationRepository
-    from interactive_books.infra.storage.embedding_repo import EmbeddingRepository
     from interactive_books.infra.storage.summary_repo import SummaryRepository
 
-    openai_key = _require_env("OPENAI_API_KEY")
-    anthropic_key = _require_env("ANTHROPIC_API_KEY")
-    db = _open_db(enable_vec=True)
+    embedding_provider = _embedding_provider()
+    chat_provider = _chat_provider()
+    db = _open_db()
 
     try:
         book_repo = BookRepository(db)
@@ -269,7 +634,7 @@ def chat(
         )
 
         conversation = _select_or_create_conversation(manage, book_id)
-        is_new_conversation = not message_repo.get_by_conversation(conversation.id)
+        is_new_conversation = not message_repo.get_recent(conversation.id, 1)
 
         summary_context: str | None = None
         if not no_summary:
@@ -286,8 +651,6 @@ def chat(
         typer.echo(f"Conversation: {conversation.title} ({conversation.id[:8]}...)")
         typer.echo("Type your message (or 'quit' to exit).\n")
 
-        chat_provider = ChatProvider(api_key=anthropic_key)
-
         def _on_event(event: ChatEvent) -> None:
             if isinstance(event, ToolInvocationEvent):
                 typer.echo(f"[verbose] Tool call: {event.tool_name}({event.arguments})")
@@ -299,19 +662,76 @@ def chat(
                     f"[verbose]   → {event.result_count} results ({page_ranges})"
                 )
             elif isinstance(event, TokenUsageEvent):
+                model = f" ({event.model})" if event.model else ""
+                typer.echo(
+                    f"[verbose] Tokens: {event.input_tokens:,} in / "
+                    f"{event.output_tokens:,} out{model}"
+                )
+            elif isinstance(event, DegradationEvent):
+                typer.echo(
+                    f"[verbose] Deadline: {event.kind.value} "
+                    f"({event.remaining_seconds:.1f}s left)"
+                )
+            elif isinstance(event, AnswerCacheHitEvent):
                 typer.echo(
-                    f"[verbose] Tokens: {event.input_tokens:,} in / {event.output_tokens:,} out"
+                    f"[verbose] Answer cache hit: {event.cached_question!r} "
+                    f"(similarity {event.similarity:.3f}, hit {event.hit_count})"
                 )
 
+        context_strategy: ContextStrategyPort = ConversationContextStrategy()
+        if context_budget is not None:
+            from interactive_books.infra.context.rolling_summary import (
+                ConversationContextStrategy as RollingSummaryContextStrategy,
+            )
+            from interactive_books.infra.storage.conversation_summary_repo import (
+                ConversationSummaryRepository,
+            )
+
+            context_strategy = RollingSummaryContextStrategy(
+                chat_provider=chat_provider,
+                summary_repo=ConversationSummaryRepository(db),
+                message_repo=message_repo,
+                prompts_dir=PROMPTS_DIR,
+                token_budget=context_budget,
+            )
+
+        retrieval_strategy: RetrievalStrategyPort
+        if _chat_provider_name() == "ollama":
+            # Local models get passages up front instead of calling tools.
+            from interactive_books.infra.retrieval.always_retrieve import (
+                RetrievalStrategy as AlwaysRetrieveStrategy,
+            )
+
+            retrieval_strategy = AlwaysRetrieveStrategy(
+                PROMPTS_DIR, speculative=speculative
+            )
+        else:
+            from interactive_books.infra.retrieval.tool_use import RetrievalStrategy
+
+            retrieval_strategy = RetrievalStrategy(speculative=speculative)
+
+        cache: AnswerCache | None = None
+        if answer_cache:
+            from interactive_books.infra.storage.answer_cache_repo import (
+                AnswerCacheRepository,
+            )
+
+            cache = AnswerCache(
+                embedding_provider=embedding_provider,
+                repo=AnswerCacheRepository(db),
+            )
+
         chat_use_case = ChatWithBookUseCase(
             chat_provider=chat_provider,
-            retrieval_strategy=RetrievalStrategy(),
-            context_strategy=ConversationContextStrategy(),
+            retrieval_strategy=retrieval_strategy,
+            context_strategy=context_strategy,
             search_use_case=SearchBooksUseCase(
-                embedding_provider=EmbeddingProvider(api_key=openai_key),
+                embedding_provider=embedding_provider,
                 book_repo=book_repo,
                 chunk_repo=ChunkRepository(db),
-                embedding_repo=EmbeddingRepository(db),
+                embedding_repo=_embedding_repo(db),
+                mode=SearchMode.HYBRID,
+                section_embedding_repo=_section_embedding_repo(db, embedding_provider),
             ),
             conversation_repo=conversation_repo,
             message_repo=message_repo,
@@ -319,10 +739,20 @@ def chat(
             prompts_dir=PROMPTS_DIR,
             on_event=_on_event if _verbose else None,
             summary_context=summary_context,
+            answer_cache=cache,
+            turn_deadline_seconds=deadline,
         )
 
         if _verbose:
             typer.echo(f"[verbose] Chat model: {chat_provider.model_name}")
+            for purpose in CallPurpose:
+                route = chat_provider.route_for(purpose)
+                typer.echo(
+                    f"[verbose]   {purpose.value}: {route.model} "
+                    f"(max {route.max_tokens:,} tokens)"
+                )
+
+        session = chat_use_case.open_session(conversation.id)
 
         while True:
             try:
@@ -339,20 +769,20 @@ def chat(
                 continue
 
             try:
-                answer = chat_use_case.execute(conversation.id, user_input)
+                answer = session.send(user_input)
                 typer.echo(f"\nAssistant: {answer}\n")
             except (BookError, LLMError) as e:
                 typer.echo(f"Error: {e.message}", err=True)
     finally:
-        db.close()
+        _close_db(db)
 
 
-def _display_summaries(
-    summaries: list["SectionSummary"], header: str  # noqa: F821
-) -> None:
+def _display_summaries(summaries: list["SectionSummary"], header: str) -> None:
     typer.echo(f"{header}\n")
     for s in summaries:
-        typer.echo(f"  [{s.section_index + 1}] {s.title} (pp.{s.start_page}-{s.end_page})")
+        typer.echo(
+            f"  [{s.section_index + 1}] {s.title} (pp.{s.start_page}-{s.end_page})"
+        )
         typer.echo(f"      {s.summary}")
         for ks in s.key_statements:
             typer.echo(f"        • {ks.statement} (p.{ks.page})")
@@ -417,23 +847,17 @@ def embed(
     """Generate embeddings for a book's chunks."""
     from interactive_books.app.embed import EmbedBookUseCase
     from interactive_books.domain.errors import BookError
-    from interactive_books.infra.embeddings.openai import EmbeddingProvider
+    from interactive_books.infra.storage.answer_cache_repo import AnswerCacheRepository
     from interactive_books.infra.storage.book_repo import BookRepository
     from interactive_books.infra.storage.chunk_repo import ChunkRepository
-    from interactive_books.infra.storage.embedding_repo import EmbeddingRepository
-
-    api_key = _require_env("OPENAI_API_KEY")
-    db = _open_db(enable_vec=True)
 
     def _log_retry(attempt: int, delay: float) -> None:
         typer.echo(
             f"[verbose] Rate limited, retrying in {delay:.1f}s (attempt {attempt})"
         )
 
-    provider = EmbeddingProvider(
-        api_key=api_key,
-        on_retry=_log_retry if _verbose else None,
-    )
+    provider = _embedding_provider(on_retry=_log_retry if _verbose else None)
+    db = _open_db()
     chunk_repo = ChunkRepository(db)
 
     def _log_progress(batch_num: int, total_batches: int, batch_size: int) -> None:
@@ -445,8 +869,10 @@ def embed(
         embedding_provider=provider,
         book_repo=BookRepository(db),
         chunk_repo=chunk_repo,
-        embedding_repo=EmbeddingRepository(db),
+        embedding_repo=_embedding_repo(db),
         on_progress=_log_progress if _verbose else None,
+        answer_cache_repo=AnswerCacheRepository(db),
+        unit_of_work=db,
     )
 
     try:
@@ -457,16 +883,19 @@ def embed(
                 f"[verbose] Provider: {provider.provider_name}, Dimension: {provider.dimension}"
             )
         book = use_case.execute(book_id)
+        section_count = _embed_sections(db, book_id, provider)
         typer.echo(f"Book ID:     {book.id}")
         typer.echo(f"Title:       {book.title}")
         typer.echo(f"Chunks:      {chunk_count}")
+        if section_count:
+            typer.echo(f"Sections:    {section_count} summary vectors")
         typer.echo(f"Provider:    {book.embedding_provider}")
         typer.echo(f"Dimension:   {book.embedding_dimension}")
     except BookError as e:
         typer.echo(f"Error: {e.message}", err=True)
         raise typer.Exit(code=1)
     finally:
-        db.close()
+        _close_db(db)
 
 
 @app.command()
@@ -496,7 +925,7 @@ def books() -> None:
                 f"{s.id:<38} {s.title:<30} {s.status.value:<10} {s.chunk_count:>6} {provider:<12} {s.current_page:>4}"
             )
     finally:
-        db.close()
+        _close_db(db)
 
 
 @app.command()
@@ -530,7 +959,7 @@ def show(
         typer.echo(f"Error: {e.message}", err=True)
         raise typer.Exit(code=1)
     finally:
-        db.close()
+        _close_db(db)
 
 
 @app.command()
@@ -542,9 +971,8 @@ def delete(
     from interactive_books.app.delete_book import DeleteBookUseCase
     from interactive_books.domain.errors import BookError
     from interactive_books.infra.storage.book_repo import BookRepository
-    from interactive_books.infra.storage.embedding_repo import EmbeddingRepository
 
-    db = _open_db(enable_vec=True)
+    db = _open_db()
 
     try:
         book_repo = BookRepository(db)
@@ -558,7 +986,8 @@ def delete(
 
         use_case = DeleteBookUseCase(
             book_repo=book_repo,
-            embedding_repo=EmbeddingRepository(db),
+            embedding_repo=_embedding_repo(db),
+            section_embedding_repo=_section_embedding_repo(db),
         )
         deleted = use_case.execute(book_id)
         typer.echo(f"Deleted: {deleted.title} ({deleted.id})")
@@ -566,7 +995,7 @@ def delete(
         typer.echo(f"Error: {e.message}", err=True)
         raise typer.Exit(code=1)
     finally:
-        db.close()
+        _close_db(db)
 
 
 @app.command(name="search-page")
@@ -597,57 +1026,168 @@ def search_page(
         typer.echo(f"Page {page} — {len(chunks)} chunk(s) from '{book.title}':\n")
         for i, chunk in enumerate(chunks, 1):
             typer.echo(f"[{i}] pages {chunk.start_page}-{chunk.end_page}")
-            typer.echo(f"    {chunk.content[:CONTENT_PREVIEW_LENGTH].replace(chr(10), ' ')}")
+            typer.echo(
+                f"    {chunk.content[:CONTENT_PREVIEW_LENGTH].replace(chr(10), ' ')}"
+            )
             typer.echo()
     except BookError as e:
         typer.echo(f"Error: {e.message}", err=True)
         raise typer.Exit(code=1)
     finally:
-        db.close()
+        _close_db(db)
 
 
 @app.command()
 def summarize(
-    book_id: str = typer.Argument(..., help="ID of the book to summarize"),
+    book_ids: list[str] | None = typer.Argument(
+        None, help="ID(s) of the book(s) to summarize"
+    ),
     regenerate: bool = typer.Option(
         False, "--regenerate", "-r", help="Force re-generation even if cached"
     ),
+    batch: bool = typer.Option(
+        False, "--batch", help="Submit all sections as one discounted batch job"
+    ),
+    batch_id: str | None = typer.Option(
+        None, "--batch-id", help="Resume polling and ingest a submitted batch"
+    ),
+    poll_interval: float = typer.Option(
+        30.0, "--poll-interval", help="Seconds between batch status checks"
+    ),
+    max_wait: float = typer.Option(
+        86400.0,
+        "--max-wait",
+        help="Seconds to wait for a batch before stopping (resume with --batch-id)",
+    ),
 ) -> None:
     """Generate section summaries for a book using an LLM."""
     from interactive_books.app.summarize import SummarizeBookUseCase
     from interactive_books.domain.errors import BookError, LLMError
-    from interactive_books.infra.llm.anthropic import ChatProvider
     from interactive_books.infra.storage.book_repo import BookRepository
     from interactive_books.infra.storage.chunk_repo import ChunkRepository
     from interactive_books.infra.storage.summary_repo import SummaryRepository
 
-    anthropic_key = _require_env("ANTHROPIC_API_KEY")
+    if not book_ids and batch_id is None:
+        typer.echo("Error: Provide at least one book ID or --batch-id.", err=True)
+        raise typer.Exit(code=1)
+
+    # Message Batches are Anthropic-only; per-section calls follow CHAT_PROVIDER.
+    use_batch = batch or batch_id is not None
+    anthropic_key = _require_env("ANTHROPIC_API_KEY") if use_batch else ""
+    chat_provider = None if use_batch else _chat_provider()
+    # Summaries of embedded books are embedded too, to route vector searches.
+    embedding_provider = _optional_embedding_provider()
     db = _open_db()
 
     try:
+        if chat_provider is None:
+            summarized = _summarize_in_batch(
+                db,
+                anthropic_key,
+                book_ids or [],
+                batch_id,
+                regenerate,
+                poll_interval,
+                max_wait,
+            )
+            if embedding_provider is not None:
+                for book_id in summarized:
+                    _embed_sections(db, book_id, embedding_provider)
+            return
+
         def _on_progress(current: int, total: int) -> None:
             typer.echo(f"Summarizing section {current}/{total}...")
 
         use_case = SummarizeBookUseCase(
-            chat_provider=ChatProvider(api_key=anthropic_key),
+            chat_provider=chat_provider,
             book_repo=BookRepository(db),
             chunk_repo=ChunkRepository(db),
             summary_repo=SummaryRepository(db),
             prompts_dir=PROMPTS_DIR,
             on_progress=_on_progress,
         )
-        summaries = use_case.execute(book_id, regenerate=regenerate)
+        for book_id in book_ids or []:
+            summaries = use_case.execute(book_id, regenerate=regenerate)
+            if embedding_provider is not None:
+                _embed_sections(db, book_id, embedding_provider)
 
-        typer.echo()
-        _display_summaries(
-            summaries,
-            f"{len(summaries)} section(s) summarized:",
-        )
+            typer.echo()
+            _display_summaries(
+                summaries,
+                f"{len(summaries)} section(s) summarized:",
+            )
     except (BookError, LLMError) as e:
         typer.echo(f"Error: {e.message}", err=True)
         raise typer.Exit(code=1)
     finally:
-        db.close()
+        _close_db(db)
+
+
+def _summarize_in_batch(  # type: ignore[no-untyped-def]
+    db,
+    anthropic_key: str,
+    book_ids: list[str],
+    batch_id: str | None,
+    regenerate: bool,
+    poll_interval: float,
+    max_wait: float,
+) -> list[str]:
+    """Runs or resumes a summary batch; returns the books it summarized."""
+    from interactive_books.app.summarize_batch import BatchSummarizeBooksUseCase
+    from interactive_books.infra.llm.anthropic import (
+        DEFAULT_ROUTES,
+        BatchChatProvider,
+        ChatProvider,
+    )
+    from interactive_books.infra.storage.book_repo import BookRepository
+    from interactive_books.infra.storage.chunk_repo import ChunkRepository
+    from interactive_books.infra.storage.summary_batch_repo import (
+        SummaryBatchRepository,
+    )
+    from interactive_books.infra.storage.summary_repo import SummaryRepository
+
+    book_repo = BookRepository(db)
+    routes = _chat_model_routes(DEFAULT_ROUTES)
+
+    def _on_poll(polls: int) -> None:
+        if _verbose:
+            typer.echo(f"[verbose] Batch still processing (check {polls})")
+
+    use_case = BatchSummarizeBooksUseCase(
+        batch_provider=BatchChatProvider(api_key=anthropic_key, routes=routes),
+        chat_provider=ChatProvider(api_key=anthropic_key, routes=routes),
+        book_repo=book_repo,
+        chunk_repo=ChunkRepository(db),
+        summary_repo=SummaryRepository(db),
+        batch_repo=SummaryBatchRepository(db),
+        prompts_dir=PROMPTS_DIR,
+        poll_interval=poll_interval,
+        max_wait=max_wait,
+        on_poll=_on_poll,
+    )
+
+    if batch_id is None:
+        submitted = use_case.submit(book_ids, regenerate=regenerate)
+        if submitted is None:
+            typer.echo("All books already summarized (use --regenerate to redo).")
+            return []
+        batch_id = submitted.id
+        typer.echo(
+            f"Submitted batch {submitted.provider_batch_id} "
+            f"({len(submitted.sections)} sections, {len(submitted.book_ids)} book(s))"
+        )
+        typer.echo(f"Resume later with: summarize --batch-id {batch_id}")
+
+    summaries_by_book = use_case.resume(batch_id)
+    for book_id, summaries in summaries_by_book.items():
+        book = book_repo.get(book_id)
+        title = book.title if book else book_id
+        typer.echo()
+        _display_summaries(
+            summaries,
+            f"{title}: {len(summaries)} section(s) summarized:",
+        )
+    return list(summaries_by_book)
 
 
 @app.command(name="set-page")
@@ -676,4 +1216,4 @@ def set_page(
         typer.echo(f"Error: {e.message}", err=True)
         raise typer.Exit(code=1)
     finally:
-        db.close()
+        _close_db(db)
@@ -0,0 +1,133 @@
+from array import array
+
+from interactive_books.app.answer_cache import AnswerCache
+from interactive_books.domain.book import Book
+from interactive_books.domain.embedding_vector import float32_vector
+
+from tests.fakes import FakeAnswerCacheRepository
+
+
+class KeyedEmbeddingProvider:
+    """Embeds each known text to a fixed vector; unknown texts are orthogonal."""
+
+    def __init__(self, vectors: dict[str, list[float]]) -> None:
+        self._vectors = vectors
+        self.call_count = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "keyed"
+
+    @property
+    def dimension(self) -> int:
+        return 3
+
+    def embed(self, texts: list[str]) -> list[array[float]]:
+        self.call_count += 1
+        return [float32_vector(self._vectors.get(t, [0.0, 0.0, 1.0])) for t in texts]
+
+
+_VECTORS = {
+    "Who is O'Brien?": [1.0, 0.0, 0.0],
+    "who is obrien": [0.99, 0.05, 0.0],
+    "What is Room 101?": [0.0, 1.0, 0.0],
+}
+
+
+def _cache(
+    repo: FakeAnswerCacheRepository, **kwargs: int
+) -> tuple[AnswerCache, KeyedEmbeddingProvider]:
+    provider = KeyedEmbeddingProvider(_VECTORS)
+    return AnswerCache(embedding_provider=provider, repo=repo, **kwargs), provider
+
+
+def _book(current_page: int = 0) -> Book:
+    return Book(id="b1", title="1984", current_page=current_page)
+
+
+def _remember(cache: AnswerCache, book: Book, question: str, cited: int = 10) -> None:
+    lookup = cache.lookup(book, question)
+    cache.store(book.id, question, lookup, f"Answer to {question}", cited)
+
+
+class TestAnswerCacheLookup:
+    def test_similar_question_hits(self) -> None:
+        repo = FakeAnswerCacheRepository()
+        cache, _ = _cache(repo)
+        _remember(cache, _book(), "Who is O'Brien?")
+
+        lookup = cache.lookup(_book(), "who is obrien")
+
+        assert lookup.answer is not None
+        assert lookup.answer.answer == "Answer to Who is O'Brien?"
+        assert lookup.similarity > 0.99
+        assert lookup.answer.hit_count == 1
+
+    def test_different_question_misses(self) -> None:
+        repo = FakeAnswerCacheRepository()
+        cache, _ = _cache(repo)
+        _remember(cache, _book(), "Who is O'Brien?")
+
+        assert cache.lookup(_book(), "What is Room 101?").answer is None
+
+    def test_other_reading_bucket_misses(self) -> None:
+        repo = FakeAnswerCacheRepository()
+        cache, _ = _cache(repo)
+        _remember(cache, _book(current_page=30), "Who is O'Brien?", cited=30)
+
+        assert cache.lookup(_book(current_page=80), "who is obrien").answer is None
+
+    def test_answer_citing_later_pages_is_not_served(self) -> None:
+        repo = FakeAnswerCacheRepository()
+        cache, _ = _cache(repo)
+        _remember(cache, _book(current_page=30), "Who is O'Brien?", cited=30)
+
+        assert cache.lookup(_book(current_page=28), "who is obrien").answer is None
+        assert cache.lookup(_book(current_page=30), "who is obrien").answer is not None
+
+    def test_best_of_several_candidates_is_served(self) -> None:
+        repo = FakeAnswerCacheRepository()
+        cache, _ = _cache(repo)
+        _remember(cache, _book(), "What is Room 101?")
+        _remember(cache, _book(), "Who is O'Brien?")
+
+        lookup = cache.lookup(_book(), "who is obrien")
+
+        assert lookup.answer is not None
+        assert lookup.answer.question == "Who is O'Brien?"
+
+    def test_candidates_of_another_dimension_are_skipped(self) -> None:
+        repo = FakeAnswerCacheRepository()
+        cache, _ = _cache(repo)
+        _remember(cache, _book(), "Who is O'Brien?")
+        for answer in repo.answers.values():
+            answer.question_embedding = float32_vector([1.0, 0.0])
+
+        assert cache.lookup(_book(), "who is obrien").answer is None
+
+    def test_lookup_embeds_question_once(self) -> None:
+        cache, provider = _cache(FakeAnswerCacheRepository())
+
+        cache.lookup(_book(), "Who is O'Brien?")
+
+        assert provider.call_count == 1
+
+
+class TestAnswerCacheStore:
+    def test_store_evicts_beyond_book_limit(self) -> None:
+        repo = FakeAnswerCacheRepository()
+        cache, _ = _cache(repo, max_answers_per_book=1)
+
+        _remember(cache, _book(), "Who is O'Brien?")
+        _remember(cache, _book(), "What is Room 101?")
+
+        assert [a.question for a in repo.answers.values()] == ["What is Room 101?"]
+
+    def test_blank_answer_is_not_stored(self) -> None:
+        repo = FakeAnswerCacheRepository()
+        cache, _ = _cache(repo)
+        lookup = cache.lookup(_book(), "Who is O'Brien?")
+
+        cache.store("b1", "Who is O'Brien?", lookup, "  ", 0)
+
+        assert repo.answers == {}
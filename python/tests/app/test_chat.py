@@ -1,17 +1,39 @@
+import threading
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 
 import pytest
-from interactive_books.app.chat import ChatWithBookUseCase
+from interactive_books.app.answer_cache import AnswerCache
+from interactive_books.app.chat import ChatSession, ChatWithBookUseCase
 from interactive_books.domain.book import Book, BookStatus
 from interactive_books.domain.chat import ChatMessage, MessageRole
-from interactive_books.domain.chat_event import ChatEvent
+from interactive_books.domain.chat_event import (
+    AnswerCacheHitEvent,
+    ChatEvent,
+    DegradationEvent,
+    DegradationKind,
+    ToolResultEvent,
+)
 from interactive_books.domain.conversation import Conversation
+from interactive_books.domain.deadline import Deadline
 from interactive_books.domain.errors import BookError, BookErrorCode
+from interactive_books.domain.model_route import CallPurpose
+from interactive_books.domain.passage_reference import PassageReference
 from interactive_books.domain.prompt_message import PromptMessage
 from interactive_books.domain.search_result import SearchResult
-from interactive_books.domain.tool import ChatResponse, ToolDefinition, ToolResult
+from interactive_books.domain.tool import (
+    ChatResponse,
+    ToolDefinition,
+    ToolInvocation,
+    ToolResult,
+)
+from interactive_books.infra.retrieval.tool_use import (
+    RetrievalStrategy as ToolUseRetrievalStrategy,
+)
+
+from tests.fakes import FakeAnswerCacheRepository, FakeEmbeddingProvider
 
 # ── Fakes ────────────────────────────────────────────────────────
 
@@ -36,16 +58,35 @@ class FakeConversationRepository:
 class FakeChatMessageRepository:
     def __init__(self) -> None:
         self._store: list[ChatMessage] = []
+        self.save_many_calls = 0
+        self.get_recent_calls = 0
 
     def save(self, message: ChatMessage) -> None:
         self._store.append(message)
 
+    def save_many(self, messages: list[ChatMessage]) -> None:
+        self.save_many_calls += 1
+        self._store.extend(messages)
+
     def get_by_conversation(self, conversation_id: str) -> list[ChatMessage]:
         return [m for m in self._store if m.conversation_id == conversation_id]
 
+    def get_recent(self, conversation_id: str, limit: int) -> list[ChatMessage]:
+        self.get_recent_calls += 1
+        return self.get_by_conversation(conversation_id)[-limit:]
+
     def delete_by_conversation(self, conversation_id: str) -> None:
         self._store = [m for m in self._store if m.conversation_id != conversation_id]
 
+    def get_after(
+        self, conversation_id: str, created_at: datetime, message_id: str
+    ) -> list[ChatMessage]:
+        return [
+            m
+            for m in self.get_by_conversation(conversation_id)
+            if (m.created_at, m.id) > (created_at, message_id)
+        ]
+
 
 class FakeBookRepository:
     def __init__(self) -> None:
@@ -68,28 +109,65 @@ class FakeSearchBooksUseCase:
     def __init__(self, results: list[SearchResult] | None = None) -> None:
         self._results = results or []
         self.last_query: str | None = None
+        self.last_queries: list[str] | None = None
+        self.execute_calls = 0
+        self.last_top_k: int | None = None
+        self.last_phrase: str | None = None
 
     def execute(self, book_id: str, query: str, top_k: int = 5) -> list[SearchResult]:
         self.last_query = query
+        self.last_top_k = top_k
+        self.execute_calls += 1
         return self._results
 
+    def execute_many(
+        self, book_id: str, queries: list[str], top_k: int = 5
+    ) -> list[list[SearchResult]]:
+        self.last_queries = list(queries)
+        return [self._results for _ in queries]
+
+    def find_quote(self, book_id: str, phrase: str) -> list[SearchResult]:
+        self.last_phrase = phrase
+        return self._results
+
+
+class BlockingSearchBooksUseCase(FakeSearchBooksUseCase):
+    """Holds each search until ``release`` is set, like a slow worker thread."""
+
+    def __init__(self, results: list[SearchResult] | None = None) -> None:
+        super().__init__(results)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def execute(self, book_id: str, query: str, top_k: int = 5) -> list[SearchResult]:
+        self.started.set()
+        self.release.wait(timeout=5)
+        return super().execute(book_id, query, top_k)
+
 
 class FakeRetrievalStrategy:
-    """Returns a canned response text and optional intermediate messages."""
+    """Returns a canned response text and optional intermediate messages,
+    emitting any given events on the way."""
 
     def __init__(
         self,
         response_text: str = "Here is my answer.",
         intermediate_messages: list[ChatMessage] | None = None,
+        events: list[ChatEvent] | None = None,
     ) -> None:
         self._response_text = response_text
         self._intermediate = intermediate_messages or []
+        self._events = events or []
         self.last_messages: list[PromptMessage] | None = None
         self.last_tools: list[ToolDefinition] | None = None
         self.last_tool_handlers: dict[str, Callable[[dict[str, object]], ToolResult]] | None = (
             None
         )
         self.last_on_event: Callable[[ChatEvent], None] | None = None
+        self.last_batch_tool_handlers: (
+            dict[str, Callable[[list[dict[str, object]]], list[ToolResult]]] | None
+        ) = None
+        self.last_deadline: Deadline | None = None
 
     def execute(
         self,
@@ -98,29 +176,83 @@ class FakeRetrievalStrategy:
         tools: list[ToolDefinition],
         tool_handlers: dict[str, Callable[[dict[str, object]], ToolResult]],
         on_event: Callable[[ChatEvent], None] | None = None,
+        batch_tool_handlers: (
+            dict[str, Callable[[list[dict[str, object]]], list[ToolResult]]] | None
+        ) = None,
+        deadline: Deadline | None = None,
     ) -> tuple[str, list[ChatMessage]]:
+        self.last_deadline = deadline
         self.last_messages = messages
         self.last_tools = tools
         self.last_tool_handlers = tool_handlers
         self.last_on_event = on_event
+        self.last_batch_tool_handlers = batch_tool_handlers
+        if on_event:
+            for event in self._events:
+                on_event(event)
         return self._response_text, self._intermediate
 
 
 class FakeContextStrategy:
+    history_limit = 100
+
     def build_context(self, history: list[ChatMessage]) -> list[ChatMessage]:
         return history
 
 
+class ScriptedChatProvider:
+    """Replies to tool-enabled calls from a script and records their messages."""
+
+    def __init__(self, responses: list[ChatResponse]) -> None:
+        self._responses = list(responses)
+        self.calls: list[list[PromptMessage]] = []
+
+    @property
+    def model_name(self) -> str:
+        return "fake-model"
+
+    def chat(
+        self,
+        messages: list[PromptMessage],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> str:
+        return ""
+
+    def chat_with_tools(
+        self,
+        messages: list[PromptMessage],
+        tools: list[ToolDefinition],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> ChatResponse:
+        self.calls.append(list(messages))
+        return self._responses.pop(0)
+
+
 class FakeChatProvider:
     @property
     def model_name(self) -> str:
         return "fake-model"
 
-    def chat(self, messages: list[PromptMessage]) -> str:
+    def chat(
+        self,
+        messages: list[PromptMessage],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> str:
         return ""
 
     def chat_with_tools(
-        self, messages: list[PromptMessage], tools: list[ToolDefinition]
+        self,
+        messages: list[PromptMessage],
+        tools: list[ToolDefinition],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
     ) -> ChatResponse:
         return ChatResponse(text="")
 
@@ -483,7 +615,7 @@ class TestContextIntegration:
 
 
 class TestEventCallbackPassthrough:
-    def test_on_event_passed_to_retrieval_strategy(
+    def test_retrieval_events_reach_the_callback(
         self,
         prompts_dir: Path,
         conversation_repo: FakeConversationRepository,
@@ -502,10 +634,13 @@ class TestEventCallbackPassthrough:
         )
 
         uc.execute("conv-1", "Hello")
+        assert retrieval.last_on_event is not None
+        event = ToolResultEvent(query="whale", result_count=0, results=[])
+        retrieval.last_on_event(event)
 
-        assert retrieval.last_on_event is callback
+        assert events == [event]
 
-    def test_none_on_event_passed_when_not_provided(
+    def test_events_are_dropped_when_no_callback_is_provided(
         self,
         prompts_dir: Path,
         conversation_repo: FakeConversationRepository,
@@ -521,8 +656,11 @@ class TestEventCallbackPassthrough:
         )
 
         uc.execute("conv-1", "Hello")
+        assert retrieval.last_on_event is not None
 
-        assert retrieval.last_on_event is None
+        retrieval.last_on_event(
+            ToolResultEvent(query="whale", result_count=0, results=[])
+        )
 
 
 # ── Helpers for set_page tests ─────────────────────────────────
@@ -779,3 +917,848 @@ class TestSetPageBookNotFound:
         result = _invoke_set_page(ctx.retrieval, {"page": 10})
 
         assert "not found" in result.formatted_text.lower()
+
+
+# ── Tests: Batched search handler ───────────────────────────────
+
+
+class TestSearchBatchHandler:
+    def test_batch_handler_runs_all_queries_through_one_search(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        result = SearchResult(
+            chunk_id="c1", content="Whale text.", start_page=3, end_page=4, distance=0.1
+        )
+        search = FakeSearchBooksUseCase([result])
+        retrieval = FakeRetrievalStrategy()
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+            retrieval=retrieval,
+            search=search,
+        )
+
+        uc.execute("conv-1", "Compare")
+
+        assert retrieval.last_batch_tool_handlers is not None
+        batch_handler = retrieval.last_batch_tool_handlers["search_book"]
+        tool_results = batch_handler([{"query": "whales"}, {"query": "ships"}])
+
+        assert search.last_queries == ["whales", "ships"]
+        assert [r.query for r in tool_results] == ["whales", "ships"]
+        assert "[Pages 3-4]" in tool_results[0].formatted_text
+        assert "already provided" in tool_results[1].formatted_text.lower()
+
+
+# ── Tests: Chat session ──────────────────────────────────────────
+
+
+class TestChatSession:
+    def test_loads_history_once_across_turns(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+        )
+
+        session = uc.open_session("conv-1")
+        session.send("First")
+        session.send("Second")
+
+        assert message_repo.get_recent_calls == 1
+
+    def test_each_turn_is_saved_in_one_write(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        tool_msg = ChatMessage(
+            id="tool-1",
+            conversation_id="",
+            role=MessageRole.TOOL_RESULT,
+            content="[Pages 1-2]: text",
+        )
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+            retrieval=FakeRetrievalStrategy(intermediate_messages=[tool_msg]),
+        )
+
+        session = uc.open_session("conv-1")
+        session.send("First")
+        session.send("Second")
+
+        assert message_repo.save_many_calls == 2
+        assert [m.role for m in message_repo.get_by_conversation("conv-1")] == [
+            MessageRole.USER,
+            MessageRole.TOOL_RESULT,
+            MessageRole.ASSISTANT,
+        ] * 2
+
+    def test_later_turns_see_earlier_turns(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        retrieval = FakeRetrievalStrategy(response_text="Answer one.")
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+            retrieval=retrieval,
+        )
+
+        session = uc.open_session("conv-1")
+        session.send("Question one")
+        session.send("Question two")
+
+        assert retrieval.last_messages is not None
+        assert [m.content for m in retrieval.last_messages[1:]] == [
+            "Question one",
+            "Answer one.",
+            "Question two",
+        ]
+        assert [m.content for m in session.history][-2:] == [
+            "Question two",
+            "Answer one.",
+        ]
+
+    def test_prompt_is_read_only_when_opening(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        retrieval = FakeRetrievalStrategy()
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+            retrieval=retrieval,
+        )
+
+        session = uc.open_session("conv-1")
+        (prompts_dir / "conversation_system_prompt.md").unlink()
+        session.send("Hello")
+
+        assert retrieval.last_messages is not None
+        assert "reading companion" in retrieval.last_messages[0].content
+
+    def test_tool_handlers_are_built_once(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        retrieval = FakeRetrievalStrategy()
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+            retrieval=retrieval,
+        )
+
+        session = uc.open_session("conv-1")
+        session.send("First")
+        first_handlers = retrieval.last_tool_handlers
+        session.send("Second")
+
+        assert retrieval.last_tool_handlers is first_handlers
+
+    def test_summary_context_only_on_first_turn(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        retrieval = FakeRetrievalStrategy()
+        uc = ChatWithBookUseCase(
+            chat_provider=FakeChatProvider(),
+            retrieval_strategy=retrieval,
+            context_strategy=FakeContextStrategy(),
+            search_use_case=FakeSearchBooksUseCase(),  # type: ignore[arg-type]
+            conversation_repo=conversation_repo,  # type: ignore[arg-type]
+            message_repo=message_repo,  # type: ignore[arg-type]
+            book_repo=FakeBookRepository(),  # type: ignore[arg-type]
+            prompts_dir=prompts_dir,
+            summary_context="Section: Opening",
+        )
+
+        session = uc.open_session("conv-1")
+        session.send("First")
+        assert retrieval.last_messages is not None
+        assert "Book structure overview" in retrieval.last_messages[0].content
+
+        session.send("Second")
+        assert "Book structure overview" not in retrieval.last_messages[0].content
+
+    def test_history_is_capped_at_context_limit(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        context = FakeContextStrategy()
+        context.history_limit = 3
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+            context=context,
+        )
+
+        session = uc.open_session("conv-1")
+        for i in range(3):
+            session.send(f"Question {i}")
+
+        assert len(session.history) == 3
+        assert session.history[-2].content == "Question 2"
+
+    def test_open_session_unknown_conversation_raises(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+        )
+
+        with pytest.raises(BookError) as exc_info:
+            uc.open_session("missing")
+
+        assert exc_info.value.code == BookErrorCode.NOT_FOUND
+
+
+# ── Tests: Conversation passage cache ────────────────────────────
+
+
+_WHALE_RESULT = SearchResult(
+    chunk_id="c1", content="Whale text.", start_page=3, end_page=4, distance=0.1
+)
+
+
+class TestConversationPassageCache:
+    def _session(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+        search: FakeSearchBooksUseCase,
+        retrieval: FakeRetrievalStrategy,
+        book_repo: FakeBookRepository | None = None,
+    ) -> ChatSession:
+        _seed_conversation(conversation_repo)
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+            retrieval=retrieval,
+            search=search,
+            book_repo=book_repo,
+        )
+        return uc.open_session("conv-1")
+
+    def test_repeat_hit_becomes_page_reference(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        retrieval = FakeRetrievalStrategy()
+        session = self._session(
+            prompts_dir,
+            conversation_repo,
+            message_repo,
+            FakeSearchBooksUseCase([_WHALE_RESULT]),
+            retrieval,
+        )
+        session.send("Tell me about the whale")
+        assert retrieval.last_tool_handlers is not None
+        handler = retrieval.last_tool_handlers["search_book"]
+
+        assert retrieval.last_on_event is not None
+        first = handler({"query": "whale"})
+        retrieval.last_on_event(
+            ToolResultEvent(query="whale", result_count=1, results=[_WHALE_RESULT])
+        )
+        second = handler({"query": "the harpoon"})
+
+        assert "[Pages 3-4]" in first.formatted_text
+        assert second.formatted_text == (
+            "Already provided earlier in this turn, see pages 3–4."
+        )
+        assert second.results == []
+
+    def test_hits_that_never_reached_the_model_are_searched_again(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        retrieval = FakeRetrievalStrategy()
+        session = self._session(
+            prompts_dir,
+            conversation_repo,
+            message_repo,
+            FakeSearchBooksUseCase([_WHALE_RESULT]),
+            retrieval,
+        )
+        session.send("Tell me about the whale")
+        assert retrieval.last_tool_handlers is not None
+        handler = retrieval.last_tool_handlers["search_book"]
+
+        handler({"query": "whale"})
+        second = handler({"query": "the harpoon"})
+
+        assert "[Pages 3-4]" in second.formatted_text
+
+    def test_passages_from_stored_turns_are_sent_again(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        message_repo.save(
+            ChatMessage(
+                id="tool-0",
+                conversation_id="conv-1",
+                role=MessageRole.TOOL_RESULT,
+                content=PassageReference.from_results("whale", [_WHALE_RESULT])
+                .to_content(),
+            )
+        )
+        retrieval = FakeRetrievalStrategy()
+        session = self._session(
+            prompts_dir,
+            conversation_repo,
+            message_repo,
+            FakeSearchBooksUseCase([_WHALE_RESULT]),
+            retrieval,
+        )
+        session.send("And the whale again?")
+        assert retrieval.last_tool_handlers is not None
+
+        result = retrieval.last_tool_handlers["search_book"]({"query": "whale"})
+
+        assert "[Pages 3-4]" in result.formatted_text
+
+    def test_passages_from_earlier_turns_are_sent_again(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        retrieval = FakeRetrievalStrategy()
+        session = self._session(
+            prompts_dir,
+            conversation_repo,
+            message_repo,
+            FakeSearchBooksUseCase([_WHALE_RESULT]),
+            retrieval,
+        )
+        session.send("Tell me about the whale")
+        assert retrieval.last_on_event is not None
+        retrieval.last_on_event(
+            ToolResultEvent(query="whale", result_count=1, results=[_WHALE_RESULT])
+        )
+        session.send("And the harpoon?")
+        assert retrieval.last_tool_handlers is not None
+
+        result = retrieval.last_tool_handlers["search_book"]({"query": "harpoon"})
+
+        assert "[Pages 3-4]" in result.formatted_text
+
+    def test_similar_query_skips_search(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        search = FakeSearchBooksUseCase([_WHALE_RESULT])
+        retrieval = FakeRetrievalStrategy()
+        session = self._session(
+            prompts_dir, conversation_repo, message_repo, search, retrieval
+        )
+        session.send("Hello")
+        assert retrieval.last_tool_handlers is not None
+        handler = retrieval.last_tool_handlers["search_book"]
+
+        handler({"query": "Who is Captain Ahab?"})
+        handler({"query": "captain ahab"})
+
+        assert search.execute_calls == 1
+
+    def test_set_page_clears_query_cache(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        book_repo = FakeBookRepository()
+        book_repo.save(
+            Book(id="book-1", title="Moby Dick", status=BookStatus.READY)
+        )
+        search = FakeSearchBooksUseCase([_WHALE_RESULT])
+        retrieval = FakeRetrievalStrategy()
+        session = self._session(
+            prompts_dir, conversation_repo, message_repo, search, retrieval, book_repo
+        )
+        session.send("Hello")
+        assert retrieval.last_tool_handlers is not None
+        handlers = retrieval.last_tool_handlers
+
+        handlers["search_book"]({"query": "ahab"})
+        handlers["set_page"]({"page": 10})
+        handlers["search_book"]({"query": "ahab"})
+
+        assert search.execute_calls == 2
+
+    def test_search_overtaken_by_set_page_is_not_cached(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        book_repo = FakeBookRepository()
+        book_repo.save(
+            Book(id="book-1", title="Moby Dick", status=BookStatus.READY)
+        )
+        search = BlockingSearchBooksUseCase([_WHALE_RESULT])
+        retrieval = FakeRetrievalStrategy()
+        session = self._session(
+            prompts_dir, conversation_repo, message_repo, search, retrieval, book_repo
+        )
+        session.send("Hello")
+        assert retrieval.last_tool_handlers is not None
+        handlers = retrieval.last_tool_handlers
+
+        speculative = threading.Thread(
+            target=handlers["search_book"], args=({"query": "ahab"},)
+        )
+        speculative.start()
+        assert search.started.wait(timeout=5)
+        handlers["set_page"]({"page": 10})
+        search.release.set()
+        speculative.join(timeout=5)
+        handlers["search_book"]({"query": "ahab"})
+
+        assert search.execute_calls == 2
+
+    def test_discarded_speculative_search_does_not_count_as_provided(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        chat = ScriptedChatProvider(
+            [
+                ChatResponse(
+                    tool_invocations=[
+                        ToolInvocation(
+                            tool_name="search_book",
+                            tool_use_id="tu_1",
+                            arguments={"query": "harpoon ships"},
+                        )
+                    ]
+                ),
+                ChatResponse(text="Done."),
+            ]
+        )
+        uc = ChatWithBookUseCase(
+            chat_provider=chat,
+            retrieval_strategy=ToolUseRetrievalStrategy(speculative=True),
+            context_strategy=FakeContextStrategy(),
+            search_use_case=FakeSearchBooksUseCase([_WHALE_RESULT]),  # type: ignore[arg-type]
+            conversation_repo=conversation_repo,  # type: ignore[arg-type]
+            message_repo=message_repo,  # type: ignore[arg-type]
+            book_repo=FakeBookRepository(),  # type: ignore[arg-type]
+            prompts_dir=prompts_dir,
+        )
+
+        uc.open_session("conv-1").send("Tell me about the whale")
+
+        tool_result = chat.calls[1][-1]
+        assert tool_result.role == "tool_result"
+        assert "Whale text." in tool_result.content
+
+    def test_batch_searches_only_uncached_queries(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        search = FakeSearchBooksUseCase([_WHALE_RESULT])
+        retrieval = FakeRetrievalStrategy()
+        session = self._session(
+            prompts_dir, conversation_repo, message_repo, search, retrieval
+        )
+        session.send("Hello")
+        assert retrieval.last_tool_handlers is not None
+        assert retrieval.last_batch_tool_handlers is not None
+
+        retrieval.last_tool_handlers["search_book"]({"query": "ahab"})
+        retrieval.last_batch_tool_handlers["search_book"](
+            [{"query": "ahab"}, {"query": "ishmael"}]
+        )
+
+        assert search.last_queries == ["ishmael"]
+
+
+# ── Tests: Answer cache ──────────────────────────────────────────
+
+
+class TestAnswerCacheIntegration:
+    def _use_case(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+        retrieval: FakeRetrievalStrategy,
+        answer_repo: FakeAnswerCacheRepository,
+        events: list[ChatEvent] | None = None,
+    ) -> ChatWithBookUseCase:
+        book_repo = FakeBookRepository()
+        book_repo.save(Book(id="book-1", title="1984", status=BookStatus.READY))
+        return ChatWithBookUseCase(
+            chat_provider=FakeChatProvider(),
+            retrieval_strategy=retrieval,
+            context_strategy=FakeContextStrategy(),
+            search_use_case=FakeSearchBooksUseCase(),  # type: ignore[arg-type]
+            conversation_repo=conversation_repo,  # type: ignore[arg-type]
+            message_repo=message_repo,  # type: ignore[arg-type]
+            book_repo=book_repo,  # type: ignore[arg-type]
+            prompts_dir=prompts_dir,
+            on_event=events.append if events is not None else None,
+            answer_cache=AnswerCache(
+                embedding_provider=FakeEmbeddingProvider(), repo=answer_repo
+            ),
+        )
+
+    def test_opening_answer_is_stored_with_cited_pages(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        tool_msg = ChatMessage(
+            id="tool-1",
+            conversation_id="",
+            role=MessageRole.TOOL_RESULT,
+            content=PassageReference(
+                query="o'brien", chunk_ids=("c1", "c2"), pages=((3, 4), (12, 13))
+            ).to_content(),
+        )
+        answer_repo = FakeAnswerCacheRepository()
+        uc = self._use_case(
+            prompts_dir,
+            conversation_repo,
+            message_repo,
+            FakeRetrievalStrategy("He is a Party member.", [tool_msg]),
+            answer_repo,
+        )
+
+        uc.execute("conv-1", "Who is O'Brien?")
+
+        [stored] = answer_repo.answers.values()
+        assert stored.question == "Who is O'Brien?"
+        assert stored.answer == "He is a Party member."
+        assert stored.max_cited_page == 13
+
+    def test_cached_answer_skips_retrieval(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        _seed_conversation(conversation_repo, conv_id="conv-2")
+        answer_repo = FakeAnswerCacheRepository()
+        self._use_case(
+            prompts_dir,
+            conversation_repo,
+            message_repo,
+            FakeRetrievalStrategy("He is a Party member."),
+            answer_repo,
+        ).execute("conv-1", "Who is O'Brien?")
+        retrieval = FakeRetrievalStrategy("Fresh answer.")
+        events: list[ChatEvent] = []
+        uc = self._use_case(
+            prompts_dir, conversation_repo, message_repo, retrieval, answer_repo, events
+        )
+
+        result = uc.execute("conv-2", "Who is O'Brien?")
+
+        assert result == "He is a Party member."
+        assert retrieval.last_messages is None
+        assert [m.role for m in message_repo.get_by_conversation("conv-2")] == [
+            MessageRole.USER,
+            MessageRole.ASSISTANT,
+        ]
+        [event] = events
+        assert isinstance(event, AnswerCacheHitEvent)
+        assert event.hit_count == 1
+
+    def test_follow_up_turns_are_not_cached(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        answer_repo = FakeAnswerCacheRepository()
+        session = self._use_case(
+            prompts_dir,
+            conversation_repo,
+            message_repo,
+            FakeRetrievalStrategy(),
+            answer_repo,
+        ).open_session("conv-1")
+
+        session.send("Who is O'Brien?")
+        session.send("And what does he want?")
+
+        assert len(answer_repo.answers) == 1
+
+    def test_turn_using_other_tools_is_not_cached(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        tool_msg = ChatMessage(
+            id="tool-1",
+            conversation_id="",
+            role=MessageRole.TOOL_RESULT,
+            content="Reading position set to page 40.",
+        )
+        answer_repo = FakeAnswerCacheRepository()
+        uc = self._use_case(
+            prompts_dir,
+            conversation_repo,
+            message_repo,
+            FakeRetrievalStrategy(intermediate_messages=[tool_msg]),
+            answer_repo,
+        )
+
+        uc.execute("conv-1", "I'm on page 40, who is O'Brien?")
+
+        assert answer_repo.answers == {}
+
+    def test_turn_degraded_by_the_deadline_is_not_cached(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        tool_msg = ChatMessage(
+            id="tool-1",
+            conversation_id="",
+            role=MessageRole.TOOL_RESULT,
+            content=PassageReference(
+                query="o'brien", chunk_ids=("c1",), pages=((3, 4),)
+            ).to_content(),
+        )
+        answer_repo = FakeAnswerCacheRepository()
+        uc = self._use_case(
+            prompts_dir,
+            conversation_repo,
+            message_repo,
+            FakeRetrievalStrategy(
+                "He is a Party member.",
+                [tool_msg],
+                events=[
+                    DegradationEvent(
+                        kind=DegradationKind.FORCE_FINAL_ANSWER,
+                        remaining_seconds=0.5,
+                    )
+                ],
+            ),
+            answer_repo,
+        )
+
+        result = uc.execute("conv-1", "Who is O'Brien?")
+
+        assert result == "He is a Party member."
+        assert answer_repo.answers == {}
+
+
+# ── Tests: Turn deadline ─────────────────────────────────────────
+
+
+class TestTurnDeadline:
+    def test_session_passes_fresh_deadline_per_turn(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        retrieval = FakeRetrievalStrategy()
+        uc = ChatWithBookUseCase(
+            chat_provider=FakeChatProvider(),
+            retrieval_strategy=retrieval,
+            context_strategy=FakeContextStrategy(),
+            search_use_case=FakeSearchBooksUseCase(),  # type: ignore[arg-type]
+            conversation_repo=conversation_repo,  # type: ignore[arg-type]
+            message_repo=message_repo,  # type: ignore[arg-type]
+            book_repo=FakeBookRepository(),  # type: ignore[arg-type]
+            prompts_dir=prompts_dir,
+            turn_deadline_seconds=8.0,
+        )
+        session = uc.open_session("conv-1")
+
+        session.send("First")
+        first = retrieval.last_deadline
+        session.send("Second")
+
+        assert first is not None
+        assert first.budget_seconds == 8.0
+        assert retrieval.last_deadline is not first
+
+    def test_no_deadline_by_default(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        retrieval = FakeRetrievalStrategy()
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+            retrieval=retrieval,
+        )
+
+        uc.execute("conv-1", "Hello")
+
+        assert retrieval.last_deadline is None
+
+    def test_search_handler_honors_reduced_top_k(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        results = [
+            SearchResult(
+                chunk_id=f"c{i}",
+                content=f"Passage {i}.",
+                start_page=i * 10,
+                end_page=i * 10,
+                distance=0.1 * i,
+            )
+            for i in range(1, 4)
+        ]
+        search = FakeSearchBooksUseCase(results)
+        retrieval = FakeRetrievalStrategy()
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+            retrieval=retrieval,
+            search=search,
+        )
+        uc.execute("conv-1", "Hello")
+        assert retrieval.last_tool_handlers is not None
+
+        result = retrieval.last_tool_handlers["search_book"](
+            {"query": "whales", "top_k": 2}
+        )
+
+        assert search.last_top_k == 2
+        assert result.result_count == 2
+
+
+# ── Tests: Find Quote Tool ───────────────────────────────────────
+
+
+class TestFindQuoteTool:
+    def test_tool_is_offered_and_returns_matching_passages(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        search = FakeSearchBooksUseCase(
+            [
+                SearchResult(
+                    chunk_id="c1",
+                    content="Call me Ishmael.",
+                    start_page=1,
+                    end_page=1,
+                    distance=0.0,
+                )
+            ]
+        )
+        retrieval = FakeRetrievalStrategy()
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+            retrieval=retrieval,
+            search=search,
+        )
+        uc.execute("conv-1", "Where does it say call me Ishmael?")
+        assert retrieval.last_tools is not None
+        assert "find_quote" in [t.name for t in retrieval.last_tools]
+        assert retrieval.last_tool_handlers is not None
+
+        result = retrieval.last_tool_handlers["find_quote"](
+            {"phrase": "call me Ishmael"}
+        )
+
+        assert search.last_phrase == "call me Ishmael"
+        assert result.result_count == 1
+        assert "Call me Ishmael." in result.formatted_text
+        assert search.execute_calls == 0
+
+    def test_empty_phrase_is_an_error(
+        self,
+        prompts_dir: Path,
+        conversation_repo: FakeConversationRepository,
+        message_repo: FakeChatMessageRepository,
+    ) -> None:
+        _seed_conversation(conversation_repo)
+        retrieval = FakeRetrievalStrategy()
+        uc = _make_use_case(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            prompts_dir=prompts_dir,
+            retrieval=retrieval,
+        )
+        uc.execute("conv-1", "Hello")
+        assert retrieval.last_tool_handlers is not None
+
+        result = retrieval.last_tool_handlers["find_quote"]({"phrase": "  "})
+
+        assert result.formatted_text.startswith("Error:")
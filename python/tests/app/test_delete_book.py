@@ -1,3 +1,5 @@
+from array import array
+
 import pytest
 from interactive_books.app.delete_book import DeleteBookUseCase
 from interactive_books.domain.book import Book, BookStatus
@@ -44,7 +46,7 @@ class FakeEmbeddingRepository:
         provider_name: str,
         dimension: int,
         book_id: str,
-        query_vector: list[float],
+        query_vector: array[float],
         top_k: int,
     ) -> list[tuple[str, float, int, int]]:
         return []
@@ -75,6 +77,28 @@ class TestDeleteBookUseCase:
         assert book_repo.get("b1") is None
         assert embedding_repo.deleted == [("openai", 1536, "b1")]
 
+    def test_deletes_section_embeddings(self) -> None:
+        book_repo = FakeBookRepository()
+        section_repo = FakeEmbeddingRepository()
+        book_repo.save(
+            Book(
+                id="b1",
+                title="Test",
+                status=BookStatus.READY,
+                embedding_provider="openai",
+                embedding_dimension=1536,
+            )
+        )
+
+        use_case = DeleteBookUseCase(
+            book_repo=book_repo,  # type: ignore[arg-type]
+            embedding_repo=FakeEmbeddingRepository(),  # type: ignore[arg-type]
+            section_embedding_repo=section_repo,  # type: ignore[arg-type]
+        )
+        use_case.execute("b1")
+
+        assert section_repo.deleted == [("openai", 1536, "b1")]
+
     def test_deletes_book_without_embeddings(self) -> None:
         book_repo = FakeBookRepository()
         embedding_repo = FakeEmbeddingRepository()
@@ -1,13 +1,17 @@
+from array import array
+
 import pytest
 from interactive_books.app.embed import EmbedBookUseCase
 from interactive_books.domain.book import Book, BookStatus
 from interactive_books.domain.chunk import Chunk
 from interactive_books.domain.errors import BookError, BookErrorCode
 from tests.fakes import (
+    FakeAnswerCacheRepository,
     FakeBookRepository,
     FakeChunkRepository,
     FakeEmbeddingProvider,
     FakeEmbeddingRepository,
+    FakeUnitOfWork,
 )
 
 
@@ -20,7 +24,7 @@ class FailingEmbeddingProvider:
     def dimension(self) -> int:
         return 4
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
+    def embed(self, texts: list[str]) -> list[array[float]]:
         raise BookError(BookErrorCode.EMBEDDING_FAILED, "API exploded")
 
 
@@ -52,6 +56,7 @@ def _make_use_case(
     embedding_provider: FakeEmbeddingProvider | FailingEmbeddingProvider | None = None,
     embedding_repo: FakeEmbeddingRepository | None = None,
     batch_size: int = 100,
+    unit_of_work: FakeUnitOfWork | None = None,
 ) -> tuple[
     EmbedBookUseCase, FakeBookRepository, FakeChunkRepository, FakeEmbeddingRepository
 ]:
@@ -66,6 +71,7 @@ def _make_use_case(
             chunk_repo=cr,
             embedding_repo=er,
             batch_size=batch_size,
+            unit_of_work=unit_of_work,
         ),
         br,
         cr,
@@ -167,6 +173,24 @@ class TestReEmbed:
         use_case.execute("book-1")
         assert embedding_repo.count_for_book("book-1", "fake", 4) == 3
 
+    def test_re_embed_invalidates_cached_answers(self) -> None:
+        book_repo = FakeBookRepository()
+        chunk_repo = FakeChunkRepository()
+        answer_cache_repo = FakeAnswerCacheRepository()
+        use_case = EmbedBookUseCase(
+            embedding_provider=FakeEmbeddingProvider(),
+            book_repo=book_repo,
+            chunk_repo=chunk_repo,
+            embedding_repo=FakeEmbeddingRepository(),
+            answer_cache_repo=answer_cache_repo,
+        )
+        book_repo.save(_ready_book())
+        chunk_repo.save_chunks("book-1", _chunks())
+
+        use_case.execute("book-1")
+
+        assert answer_cache_repo.deleted_books == ["book-1"]
+
 
 class TestEmbedFailureCleanup:
     def test_api_failure_cleans_up_and_preserves_book_state(self) -> None:
@@ -188,6 +212,34 @@ class TestEmbedFailureCleanup:
         assert not embedding_repo.has_embeddings("book-1", "failing", 4)
 
 
+class TestEmbedBulkLoad:
+    def test_writes_run_in_one_bulk_load(self) -> None:
+        unit_of_work = FakeUnitOfWork()
+        use_case, book_repo, chunk_repo, embedding_repo = _make_use_case(
+            unit_of_work=unit_of_work
+        )
+        book_repo.save(_ready_book())
+        chunk_repo.save_chunks("book-1", _chunks())
+
+        use_case.execute("book-1")
+
+        assert unit_of_work.loads == 1
+        assert embedding_repo.has_embeddings("book-1", "fake", 4)
+
+    def test_provider_failure_never_opens_a_bulk_load(self) -> None:
+        unit_of_work = FakeUnitOfWork()
+        use_case, book_repo, chunk_repo, _ = _make_use_case(
+            embedding_provider=FailingEmbeddingProvider(), unit_of_work=unit_of_work
+        )
+        book_repo.save(_ready_book())
+        chunk_repo.save_chunks("book-1", _chunks())
+
+        with pytest.raises(BookError):
+            use_case.execute("book-1")
+
+        assert unit_of_work.loads == 0
+
+
 class TestEmbedPageRangePropagation:
     def test_page_ranges_propagated_from_chunks_to_embedding_vectors(self) -> None:
         use_case, book_repo, chunk_repo, embedding_repo = _make_use_case()
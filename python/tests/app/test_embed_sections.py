@@ -0,0 +1,113 @@
+import pytest
+from interactive_books.app.embed_sections import EmbedSectionsUseCase
+from interactive_books.domain.book import Book
+from interactive_books.domain.errors import BookError, BookErrorCode
+from interactive_books.domain.section_summary import KeyStatement, SectionSummary
+from tests.fakes import (
+    FakeBookRepository,
+    FakeEmbeddingProvider,
+    FakeEmbeddingRepository,
+    FakeSummaryRepository,
+)
+
+
+def _embedded_book(provider: str = "fake") -> Book:
+    book = Book(id="book-1", title="Test Book")
+    book.embedding_provider = provider
+    book.embedding_dimension = 4
+    return book
+
+
+def _summaries() -> list[SectionSummary]:
+    return [
+        SectionSummary(
+            id="s1",
+            book_id="book-1",
+            title="Departure",
+            start_page=1,
+            end_page=20,
+            summary="Ishmael signs on to the Pequod.",
+            key_statements=[KeyStatement(statement="Call me Ishmael.", page=1)],
+            section_index=0,
+        ),
+        SectionSummary(
+            id="s2",
+            book_id="book-1",
+            title="The Chase",
+            start_page=21,
+            end_page=40,
+            summary="Ahab hunts the white whale.",
+            key_statements=[],
+            section_index=1,
+        ),
+    ]
+
+
+def _make_use_case(
+    book: Book | None = None, summaries: list[SectionSummary] | None = None
+) -> tuple[EmbedSectionsUseCase, FakeEmbeddingProvider, FakeEmbeddingRepository]:
+    book_repo, summary_repo = FakeBookRepository(), FakeSummaryRepository()
+    if book is not None:
+        book_repo.save(book)
+    summary_repo.save_all("book-1", summaries or [])
+    provider, section_repo = FakeEmbeddingProvider(), FakeEmbeddingRepository()
+    use_case = EmbedSectionsUseCase(
+        embedding_provider=provider,
+        book_repo=book_repo,
+        summary_repo=summary_repo,
+        section_embedding_repo=section_repo,
+    )
+    return use_case, provider, section_repo
+
+
+class TestEmbedSections:
+    def test_embeds_summaries_and_key_statements_with_section_pages(self) -> None:
+        use_case, provider, section_repo = _make_use_case(
+            _embedded_book(), _summaries()
+        )
+
+        stored = use_case.execute("book-1")
+
+        assert stored == 3
+        assert provider.call_count == 1
+        assert provider.last_texts == [
+            "Departure\nIshmael signs on to the Pequod.",
+            "Call me Ishmael.",
+            "The Chase\nAhab hunts the white whale.",
+        ]
+        rows = [
+            (ev.chunk_id, ev.start_page, ev.end_page)
+            for _, ev in section_repo.embeddings["fake_4"]
+        ]
+        assert rows == [("s1", 1, 20), ("s1:0", 1, 20), ("s2", 21, 40)]
+
+    def test_replaces_previous_vectors(self) -> None:
+        use_case, _, section_repo = _make_use_case(_embedded_book(), _summaries())
+
+        use_case.execute("book-1")
+        use_case.execute("book-1")
+
+        assert len(section_repo.embeddings["fake_4"]) == 3
+
+    def test_skips_book_embedded_by_another_provider(self) -> None:
+        use_case, provider, section_repo = _make_use_case(
+            _embedded_book(provider="openai"), _summaries()
+        )
+
+        assert use_case.execute("book-1") == 0
+        assert provider.call_count == 0
+        assert section_repo.embeddings.get("fake_4", []) == []
+
+    def test_skips_book_without_summaries(self) -> None:
+        use_case, provider, _ = _make_use_case(_embedded_book())
+
+        assert use_case.execute("book-1") == 0
+        assert provider.call_count == 0
+
+    def test_book_not_found_raises(self) -> None:
+        use_case, _, _ = _make_use_case()
+
+        with pytest.raises(BookError) as exc_info:
+            use_case.execute("missing")
+
+        assert exc_info.value.code == BookErrorCode.NOT_FOUND
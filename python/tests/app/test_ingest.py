@@ -1,13 +1,20 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
 from interactive_books.app.ingest import IngestBookUseCase
 from interactive_books.domain.book import Book, BookStatus
 from interactive_books.domain.chunk_data import ChunkData
-from interactive_books.domain.errors import BookError, BookErrorCode
+from interactive_books.domain.errors import (
+    BookError,
+    BookErrorCode,
+    StorageError,
+    StorageErrorCode,
+)
 from interactive_books.domain.page_content import PageContent
 from interactive_books.domain.protocols import BookParser, TextChunker, UrlParser
-from tests.fakes import FakeBookRepository, FakeChunkRepository
+from tests.fakes import FakeBookRepository, FakeChunkRepository, FakeUnitOfWork
 
 
 class FakeEmbedBookUseCase:
@@ -75,6 +82,16 @@ class FailingChunker:
         raise BookError(BookErrorCode.PARSE_FAILED, "Chunking failed")
 
 
+class FailingCommitUnitOfWork(FakeUnitOfWork):
+    """Runs the bulk load, then fails as a commit would."""
+
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        with super().bulk_load():
+            yield
+            raise StorageError(StorageErrorCode.WRITE_FAILED, "Commit failed")
+
+
 def make_use_case(
     *,
     pdf_parser: BookParser | None = None,
@@ -88,6 +105,7 @@ def make_use_case(
     book_repo: FakeBookRepository | None = None,
     chunk_repo: FakeChunkRepository | None = None,
     embed_use_case: FakeEmbedBookUseCase | None = None,
+    unit_of_work: FakeUnitOfWork | None = None,
 ) -> tuple[IngestBookUseCase, FakeBookRepository, FakeChunkRepository]:
     br = book_repo or FakeBookRepository()
     cr = chunk_repo or FakeChunkRepository()
@@ -104,6 +122,7 @@ def make_use_case(
             book_repo=br,
             chunk_repo=cr,
             embed_use_case=embed_use_case,  # type: ignore[arg-type]
+            unit_of_work=unit_of_work,
         ),
         br,
         cr,
@@ -137,9 +156,7 @@ class TestIngestSuccess:
 
 
 class TestIngestEpubSuccess:
-    def test_successful_epub_ingest_returns_ready_book(
-        self, tmp_path: Path
-    ) -> None:
+    def test_successful_epub_ingest_returns_ready_book(self, tmp_path: Path) -> None:
         use_case, _, _ = make_use_case()
         epub_path = tmp_path / "test.epub"
         epub_path.touch()
@@ -158,9 +175,7 @@ class TestIngestEpubSuccess:
 
 
 class TestIngestDocxSuccess:
-    def test_successful_docx_ingest_returns_ready_book(
-        self, tmp_path: Path
-    ) -> None:
+    def test_successful_docx_ingest_returns_ready_book(self, tmp_path: Path) -> None:
         use_case, _, _ = make_use_case()
         docx_path = tmp_path / "test.docx"
         docx_path.touch()
@@ -228,6 +243,39 @@ class TestIngestFailures:
         assert books[0].status == BookStatus.FAILED
 
 
+class TestIngestBulkLoad:
+    def test_chunks_and_book_are_written_in_one_bulk_load(self, tmp_path: Path) -> None:
+        unit_of_work = FakeUnitOfWork()
+        use_case, _, chunk_repo = make_use_case(unit_of_work=unit_of_work)
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.touch()
+        book, _ = use_case.execute(pdf_path, "Test Book")
+        assert unit_of_work.loads == 1
+        assert len(chunk_repo.get_by_book(book.id)) == 2
+
+    def test_chunk_failure_never_opens_a_bulk_load(self, tmp_path: Path) -> None:
+        unit_of_work = FakeUnitOfWork()
+        use_case, _, _ = make_use_case(
+            chunker=FailingChunker(), unit_of_work=unit_of_work
+        )
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.touch()
+        with pytest.raises(BookError):
+            use_case.execute(pdf_path, "Bad Book")
+        assert unit_of_work.loads == 0
+
+    def test_failed_commit_marks_the_book_failed(self, tmp_path: Path) -> None:
+        unit_of_work = FailingCommitUnitOfWork()
+        use_case, book_repo, _ = make_use_case(unit_of_work=unit_of_work)
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.touch()
+        with pytest.raises(StorageError):
+            use_case.execute(pdf_path, "Test Book")
+        assert unit_of_work.rolled_back == 1
+        [book] = book_repo.get_all()
+        assert book.status == BookStatus.FAILED
+
+
 class TestIngestChunkAssociation:
     def test_chunks_linked_to_book(self, tmp_path: Path) -> None:
         chunks = [
@@ -305,9 +353,7 @@ class TestAutoEmbed:
 
 
 class TestIngestHtmlSuccess:
-    def test_successful_html_ingest_returns_ready_book(
-        self, tmp_path: Path
-    ) -> None:
+    def test_successful_html_ingest_returns_ready_book(self, tmp_path: Path) -> None:
         use_case, _, _ = make_use_case()
         html_path = tmp_path / "test.html"
         html_path.touch()
@@ -317,9 +363,7 @@ class TestIngestHtmlSuccess:
 
 
 class TestIngestMarkdownSuccess:
-    def test_successful_md_ingest_returns_ready_book(
-        self, tmp_path: Path
-    ) -> None:
+    def test_successful_md_ingest_returns_ready_book(self, tmp_path: Path) -> None:
         use_case, _, _ = make_use_case()
         md_path = tmp_path / "test.md"
         md_path.touch()
@@ -331,9 +375,7 @@ class TestIngestMarkdownSuccess:
 class TestIngestUrlSuccess:
     def test_successful_url_ingest_returns_ready_book(self) -> None:
         use_case, _, _ = make_use_case()
-        book, embed_error = use_case.execute(
-            "https://example.com/page", "URL Book"
-        )
+        book, embed_error = use_case.execute("https://example.com/page", "URL Book")
         assert book.status == BookStatus.READY
         assert embed_error is None
 
@@ -11,6 +11,7 @@ when OPENAI_API_KEY is not set).
 """
 
 import os
+from array import array
 from collections.abc import Generator
 from pathlib import Path
 
@@ -18,6 +19,7 @@ import pytest
 from interactive_books.app.embed import EmbedBookUseCase
 from interactive_books.app.ingest import IngestBookUseCase
 from interactive_books.domain.book import BookStatus
+from interactive_books.domain.embedding_vector import float32_vector
 from interactive_books.domain.page_content import PageContent
 from interactive_books.infra.chunkers.recursive import TextChunker
 from interactive_books.infra.parsers.txt import BookParser as TxtBookParser
@@ -46,9 +48,9 @@ class FakeEmbeddingProvider:
     def dimension(self) -> int:
         return self._dimension
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
+    def embed(self, texts: list[str]) -> list[array[float]]:
         self.call_count += 1
-        return [[0.1] * self._dimension for _ in texts]
+        return [float32_vector([0.1] * self._dimension) for _ in texts]
 
 
 class FailingEmbeddingProvider:
@@ -62,7 +64,7 @@ class FailingEmbeddingProvider:
     def dimension(self) -> int:
         return FAKE_DIMENSION
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
+    def embed(self, texts: list[str]) -> list[array[float]]:
         msg = "API rate limit exceeded"
         raise RuntimeError(msg)
 
@@ -0,0 +1,101 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from interactive_books.app.passage_cache import ConversationPassageCache
+from interactive_books.domain.search_result import SearchResult
+
+
+def _result(chunk_id: str, page: int) -> SearchResult:
+    return SearchResult(
+        chunk_id=chunk_id, content="text", start_page=page, end_page=page, distance=0.1
+    )
+
+
+class TestProvidedPassages:
+    def test_split_new_reports_provided_hits_as_page_ranges(self) -> None:
+        cache = ConversationPassageCache()
+        cache.mark_provided([_result("c1", 3)])
+
+        new, repeated = cache.split_new([_result("c1", 3), _result("c2", 7)])
+
+        assert [r.chunk_id for r in new] == ["c2"]
+        assert repeated == [(3, 3)]
+
+    def test_split_new_does_not_record_hits(self) -> None:
+        cache = ConversationPassageCache()
+        cache.split_new([_result("c1", 3)])
+
+        new, repeated = cache.split_new([_result("c1", 3)])
+
+        assert [r.chunk_id for r in new] == ["c1"]
+        assert repeated == []
+
+    def test_clear_provided(self) -> None:
+        cache = ConversationPassageCache()
+        cache.mark_provided([_result("c1", 3)])
+
+        cache.clear_provided()
+
+        assert cache.split_new([_result("c1", 3)]) == ([_result("c1", 3)], [])
+
+
+class TestQueryCache:
+    def test_lookup_matches_near_identical_queries(self) -> None:
+        cache = ConversationPassageCache()
+        cache.store("Who is Captain Ahab?", [_result("c1", 3)], generation=0)
+
+        hit = cache.lookup("captain ahab")
+
+        assert hit is not None
+        assert hit[0].chunk_id == "c1"
+
+    def test_lookup_misses_different_queries(self) -> None:
+        cache = ConversationPassageCache()
+        cache.store("captain ahab", [_result("c1", 3)], generation=0)
+
+        assert cache.lookup("the white whale") is None
+
+    def test_evicts_least_recently_used_query(self) -> None:
+        cache = ConversationPassageCache(max_queries=2)
+        cache.store("ahab", [], generation=0)
+        cache.store("ishmael", [], generation=0)
+        cache.lookup("ahab")
+        cache.store("queequeg", [], generation=0)
+
+        assert cache.lookup("ishmael") is None
+        assert cache.lookup("ahab") == []
+
+    def test_clear_queries(self) -> None:
+        cache = ConversationPassageCache()
+        cache.store("ahab", [], generation=0)
+
+        cache.clear_queries()
+
+        assert cache.lookup("ahab") is None
+
+    def test_store_from_before_clear_queries_is_dropped(self) -> None:
+        cache = ConversationPassageCache()
+        generation = cache.generation
+
+        cache.clear_queries()
+        cache.store("ahab", [_result("c1", 3)], generation=generation)
+
+        assert cache.lookup("ahab") is None
+
+
+class TestConcurrentUse:
+    def test_lookup_and_store_from_several_threads(self) -> None:
+        cache = ConversationPassageCache(max_queries=4)
+
+        def store() -> None:
+            for i in range(2000):
+                cache.store(f"query {i}", [], generation=cache.generation)
+
+        def lookup() -> None:
+            for i in range(2000):
+                cache.lookup(f"other question {i}")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(f) for f in (store, lookup, store, lookup)]
+
+        for future in futures:
+            future.result()
@@ -1,9 +1,10 @@
 import pytest
-from interactive_books.app.search import SearchBooksUseCase
+from interactive_books.app.search import SearchBooksUseCase, SearchMode
 from interactive_books.domain.book import Book
 from interactive_books.domain.chunk import Chunk
 from interactive_books.domain.errors import BookError, BookErrorCode
 from interactive_books.domain.search_result import SearchResult
+from interactive_books.domain.section_routing import LAST_PAGE
 from tests.fakes import (
     FakeBookRepository,
     FakeChunkRepository,
@@ -90,7 +91,9 @@ class TestSearchSuccess:
         book = _ready_book_with_embeddings()
         book_repo.save(book)
         chunk_repo.save_chunks("book-1", _chunks_with_pages())
-        embedding_repo.set_search_results([("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)])
+        embedding_repo.set_search_results(
+            [("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)]
+        )
 
         results = use_case.execute("book-1", "test query")
 
@@ -99,6 +102,7 @@ class TestSearchSuccess:
         assert results[0].chunk_id == "c1"
         assert results[0].content == "Early content"
         assert results[0].distance == 0.1
+        assert [r.chunk_index for r in results] == [0, 1, 2]
 
     def test_embeds_query_text(self) -> None:
         use_case, book_repo, chunk_repo, provider, embedding_repo = _make_use_case()
@@ -116,13 +120,48 @@ class TestSearchSuccess:
         book = _ready_book_with_embeddings()
         book_repo.save(book)
         chunk_repo.save_chunks("book-1", _chunks_with_pages())
-        embedding_repo.set_search_results([("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)])
+        embedding_repo.set_search_results(
+            [("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)]
+        )
 
         results = use_case.execute("book-1", "query", top_k=2)
 
         assert len(results) <= 2
 
 
+class TestSearchMany:
+    def test_embeds_all_queries_in_one_call(self) -> None:
+        use_case, book_repo, chunk_repo, provider, embedding_repo = _make_use_case()
+        book_repo.save(_ready_book_with_embeddings())
+        chunk_repo.save_chunks("book-1", _chunks_with_pages())
+        embedding_repo.set_search_results([("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50)])
+
+        results = use_case.execute_many("book-1", ["whales", "the sea"])
+
+        assert provider.call_count == 1
+        assert embedding_repo.search_many_calls == 1
+        assert provider.last_texts == ["whales", "the sea"]
+        assert len(results) == 2
+        assert [r.chunk_id for r in results[1]] == ["c1", "c2"]
+
+    def test_applies_page_filter_to_every_query(self) -> None:
+        use_case, book_repo, chunk_repo, _, embedding_repo = _make_use_case()
+        book_repo.save(_ready_book_with_embeddings(current_page=45))
+        chunk_repo.save_chunks("book-1", _chunks_with_pages())
+        embedding_repo.set_search_results([("c3", 0.1, 80, 90), ("c2", 0.5, 40, 50)])
+
+        results = use_case.execute_many("book-1", ["a", "b"])
+
+        assert [[r.chunk_id for r in rs] for rs in results] == [["c2"], ["c2"]]
+
+    def test_empty_queries_returns_empty(self) -> None:
+        use_case, book_repo, _, provider, _ = _make_use_case()
+        book_repo.save(_ready_book_with_embeddings())
+
+        assert use_case.execute_many("book-1", []) == []
+        assert provider.call_count == 0
+
+
 class TestSearchBookNotFound:
     def test_raises_not_found(self) -> None:
         use_case, _, _, _, _ = _make_use_case()
@@ -145,6 +184,30 @@ class TestSearchNoEmbeddings:
         assert exc_info.value.code == BookErrorCode.INVALID_STATE
 
 
+class TestSearchProviderMismatch:
+    def test_raises_when_book_was_embedded_with_another_provider(self) -> None:
+        use_case, book_repo, _, provider, _ = _make_use_case()
+        book = _ready_book_with_embeddings()
+        book.embedding_provider = "local"
+        book_repo.save(book)
+
+        with pytest.raises(BookError) as exc_info:
+            use_case.execute("book-1", "query")
+        assert exc_info.value.code == BookErrorCode.INVALID_STATE
+        assert "re-embed" in exc_info.value.message
+        assert provider.call_count == 0
+
+    def test_raises_when_dimension_differs(self) -> None:
+        use_case, book_repo, _, _, _ = _make_use_case(
+            provider=FakeEmbeddingProvider(dimension=8)
+        )
+        book_repo.save(_ready_book_with_embeddings())
+
+        with pytest.raises(BookError) as exc_info:
+            use_case.execute("book-1", "query")
+        assert exc_info.value.code == BookErrorCode.INVALID_STATE
+
+
 class TestPageFiltering:
     def test_filters_chunks_beyond_current_page(self) -> None:
         use_case, book_repo, chunk_repo, _, embedding_repo = _make_use_case()
@@ -152,7 +215,9 @@ class TestPageFiltering:
         book_repo.save(book)
         chunk_repo.save_chunks("book-1", _chunks_with_pages())
         # All 3 returned from vector search, but c3 starts at page 80
-        embedding_repo.set_search_results([("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)])
+        embedding_repo.set_search_results(
+            [("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)]
+        )
 
         results = use_case.execute("book-1", "query")
 
@@ -160,13 +225,16 @@ class TestPageFiltering:
         assert "c1" in chunk_ids
         assert "c2" in chunk_ids
         assert "c3" not in chunk_ids  # start_page=80 > current_page=50
+        assert embedding_repo.last_search_max_page == 50
 
     def test_no_filtering_when_current_page_is_zero(self) -> None:
         use_case, book_repo, chunk_repo, _, embedding_repo = _make_use_case()
         book = _ready_book_with_embeddings(current_page=0)
         book_repo.save(book)
         chunk_repo.save_chunks("book-1", _chunks_with_pages())
-        embedding_repo.set_search_results([("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)])
+        embedding_repo.set_search_results(
+            [("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)]
+        )
 
         results = use_case.execute("book-1", "query")
 
@@ -201,7 +269,9 @@ class TestPageOverride:
         book = _ready_book_with_embeddings(current_page=0)  # no filtering by default
         book_repo.save(book)
         chunk_repo.save_chunks("book-1", _chunks_with_pages())
-        embedding_repo.set_search_results([("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)])
+        embedding_repo.set_search_results(
+            [("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)]
+        )
 
         results = use_case.execute("book-1", "query", page_override=50)
 
@@ -215,7 +285,9 @@ class TestPageOverride:
         book = _ready_book_with_embeddings(current_page=50)  # filtering active
         book_repo.save(book)
         chunk_repo.save_chunks("book-1", _chunks_with_pages())
-        embedding_repo.set_search_results([("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)])
+        embedding_repo.set_search_results(
+            [("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)]
+        )
 
         results = use_case.execute("book-1", "query", page_override=0)
 
@@ -226,7 +298,9 @@ class TestPageOverride:
         book = _ready_book_with_embeddings(current_page=50)
         book_repo.save(book)
         chunk_repo.save_chunks("book-1", _chunks_with_pages())
-        embedding_repo.set_search_results([("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)])
+        embedding_repo.set_search_results(
+            [("c1", 0.1, 1, 10), ("c2", 0.5, 40, 50), ("c3", 0.9, 80, 90)]
+        )
 
         results = use_case.execute("book-1", "query", page_override=None)
 
@@ -243,3 +317,368 @@ class TestPageOverride:
         use_case.execute("book-1", "query", top_k=5, page_override=50)
 
         assert embedding_repo.last_search_top_k == 15  # 5 * 3, over-fetch active
+
+
+def _quote_chunks(book_id: str = "book-1") -> list[Chunk]:
+    return [
+        Chunk(
+            id="q1",
+            book_id=book_id,
+            content="Call me Ishmael. Some years ago, never mind how long.",
+            start_page=1,
+            end_page=1,
+            chunk_index=0,
+        ),
+        Chunk(
+            id="q2",
+            book_id=book_id,
+            content="The white whale swam ahead of the ship.",
+            start_page=30,
+            end_page=30,
+            chunk_index=1,
+        ),
+        Chunk(
+            id="q3",
+            book_id=book_id,
+            content="Ahab hunted the white whale across every sea.",
+            start_page=60,
+            end_page=60,
+            chunk_index=2,
+        ),
+    ]
+
+
+def _lexical_use_case(
+    book_repo: FakeBookRepository, chunk_repo: FakeChunkRepository
+) -> SearchBooksUseCase:
+    return SearchBooksUseCase(
+        embedding_provider=None,
+        book_repo=book_repo,
+        chunk_repo=chunk_repo,
+        embedding_repo=None,
+        mode=SearchMode.LEXICAL,
+    )
+
+
+class TestLexicalMode:
+    def test_ranks_by_keyword_score_without_embeddings(self) -> None:
+        book_repo, chunk_repo = FakeBookRepository(), FakeChunkRepository()
+        book_repo.save(Book(id="book-1", title="Test Book"))
+        chunk_repo.save_chunks("book-1", _quote_chunks())
+
+        results = _lexical_use_case(book_repo, chunk_repo).execute(
+            "book-1", "Ahab white whale"
+        )
+
+        assert [r.chunk_id for r in results] == ["q3", "q2"]
+        assert results[0].distance < results[1].distance
+
+    def test_applies_reading_position(self) -> None:
+        book_repo, chunk_repo = FakeBookRepository(), FakeChunkRepository()
+        book_repo.save(Book(id="book-1", title="Test Book"))
+        chunk_repo.save_chunks("book-1", _quote_chunks())
+
+        results = _lexical_use_case(book_repo, chunk_repo).execute(
+            "book-1", "white whale", page_override=40
+        )
+
+        assert [r.chunk_id for r in results] == ["q2"]
+
+    def test_vector_mode_without_provider_raises(self) -> None:
+        book_repo, chunk_repo = FakeBookRepository(), FakeChunkRepository()
+        book_repo.save(_ready_book_with_embeddings())
+        use_case = SearchBooksUseCase(
+            embedding_provider=None,
+            book_repo=book_repo,
+            chunk_repo=chunk_repo,
+            embedding_repo=None,
+        )
+
+        with pytest.raises(BookError) as exc_info:
+            use_case.execute("book-1", "query")
+
+        assert exc_info.value.code == BookErrorCode.INVALID_STATE
+
+
+class TestHybridMode:
+    def test_fuses_vector_and_keyword_rankings(self) -> None:
+        book_repo, chunk_repo = FakeBookRepository(), FakeChunkRepository()
+        embedding_repo = FakeEmbeddingRepository()
+        book_repo.save(_ready_book_with_embeddings())
+        chunk_repo.save_chunks("book-1", _quote_chunks())
+        # Vector search misses the exact name; keywords find it.
+        embedding_repo.set_search_results([("q2", 0.2, 30, 30), ("q1", 0.4, 1, 1)])
+        use_case = SearchBooksUseCase(
+            embedding_provider=FakeEmbeddingProvider(),
+            book_repo=book_repo,
+            chunk_repo=chunk_repo,
+            embedding_repo=embedding_repo,
+            mode=SearchMode.HYBRID,
+        )
+
+        results = use_case.execute("book-1", "Ahab whale", top_k=3)
+
+        assert [r.chunk_id for r in results] == ["q2", "q3", "q1"]
+        assert [r.distance for r in results] == sorted(r.distance for r in results)
+
+    def test_fetches_deeper_than_top_k(self) -> None:
+        book_repo, chunk_repo = FakeBookRepository(), FakeChunkRepository()
+        embedding_repo = FakeEmbeddingRepository()
+        book_repo.save(_ready_book_with_embeddings())
+        chunk_repo.save_chunks("book-1", _quote_chunks())
+        use_case = SearchBooksUseCase(
+            embedding_provider=FakeEmbeddingProvider(),
+            book_repo=book_repo,
+            chunk_repo=chunk_repo,
+            embedding_repo=embedding_repo,
+            mode=SearchMode.HYBRID,
+        )
+
+        use_case.execute("book-1", "whale", top_k=2)
+
+        assert embedding_repo.last_search_top_k == 6
+
+
+def _library(
+    *books: Book, mode: SearchMode = SearchMode.VECTOR
+) -> tuple[SearchBooksUseCase, FakeEmbeddingProvider, FakeEmbeddingRepository]:
+    book_repo, chunk_repo = FakeBookRepository(), FakeChunkRepository()
+    provider, embedding_repo = FakeEmbeddingProvider(), FakeEmbeddingRepository()
+    for book in books:
+        book_repo.save(book)
+        chunk_repo.save_chunks(
+            book.id,
+            [
+                Chunk(
+                    id=f"{book.id}-c{i}",
+                    book_id=book.id,
+                    content=f"{book.title} whale passage {i}",
+                    start_page=i * 10 + 1,
+                    end_page=i * 10 + 5,
+                    chunk_index=i,
+                )
+                for i in range(4)
+            ],
+        )
+    use_case = SearchBooksUseCase(
+        embedding_provider=provider,
+        book_repo=book_repo,
+        chunk_repo=chunk_repo,
+        embedding_repo=embedding_repo,
+        mode=mode,
+    )
+    return use_case, provider, embedding_repo
+
+
+def _hits(book_id: str, *distances: float) -> list[tuple[str, float, int, int]]:
+    return [
+        (f"{book_id}-c{i}", distance, i * 10 + 1, i * 10 + 5)
+        for i, distance in enumerate(distances)
+    ]
+
+
+class TestLibrarySearch:
+    def test_merges_books_by_distance_and_embeds_once(self) -> None:
+        use_case, provider, embedding_repo = _library(
+            _ready_book_with_embeddings("a"), _ready_book_with_embeddings("b")
+        )
+        embedding_repo.set_search_results(_hits("a", 0.1, 0.4), book_id="a")
+        embedding_repo.set_search_results(_hits("b", 0.2, 0.3), book_id="b")
+
+        results = use_case.execute_library("surveillance", top_k=3)
+
+        assert provider.call_count == 1
+        assert [(r.book_id, r.result.chunk_id) for r in results] == [
+            ("a", "a-c0"),
+            ("b", "b-c0"),
+            ("b", "b-c1"),
+        ]
+        assert results[0].book_title == "Test Book"
+
+    def test_caps_results_per_book(self) -> None:
+        use_case, _, embedding_repo = _library(
+            _ready_book_with_embeddings("a"), _ready_book_with_embeddings("b")
+        )
+        embedding_repo.set_search_results(_hits("a", 0.1, 0.2, 0.3), book_id="a")
+        embedding_repo.set_search_results(_hits("b", 0.9), book_id="b")
+
+        results = use_case.execute_library("query", top_k=4, per_book_limit=2)
+
+        assert [r.result.chunk_id for r in results] == ["a-c0", "a-c1", "b-c0"]
+
+    def test_applies_each_books_reading_position(self) -> None:
+        use_case, _, embedding_repo = _library(
+            _ready_book_with_embeddings("a", current_page=5),
+            _ready_book_with_embeddings("b"),
+        )
+        embedding_repo.set_search_results(_hits("a", 0.1, 0.2), book_id="a")
+        embedding_repo.set_search_results(_hits("b", 0.3, 0.4), book_id="b")
+
+        results = use_case.execute_library("query", top_k=5)
+
+        assert embedding_repo.max_page_by_book == {"a": 5, "b": 0}
+        assert [r.result.chunk_id for r in results] == ["a-c0", "b-c0", "b-c1"]
+
+    def test_skips_books_embedded_with_another_provider(self) -> None:
+        other = _ready_book_with_embeddings("other")
+        other.embedding_provider = "openai"
+        use_case, _, embedding_repo = _library(
+            _ready_book_with_embeddings("a"), other, Book(id="raw", title="Raw")
+        )
+        embedding_repo.set_search_results(_hits("a", 0.1), book_id="a")
+
+        results = use_case.execute_library("query")
+
+        assert set(embedding_repo.max_page_by_book) == {"a"}
+        assert [r.book_id for r in results] == ["a"]
+
+    def test_searches_only_selected_books(self) -> None:
+        use_case, _, embedding_repo = _library(
+            _ready_book_with_embeddings("a"), _ready_book_with_embeddings("b")
+        )
+        embedding_repo.set_search_results(_hits("a", 0.1), book_id="a")
+        embedding_repo.set_search_results(_hits("b", 0.2), book_id="b")
+
+        results = use_case.execute_library("query", book_ids=["b"])
+
+        assert [r.book_id for r in results] == ["b"]
+
+    def test_selected_book_without_matching_embeddings_raises(self) -> None:
+        use_case, _, _ = _library(
+            _ready_book_with_embeddings("a"), Book(id="raw", title="Raw")
+        )
+
+        with pytest.raises(BookError) as exc_info:
+            use_case.execute_library("query", book_ids=["a", "raw"])
+
+        assert exc_info.value.code == BookErrorCode.INVALID_STATE
+
+    def test_unknown_selected_book_raises_not_found(self) -> None:
+        use_case, _, _ = _library(_ready_book_with_embeddings("a"))
+
+        with pytest.raises(BookError) as exc_info:
+            use_case.execute_library("query", book_ids=["missing"])
+
+        assert exc_info.value.code == BookErrorCode.NOT_FOUND
+
+    def test_lexical_mode_searches_every_book(self) -> None:
+        use_case, provider, _ = _library(
+            Book(id="a", title="Moby Dick"),
+            Book(id="b", title="Leviathan"),
+            mode=SearchMode.LEXICAL,
+        )
+
+        results = use_case.execute_library("Leviathan whale", top_k=2)
+
+        assert provider.call_count == 0
+        assert [r.book_id for r in results] == ["b", "b"]
+
+    def test_empty_library_returns_empty(self) -> None:
+        use_case, provider, _ = _library()
+
+        assert use_case.execute_library("query") == []
+        assert provider.call_count == 0
+
+
+def _routed_use_case(
+    section_hits: list[tuple[str, float, int, int]],
+) -> tuple[SearchBooksUseCase, FakeEmbeddingRepository]:
+    book_repo, chunk_repo = FakeBookRepository(), FakeChunkRepository()
+    embedding_repo, section_repo = FakeEmbeddingRepository(), FakeEmbeddingRepository()
+    book_repo.save(_ready_book_with_embeddings())
+    chunk_repo.save_chunks("book-1", _chunks_with_pages())
+    # Flat KNN prefers the middle of the book.
+    embedding_repo.set_search_results(
+        [("c2", 0.1, 40, 50), ("c1", 0.2, 1, 10), ("c3", 0.3, 80, 90)]
+    )
+    section_repo.set_search_results(section_hits)
+    use_case = SearchBooksUseCase(
+        embedding_provider=FakeEmbeddingProvider(),
+        book_repo=book_repo,
+        chunk_repo=chunk_repo,
+        embedding_repo=embedding_repo,
+        section_embedding_repo=section_repo,
+        routed_sections=1,
+    )
+    return use_case, embedding_repo
+
+
+# The opening section's summary is much closer to the query than the others.
+_CONFIDENT_SECTIONS = [
+    ("s1", 0.1, 1, 30),
+    ("s2", 0.9, 31, 60),
+    ("s3", 0.95, 61, 90),
+]
+
+
+class TestSectionRouting:
+    def test_restricts_chunk_search_to_routed_sections(self) -> None:
+        use_case, embedding_repo = _routed_use_case(_CONFIDENT_SECTIONS)
+
+        results = use_case.execute("book-1", "query", top_k=1)
+
+        assert [r.chunk_id for r in results] == ["c1"]
+        assert embedding_repo.last_search_page_ranges == [
+            (1, 30),
+            (91, LAST_PAGE),
+        ]
+
+    def test_falls_back_to_flat_search_when_sections_hold_too_few(self) -> None:
+        use_case, embedding_repo = _routed_use_case(_CONFIDENT_SECTIONS)
+
+        results = use_case.execute("book-1", "query", top_k=2)
+
+        assert [r.chunk_id for r in results] == ["c2", "c1"]
+        assert embedding_repo.last_search_page_ranges is None
+
+    def test_searches_flat_when_routing_is_not_confident(self) -> None:
+        use_case, embedding_repo = _routed_use_case(
+            [("s1", 0.80, 1, 30), ("s2", 0.81, 31, 60), ("s3", 0.82, 61, 90)]
+        )
+
+        results = use_case.execute("book-1", "query", top_k=1)
+
+        assert [r.chunk_id for r in results] == ["c2"]
+        assert embedding_repo.search_many_calls == 1
+
+    def test_searches_flat_without_section_embeddings(self) -> None:
+        use_case, embedding_repo = _routed_use_case([])
+
+        results = use_case.execute("book-1", "query", top_k=1)
+
+        assert [r.chunk_id for r in results] == ["c2"]
+        assert embedding_repo.last_search_page_ranges is None
+
+
+class TestFindQuote:
+    def test_returns_chunks_with_exact_phrase_in_reading_order(self) -> None:
+        book_repo, chunk_repo = FakeBookRepository(), FakeChunkRepository()
+        book_repo.save(Book(id="book-1", title="Test Book"))
+        chunk_repo.save_chunks("book-1", _quote_chunks())
+
+        results = _lexical_use_case(book_repo, chunk_repo).find_quote(
+            "book-1", "the WHITE whale"
+        )
+
+        assert [r.chunk_id for r in results] == ["q2", "q3"]
+
+    def test_respects_current_page(self) -> None:
+        book_repo, chunk_repo = FakeBookRepository(), FakeChunkRepository()
+        book = Book(id="book-1", title="Test Book")
+        book.set_current_page(45)
+        book_repo.save(book)
+        chunk_repo.save_chunks("book-1", _quote_chunks())
+
+        results = _lexical_use_case(book_repo, chunk_repo).find_quote(
+            "book-1", "white whale"
+        )
+
+        assert [r.chunk_id for r in results] == ["q2"]
+
+    def test_book_not_found_raises(self) -> None:
+        use_case = _lexical_use_case(FakeBookRepository(), FakeChunkRepository())
+
+        with pytest.raises(BookError) as exc_info:
+            use_case.find_quote("missing", "anything")
+
+        assert exc_info.value.code == BookErrorCode.NOT_FOUND
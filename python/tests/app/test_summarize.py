@@ -9,7 +9,9 @@ from interactive_books.app.summarize import (
 )
 from interactive_books.domain.book import Book
 from interactive_books.domain.chunk import Chunk
+from interactive_books.domain.deadline import Deadline
 from interactive_books.domain.errors import BookError, BookErrorCode, LLMError
+from interactive_books.domain.model_route import CallPurpose
 from interactive_books.domain.prompt_message import PromptMessage
 from interactive_books.domain.section_summary import SectionSummary
 from interactive_books.domain.tool import ChatResponse, ToolDefinition
@@ -116,17 +118,30 @@ class FakeChatProvider:
     def __init__(self, responses: list[str]) -> None:
         self._responses = list(responses)
         self.call_count = 0
+        self.purposes: list[CallPurpose] = []
 
     @property
     def model_name(self) -> str:
         return "fake"
 
-    def chat(self, messages: list[PromptMessage]) -> str:
+    def chat(
+        self,
+        messages: list[PromptMessage],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> str:
+        self.purposes.append(purpose)
         self.call_count += 1
         return self._responses.pop(0)
 
     def chat_with_tools(
-        self, messages: list[PromptMessage], tools: list[ToolDefinition]
+        self,
+        messages: list[PromptMessage],
+        tools: list[ToolDefinition],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
     ) -> ChatResponse:
         raise NotImplementedError
 
@@ -324,11 +339,12 @@ class TestSummarizeBookUseCase:
         chunk_repo = FakeChunkRepository()
         chunk_repo.save_chunks("b1", [_chunk("c1", 1, 3)])
 
+        chat = FakeChatProvider([
+            "Not valid JSON at all",
+            _valid_json_response(title="Recovered"),
+        ])
         use_case = SummarizeBookUseCase(
-            chat_provider=FakeChatProvider([
-                "Not valid JSON at all",
-                _valid_json_response(title="Recovered"),
-            ]),
+            chat_provider=chat,
             book_repo=book_repo,
             chunk_repo=chunk_repo,
             summary_repo=FakeSummaryRepository(),
@@ -338,6 +354,7 @@ class TestSummarizeBookUseCase:
 
         assert len(result) == 1
         assert result[0].title == "Recovered"
+        assert chat.purposes == [CallPurpose.SUMMARIZATION] * 2
 
     def test_raises_after_retry_fails(self, prompts_dir: Path) -> None:
         book_repo = FakeBookRepository()
@@ -0,0 +1,288 @@
+import json
+from pathlib import Path
+
+import pytest
+from interactive_books.app.summarize_batch import (
+    DEFAULT_MAX_WAIT,
+    BatchSummarizeBooksUseCase,
+)
+from interactive_books.domain.book import Book
+from interactive_books.domain.chunk import Chunk
+from interactive_books.domain.deadline import Deadline
+from interactive_books.domain.errors import BookError, BookErrorCode
+from interactive_books.domain.model_route import CallPurpose
+from interactive_books.domain.prompt_message import PromptMessage
+from interactive_books.domain.section_summary import SectionSummary
+from interactive_books.domain.summary_batch import SummaryBatch, SummaryBatchStatus
+from interactive_books.domain.tool import ChatResponse, ToolDefinition
+
+from tests.fakes import (
+    FakeBookRepository,
+    FakeChunkRepository,
+    FakeSummaryBatchRepository,
+    FakeSummaryRepository,
+)
+
+
+def _summary_json(title: str) -> str:
+    return json.dumps(
+        {
+            "title": title,
+            "summary": f"Summary of {title}.",
+            "key_statements": [{"statement": f"{title} point.", "page": 1}],
+        }
+    )
+
+
+class FakeBatchChatProvider:
+    def __init__(
+        self, responses: dict[str, str] | None = None, *, polls_before_end: int = 0
+    ) -> None:
+        self._responses = responses
+        self._polls_before_end = polls_before_end
+        self.submitted: dict[str, list[PromptMessage]] = {}
+        self.status_checks = 0
+
+    def submit_batch(self, requests: dict[str, list[PromptMessage]]) -> str:
+        self.submitted = dict(requests)
+        return "msgbatch_1"
+
+    def is_batch_ended(self, batch_id: str) -> bool:
+        self.status_checks += 1
+        return self.status_checks > self._polls_before_end
+
+    def get_batch_results(self, batch_id: str) -> dict[str, str]:
+        if self._responses is not None:
+            return self._responses
+        return {cid: _summary_json(f"Batch {cid}") for cid in self.submitted}
+
+
+class FakeChatProvider:
+    def __init__(self, responses: list[str] | None = None) -> None:
+        self._responses = list(responses or [])
+        self.call_count = 0
+        self.purposes: list[CallPurpose] = []
+
+    @property
+    def model_name(self) -> str:
+        return "fake"
+
+    def chat(
+        self,
+        messages: list[PromptMessage],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> str:
+        self.purposes.append(purpose)
+        self.call_count += 1
+        return self._responses.pop(0)
+
+    def chat_with_tools(
+        self,
+        messages: list[PromptMessage],
+        tools: list[ToolDefinition],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> ChatResponse:
+        raise NotImplementedError
+
+
+@pytest.fixture
+def prompts_dir(tmp_path: Path) -> Path:
+    (tmp_path / "summarization_prompt.md").write_text(
+        "Summarize pages {{start_page}} to {{end_page}}.\n\n{{content}}"
+    )
+    return tmp_path
+
+
+def _seed_book(
+    book_repo: FakeBookRepository,
+    chunk_repo: FakeChunkRepository,
+    book_id: str,
+    page_ranges: list[tuple[int, int]],
+) -> None:
+    book_repo.save(Book(id=book_id, title=f"Book {book_id}"))
+    chunk_repo.save_chunks(
+        book_id,
+        [
+            Chunk(
+                id=f"{book_id}-c{i}",
+                book_id=book_id,
+                content=f"Content {i}.",
+                start_page=start,
+                end_page=end,
+                chunk_index=i,
+            )
+            for i, (start, end) in enumerate(page_ranges)
+        ],
+    )
+
+
+class _Harness:
+    def __init__(
+        self,
+        prompts_dir: Path,
+        batch_provider: FakeBatchChatProvider | None = None,
+        chat_provider: FakeChatProvider | None = None,
+        *,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ) -> None:
+        self.book_repo = FakeBookRepository()
+        self.chunk_repo = FakeChunkRepository()
+        self.summary_repo = FakeSummaryRepository()
+        self.batch_repo = FakeSummaryBatchRepository()
+        self.batch_provider = batch_provider or FakeBatchChatProvider()
+        self.chat_provider = chat_provider or FakeChatProvider()
+        self.sleeps: list[float] = []
+        self.use_case = BatchSummarizeBooksUseCase(
+            batch_provider=self.batch_provider,
+            chat_provider=self.chat_provider,
+            book_repo=self.book_repo,
+            chunk_repo=self.chunk_repo,
+            summary_repo=self.summary_repo,
+            batch_repo=self.batch_repo,
+            prompts_dir=prompts_dir,
+            poll_interval=5.0,
+            max_wait=max_wait,
+            sleep=self.sleeps.append,
+        )
+
+
+class TestSubmit:
+    def test_submits_sections_of_all_books_in_one_batch(
+        self, prompts_dir: Path
+    ) -> None:
+        h = _Harness(prompts_dir)
+        _seed_book(h.book_repo, h.chunk_repo, "b1", [(1, 2), (5, 6)])
+        _seed_book(h.book_repo, h.chunk_repo, "b2", [(1, 3)])
+
+        batch = h.use_case.submit(["b1", "b2"])
+
+        assert batch is not None
+        assert batch.provider_batch_id == "msgbatch_1"
+        assert list(h.batch_provider.submitted) == ["b1-0", "b1-1", "b2-0"]
+        assert "pages 5 to 6" in h.batch_provider.submitted["b1-1"][0].content
+        assert h.batch_repo.get(batch.id) is batch
+
+    def test_skips_books_with_cached_summaries(self, prompts_dir: Path) -> None:
+        h = _Harness(prompts_dir)
+        _seed_book(h.book_repo, h.chunk_repo, "b1", [(1, 2)])
+        h.summary_repo.summaries["b1"] = [
+            SectionSummary(
+                id="s1",
+                book_id="b1",
+                title="Cached",
+                start_page=1,
+                end_page=2,
+                summary="Cached.",
+                key_statements=[],
+                section_index=0,
+            )
+        ]
+
+        assert h.use_case.submit(["b1"]) is None
+        assert h.batch_provider.submitted == {}
+
+    def test_unknown_book_raises_not_found(self, prompts_dir: Path) -> None:
+        h = _Harness(prompts_dir)
+
+        with pytest.raises(BookError) as exc_info:
+            h.use_case.submit(["missing"])
+
+        assert exc_info.value.code == BookErrorCode.NOT_FOUND
+
+
+class TestWaitAndIngest:
+    def test_polls_until_batch_ends(self, prompts_dir: Path) -> None:
+        h = _Harness(prompts_dir, FakeBatchChatProvider(polls_before_end=2))
+        _seed_book(h.book_repo, h.chunk_repo, "b1", [(1, 2)])
+        batch = h.use_case.submit(["b1"])
+        assert batch is not None
+
+        waited = h.use_case.wait(batch.id)
+
+        assert waited.status == SummaryBatchStatus.ENDED
+        assert h.sleeps == [5.0, 5.0]
+
+    def test_wait_gives_up_after_max_wait_and_can_resume(
+        self, prompts_dir: Path
+    ) -> None:
+        h = _Harness(
+            prompts_dir, FakeBatchChatProvider(polls_before_end=3), max_wait=10.0
+        )
+        _seed_book(h.book_repo, h.chunk_repo, "b1", [(1, 2)])
+        batch = h.use_case.submit(["b1"])
+        assert batch is not None
+
+        with pytest.raises(BookError) as exc_info:
+            h.use_case.wait(batch.id)
+
+        assert exc_info.value.code == BookErrorCode.INVALID_STATE
+        assert f"--batch-id {batch.id}" in exc_info.value.message
+        assert h.sleeps == [5.0, 5.0]
+        assert h.use_case.wait(batch.id).status == SummaryBatchStatus.ENDED
+
+    def test_batch_whose_books_were_deleted_ingests_as_empty(
+        self, prompts_dir: Path
+    ) -> None:
+        h = _Harness(prompts_dir)
+        h.batch_repo.save(
+            SummaryBatch(id="b", provider_batch_id="msgbatch_1", sections=[])
+        )
+
+        assert h.use_case.resume("b") == {}
+        assert h.batch_repo.batches["b"].status == SummaryBatchStatus.INGESTED
+
+    def test_ingest_before_end_raises(self, prompts_dir: Path) -> None:
+        h = _Harness(prompts_dir)
+        _seed_book(h.book_repo, h.chunk_repo, "b1", [(1, 2)])
+        batch = h.use_case.submit(["b1"])
+        assert batch is not None
+
+        with pytest.raises(BookError) as exc_info:
+            h.use_case.ingest(batch.id)
+
+        assert exc_info.value.code == BookErrorCode.INVALID_STATE
+
+    def test_execute_saves_summaries_per_book(self, prompts_dir: Path) -> None:
+        h = _Harness(prompts_dir)
+        _seed_book(h.book_repo, h.chunk_repo, "b1", [(1, 2), (5, 6)])
+        _seed_book(h.book_repo, h.chunk_repo, "b2", [(1, 3)])
+
+        result = h.use_case.execute(["b1", "b2"])
+
+        assert [s.title for s in result["b1"]] == ["Batch b1-0", "Batch b1-1"]
+        assert [s.section_index for s in result["b1"]] == [0, 1]
+        assert result["b1"][1].start_page == 5
+        assert h.summary_repo.get_by_book("b2")[0].title == "Batch b2-0"
+        assert h.chat_provider.call_count == 0
+        (batch,) = h.batch_repo.batches.values()
+        assert batch.status == SummaryBatchStatus.INGESTED
+
+    def test_missing_or_invalid_results_fall_back_to_interactive_calls(
+        self, prompts_dir: Path
+    ) -> None:
+        chat = FakeChatProvider([_summary_json("Retried"), _summary_json("Direct")])
+        h = _Harness(
+            prompts_dir,
+            FakeBatchChatProvider({"b1-0": "not json"}),
+            chat,
+        )
+        _seed_book(h.book_repo, h.chunk_repo, "b1", [(1, 2), (5, 6)])
+
+        result = h.use_case.execute(["b1"])
+
+        assert [s.title for s in result["b1"]] == ["Retried", "Direct"]
+        assert chat.call_count == 2
+
+    def test_ingest_is_idempotent_once_ingested(self, prompts_dir: Path) -> None:
+        h = _Harness(prompts_dir)
+        _seed_book(h.book_repo, h.chunk_repo, "b1", [(1, 2)])
+        first = h.use_case.execute(["b1"])
+        (batch,) = h.batch_repo.batches.values()
+
+        again = h.use_case.resume(batch.provider_batch_id)
+
+        assert again == first
@@ -1,11 +1,20 @@
+import pytest
+import typer
 from interactive_books.domain.chat_event import (
     TokenUsageEvent,
     ToolInvocationEvent,
     ToolResultEvent,
 )
 from interactive_books.domain.conversation import Conversation
+from interactive_books.domain.model_route import CallPurpose, ModelRoute
 from interactive_books.domain.search_result import SearchResult
-from interactive_books.main import _select_or_create_conversation, app
+from interactive_books.infra.llm.anthropic import DEFAULT_ROUTES
+from interactive_books.main import (
+    _chat_model_routes,
+    _chat_provider,
+    _select_or_create_conversation,
+    app,
+)
 
 
 class FakeManageConversations:
@@ -137,7 +146,11 @@ class TestVerboseEventFormatting:
             )
             return f"[verbose]   → {event.result_count} results ({page_ranges})"
         if isinstance(event, TokenUsageEvent):
-            return f"[verbose] Tokens: {event.input_tokens:,} in / {event.output_tokens:,} out"
+            model = f" ({event.model})" if event.model else ""
+            return (
+                f"[verbose] Tokens: {event.input_tokens:,} in / "
+                f"{event.output_tokens:,} out{model}"
+            )
         return None
 
     def test_tool_invocation_event_format(self) -> None:
@@ -175,3 +188,65 @@ class TestVerboseEventFormatting:
         event = TokenUsageEvent(input_tokens=1500, output_tokens=120)
         line = self._format_event(event)
         assert line == "[verbose] Tokens: 1,500 in / 120 out"
+
+    def test_token_usage_event_includes_model(self) -> None:
+        event = TokenUsageEvent(
+            input_tokens=1500, output_tokens=120, model="claude-haiku-4-5-20251001"
+        )
+        line = self._format_event(event)
+        assert line == (
+            "[verbose] Tokens: 1,500 in / 120 out (claude-haiku-4-5-20251001)"
+        )
+
+
+# ── Tests: Model Routes ─────────────────────────────────────────
+
+
+class TestChatModelRoutes:
+    def test_defaults_without_env(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        for purpose in CallPurpose:
+            monkeypatch.delenv(f"CHAT_MODEL_{purpose.name}", raising=False)
+            monkeypatch.delenv(f"CHAT_MAX_TOKENS_{purpose.name}", raising=False)
+
+        assert _chat_model_routes(DEFAULT_ROUTES) == DEFAULT_ROUTES
+
+    def test_env_overrides_one_purpose(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        monkeypatch.setenv("CHAT_MODEL_REFORMULATION", "small-model")
+        monkeypatch.setenv("CHAT_MAX_TOKENS_REFORMULATION", "64")
+
+        routes = _chat_model_routes(DEFAULT_ROUTES)
+
+        assert routes[CallPurpose.REFORMULATION] == ModelRoute(
+            model="small-model", max_tokens=64
+        )
+        assert routes[CallPurpose.ANSWER] == DEFAULT_ROUTES[CallPurpose.ANSWER]
+
+    def test_invalid_max_tokens_exits(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        monkeypatch.setenv("CHAT_MAX_TOKENS_ANSWER", "lots")
+
+        with pytest.raises(typer.Exit):
+            _chat_model_routes(DEFAULT_ROUTES)
+
+
+# ── Tests: Chat Provider Selection ──────────────────────────────
+
+
+class TestChatProviderSelection:
+    def test_ollama_uses_configured_model_for_every_purpose(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        from interactive_books.infra.llm.ollama import ChatProvider
+
+        monkeypatch.setenv("CHAT_PROVIDER", "ollama")
+        monkeypatch.setenv("OLLAMA_MODEL", "mistral")
+        for purpose in CallPurpose:
+            monkeypatch.delenv(f"CHAT_MODEL_{purpose.name}", raising=False)
+
+        provider = _chat_provider()
+
+        assert isinstance(provider, ChatProvider)
+        assert {provider.route_for(p).model for p in CallPurpose} == {"mistral"}
+
+    def test_unknown_provider_exits(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+        monkeypatch.setenv("CHAT_PROVIDER", "bogus")
+
+        with pytest.raises(typer.Exit):
+            _chat_provider()
@@ -65,3 +65,30 @@ class TestEmbedVerbose:
         assert result.exit_code == 0
         assert "[verbose] Embedding 10 chunks" in result.output
         assert "[verbose] Provider: openai, Dimension: 1536" in result.output
+
+
+class TestEmbedShards:
+    def test_closes_the_shard_pool_with_the_database(self) -> None:
+        with (
+            patch("interactive_books.main._open_db") as mock_open_db,
+            patch("interactive_books.main._require_env", return_value="sk-test"),
+            patch("interactive_books.main._embed_sections", return_value=0),
+            patch("interactive_books.app.embed.EmbedBookUseCase") as mock_embed_cls,
+            patch("interactive_books.infra.embeddings.openai.EmbeddingProvider"),
+            patch("interactive_books.infra.storage.book_repo.BookRepository"),
+            patch("interactive_books.infra.storage.chunk_repo.ChunkRepository"),
+            patch(
+                "interactive_books.infra.storage.shard_embedding_repo.ShardPool"
+            ) as mock_pool_cls,
+            patch(
+                "interactive_books.infra.storage.shard_embedding_repo.EmbeddingRepository"
+            ),
+        ):
+            mock_embed_cls.return_value.execute.return_value = _embedded_book()
+            result = runner.invoke(
+                app, ["embed", "book-1"], env={"VECTOR_INDEX": "shards"}
+            )
+
+        assert result.exit_code == 0
+        mock_pool_cls.return_value.close.assert_called_once()
+        mock_open_db.return_value.close.assert_called_once()
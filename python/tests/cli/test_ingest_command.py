@@ -95,6 +95,44 @@ class TestIngestOutput:
         assert "Tip: Run 'embed' command separately" in result.output
 
 
+class TestIngestEmbeddingProvider:
+    def test_local_provider_embeds_without_api_key(self, tmp_path: Path) -> None:
+        book = _ready_book()
+        book.embedding_provider = "local"
+        book.embedding_dimension = 384
+        pdf = tmp_path / "test.pdf"
+        pdf.touch()
+
+        with (
+            patch("interactive_books.main._open_db"),
+            patch("interactive_books.app.ingest.IngestBookUseCase") as mock_ingest_cls,
+            patch("interactive_books.infra.storage.chunk_repo.ChunkRepository"),
+            patch("interactive_books.infra.storage.embedding_repo.EmbeddingRepository"),
+            patch("interactive_books.app.embed.EmbedBookUseCase") as mock_embed_cls,
+            patch.dict("os.environ", {"EMBEDDING_PROVIDER": "local"}, clear=False),
+        ):
+            import os
+
+            os.environ.pop("OPENAI_API_KEY", None)
+            mock_ingest_cls.return_value.execute.return_value = (book, None)
+            result = runner.invoke(app, ["ingest", str(pdf)])
+
+        assert result.exit_code == 0
+        assert "Embedded:    local" in result.output
+        provider = mock_embed_cls.call_args.kwargs["embedding_provider"]
+        assert provider.provider_name == "local"
+
+    def test_unknown_provider_exits_with_error(self, tmp_path: Path) -> None:
+        pdf = tmp_path / "test.pdf"
+        pdf.touch()
+
+        with patch.dict("os.environ", {"EMBEDDING_PROVIDER": "bogus"}, clear=False):
+            result = runner.invoke(app, ["ingest", str(pdf)])
+
+        assert result.exit_code == 1
+        assert "Unknown EMBEDDING_PROVIDER 'bogus'" in result.output
+
+
 class TestIngestVerbose:
     def test_verbose_shows_chunk_count(self, tmp_path: Path) -> None:
         book = _ready_book()
@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+import typer.testing
+from interactive_books.domain.library_search_result import LibrarySearchResult
+from interactive_books.domain.search_result import SearchResult
+from interactive_books.main import app
+
+runner = typer.testing.CliRunner()
+
+
+def _hit(book_id: str, title: str, chunk_id: str) -> LibrarySearchResult:
+    return LibrarySearchResult(
+        book_id=book_id,
+        book_title=title,
+        result=SearchResult(
+            chunk_id=chunk_id,
+            content="The whale surfaced.",
+            start_page=3,
+            end_page=4,
+            distance=-0.5,
+        ),
+    )
+
+
+def _invoke(args: list[str], hits: list[LibrarySearchResult] | None = None):  # type: ignore[no-untyped-def]
+    with (
+        patch("interactive_books.main._open_db"),
+        patch("interactive_books.app.search.SearchBooksUseCase") as mock_cls,
+    ):
+        mock_cls.return_value.execute_library.return_value = hits or []
+        result = runner.invoke(app, ["search", *args, "--mode", "lexical"])
+    return result, mock_cls.return_value
+
+
+class TestLibrarySearchCommand:
+    def test_all_searches_every_book_and_shows_titles(self) -> None:
+        result, use_case = _invoke(["--all", "whale"], [_hit("b1", "Moby Dick", "c1")])
+
+        assert result.exit_code == 0
+        assert "Moby Dick (b1), pages 3-4" in result.output
+        use_case.execute_library.assert_called_once()
+        args, kwargs = use_case.execute_library.call_args
+        assert args == ("whale",)
+        assert kwargs["book_ids"] is None
+        assert kwargs["page_override"] is None
+
+    def test_book_options_select_a_subset(self) -> None:
+        result, use_case = _invoke(
+            ["--book", "b1", "--book", "b2", "--per-book", "1", "whale"]
+        )
+
+        assert result.exit_code == 0
+        kwargs = use_case.execute_library.call_args.kwargs
+        assert kwargs["book_ids"] == ["b1", "b2"]
+        assert kwargs["per_book_limit"] == 1
+
+    def test_all_rejects_a_book_id_argument(self) -> None:
+        result, use_case = _invoke(["--all", "b1", "whale"])
+
+        assert result.exit_code == 1
+        assert "only the query" in result.output
+        use_case.execute_library.assert_not_called()
+
+    def test_all_rejects_page_override(self) -> None:
+        result, _ = _invoke(["--all", "--page", "10", "whale"])
+
+        assert result.exit_code == 1
+        assert "own reading position" in result.output
+
+    def test_single_book_search_still_needs_a_query(self) -> None:
+        result, _ = _invoke(["b1"])
+
+        assert result.exit_code == 2
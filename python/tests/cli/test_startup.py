@@ -0,0 +1,53 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from interactive_books.main import SCHEMA_DIR, SCHEMA_VERSION
+
+# Modules that only vector, LLM or settings work should pull in.
+HEAVY_MODULES = ("anthropic", "openai", "numpy", "sqlite_vec", "pydantic_settings")
+STARTUP_BUDGET_SECONDS = 1.0
+
+_SCRIPT = """
+import json, sys, time
+from pathlib import Path
+
+started = time.perf_counter()
+from interactive_books import main
+
+main.DB_PATH = Path(sys.argv[1])
+main.app(sys.argv[2:], standalone_mode=False)
+elapsed = time.perf_counter() - started
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _run(db_path: Path, *args: str) -> dict:  # type: ignore[type-arg]
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT, str(db_path), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_schema_version_matches_newest_migration() -> None:
+    newest = max(int(path.name.split("_", 1)[0]) for path in SCHEMA_DIR.glob("*.sql"))
+    assert SCHEMA_VERSION == newest
+
+
+@pytest.mark.parametrize("args", [["books"], ["show", "missing-book"]])
+def test_read_only_commands_start_within_budget(
+    tmp_path: Path, args: list[str]
+) -> None:
+    db_path = tmp_path / "books.db"
+    _run(db_path, "books")  # creates and migrates the database
+
+    report = _run(db_path, *args)
+
+    assert report["elapsed"] < STARTUP_BUDGET_SECONDS
+    loaded = {name.split(".")[0] for name in report["modules"]}
+    assert loaded.isdisjoint(HEAVY_MODULES)
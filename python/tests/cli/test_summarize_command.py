@@ -99,3 +99,63 @@ class TestSummarizeCommand:
 
         assert result.exit_code == 1
         assert "not found" in result.output.lower()
+
+    def test_requires_book_ids_or_batch_id(self) -> None:
+        with (
+            patch("interactive_books.main._open_db"),
+            patch("interactive_books.main._require_env", return_value="fake-key"),
+        ):
+            result = runner.invoke(app, ["summarize"])
+
+        assert result.exit_code == 1
+        assert "book id" in result.output.lower()
+
+    def test_batch_flag_submits_and_displays_per_book(self) -> None:
+        from interactive_books.domain.book import Book
+        from interactive_books.domain.summary_batch import (
+            SummaryBatch,
+            SummaryBatchSection,
+        )
+
+        batch = SummaryBatch(
+            id="batch-1",
+            provider_batch_id="msgbatch_1",
+            sections=[
+                SummaryBatchSection(
+                    custom_id="book-1-0",
+                    book_id="book-1",
+                    section_index=0,
+                    start_page=1,
+                    end_page=5,
+                )
+            ],
+        )
+
+        with (
+            patch("interactive_books.main._open_db"),
+            patch("interactive_books.main._require_env", return_value="fake-key"),
+            patch("interactive_books.infra.llm.anthropic.ChatProvider"),
+            patch("interactive_books.infra.llm.anthropic.BatchChatProvider"),
+            patch(
+                "interactive_books.infra.storage.book_repo.BookRepository"
+            ) as mock_book_repo_cls,
+            patch(
+                "interactive_books.app.summarize_batch.BatchSummarizeBooksUseCase"
+            ) as mock_use_case_cls,
+        ):
+            mock_book_repo_cls.return_value.get.return_value = Book(
+                id="book-1", title="Moby Dick"
+            )
+            mock_use_case_cls.return_value.submit.return_value = batch
+            mock_use_case_cls.return_value.resume.return_value = {
+                "book-1": _sample_summaries()
+            }
+
+            result = runner.invoke(app, ["summarize", "book-1", "--batch"])
+
+            mock_use_case_cls.return_value.resume.assert_called_once_with("batch-1")
+
+        assert result.exit_code == 0
+        assert "Submitted batch msgbatch_1" in result.output
+        assert "--batch-id batch-1" in result.output
+        assert "Moby Dick: 2 section(s) summarized" in result.output
@@ -0,0 +1,56 @@
+import pytest
+from interactive_books.domain.cached_answer import CachedAnswer, page_bucket
+from interactive_books.domain.embedding_vector import float32_vector
+from interactive_books.domain.errors import BookError, BookErrorCode
+
+
+def _answer(max_cited_page: int = 0) -> CachedAnswer:
+    return CachedAnswer(
+        id="a1",
+        book_id="b1",
+        page_bucket=1,
+        question="Who is O'Brien?",
+        question_embedding=float32_vector([1.0, 0.0]),
+        answer="An Inner Party member.",
+        max_cited_page=max_cited_page,
+    )
+
+
+class TestPageBucket:
+    def test_unrestricted_reader_has_own_bucket(self) -> None:
+        assert page_bucket(0) == 0
+
+    def test_pages_group_into_fixed_size_buckets(self) -> None:
+        assert page_bucket(1, 25) == 1
+        assert page_bucket(25, 25) == 1
+        assert page_bucket(26, 25) == 2
+
+
+class TestCachedAnswer:
+    def test_empty_answer_raises(self) -> None:
+        with pytest.raises(BookError) as exc_info:
+            CachedAnswer(
+                id="a1",
+                book_id="b1",
+                page_bucket=0,
+                question="q",
+                question_embedding=float32_vector([]),
+                answer="  ",
+            )
+        assert exc_info.value.code == BookErrorCode.INVALID_STATE
+
+    def test_visible_when_citations_are_within_position(self) -> None:
+        answer = _answer(max_cited_page=40)
+
+        assert answer.is_visible_at(40)
+        assert not answer.is_visible_at(39)
+        assert answer.is_visible_at(0)
+
+    def test_record_hit_counts_and_touches(self) -> None:
+        answer = _answer()
+        before = answer.last_used_at
+
+        answer.record_hit()
+
+        assert answer.hit_count == 1
+        assert answer.last_used_at >= before
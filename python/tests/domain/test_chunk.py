@@ -47,3 +47,7 @@ class TestChunkImmutability:
         chunk = Chunk(id="c1", book_id="b1", content="x", start_page=1, end_page=1, chunk_index=0)
         with pytest.raises(FrozenInstanceError):
             chunk.content = "modified"  # type: ignore[misc]
+
+    def test_chunk_has_no_instance_dict(self) -> None:
+        chunk = Chunk(id="c1", book_id="b1", content="x", start_page=1, end_page=1, chunk_index=0)
+        assert not hasattr(chunk, "__dict__")
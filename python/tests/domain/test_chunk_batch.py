@@ -0,0 +1,41 @@
+import pytest
+from interactive_books.domain.chunk_batch import ChunkBatch
+from interactive_books.domain.errors import BookError, BookErrorCode
+
+
+class TestChunkBatch:
+    def test_length_is_the_number_of_rows(self) -> None:
+        batch = ChunkBatch(
+            book_id="b1",
+            ids=["c1", "c2"],
+            contents=["First", "Second"],
+            start_pages=[1, 2],
+            end_pages=[1, 3],
+            chunk_indexes=[0, 1],
+        )
+
+        assert len(batch) == 2
+
+    def test_empty_batch_is_falsy(self) -> None:
+        batch = ChunkBatch(
+            book_id="b1",
+            ids=[],
+            contents=[],
+            start_pages=[],
+            end_pages=[],
+            chunk_indexes=[],
+        )
+
+        assert not batch
+
+    def test_mismatched_columns_raise(self) -> None:
+        with pytest.raises(BookError) as exc_info:
+            ChunkBatch(
+                book_id="b1",
+                ids=["c1", "c2"],
+                contents=["First"],
+                start_pages=[1, 2],
+                end_pages=[1, 3],
+                chunk_indexes=[0, 1],
+            )
+        assert exc_info.value.code == BookErrorCode.INVALID_STATE
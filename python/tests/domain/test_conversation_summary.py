@@ -0,0 +1,37 @@
+from datetime import datetime, timezone
+
+import pytest
+from interactive_books.domain.conversation_summary import ConversationSummary
+from interactive_books.domain.errors import BookError, BookErrorCode
+
+NOON = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def _summary() -> ConversationSummary:
+    return ConversationSummary(
+        conversation_id="c1",
+        content="Talked about whales.",
+        covered_message_id="m5",
+        covered_until=NOON,
+    )
+
+
+class TestConversationSummary:
+    def test_rejects_empty_content(self) -> None:
+        with pytest.raises(BookError) as exc_info:
+            ConversationSummary(
+                conversation_id="c1",
+                content="  ",
+                covered_message_id="m1",
+                covered_until=NOON,
+            )
+
+        assert exc_info.value.code == BookErrorCode.INVALID_STATE
+
+    def test_covers_messages_up_to_cursor(self) -> None:
+        summary = _summary()
+
+        assert summary.covers(datetime(2025, 1, 1, 11, tzinfo=timezone.utc), "m9")
+        assert summary.covers(NOON, "m5")
+        assert not summary.covers(NOON, "m6")
+        assert not summary.covers(datetime(2025, 1, 1, 13, tzinfo=timezone.utc), "m1")
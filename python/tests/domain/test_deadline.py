@@ -0,0 +1,63 @@
+from interactive_books.domain.deadline import MIN_DEADLINE_TIMEOUT, Deadline
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDeadline:
+    def test_remaining_counts_down_to_zero(self) -> None:
+        clock = FakeClock()
+        deadline = Deadline(10.0, clock=clock)
+
+        clock.now += 4.0
+        assert deadline.remaining() == 6.0
+        assert deadline.fraction_remaining() == 0.6
+
+        clock.now += 20.0
+        assert deadline.remaining() == 0.0
+        assert deadline.expired()
+
+    def test_optional_steps_drop_out_as_budget_runs_down(self) -> None:
+        clock = FakeClock()
+        deadline = Deadline(10.0, clock=clock)
+        assert deadline.allows_reformulation()
+
+        clock.now += 3.0
+        assert not deadline.allows_reformulation()
+        assert deadline.allows_full_search()
+
+        clock.now += 3.0
+        assert not deadline.allows_full_search()
+        assert deadline.allows_tool_round()
+
+        clock.now += 2.0
+        assert not deadline.allows_tool_round()
+
+    def test_zero_budget_is_already_spent(self) -> None:
+        deadline = Deadline(0.0, clock=FakeClock())
+
+        assert deadline.fraction_remaining() == 0.0
+        assert not deadline.allows_tool_round()
+
+    def test_request_gets_the_time_left(self) -> None:
+        clock = FakeClock()
+        deadline = Deadline(30.0, clock=clock)
+        clock.now += 10.0
+
+        request = deadline.for_request()
+
+        assert request.budget_seconds == 20.0
+        clock.now += 20.0
+        assert request.expired()
+
+    def test_request_near_the_end_still_gets_the_minimum(self) -> None:
+        clock = FakeClock()
+        deadline = Deadline(10.0, clock=clock)
+        clock.now += 9.0
+
+        assert deadline.for_request().budget_seconds == MIN_DEADLINE_TIMEOUT
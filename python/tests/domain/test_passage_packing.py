@@ -0,0 +1,120 @@
+from interactive_books.domain.passage_packing import (
+    Passage,
+    format_passages,
+    pack_passages,
+)
+from interactive_books.domain.search_result import SearchResult
+
+
+def _words(start: int, end: int) -> str:
+    return " ".join(f"w{i}" for i in range(start, end))
+
+
+def _hit(
+    chunk_id: str,
+    content: str,
+    chunk_index: int | None,
+    pages: tuple[int, int] = (1, 1),
+) -> SearchResult:
+    return SearchResult(
+        chunk_id=chunk_id,
+        content=content,
+        start_page=pages[0],
+        end_page=pages[1],
+        distance=0.1,
+        chunk_index=chunk_index,
+    )
+
+
+class TestMergeAdjacent:
+    def test_merges_consecutive_chunks_and_removes_overlap(self) -> None:
+        hits = [
+            _hit("c2", _words(40, 80), 2, (5, 6)),
+            _hit("c1", _words(0, 50), 1, (3, 5)),
+        ]
+
+        (passage,) = pack_passages(hits)
+
+        assert passage.content == _words(0, 80)
+        assert (passage.start_page, passage.end_page) == (3, 6)
+        assert passage.chunk_ids == ("c1", "c2")
+
+    def test_keeps_non_adjacent_chunks_separate_in_rank_order(self) -> None:
+        hits = [
+            _hit("c9", "late text here", 9, (40, 41)),
+            _hit("c1", "early text here", 1, (2, 3)),
+        ]
+
+        passages = pack_passages(hits)
+
+        assert [p.chunk_ids for p in passages] == [("c9",), ("c1",)]
+
+    def test_adjacent_chunks_without_shared_words_are_concatenated(self) -> None:
+        hits = [_hit("c1", "alpha beta", 1), _hit("c2", "gamma delta", 2)]
+
+        (passage,) = pack_passages(hits)
+
+        assert passage.content == "alpha beta gamma delta"
+
+    def test_results_without_chunk_index_are_kept_as_is(self) -> None:
+        hits = [_hit("a", "first passage", None), _hit("b", "second passage", None)]
+
+        assert [p.content for p in pack_passages(hits)] == [
+            "first passage",
+            "second passage",
+        ]
+
+    def test_repeated_chunk_is_used_once(self) -> None:
+        hits = [_hit("c1", "same words", 1), _hit("c1", "same words", 1)]
+
+        assert len(pack_passages(hits)) == 1
+
+
+class TestNearDuplicates:
+    def test_drops_passage_contained_in_better_ranked_one(self) -> None:
+        hits = [
+            _hit("c1", _words(0, 100), 1, (1, 4)),
+            _hit("c7", _words(10, 60) + " extra", 7, (20, 21)),
+        ]
+
+        passages = pack_passages(hits)
+
+        assert [p.chunk_ids for p in passages] == [("c1",)]
+
+    def test_keeps_distinct_passages(self) -> None:
+        hits = [_hit("c1", _words(0, 50), 1), _hit("c7", _words(200, 250), 7)]
+
+        assert len(pack_passages(hits)) == 2
+
+
+class TestTokenBudget:
+    def test_stops_adding_passages_over_budget(self) -> None:
+        hits = [
+            _hit("c1", _words(0, 30), 1),
+            _hit("c5", _words(100, 130), 5),
+            _hit("c9", _words(200, 210), 9),
+        ]
+
+        passages = pack_passages(hits, token_budget=45)
+
+        assert [p.chunk_ids for p in passages] == [("c1",), ("c9",)]
+        assert sum(p.token_count for p in passages) <= 45
+
+    def test_truncates_first_passage_when_it_alone_exceeds_budget(self) -> None:
+        (passage,) = pack_passages([_hit("c1", _words(0, 100), 1, (4, 9))], 20)
+
+        assert passage.token_count == 20
+        assert passage.content.endswith("…")
+        assert (passage.start_page, passage.end_page) == (4, 9)
+
+
+class TestFormatPassages:
+    def test_formats_with_page_citations(self) -> None:
+        text = format_passages(
+            [
+                Passage(content="One.", start_page=1, end_page=2, chunk_ids=("a",)),
+                Passage(content="Two.", start_page=7, end_page=7, chunk_ids=("b",)),
+            ]
+        )
+
+        assert text == "[Pages 1-2]:\nOne.\n\n[Pages 7-7]:\nTwo."
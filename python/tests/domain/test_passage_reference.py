@@ -0,0 +1,39 @@
+from interactive_books.domain.passage_reference import PassageReference
+from interactive_books.domain.search_result import SearchResult
+
+
+class TestPassageReference:
+    def test_from_results(self) -> None:
+        reference = PassageReference.from_results(
+            "whales",
+            [
+                SearchResult(
+                    chunk_id="c1", content="x", start_page=3, end_page=4, distance=0.1
+                ),
+                SearchResult(
+                    chunk_id="c9", content="y", start_page=20, end_page=20, distance=0.3
+                ),
+            ],
+        )
+
+        assert reference.chunk_ids == ("c1", "c9")
+        assert reference.pages == ((3, 4), (20, 20))
+
+    def test_content_round_trip(self) -> None:
+        reference = PassageReference(
+            query="the white whale", chunk_ids=("c1", "c2"), pages=((1, 2), (2, 3))
+        )
+
+        assert PassageReference.from_content(reference.to_content()) == reference
+
+    def test_content_is_compact(self) -> None:
+        reference = PassageReference(query="q", chunk_ids=("c1",), pages=((1, 1),))
+
+        assert len(reference.to_content()) < 100
+
+    def test_legacy_text_is_not_a_reference(self) -> None:
+        assert PassageReference.from_content("[Pages 1-2]:\nSome text") is None
+
+    def test_other_json_is_not_a_reference(self) -> None:
+        assert PassageReference.from_content('{"kind": "other"}') is None
+        assert PassageReference.from_content("{not json") is None
@@ -0,0 +1,16 @@
+from interactive_books.domain.query_similarity import query_similarity
+
+
+class TestQuerySimilarity:
+    def test_ignores_case_punctuation_and_stopwords(self) -> None:
+        assert query_similarity("Who is Ahab?", "ahab") == 1.0
+
+    def test_disjoint_queries_score_zero(self) -> None:
+        assert query_similarity("white whale", "harpoon") == 0.0
+
+    def test_partial_overlap(self) -> None:
+        assert query_similarity("ahab whale", "ahab harpoon") == 1 / 3
+
+    def test_stopword_only_queries_compare_verbatim(self) -> None:
+        assert query_similarity("Who is it?", "who is it?") == 1.0
+        assert query_similarity("Who is it?", "what is this") == 0.0
@@ -0,0 +1,27 @@
+from interactive_books.domain.rank_fusion import RRF_K, reciprocal_rank_fusion
+
+
+class TestReciprocalRankFusion:
+    def test_agreement_outranks_a_single_first_place(self) -> None:
+        fused = reciprocal_rank_fusion([["a", "b"], ["c", "b"]])
+
+        assert [item for item, _ in fused] == ["b", "a", "c"]
+
+    def test_scores_sum_reciprocal_ranks(self) -> None:
+        fused = dict(reciprocal_rank_fusion([["a"], ["b", "a"]]))
+
+        assert fused["a"] == 1 / (RRF_K + 1) + 1 / (RRF_K + 2)
+        assert fused["b"] == 1 / (RRF_K + 1)
+
+    def test_ties_keep_first_seen_order(self) -> None:
+        fused = reciprocal_rank_fusion([["x"], ["y"]])
+
+        assert [item for item, _ in fused] == ["x", "y"]
+
+    def test_duplicates_within_a_ranking_count_once(self) -> None:
+        fused = dict(reciprocal_rank_fusion([["a", "a", "b"]]))
+
+        assert fused["b"] == 1 / (RRF_K + 2)
+
+    def test_empty_rankings(self) -> None:
+        assert reciprocal_rank_fusion([[], []]) == []
@@ -0,0 +1,38 @@
+from interactive_books.domain.section_routing import LAST_PAGE, route_sections
+
+
+def _hits(*sections: tuple[int, int, float]) -> list[tuple[str, float, int, int]]:
+    return [
+        (f"s{i}", distance, start, end)
+        for i, (start, end, distance) in enumerate(sections)
+    ]
+
+
+class TestRouteSections:
+    def test_keeps_the_closest_sections_and_the_unsummarized_tail(self) -> None:
+        hits = _hits((1, 10, 0.9), (11, 20, 0.2), (21, 30, 0.8), (31, 40, 0.3))
+
+        assert route_sections(hits, top_sections=2) == [
+            (11, 20),
+            (31, 40),
+            (41, LAST_PAGE),
+        ]
+
+    def test_section_scores_its_closest_row(self) -> None:
+        # A key statement on pages 1-10 matches far better than its summary.
+        hits = _hits((1, 10, 0.9), (1, 10, 0.1), (11, 20, 0.8), (21, 30, 0.85))
+
+        assert route_sections(hits, top_sections=1) == [(1, 10), (31, LAST_PAGE)]
+
+    def test_too_few_sections_search_flat(self) -> None:
+        hits = _hits((1, 10, 0.1), (11, 20, 0.9))
+
+        assert route_sections(hits, top_sections=2) is None
+
+    def test_indistinct_sections_search_flat(self) -> None:
+        hits = _hits((1, 10, 0.80), (11, 20, 0.81), (21, 30, 0.82), (31, 40, 0.83))
+
+        assert route_sections(hits, top_sections=1) is None
+
+    def test_no_hits_search_flat(self) -> None:
+        assert route_sections([]) is None
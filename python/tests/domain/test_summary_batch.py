@@ -0,0 +1,59 @@
+import pytest
+from interactive_books.domain.errors import BookError, BookErrorCode
+from interactive_books.domain.summary_batch import (
+    SummaryBatch,
+    SummaryBatchSection,
+    SummaryBatchStatus,
+)
+
+
+def _section(custom_id: str, book_id: str, index: int = 0) -> SummaryBatchSection:
+    return SummaryBatchSection(
+        custom_id=custom_id,
+        book_id=book_id,
+        section_index=index,
+        start_page=1,
+        end_page=2,
+    )
+
+
+def _batch() -> SummaryBatch:
+    return SummaryBatch(
+        id="batch-1",
+        provider_batch_id="msgbatch_1",
+        sections=[_section("b2-0", "b2"), _section("b1-0", "b1"), _section("b2-1", "b2", 1)],
+    )
+
+
+class TestSummaryBatch:
+    def test_starts_submitted(self) -> None:
+        assert _batch().status == SummaryBatchStatus.SUBMITTED
+
+    def test_batch_of_deleted_books_has_no_book_ids(self) -> None:
+        batch = SummaryBatch(id="b", provider_batch_id="p", sections=[])
+
+        assert batch.book_ids == []
+
+    def test_book_ids_are_unique_in_submission_order(self) -> None:
+        assert _batch().book_ids == ["b2", "b1"]
+
+    def test_lifecycle(self) -> None:
+        batch = _batch()
+
+        batch.mark_ended()
+        batch.mark_ingested()
+
+        assert batch.status == SummaryBatchStatus.INGESTED
+
+    def test_cannot_ingest_before_ended(self) -> None:
+        with pytest.raises(BookError) as exc_info:
+            _batch().mark_ingested()
+
+        assert exc_info.value.code == BookErrorCode.INVALID_STATE
+
+    def test_cannot_end_twice(self) -> None:
+        batch = _batch()
+        batch.mark_ended()
+
+        with pytest.raises(BookError):
+            batch.mark_ended()
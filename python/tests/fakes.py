@@ -1,7 +1,19 @@
+import re
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from interactive_books.domain.book import Book
+from interactive_books.domain.cached_answer import CachedAnswer
 from interactive_books.domain.chunk import Chunk
-from interactive_books.domain.embedding_vector import EmbeddingVector
+from interactive_books.domain.chunk_batch import ChunkBatch
+from interactive_books.domain.embedding_vector import EmbeddingVector, float32_vector
 from interactive_books.domain.section_summary import SectionSummary
+from interactive_books.domain.summary_batch import SummaryBatch, SummaryBatchStatus
+
+
+def _words(text: str) -> list[str]:
+    return re.findall(r"\w+", text.lower())
 
 
 class FakeBookRepository:
@@ -31,6 +43,34 @@ class FakeChunkRepository:
     def get_by_book(self, book_id: str) -> list[Chunk]:
         return self.chunks.get(book_id, [])
 
+    def save_batch(self, batch: ChunkBatch) -> None:
+        self.chunks[batch.book_id] = [
+            Chunk(
+                id=batch.ids[i],
+                book_id=batch.book_id,
+                content=batch.contents[i],
+                start_page=batch.start_pages[i],
+                end_page=batch.end_pages[i],
+                chunk_index=batch.chunk_indexes[i],
+            )
+            for i in range(len(batch))
+        ]
+
+    def get_batch(self, book_id: str) -> ChunkBatch:
+        chunks = self.get_by_book(book_id)
+        return ChunkBatch(
+            book_id=book_id,
+            ids=[c.id for c in chunks],
+            contents=[c.content for c in chunks],
+            start_pages=[c.start_page for c in chunks],
+            end_pages=[c.end_page for c in chunks],
+            chunk_indexes=[c.chunk_index for c in chunks],
+        )
+
+    def get_by_ids(self, chunk_ids: list[str]) -> list[Chunk]:
+        wanted = set(chunk_ids)
+        return [c for chunks in self.chunks.values() for c in chunks if c.id in wanted]
+
     def get_by_page_range(
         self, book_id: str, start_page: int, end_page: int
     ) -> list[Chunk]:
@@ -46,6 +86,30 @@ class FakeChunkRepository:
     def delete_by_book(self, book_id: str) -> None:
         self.chunks.pop(book_id, None)
 
+    def search_text(
+        self, book_id: str, query: str, top_k: int, max_page: int = 0
+    ) -> list[tuple[Chunk, float]]:
+        words = set(_words(query))
+        scored = [
+            (c, -float(len(words & set(_words(c.content)))))
+            for c in self.get_by_book(book_id)
+            if max_page <= 0 or c.start_page <= max_page
+        ]
+        matches = [(c, score) for c, score in scored if score < 0]
+        return sorted(matches, key=lambda pair: pair[1])[:top_k]
+
+    def find_phrase(
+        self, book_id: str, phrase: str, top_k: int, max_page: int = 0
+    ) -> list[Chunk]:
+        needle = " ".join(_words(phrase))
+        return [
+            c
+            for c in self.get_by_book(book_id)
+            if (max_page <= 0 or c.start_page <= max_page)
+            and needle
+            and f" {needle} " in f" {' '.join(_words(c.content))} "
+        ][:top_k]
+
 
 class FakeEmbeddingProvider:
     def __init__(self, dimension: int = 4) -> None:
@@ -61,10 +125,10 @@ class FakeEmbeddingProvider:
     def dimension(self) -> int:
         return self._dimension
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
+    def embed(self, texts: list[str]) -> list[array[float]]:
         self.call_count += 1
         self.last_texts = texts
-        return [[0.1] * self._dimension for _ in texts]
+        return [float32_vector([0.1] * self._dimension) for _ in texts]
 
 
 class FakeEmbeddingRepository:
@@ -72,12 +136,25 @@ class FakeEmbeddingRepository:
 
     def __init__(self) -> None:
         self._search_results: list[tuple[str, float, int, int]] = []
+        self._book_results: dict[str, list[tuple[str, float, int, int]]] = {}
         self.last_search_top_k: int | None = None
+        self.last_search_max_page: int | None = None
+        self.last_search_page_ranges: list[tuple[int, int]] | None = None
+        self.max_page_by_book: dict[str, int] = {}
+        self.search_many_calls = 0
         self.tables: set[str] = set()
         self.embeddings: dict[str, list[tuple[str, EmbeddingVector]]] = {}
 
-    def set_search_results(self, results: list[tuple[str, float, int, int]]) -> None:
-        self._search_results = results
+    def set_search_results(
+        self,
+        results: list[tuple[str, float, int, int]],
+        *,
+        book_id: str | None = None,
+    ) -> None:
+        if book_id is None:
+            self._search_results = results
+        else:
+            self._book_results[book_id] = results
 
     def ensure_table(self, provider_name: str, dimension: int) -> None:
         self.tables.add(f"{provider_name}_{dimension}")
@@ -110,11 +187,51 @@ class FakeEmbeddingRepository:
         provider_name: str,
         dimension: int,
         book_id: str,
-        query_vector: list[float],
+        query_vector: array[float],
         top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
     ) -> list[tuple[str, float, int, int]]:
         self.last_search_top_k = top_k
-        return self._search_results[:top_k]
+        return self._hits(book_id, top_k, max_page, page_ranges)
+
+    def search_many(
+        self,
+        provider_name: str,
+        dimension: int,
+        book_id: str,
+        query_vectors: list[array[float]],
+        top_k: int,
+        *,
+        max_page: int = 0,
+        page_ranges: list[tuple[int, int]] | None = None,
+    ) -> list[list[tuple[str, float, int, int]]]:
+        self.search_many_calls += 1
+        self.last_search_top_k = top_k
+        self.last_search_max_page = max_page
+        self.last_search_page_ranges = page_ranges
+        self.max_page_by_book[book_id] = max_page
+        return [
+            self._hits(book_id, top_k, max_page, page_ranges) for _ in query_vectors
+        ]
+
+    def _hits(
+        self,
+        book_id: str,
+        top_k: int,
+        max_page: int,
+        page_ranges: list[tuple[int, int]] | None = None,
+    ) -> list[tuple[str, float, int, int]]:
+        results = self._book_results.get(book_id, self._search_results)
+        if page_ranges is not None:
+            # Ranged searches rank every row in the ranges, not a KNN prefix.
+            results = [
+                hit
+                for hit in results
+                if any(hit[2] <= end and hit[3] >= start for start, end in page_ranges)
+            ]
+        return [hit for hit in results[:top_k] if max_page <= 0 or hit[2] <= max_page]
 
     def count_for_book(self, book_id: str, provider_name: str, dimension: int) -> int:
         key = f"{provider_name}_{dimension}"
@@ -133,3 +250,67 @@ class FakeSummaryRepository:
 
     def delete_by_book(self, book_id: str) -> None:
         self.summaries.pop(book_id, None)
+
+
+class FakeSummaryBatchRepository:
+    def __init__(self) -> None:
+        self.batches: dict[str, SummaryBatch] = {}
+
+    def save(self, batch: SummaryBatch) -> None:
+        self.batches[batch.id] = batch
+
+    def get(self, batch_id: str) -> SummaryBatch | None:
+        return self.batches.get(batch_id) or next(
+            (b for b in self.batches.values() if b.provider_batch_id == batch_id),
+            None,
+        )
+
+    def get_pending(self) -> list[SummaryBatch]:
+        return [
+            b for b in self.batches.values() if b.status != SummaryBatchStatus.INGESTED
+        ]
+
+
+class FakeAnswerCacheRepository:
+    def __init__(self) -> None:
+        self.answers: dict[str, CachedAnswer] = {}
+        self.deleted_books: list[str] = []
+
+    def save(self, answer: CachedAnswer) -> None:
+        self.answers[answer.id] = answer
+
+    def get_candidates(self, book_id: str, page_bucket: int) -> list[CachedAnswer]:
+        return [
+            a
+            for a in self.answers.values()
+            if a.book_id == book_id and a.page_bucket == page_bucket
+        ]
+
+    def evict(self, book_id: str, keep: int) -> int:
+        ranked = sorted(
+            (a for a in self.answers.values() if a.book_id == book_id),
+            key=lambda a: a.last_used_at,
+            reverse=True,
+        )
+        for answer in ranked[keep:]:
+            del self.answers[answer.id]
+        return len(ranked[keep:])
+
+    def delete_by_book(self, book_id: str) -> None:
+        self.deleted_books.append(book_id)
+        self.answers = {k: a for k, a in self.answers.items() if a.book_id != book_id}
+
+
+class FakeUnitOfWork:
+    def __init__(self) -> None:
+        self.loads = 0
+        self.rolled_back = 0
+
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        self.loads += 1
+        try:
+            yield
+        except BaseException:
+            self.rolled_back += 1
+            raise
@@ -0,0 +1,125 @@
+import itertools
+from collections.abc import Callable
+
+from tests.helpers.stub_server import StubRequest, StubResponse, StubServer
+
+Responder = Callable[[dict[str, object]], str | None]
+
+
+def _message(text: str, model: str) -> dict[str, object]:
+    return {
+        "id": "msg_stub",
+        "type": "message",
+        "role": "assistant",
+        "model": model,
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 10, "output_tokens": 5},
+    }
+
+
+class AnthropicBatchStub:
+    """Stand-in for the Messages and Message Batches endpoints.
+
+    ``responder`` maps request params to the assistant text; returning ``None``
+    makes that batch entry come back as ``errored``. A batch reports
+    ``in_progress`` for ``polls_before_end`` status checks before ending.
+    """
+
+    def __init__(self, responder: Responder, *, polls_before_end: int = 0) -> None:
+        self._responder = responder
+        self._polls_before_end = polls_before_end
+        self._ids = itertools.count(1)
+        self.batches: dict[str, list[dict[str, object]]] = {}
+        self.status_checks: dict[str, int] = {}
+        self.message_calls: list[dict[str, object]] = []
+        self.server = StubServer(
+            {
+                ("POST", "/v1/messages"): self._create_message,
+                ("POST", "/v1/messages/batches"): self._create_batch,
+                ("GET", r"/v1/messages/batches/(?P<id>[^/]+)"): self._retrieve_batch,
+                ("GET", r"/v1/messages/batches/(?P<id>[^/]+)/results"): self._results,
+            }
+        )
+
+    def __enter__(self) -> "AnthropicBatchStub":
+        self.server.__enter__()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.server.__exit__(None, None, None)
+
+    @property
+    def base_url(self) -> str:
+        return self.server.base_url
+
+    def _create_message(self, request: StubRequest) -> StubResponse:
+        params = request.json()
+        assert isinstance(params, dict)
+        self.message_calls.append(params)
+        text = self._responder(params) or ""
+        return StubResponse(body=_message(text, str(params["model"])))
+
+    def _create_batch(self, request: StubRequest) -> StubResponse:
+        body = request.json()
+        assert isinstance(body, dict)
+        batch_id = f"msgbatch_{next(self._ids)}"
+        self.batches[batch_id] = list(body["requests"])
+        self.status_checks[batch_id] = 0
+        return StubResponse(body=self._batch_body(batch_id, ended=False))
+
+    def _retrieve_batch(self, request: StubRequest) -> StubResponse:
+        batch_id = request.match["id"]
+        if batch_id not in self.batches:
+            return StubResponse(status=404, body={"type": "error"})
+        self.status_checks[batch_id] += 1
+        ended = self.status_checks[batch_id] > self._polls_before_end
+        return StubResponse(body=self._batch_body(batch_id, ended=ended))
+
+    def _results(self, request: StubRequest) -> StubResponse:
+        lines: list[object] = []
+        for entry in self.batches[request.match["id"]]:
+            params = entry["params"]
+            assert isinstance(params, dict)
+            text = self._responder(params)
+            if text is None:
+                result: dict[str, object] = {
+                    "type": "errored",
+                    "error": {
+                        "type": "error",
+                        "error": {"type": "api_error", "message": "stub failure"},
+                    },
+                }
+            else:
+                result = {
+                    "type": "succeeded",
+                    "message": _message(text, str(params["model"])),
+                }
+            lines.append({"custom_id": entry["custom_id"], "result": result})
+        return StubResponse(body=lines, content_type="application/x-ndjson")
+
+    def _batch_body(self, batch_id: str, *, ended: bool) -> dict[str, object]:
+        count = len(self.batches[batch_id])
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else count,
+                "succeeded": count if ended else 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": "2026-01-01T00:00:00Z",
+            "expires_at": "2026-01-02T00:00:00Z",
+            "ended_at": "2026-01-01T01:00:00Z" if ended else None,
+            "cancel_initiated_at": None,
+            "archived_at": None,
+            "results_url": (
+                f"{self.base_url}/v1/messages/batches/{batch_id}/results"
+                if ended
+                else None
+            ),
+        }
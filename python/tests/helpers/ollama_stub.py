@@ -0,0 +1,101 @@
+import threading
+import time
+
+from tests.helpers.stub_server import StubRequest, StubResponse, StubServer
+
+
+class OllamaStub:
+    """Stand-in for Ollama's ``/api/chat`` (streamed) and ``/api/embed`` endpoints.
+
+    Chat replies stream ``reply`` one word per NDJSON line. Embeddings are
+    ``[len(text), 1.0, 0.0, ...]`` padded to ``dimension``. Each request holds
+    its connection for ``delay`` seconds so tests can observe how many are in
+    flight at once (``max_in_flight``).
+    """
+
+    def __init__(
+        self,
+        *,
+        reply: str = "Hello from Ollama",
+        dimension: int = 4,
+        delay: float = 0.0,
+        error: str | None = None,
+    ) -> None:
+        self._reply = reply
+        self._dimension = dimension
+        self._delay = delay
+        self._error = error
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self.chat_calls: list[dict[str, object]] = []
+        self.embed_calls: list[dict[str, object]] = []
+        self.server = StubServer(
+            {
+                ("POST", "/api/chat"): self._chat,
+                ("POST", "/api/embed"): self._embed,
+            }
+        )
+
+    def __enter__(self) -> "OllamaStub":
+        self.server.__enter__()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.server.__exit__(None, None, None)
+
+    @property
+    def base_url(self) -> str:
+        return self.server.base_url
+
+    def _chat(self, request: StubRequest) -> StubResponse:
+        params = request.json()
+        assert isinstance(params, dict)
+        self.chat_calls.append(params)
+        if self._error is not None:
+            return StubResponse(status=404, body={"error": self._error})
+        words = self._reply.split(" ")
+        lines: list[object] = [
+            {
+                "model": params["model"],
+                "message": {"role": "assistant", "content": word + " "},
+                "done": False,
+            }
+            for word in words[:-1]
+        ]
+        lines.append(
+            {
+                "model": params["model"],
+                "message": {"role": "assistant", "content": words[-1]},
+                "done": True,
+                "prompt_eval_count": 12,
+                "eval_count": len(words),
+            }
+        )
+        return StubResponse(body=lines, content_type="application/x-ndjson")
+
+    def _embed(self, request: StubRequest) -> StubResponse:
+        params = request.json()
+        assert isinstance(params, dict)
+        with self._lock:
+            self.embed_calls.append(params)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            time.sleep(self._delay)
+            if self._error is not None:
+                return StubResponse(status=404, body={"error": self._error})
+            inputs = params["input"]
+            assert isinstance(inputs, list)
+            padding = [0.0] * (self._dimension - 2)
+            return StubResponse(
+                body={
+                    "model": params["model"],
+                    "embeddings": [
+                        [float(len(text)), 1.0, *padding] for text in inputs
+                    ],
+                }
+            )
+        finally:
+            with self._lock:
+                self._in_flight -= 1
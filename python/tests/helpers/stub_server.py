@@ -0,0 +1,117 @@
+import json
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+
+
+@dataclass(frozen=True)
+class StubRequest:
+    method: str
+    path: str
+    match: re.Match[str]
+    body: bytes
+
+    def json(self) -> object:
+        return json.loads(self.body) if self.body else None
+
+
+@dataclass(frozen=True)
+class StubResponse:
+    status: int = 200
+    body: object = None
+    content_type: str = "application/json"
+
+
+Route = Callable[[StubRequest], StubResponse]
+
+
+class StubServer:
+    """Local stand-in HTTP server for adapter tests that must not touch the network.
+
+    Routes are ``(method, path_regex) -> handler`` pairs; each handler gets the
+    parsed request and returns a ``StubResponse``. Bodies that are not ``str`` or
+    ``bytes`` are JSON-encoded; a list body with an ``application/x-ndjson``
+    content type is sent as one JSON document per line.
+    """
+
+    def __init__(self, routes: dict[tuple[str, str], Route]) -> None:
+        self._routes = [
+            (method, re.compile(f"^{pattern}$"), handler)
+            for (method, pattern), handler in routes.items()
+        ]
+        self.requests: list[StubRequest] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _dispatch(self, method: str, path: str, body: bytes) -> StubResponse:
+        path = path.split("?", 1)[0]
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                request = StubRequest(method=method, path=path, match=match, body=body)
+                self.requests.append(request)
+                return handler(request)
+        return StubResponse(status=404, body={"error": f"no route for {method} {path}"})
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                self._respond("GET")
+
+            def do_POST(self) -> None:
+                self._respond("POST")
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def _respond(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                response = stub._dispatch(method, self.path, self.rfile.read(length))
+                if isinstance(response.body, list) and response.content_type.endswith(
+                    "ndjson"
+                ):
+                    lines = [
+                        line if isinstance(line, str) else json.dumps(line)
+                        for line in response.body
+                    ]
+                    payload = "".join(f"{line}\n" for line in lines).encode()
+                elif isinstance(response.body, bytes):
+                    payload = response.body
+                elif isinstance(response.body, str):
+                    payload = response.body.encode()
+                else:
+                    payload = json.dumps(response.body).encode()
+                self.send_response(response.status)
+                self.send_header("Content-Type", response.content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
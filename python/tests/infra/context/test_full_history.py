@@ -59,3 +59,6 @@ class TestFullHistoryStrategy:
         result.append(_make_message(1))
 
         assert len(history) == 1
+
+    def test_history_limit_matches_cap(self) -> None:
+        assert ConversationContextStrategy(max_messages=7).history_limit == 7
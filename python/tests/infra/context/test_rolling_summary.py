@@ -0,0 +1,302 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from interactive_books.domain.chat import ChatMessage, MessageRole
+from interactive_books.domain.conversation_summary import ConversationSummary
+from interactive_books.domain.deadline import Deadline
+from interactive_books.domain.model_route import CallPurpose
+from interactive_books.domain.prompt_message import PromptMessage
+from interactive_books.domain.tool import ChatResponse, ToolDefinition
+from interactive_books.infra.context.rolling_summary import (
+    SUMMARY_PREFIX,
+    ConversationContextStrategy,
+)
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeChatProvider:
+    def __init__(self, responses: list[str] | None = None) -> None:
+        self._responses = list(responses or [])
+        self.prompts: list[str] = []
+        self.purposes: list[CallPurpose] = []
+
+    @property
+    def model_name(self) -> str:
+        return "fake"
+
+    def chat(
+        self,
+        messages: list[PromptMessage],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> str:
+        self.purposes.append(purpose)
+        self.prompts.append(messages[0].content)
+        return self._responses.pop(0) if self._responses else "Rolling summary."
+
+    def chat_with_tools(
+        self,
+        messages: list[PromptMessage],
+        tools: list[ToolDefinition],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> ChatResponse:
+        raise NotImplementedError
+
+
+class FakeConversationSummaryRepository:
+    def __init__(self) -> None:
+        self.summaries: dict[str, ConversationSummary] = {}
+
+    def save(self, summary: ConversationSummary) -> None:
+        self.summaries[summary.conversation_id] = summary
+
+    def get(self, conversation_id: str) -> ConversationSummary | None:
+        return self.summaries.get(conversation_id)
+
+
+class FakeChatMessageRepository:
+    def __init__(self, messages: list[ChatMessage] | None = None) -> None:
+        self.messages = list(messages or [])
+        self.loads = 0
+        self.tail_loads = 0
+
+    def save(self, message: ChatMessage) -> None:
+        self.messages.append(message)
+
+    def save_many(self, messages: list[ChatMessage]) -> None:
+        self.messages.extend(messages)
+
+    def get_by_conversation(self, conversation_id: str) -> list[ChatMessage]:
+        self.loads += 1
+        return [m for m in self.messages if m.conversation_id == conversation_id]
+
+    def get_recent(self, conversation_id: str, limit: int) -> list[ChatMessage]:
+        return self.get_by_conversation(conversation_id)[-limit:]
+
+    def get_after(
+        self, conversation_id: str, created_at: datetime, message_id: str
+    ) -> list[ChatMessage]:
+        self.tail_loads += 1
+        return [
+            m
+            for m in self.messages
+            if m.conversation_id == conversation_id
+            and (m.created_at, m.id) > (created_at, message_id)
+        ]
+
+    def delete_by_conversation(self, conversation_id: str) -> None:
+        self.messages = [
+            m for m in self.messages if m.conversation_id != conversation_id
+        ]
+
+
+@pytest.fixture
+def prompts_dir(tmp_path: Path) -> Path:
+    (tmp_path / "conversation_summary_prompt.md").write_text(
+        "Summary so far: {summary}\nNew:\n{messages}"
+    )
+    return tmp_path
+
+
+def _message(i: int, words: int = 10, role: MessageRole | None = None) -> ChatMessage:
+    return ChatMessage(
+        id=f"m{i:03d}",
+        conversation_id="c1",
+        role=role or (MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT),
+        content=" ".join([f"m{i}"] * words),
+        created_at=START + timedelta(minutes=i),
+    )
+
+
+def _strategy(
+    prompts_dir: Path,
+    chat: FakeChatProvider,
+    repo: FakeConversationSummaryRepository,
+    token_budget: int = 50,
+    *,
+    messages: FakeChatMessageRepository | None = None,
+    history_limit: int = 60,
+) -> ConversationContextStrategy:
+    return ConversationContextStrategy(
+        chat_provider=chat,
+        summary_repo=repo,
+        message_repo=messages or FakeChatMessageRepository(),
+        prompts_dir=prompts_dir,
+        token_budget=token_budget,
+        history_limit=history_limit,
+    )
+
+
+class TestWithinBudget:
+    def test_returns_history_unchanged(self, prompts_dir: Path) -> None:
+        chat = FakeChatProvider()
+        history = [_message(i) for i in range(4)]
+
+        strategy = _strategy(prompts_dir, chat, FakeConversationSummaryRepository())
+
+        result = strategy.build_context(history)
+
+        assert [m.id for m in result] == [m.id for m in history]
+        assert chat.prompts == []
+
+    def test_drops_tool_results(self, prompts_dir: Path) -> None:
+        history = [_message(0), _message(1, role=MessageRole.TOOL_RESULT), _message(2)]
+
+        result = _strategy(
+            prompts_dir, FakeChatProvider(), FakeConversationSummaryRepository()
+        ).build_context(history)
+
+        assert [m.id for m in result] == ["m000", "m002"]
+
+    def test_empty_history(self, prompts_dir: Path) -> None:
+        strategy = _strategy(
+            prompts_dir, FakeChatProvider(), FakeConversationSummaryRepository()
+        )
+
+        assert strategy.build_context([]) == []
+
+
+class TestFolding:
+    def test_folds_oldest_turns_into_summary(self, prompts_dir: Path) -> None:
+        chat = FakeChatProvider(["Reader asked about m0 to m2."])
+        repo = FakeConversationSummaryRepository()
+        history = [_message(i) for i in range(6)]
+
+        result = _strategy(prompts_dir, chat, repo).build_context(history)
+
+        assert result[0].role == MessageRole.USER
+        assert result[0].content == f"{SUMMARY_PREFIX}\nReader asked about m0 to m2."
+        assert [m.id for m in result[1:]] == ["m003", "m004", "m005"]
+        assert "m0 m0" in chat.prompts[0]
+        assert "m3 m3" not in chat.prompts[0]
+        assert chat.purposes == [CallPurpose.SUMMARIZATION]
+        stored = repo.get("c1")
+        assert stored is not None
+        assert stored.covered_message_id == "m002"
+
+    def test_next_turn_reuses_summary_without_llm_call(self, prompts_dir: Path) -> None:
+        chat = FakeChatProvider()
+        repo = FakeConversationSummaryRepository()
+        strategy = _strategy(prompts_dir, chat, repo)
+        strategy.build_context([_message(i) for i in range(6)])
+
+        result = strategy.build_context([_message(i) for i in range(8)])
+
+        assert len(chat.prompts) == 1
+        assert [m.id for m in result[1:]] == ["m003", "m004", "m005", "m006", "m007"]
+
+    def test_incremental_fold_sends_only_new_turns(self, prompts_dir: Path) -> None:
+        chat = FakeChatProvider(["First summary.", "Second summary."])
+        repo = FakeConversationSummaryRepository()
+        strategy = _strategy(prompts_dir, chat, repo)
+        strategy.build_context([_message(i) for i in range(6)])
+
+        result = strategy.build_context([_message(i) for i in range(3, 10)])
+
+        assert len(chat.prompts) == 2
+        assert "Summary so far: First summary." in chat.prompts[1]
+        assert "m2 m2" not in chat.prompts[1]
+        assert "m3 m3" in chat.prompts[1]
+        assert result[0].content.endswith("Second summary.")
+        assert sum(len(m.content.split()) for m in result[1:]) <= 50
+
+    def test_always_keeps_latest_message(self, prompts_dir: Path) -> None:
+        history = [_message(0), _message(1, words=200)]
+
+        result = _strategy(
+            prompts_dir, FakeChatProvider(), FakeConversationSummaryRepository()
+        ).build_context(history)
+
+        assert [m.id for m in result[1:]] == ["m001"]
+
+    def test_history_limit_is_configurable(self, prompts_dir: Path) -> None:
+        strategy = ConversationContextStrategy(
+            chat_provider=FakeChatProvider(),
+            summary_repo=FakeConversationSummaryRepository(),
+            message_repo=FakeChatMessageRepository(),
+            prompts_dir=prompts_dir,
+            history_limit=12,
+        )
+
+        assert strategy.history_limit == 12
+
+
+class TestHistoryWindow:
+    def test_turns_older_than_the_window_are_folded(self, prompts_dir: Path) -> None:
+        chat = FakeChatProvider(["Reader asked about m0 to m69."])
+        stored = [_message(i, words=20) for i in range(100)]
+        strategy = _strategy(
+            prompts_dir,
+            chat,
+            FakeConversationSummaryRepository(),
+            token_budget=3000,
+            messages=FakeChatMessageRepository(stored),
+        )
+
+        result = strategy.build_context(stored[-60:])
+
+        assert len(chat.prompts) == 1
+        assert "m0 m0" in chat.prompts[0]
+        assert "m39 m39" in chat.prompts[0]
+        assert "m70 m70" not in chat.prompts[0]
+        assert result[0].content.endswith("Reader asked about m0 to m69.")
+        assert [m.id for m in result[1:]] == [f"m{i:03d}" for i in range(70, 100)]
+
+    def test_window_within_the_summary_is_not_reloaded(self, prompts_dir: Path) -> None:
+        chat = FakeChatProvider()
+        stored = [_message(i, words=20) for i in range(104)]
+        messages = FakeChatMessageRepository(stored)
+        strategy = _strategy(
+            prompts_dir,
+            chat,
+            FakeConversationSummaryRepository(),
+            token_budget=3000,
+            messages=messages,
+        )
+        strategy.build_context(stored[40:100])
+
+        result = strategy.build_context(stored[44:104])
+
+        assert len(chat.prompts) == 1
+        assert messages.loads == 1
+        assert [m.id for m in result[1:]] == [f"m{i:03d}" for i in range(70, 104)]
+
+    def test_window_that_is_not_full_is_not_reloaded(self, prompts_dir: Path) -> None:
+        messages = FakeChatMessageRepository()
+        history = [_message(i) for i in range(4)]
+
+        result = _strategy(
+            prompts_dir,
+            FakeChatProvider(),
+            FakeConversationSummaryRepository(),
+            messages=messages,
+            history_limit=5,
+        ).build_context(history)
+
+        assert [m.id for m in result] == [m.id for m in history]
+        assert messages.loads == 0
+
+    def test_later_reloads_read_only_after_the_summary(self, prompts_dir: Path) -> None:
+        chat = FakeChatProvider(["First summary.", "Second summary."])
+        stored = [_message(i, words=20) for i in range(140)]
+        messages = FakeChatMessageRepository(stored)
+        strategy = _strategy(
+            prompts_dir,
+            chat,
+            FakeConversationSummaryRepository(),
+            token_budget=3000,
+            messages=messages,
+        )
+        strategy.build_context(stored[40:100])
+
+        result = strategy.build_context(stored[80:140])
+
+        assert (messages.loads, messages.tail_loads) == (1, 1)
+        assert "m69 m69" not in chat.prompts[1]
+        assert "m70 m70" in chat.prompts[1]
+        assert [m.id for m in result[1:]] == [f"m{i:03d}" for i in range(110, 140)]
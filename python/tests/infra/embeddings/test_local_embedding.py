@@ -0,0 +1,107 @@
+import math
+from array import array
+
+from interactive_books.domain.embedding_vector import EmbeddingVector, float32_vector
+from interactive_books.infra.embeddings.local import DIMENSION, EmbeddingProvider
+from interactive_books.infra.storage.database import Database
+from interactive_books.infra.storage.embedding_repo import EmbeddingRepository
+
+
+def _cosine(first: array[float], second: array[float]) -> float:
+    return sum(a * b for a, b in zip(first, second, strict=True))
+
+
+class TestEmbeddingProviderMetadata:
+    def test_provider_name_is_local(self) -> None:
+        assert EmbeddingProvider().provider_name == "local"
+
+    def test_default_dimension(self) -> None:
+        assert EmbeddingProvider().dimension == DIMENSION
+
+    def test_custom_dimension(self) -> None:
+        provider = EmbeddingProvider(dimension=64)
+
+        assert provider.dimension == 64
+        assert len(provider.embed(["hello"])[0]) == 64
+
+
+class TestEmbed:
+    def test_vectors_are_unit_length(self) -> None:
+        vectors = EmbeddingProvider().embed(["The whale", "A ship at sea"])
+
+        for vector in vectors:
+            assert math.isclose(
+                math.sqrt(sum(v * v for v in vector)), 1.0, rel_tol=1e-6
+            )
+
+    def test_empty_text_embeds_to_zero_vector(self) -> None:
+        [vector] = EmbeddingProvider().embed([""])
+
+        assert vector == float32_vector([0.0] * DIMENSION)
+
+    def test_empty_batch_returns_empty_list(self) -> None:
+        assert EmbeddingProvider().embed([]) == []
+
+    def test_deterministic_across_instances(self) -> None:
+        text = "Call me Ishmael."
+
+        assert EmbeddingProvider().embed([text]) == EmbeddingProvider().embed([text])
+
+    def test_batch_matches_single_embeddings(self) -> None:
+        provider = EmbeddingProvider()
+        texts = ["The white whale", "Queequeg's harpoon", "Ahab on deck"]
+
+        batch = provider.embed(texts)
+
+        for text, vector in zip(texts, batch, strict=True):
+            assert provider.embed([text])[0] == vector
+
+    def test_related_texts_are_closer_than_unrelated(self) -> None:
+        query, related, unrelated = EmbeddingProvider().embed(
+            [
+                "captain hunting the white whale",
+                "the captain hunted the great white whale for years",
+                "a recipe for baking sourdough bread",
+            ]
+        )
+
+        assert _cosine(query, related) > _cosine(query, unrelated)
+
+    def test_inflected_words_share_features(self) -> None:
+        whale, whaling, bread = EmbeddingProvider().embed(
+            ["whales", "whaling", "bread"]
+        )
+
+        assert _cosine(whale, whaling) > _cosine(whale, bread)
+
+
+class TestVectorSearch:
+    def test_nearest_chunk_is_the_relevant_one(self) -> None:
+        provider = EmbeddingProvider()
+        db = Database(":memory:", enable_vec=True)
+        repo = EmbeddingRepository(db)
+        texts = [
+            "Ishmael signs on to the Pequod in Nantucket.",
+            "Ahab nails a gold doubloon to the mast for the white whale.",
+            "Queequeg carves his coffin while he is sick with fever.",
+        ]
+        repo.ensure_table(provider.provider_name, provider.dimension)
+        repo.save_embeddings(
+            provider.provider_name,
+            provider.dimension,
+            "book-1",
+            [
+                EmbeddingVector(
+                    chunk_id=f"c{i}", vector=vector, start_page=i, end_page=i
+                )
+                for i, vector in enumerate(provider.embed(texts), start=1)
+            ],
+        )
+
+        [query] = provider.embed(["gold doubloon on the mast"])
+        hits = repo.search(
+            provider.provider_name, provider.dimension, "book-1", query, 1
+        )
+
+        assert hits[0][0] == "c2"
+        db.close()
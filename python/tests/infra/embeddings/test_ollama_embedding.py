@@ -0,0 +1,86 @@
+import pytest
+from interactive_books.domain.errors import BookError, BookErrorCode
+from interactive_books.infra.embeddings.ollama import (
+    MODEL,
+    REQUEST_BATCH_SIZE,
+    EmbeddingProvider,
+)
+from interactive_books.infra.ollama_client import OllamaClient
+
+from tests.helpers.ollama_stub import OllamaStub
+
+
+class TestEmbeddingProviderMetadata:
+    def test_provider_name_includes_model(self) -> None:
+        provider = EmbeddingProvider(OllamaClient(), model="mxbai-embed-large:v1")
+
+        assert provider.provider_name == "ollama_mxbai_embed_large_v1"
+
+    def test_default_model(self) -> None:
+        provider = EmbeddingProvider(OllamaClient())
+
+        assert provider.provider_name == f"ollama_{MODEL.replace('-', '_')}"
+
+    def test_configured_dimension_needs_no_request(self) -> None:
+        with OllamaStub() as stub:
+            provider = EmbeddingProvider(OllamaClient(stub.base_url), dimension=768)
+
+            assert provider.dimension == 768
+
+        assert stub.embed_calls == []
+
+    def test_dimension_is_probed_once(self) -> None:
+        with OllamaStub(dimension=6) as stub:
+            provider = EmbeddingProvider(OllamaClient(stub.base_url))
+
+            assert provider.dimension == 6
+            assert provider.dimension == 6
+
+        assert len(stub.embed_calls) == 1
+
+
+class TestEmbed:
+    def test_sends_batched_request(self) -> None:
+        with OllamaStub() as stub:
+            provider = EmbeddingProvider(OllamaClient(stub.base_url), model="m")
+
+            vectors = provider.embed(["a", "bbb"])
+
+        assert stub.embed_calls == [{"model": "m", "input": ["a", "bbb"]}]
+        assert [v[0] for v in vectors] == [1.0, 3.0]
+
+    def test_large_batches_are_split_and_keep_order(self) -> None:
+        texts = ["x" * n for n in range(1, 3 * REQUEST_BATCH_SIZE + 2)]
+        with OllamaStub() as stub:
+            provider = EmbeddingProvider(OllamaClient(stub.base_url))
+
+            vectors = provider.embed(texts)
+
+        assert len(stub.embed_calls) == 4
+        assert [v[0] for v in vectors] == [float(len(t)) for t in texts]
+
+    def test_concurrency_is_bounded_by_client(self) -> None:
+        texts = ["text"] * (6 * REQUEST_BATCH_SIZE)
+        with OllamaStub(delay=0.05) as stub:
+            client = OllamaClient(stub.base_url, max_concurrency=2)
+
+            EmbeddingProvider(client).embed(texts)
+
+        assert len(stub.embed_calls) == 6
+        assert stub.max_in_flight == 2
+
+    def test_empty_input_makes_no_request(self) -> None:
+        with OllamaStub() as stub:
+            assert EmbeddingProvider(OllamaClient(stub.base_url)).embed([]) == []
+
+        assert stub.embed_calls == []
+
+    def test_server_error_raises_embedding_failed(self) -> None:
+        with OllamaStub(error="model not found") as stub:
+            provider = EmbeddingProvider(OllamaClient(stub.base_url))
+
+            with pytest.raises(BookError) as exc_info:
+                provider.embed(["a"])
+
+        assert exc_info.value.code == BookErrorCode.EMBEDDING_FAILED
+        assert "model not found" in exc_info.value.message
@@ -1,3 +1,5 @@
+import base64
+from array import array
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,7 +11,8 @@ from openai import APIConnectionError, AuthenticationError, RateLimitError
 def _mock_embedding(index: int, vector: list[float]) -> MagicMock:
     emb = MagicMock()
     emb.index = index
-    emb.embedding = vector
+    # Base64 of the little-endian float32 components, as the API returns them.
+    emb.embedding = base64.b64encode(array("f", vector).tobytes()).decode()
     return emb
 
 
@@ -66,6 +69,18 @@ class TestEmbedBatch:
         assert result[1][0] == 1.0
         assert result[2][0] == 2.0
 
+    def test_requests_base64_and_decodes_to_float32(self) -> None:
+        response = _mock_response([_mock_embedding(0, [0.5, -0.25, 3.0])])
+
+        provider = EmbeddingProvider(api_key="test-key")
+        with patch.object(
+            provider._client.embeddings, "create", return_value=response
+        ) as create:
+            [vector] = provider.embed(["Hello"])
+
+        assert create.call_args.kwargs["encoding_format"] == "base64"
+        assert vector == array("f", [0.5, -0.25, 3.0])
+
 
 class TestEmbedErrors:
     def test_authentication_error_raises_embedding_failed(self) -> None:
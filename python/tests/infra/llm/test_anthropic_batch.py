@@ -0,0 +1,97 @@
+import pytest
+from interactive_books.domain.errors import LLMError, LLMErrorCode
+from interactive_books.domain.prompt_message import PromptMessage
+from interactive_books.domain.model_route import CallPurpose, ModelRoute
+from interactive_books.infra.llm.anthropic import DEFAULT_ROUTES, BatchChatProvider
+
+from tests.helpers.anthropic_stub import AnthropicBatchStub
+
+
+def _echo_last_user_message(params: dict[str, object]) -> str | None:
+    messages = params["messages"]
+    assert isinstance(messages, list)
+    content = messages[-1]["content"]
+    return None if content == "fail" else f"echo: {content}"
+
+
+class TestSubmitBatch:
+    def test_submits_one_request_per_custom_id(self) -> None:
+        with AnthropicBatchStub(_echo_last_user_message) as stub:
+            provider = BatchChatProvider(api_key="test-key", base_url=stub.base_url)
+
+            batch_id = provider.submit_batch(
+                {
+                    "a": [PromptMessage(role="user", content="first")],
+                    "b": [
+                        PromptMessage(role="system", content="Be brief."),
+                        PromptMessage(role="user", content="second"),
+                    ],
+                }
+            )
+
+        requests = stub.batches[batch_id]
+        assert [r["custom_id"] for r in requests] == ["a", "b"]
+        params = requests[1]["params"]
+        assert isinstance(params, dict)
+        assert params["model"] == DEFAULT_ROUTES[CallPurpose.SUMMARIZATION].model
+        assert params["system"] == "Be brief."
+        assert params["messages"] == [{"role": "user", "content": "second"}]
+
+    def test_uses_configured_summarization_route(self) -> None:
+        with AnthropicBatchStub(_echo_last_user_message) as stub:
+            provider = BatchChatProvider(
+                api_key="test-key",
+                base_url=stub.base_url,
+                routes={
+                    CallPurpose.SUMMARIZATION: ModelRoute(
+                        model="summary-model", max_tokens=1000
+                    )
+                },
+            )
+
+            batch_id = provider.submit_batch(
+                {"a": [PromptMessage(role="user", content="first")]}
+            )
+
+        params = stub.batches[batch_id][0]["params"]
+        assert isinstance(params, dict)
+        assert params["model"] == "summary-model"
+        assert params["max_tokens"] == 1000
+
+    def test_server_error_raises_llm_error(self) -> None:
+        with AnthropicBatchStub(_echo_last_user_message) as stub:
+            provider = BatchChatProvider(api_key="test-key", base_url=stub.base_url)
+            provider._client = provider._client.with_options(max_retries=0)
+
+            with pytest.raises(LLMError) as exc_info:
+                provider.is_batch_ended("msgbatch_missing")
+
+        assert exc_info.value.code == LLMErrorCode.API_CALL_FAILED
+
+
+class TestBatchLifecycle:
+    def test_reports_in_progress_until_ended(self) -> None:
+        with AnthropicBatchStub(_echo_last_user_message, polls_before_end=2) as stub:
+            provider = BatchChatProvider(api_key="test-key", base_url=stub.base_url)
+            batch_id = provider.submit_batch(
+                {"a": [PromptMessage(role="user", content="hi")]}
+            )
+
+            states = [provider.is_batch_ended(batch_id) for _ in range(3)]
+
+        assert states == [False, False, True]
+
+    def test_results_map_custom_id_to_text_and_skip_errors(self) -> None:
+        with AnthropicBatchStub(_echo_last_user_message) as stub:
+            provider = BatchChatProvider(api_key="test-key", base_url=stub.base_url)
+            batch_id = provider.submit_batch(
+                {
+                    "ok": [PromptMessage(role="user", content="hello")],
+                    "bad": [PromptMessage(role="user", content="fail")],
+                }
+            )
+            provider.is_batch_ended(batch_id)
+
+            results = provider.get_batch_results(batch_id)
+
+        assert results == {"ok": "echo: hello"}
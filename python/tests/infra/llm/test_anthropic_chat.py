@@ -1,10 +1,12 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from interactive_books.domain.deadline import MIN_DEADLINE_TIMEOUT, Deadline
 from interactive_books.domain.errors import LLMError, LLMErrorCode
+from interactive_books.domain.model_route import CallPurpose, ModelRoute
 from interactive_books.domain.prompt_message import PromptMessage
 from interactive_books.domain.tool import ToolDefinition, ToolInvocation
-from interactive_books.infra.llm.anthropic import ChatProvider
+from interactive_books.infra.llm.anthropic import DEFAULT_ROUTES, ChatProvider
 
 
 def _mock_usage(input_tokens: int = 100, output_tokens: int = 50) -> MagicMock:
@@ -233,6 +235,53 @@ class TestChatWithTools:
         assert messages[2]["content"][0]["type"] == "tool_result"
         assert messages[2]["content"][0]["tool_use_id"] == "tu_1"
 
+    def test_parallel_tool_results_share_one_user_message(self) -> None:
+        provider = ChatProvider(api_key="test-key")
+        text_block = MagicMock()
+        text_block.type = "text"
+        text_block.text = "Both chapters..."
+        mock_response = MagicMock()
+        mock_response.content = [text_block]
+        mock_response.usage = _mock_usage()
+
+        with patch.object(
+            provider._client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            provider.chat_with_tools(
+                [
+                    PromptMessage(role="user", content="Compare chapters 3 and 4"),
+                    PromptMessage(
+                        role="assistant",
+                        content="",
+                        tool_invocations=[
+                            ToolInvocation(
+                                tool_name="search_book",
+                                tool_use_id="tu_1",
+                                arguments={"query": "chapter 3"},
+                            ),
+                            ToolInvocation(
+                                tool_name="search_book",
+                                tool_use_id="tu_2",
+                                arguments={"query": "chapter 4"},
+                            ),
+                        ],
+                    ),
+                    PromptMessage(
+                        role="tool_result", content="Chapter 3...", tool_use_id="tu_1"
+                    ),
+                    PromptMessage(
+                        role="tool_result", content="Chapter 4...", tool_use_id="tu_2"
+                    ),
+                ],
+                [_search_tool()],
+            )
+
+        messages = mock_create.call_args.kwargs["messages"]
+        assert len(messages) == 3
+        assert [b["id"] for b in messages[1]["content"]] == ["tu_1", "tu_2"]
+        assert messages[2]["role"] == "user"
+        assert [b["tool_use_id"] for b in messages[2]["content"]] == ["tu_1", "tu_2"]
+
     def test_tool_result_without_tool_use_id_is_dropped(self) -> None:
         """History-loaded tool_result messages (no tool_use_id) are dropped.
 
@@ -310,3 +359,124 @@ class TestChatWithTools:
         assert result.usage is not None
         assert result.usage.input_tokens == 1234
         assert result.usage.output_tokens == 567
+
+
+class TestDeadline:
+    def test_deadline_bounds_request_timeout_without_retries(self) -> None:
+        provider = ChatProvider(api_key="test-key")
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Quick answer.")]
+
+        with patch.object(
+            provider._deadline_client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            provider.chat(
+                [PromptMessage(role="user", content="Hi")],
+                deadline=Deadline(30.0),
+            )
+
+        assert provider._deadline_client.max_retries == 0
+        assert 25.0 < mock_create.call_args.kwargs["timeout"] <= 30.0
+
+    def test_spent_deadline_still_allows_minimum_timeout(self) -> None:
+        provider = ChatProvider(api_key="test-key")
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Quick answer.")]
+
+        with patch.object(
+            provider._deadline_client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            provider.chat(
+                [PromptMessage(role="user", content="Hi")],
+                deadline=Deadline(0.0),
+            )
+
+        assert mock_create.call_args.kwargs["timeout"] == MIN_DEADLINE_TIMEOUT
+
+    def test_no_deadline_uses_default_client(self) -> None:
+        provider = ChatProvider(api_key="test-key")
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Answer.")]
+
+        with patch.object(
+            provider._client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            provider.chat([PromptMessage(role="user", content="Hi")])
+
+        assert "timeout" not in mock_create.call_args.kwargs
+
+
+class TestModelRouting:
+    def test_default_purpose_uses_answer_route(self) -> None:
+        provider = ChatProvider(api_key="test-key")
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Answer.")]
+
+        with patch.object(
+            provider._client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            provider.chat([PromptMessage(role="user", content="Hi")])
+
+        route = DEFAULT_ROUTES[CallPurpose.ANSWER]
+        assert mock_create.call_args.kwargs["model"] == route.model
+        assert mock_create.call_args.kwargs["max_tokens"] == route.max_tokens
+
+    def test_purpose_selects_its_route(self) -> None:
+        provider = ChatProvider(api_key="test-key")
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="rewritten query")]
+
+        with patch.object(
+            provider._client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            provider.chat(
+                [PromptMessage(role="user", content="Hi")],
+                purpose=CallPurpose.REFORMULATION,
+            )
+
+        route = DEFAULT_ROUTES[CallPurpose.REFORMULATION]
+        assert mock_create.call_args.kwargs["model"] == route.model
+        assert mock_create.call_args.kwargs["max_tokens"] == route.max_tokens
+
+    def test_configured_routes_override_defaults(self) -> None:
+        provider = ChatProvider(
+            api_key="test-key",
+            routes={
+                CallPurpose.TOOL_PLANNING: ModelRoute(model="planner", max_tokens=512)
+            },
+        )
+        mock_response = MagicMock()
+        mock_response.content = []
+        mock_response.usage = _mock_usage()
+
+        with patch.object(
+            provider._client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            provider.chat_with_tools(
+                [PromptMessage(role="user", content="Hi")],
+                [_search_tool()],
+                purpose=CallPurpose.TOOL_PLANNING,
+            )
+
+        assert mock_create.call_args.kwargs["model"] == "planner"
+        assert mock_create.call_args.kwargs["max_tokens"] == 512
+        assert provider.route_for(CallPurpose.ANSWER) == DEFAULT_ROUTES[
+            CallPurpose.ANSWER
+        ]
+
+    def test_usage_reports_responding_model(self) -> None:
+        provider = ChatProvider(api_key="test-key")
+        mock_response = MagicMock()
+        mock_response.content = []
+        mock_response.usage = _mock_usage()
+        mock_response.model = "claude-haiku-4-5-20251001"
+
+        with patch.object(
+            provider._client.messages, "create", return_value=mock_response
+        ):
+            result = provider.chat_with_tools(
+                [PromptMessage(role="user", content="Hi")], [_search_tool()]
+            )
+
+        assert result.usage is not None
+        assert result.usage.model == "claude-haiku-4-5-20251001"
@@ -0,0 +1,141 @@
+import pytest
+from interactive_books.domain.deadline import Deadline
+from interactive_books.domain.errors import LLMError, LLMErrorCode
+from interactive_books.domain.model_route import CallPurpose, ModelRoute
+from interactive_books.domain.prompt_message import PromptMessage
+from interactive_books.domain.tool import ToolInvocation
+from interactive_books.infra.llm.ollama import (
+    MODEL,
+    REFORMULATION_MAX_TOKENS,
+    ChatProvider,
+    default_routes,
+)
+from interactive_books.infra.ollama_client import OllamaClient
+
+from tests.helpers.ollama_stub import OllamaStub
+
+
+def _provider(stub: OllamaStub, **kwargs: object) -> ChatProvider:
+    return ChatProvider(OllamaClient(stub.base_url), **kwargs)  # type: ignore[arg-type]
+
+
+class TestDefaultRoutes:
+    def test_every_purpose_uses_one_model(self) -> None:
+        routes = default_routes("mistral")
+
+        assert {route.model for route in routes.values()} == {"mistral"}
+        assert set(routes) == set(CallPurpose)
+
+    def test_reformulation_gets_a_short_budget(self) -> None:
+        routes = default_routes()
+
+        assert routes[CallPurpose.REFORMULATION].max_tokens == REFORMULATION_MAX_TOKENS
+
+
+class TestChat:
+    def test_joins_streamed_chunks(self) -> None:
+        with OllamaStub(reply="The whale is white.") as stub:
+            answer = _provider(stub).chat([PromptMessage(role="user", content="Hi")])
+
+        assert answer == "The whale is white."
+
+    def test_sends_streaming_request_for_route(self) -> None:
+        with OllamaStub() as stub:
+            provider = _provider(
+                stub,
+                routes={
+                    CallPurpose.REFORMULATION: ModelRoute(model="tiny", max_tokens=32)
+                },
+            )
+            provider.chat(
+                [
+                    PromptMessage(role="system", content="Be brief."),
+                    PromptMessage(role="user", content="Rewrite this"),
+                ],
+                purpose=CallPurpose.REFORMULATION,
+            )
+
+        [params] = stub.chat_calls
+        assert params["model"] == "tiny"
+        assert params["stream"] is True
+        assert params["options"] == {"num_predict": 32}
+        assert params["messages"] == [
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": "Rewrite this"},
+        ]
+
+    def test_drops_tool_exchanges_from_history(self) -> None:
+        invocation = ToolInvocation(
+            tool_name="search_book", tool_use_id="t1", arguments={"query": "x"}
+        )
+        with OllamaStub() as stub:
+            _provider(stub).chat(
+                [
+                    PromptMessage(role="user", content="Q1"),
+                    PromptMessage(
+                        role="assistant", content="", tool_invocations=[invocation]
+                    ),
+                    PromptMessage(role="tool_result", content="passages"),
+                    PromptMessage(role="assistant", content="A1"),
+                    PromptMessage(role="user", content="Q2"),
+                ]
+            )
+
+        messages = stub.chat_calls[0]["messages"]
+        assert [m["content"] for m in messages] == ["Q1", "A1", "Q2"]  # type: ignore[attr-defined]
+
+    def test_model_name_is_answer_route(self) -> None:
+        provider = ChatProvider(OllamaClient())
+
+        assert provider.model_name == MODEL
+        assert provider.route_for(CallPurpose.ANSWER).model == MODEL
+
+    def test_accepts_deadline(self) -> None:
+        with OllamaStub(reply="ok") as stub:
+            answer = _provider(stub).chat(
+                [PromptMessage(role="user", content="Hi")],
+                deadline=Deadline(30.0),
+            )
+
+        assert answer == "ok"
+
+    def test_stream_running_past_its_deadline_times_out(self) -> None:
+        # Each reading of the clock moves it on by 3 seconds, so the 5 second
+        # request budget runs out while the reply is still streaming.
+        ticks = iter(range(0, 300, 3))
+        with (
+            OllamaStub(reply="one two three four five") as stub,
+            pytest.raises(LLMError) as exc_info,
+        ):
+            _provider(stub).chat(
+                [PromptMessage(role="user", content="Hi")],
+                deadline=Deadline(0.0, clock=lambda: float(next(ticks))),
+            )
+
+        assert exc_info.value.code == LLMErrorCode.TIMEOUT
+
+    def test_server_error_raises_llm_error(self) -> None:
+        with OllamaStub(error="model 'llama3.2' not found") as stub:
+            with pytest.raises(LLMError) as exc_info:
+                _provider(stub).chat([PromptMessage(role="user", content="Hi")])
+
+        assert exc_info.value.code == LLMErrorCode.API_CALL_FAILED
+        assert "not found" in exc_info.value.message
+
+    def test_unreachable_server_raises_llm_error(self) -> None:
+        provider = ChatProvider(OllamaClient("http://127.0.0.1:9"))
+
+        with pytest.raises(LLMError) as exc_info:
+            provider.chat([PromptMessage(role="user", content="Hi")])
+
+        assert exc_info.value.code == LLMErrorCode.API_CALL_FAILED
+
+
+class TestChatWithTools:
+    def test_tool_use_is_unsupported(self) -> None:
+        provider = ChatProvider(OllamaClient())
+
+        with pytest.raises(LLMError) as exc_info:
+            provider.chat_with_tools([PromptMessage(role="user", content="Hi")], [])
+
+        assert exc_info.value.code == LLMErrorCode.UNSUPPORTED_FEATURE
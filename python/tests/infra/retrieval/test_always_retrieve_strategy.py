@@ -2,7 +2,14 @@ from collections.abc import Callable
 from pathlib import Path
 
 import pytest
-from interactive_books.domain.chat_event import ChatEvent, ToolResultEvent
+from interactive_books.domain.chat_event import (
+    ChatEvent,
+    DegradationEvent,
+    DegradationKind,
+    ToolResultEvent,
+)
+from interactive_books.domain.deadline import Deadline
+from interactive_books.domain.model_route import CallPurpose
 from interactive_books.domain.prompt_message import PromptMessage
 from interactive_books.domain.search_result import SearchResult
 from interactive_books.domain.tool import ChatResponse, ToolDefinition, ToolResult
@@ -16,19 +23,34 @@ class FakeChatProvider:
         self._responses = list(responses)
         self._call_count = 0
         self.chat_calls: list[list[PromptMessage]] = []
+        self.deadlines: list[Deadline | None] = []
+        self.purposes: list[CallPurpose] = []
 
     @property
     def model_name(self) -> str:
         return "fake"
 
-    def chat(self, messages: list[PromptMessage]) -> str:
+    def chat(
+        self,
+        messages: list[PromptMessage],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> str:
         self.chat_calls.append(messages)
+        self.deadlines.append(deadline)
+        self.purposes.append(purpose)
         response = self._responses[self._call_count]
         self._call_count += 1
         return response
 
     def chat_with_tools(
-        self, messages: list[PromptMessage], tools: list[ToolDefinition]
+        self,
+        messages: list[PromptMessage],
+        tools: list[ToolDefinition],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
     ) -> ChatResponse:
         return ChatResponse(text="")
 
@@ -116,6 +138,7 @@ class TestAlwaysRetrieveMultiTurn:
 
         assert text == "The theme is Y."
         assert len(provider.chat_calls) == 2
+        assert provider.purposes == [CallPurpose.REFORMULATION, CallPurpose.ANSWER]
 
 
 class TestAlwaysRetrieveContextFormatting:
@@ -176,3 +199,135 @@ class TestAlwaysRetrieveEventEmission:
         )
 
         assert text == "The answer."
+
+
+class TestAlwaysRetrieveSpeculative:
+    _HISTORY = [
+        PromptMessage(role="user", content="Tell me about Captain Ahab"),
+        PromptMessage(role="assistant", content="He commands the Pequod."),
+    ]
+
+    def test_reuses_speculative_results_for_similar_query(
+        self, prompts_dir: Path
+    ) -> None:
+        provider = FakeChatProvider(
+            ["Why is Ahab obsessed with the whale?", "Revenge."]
+        )
+        search = FakeSearchHandler()
+        strategy = RetrievalStrategy(prompts_dir, speculative=True)
+
+        strategy.execute(
+            provider,
+            [
+                *self._HISTORY,
+                PromptMessage(role="user", content="Why is he obsessed with the whale?"),
+            ],
+            [],
+            search.as_handlers(),
+        )
+
+        assert search.captured_queries == ["Why is he obsessed with the whale?"]
+
+    def test_searches_again_when_reformulation_diverges(
+        self, prompts_dir: Path
+    ) -> None:
+        provider = FakeChatProvider(["Pequod crew nationalities", "Many."])
+        search = FakeSearchHandler()
+        strategy = RetrievalStrategy(prompts_dir, speculative=True)
+
+        strategy.execute(
+            provider,
+            [
+                *self._HISTORY,
+                PromptMessage(role="user", content="And who sails with him?"),
+            ],
+            [],
+            search.as_handlers(),
+        )
+
+        assert search.captured_queries == [
+            "And who sails with him?",
+            "Pequod crew nationalities",
+        ]
+
+    def test_first_message_is_not_speculated(self, prompts_dir: Path) -> None:
+        provider = FakeChatProvider(["Answer."])
+        search = FakeSearchHandler()
+        strategy = RetrievalStrategy(prompts_dir, speculative=True)
+
+        strategy.execute(
+            provider,
+            [PromptMessage(role="user", content="Who is Ishmael?")],
+            [],
+            search.as_handlers(),
+        )
+
+        assert search.captured_queries == ["Who is Ishmael?"]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingSearchHandler(FakeSearchHandler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.arguments: list[dict[str, object]] = []
+
+    def __call__(self, arguments: dict[str, object]) -> ToolResult:
+        self.arguments.append(arguments)
+        return super().__call__(arguments)
+
+
+_MULTI_TURN = [
+    PromptMessage(role="user", content="Tell me about chapter 3"),
+    PromptMessage(role="assistant", content="Chapter 3 is interesting."),
+    PromptMessage(role="user", content="What is its main theme?"),
+]
+
+
+class TestAlwaysRetrieveDeadline:
+    def test_low_budget_skips_reformulation_and_shrinks_search(
+        self, prompts_dir: Path
+    ) -> None:
+        clock = FakeClock()
+        deadline = Deadline(10.0, clock=clock)
+        clock.now = 6.0
+        provider = FakeChatProvider(["The theme is Y."])
+        search = RecordingSearchHandler()
+        events: list[ChatEvent] = []
+
+        text, _ = RetrievalStrategy(prompts_dir).execute(
+            provider,
+            _MULTI_TURN,
+            [],
+            search.as_handlers(),
+            on_event=events.append,
+            deadline=deadline,
+        )
+
+        assert text == "The theme is Y."
+        assert len(provider.chat_calls) == 1
+        assert provider.deadlines == [deadline]
+        assert search.arguments == [{"query": "What is its main theme?", "top_k": 2}]
+        kinds = [e.kind for e in events if isinstance(e, DegradationEvent)]
+        assert kinds == [
+            DegradationKind.SKIP_REFORMULATION,
+            DegradationKind.REDUCE_TOP_K,
+        ]
+
+    def test_ample_budget_runs_every_step(self, prompts_dir: Path) -> None:
+        deadline = Deadline(10.0, clock=FakeClock())
+        provider = FakeChatProvider(["main theme of chapter 3", "The theme is Y."])
+        search = RecordingSearchHandler()
+
+        RetrievalStrategy(prompts_dir).execute(
+            provider, _MULTI_TURN, [], search.as_handlers(), deadline=deadline
+        )
+
+        assert provider.deadlines == [deadline, deadline]
+        assert search.arguments == [{"query": "main theme of chapter 3"}]
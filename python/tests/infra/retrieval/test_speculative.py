@@ -0,0 +1,47 @@
+import threading
+
+from interactive_books.domain.tool import ToolResult
+from interactive_books.infra.retrieval._speculative import SpeculativeSearch
+
+
+def _result(query: str) -> ToolResult:
+    return ToolResult(formatted_text=f"About {query}", query=query, result_count=0)
+
+
+def _handler(arguments: dict[str, object]) -> ToolResult:
+    return _result(str(arguments["query"]))
+
+
+class TestSpeculativeSearch:
+    def test_take_returns_result_for_similar_query_once(self) -> None:
+        speculative = SpeculativeSearch(_handler, "Why is Ahab angry?")
+
+        first = speculative.take("Ahab angry")
+
+        assert first is not None
+        assert first.query == "Why is Ahab angry?"
+        assert speculative.take("Ahab angry") is None
+
+    def test_take_rejects_dissimilar_query(self) -> None:
+        speculative = SpeculativeSearch(_handler, "Why is Ahab angry?")
+
+        assert speculative.take("Queequeg") is None
+
+    def test_search_runs_in_background(self) -> None:
+        release = threading.Event()
+
+        def slow_handler(arguments: dict[str, object]) -> ToolResult:
+            release.wait(timeout=5)
+            return _result(str(arguments["query"]))
+
+        speculative = SpeculativeSearch(slow_handler, "whale")
+        release.set()
+
+        result = speculative.take("whale")
+        assert result is not None
+
+    def test_handler_failure_yields_none(self) -> None:
+        def failing_handler(arguments: dict[str, object]) -> ToolResult:
+            raise RuntimeError("boom")
+
+        assert SpeculativeSearch(failing_handler, "whale").take("whale") is None
@@ -1,12 +1,19 @@
+import threading
+import time
 from collections.abc import Callable
 
 from interactive_books.domain.chat import MessageRole
 from interactive_books.domain.chat_event import (
     ChatEvent,
+    DegradationEvent,
+    DegradationKind,
     TokenUsageEvent,
     ToolInvocationEvent,
     ToolResultEvent,
 )
+from interactive_books.domain.deadline import Deadline
+from interactive_books.domain.passage_reference import PassageReference
+from interactive_books.domain.model_route import CallPurpose
 from interactive_books.domain.prompt_message import PromptMessage
 from interactive_books.domain.search_result import SearchResult
 from interactive_books.domain.tool import (
@@ -33,22 +40,56 @@ class FakeChatProvider:
     def __init__(self, responses: list[ChatResponse]) -> None:
         self._responses = list(responses)
         self._call_count = 0
+        self.deadlines: list[Deadline | None] = []
+        self.purposes: list[CallPurpose] = []
 
     @property
     def model_name(self) -> str:
         return "fake"
 
-    def chat(self, messages: list[PromptMessage]) -> str:
+    def chat(
+        self,
+        messages: list[PromptMessage],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> str:
         return ""
 
     def chat_with_tools(
-        self, messages: list[PromptMessage], tools: list[ToolDefinition]
+        self,
+        messages: list[PromptMessage],
+        tools: list[ToolDefinition],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
     ) -> ChatResponse:
+        self.deadlines.append(deadline)
+        self.purposes.append(purpose)
         response = self._responses[self._call_count]
         self._call_count += 1
         return response
 
 
+class RecordingChatProvider(FakeChatProvider):
+    def __init__(self, responses: list[ChatResponse]) -> None:
+        super().__init__(responses)
+        self.calls: list[list[PromptMessage]] = []
+
+    def chat_with_tools(
+        self,
+        messages: list[PromptMessage],
+        tools: list[ToolDefinition],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> ChatResponse:
+        self.calls.append(list(messages))
+        return super().chat_with_tools(
+            messages, tools, deadline=deadline, purpose=purpose
+        )
+
+
 class FakeSearchHandler:
     def __init__(self, results: list[SearchResult] | None = None) -> None:
         self.captured_queries: list[str] = []
@@ -130,7 +171,10 @@ class TestToolUseStrategyRetrieveAndReply:
         assert text == "Chapter 3 is about X."
         assert len(new_messages) == 1
         assert new_messages[0].role == MessageRole.TOOL_RESULT
-        assert "[Pages 30-35]" in new_messages[0].content
+        reference = PassageReference.from_content(new_messages[0].content)
+        assert reference == PassageReference(
+            query="chapter 3", chunk_ids=("c1",), pages=((30, 35),)
+        )
         assert search.captured_queries == ["chapter 3"]
 
 
@@ -160,6 +204,9 @@ class TestToolUseStrategyMaxIterations:
 
         assert text == "Final answer after max iterations."
         assert len(new_messages) == 3
+        assert provider.purposes == [CallPurpose.TOOL_PLANNING] * 3 + [
+            CallPurpose.ANSWER
+        ]
 
     def test_returns_nonempty_text_when_all_iterations_yield_tool_calls(self) -> None:
         """Reproduces bug: LLM never produces text, only tool calls on every
@@ -453,6 +500,24 @@ class TestToolUseStrategyEventEmission:
         assert len(result_events) == 1
         assert result_events[0].result_count == 1
 
+    def test_token_usage_event_carries_model(self) -> None:
+        usage = TokenUsage(input_tokens=10, output_tokens=5, model="planner")
+        provider = FakeChatProvider([ChatResponse(text="Answer.", usage=usage)])
+        strategy = RetrievalStrategy()
+        events, on_event = _collect_events()
+
+        strategy.execute(
+            provider,
+            [PromptMessage(role="user", content="Hello")],
+            [_search_tool()],
+            FakeSearchHandler().as_handlers(),
+            on_event=on_event,
+        )
+
+        assert events == [
+            TokenUsageEvent(input_tokens=10, output_tokens=5, model="planner")
+        ]
+
     def test_no_token_event_when_usage_is_none(self) -> None:
         provider = FakeChatProvider([ChatResponse(text="Answer.")])
         strategy = RetrievalStrategy()
@@ -467,3 +532,476 @@ class TestToolUseStrategyEventEmission:
         )
 
         assert len(events) == 0
+
+
+def _search_invocation(tool_use_id: str, query: str) -> ToolInvocation:
+    return ToolInvocation(
+        tool_name="search_book", tool_use_id=tool_use_id, arguments={"query": query}
+    )
+
+
+class TestToolUseStrategyParallelInvocations:
+    def test_groups_invocations_into_one_assistant_message(self) -> None:
+        provider = RecordingChatProvider(
+            [
+                ChatResponse(
+                    text="Let me look.",
+                    tool_invocations=[
+                        _search_invocation("tu_1", "whales"),
+                        _search_invocation("tu_2", "the sea"),
+                    ],
+                ),
+                ChatResponse(text="Done."),
+            ]
+        )
+        search = FakeSearchHandler()
+
+        _, new_messages = RetrievalStrategy().execute(
+            provider,
+            [PromptMessage(role="user", content="Compare")],
+            [_search_tool()],
+            search.as_handlers(),
+        )
+
+        second_call = provider.calls[1]
+        assistant = second_call[1]
+        assert assistant.role == "assistant"
+        assert [i.tool_use_id for i in assistant.tool_invocations] == ["tu_1", "tu_2"]
+        assert [(m.role, m.tool_use_id) for m in second_call[2:]] == [
+            ("tool_result", "tu_1"),
+            ("tool_result", "tu_2"),
+        ]
+        assert len(new_messages) == 2
+
+    def test_batch_handler_receives_all_queries_of_a_turn(self) -> None:
+        provider = FakeChatProvider(
+            [
+                ChatResponse(
+                    tool_invocations=[
+                        _search_invocation("tu_1", "whales"),
+                        _search_invocation("tu_2", "the sea"),
+                    ]
+                ),
+                ChatResponse(text="Done."),
+            ]
+        )
+        single = FakeSearchHandler()
+        batches: list[list[str]] = []
+
+        def batch_handler(arguments_list: list[dict[str, object]]) -> list[ToolResult]:
+            queries = [str(a["query"]) for a in arguments_list]
+            batches.append(queries)
+            return [
+                ToolResult(formatted_text=f"About {q}", query=q, result_count=0)
+                for q in queries
+            ]
+
+        _, new_messages = RetrievalStrategy().execute(
+            provider,
+            [PromptMessage(role="user", content="Compare")],
+            [_search_tool()],
+            single.as_handlers(),
+            batch_tool_handlers={"search_book": batch_handler},
+        )
+
+        assert batches == [["whales", "the sea"]]
+        assert single.captured_queries == []
+        assert [m.content for m in new_messages] == ["About whales", "About the sea"]
+
+    def test_set_page_finishes_before_search_starts(self) -> None:
+        provider = FakeChatProvider(
+            [
+                ChatResponse(
+                    tool_invocations=[
+                        _search_invocation("tu_1", "whales"),
+                        ToolInvocation(
+                            tool_name="set_page", tool_use_id="tu_2", arguments={"page": 5}
+                        ),
+                    ]
+                ),
+                ChatResponse(text="Done."),
+            ]
+        )
+        calls: list[str] = []
+
+        def search_handler(arguments: dict[str, object]) -> ToolResult:
+            calls.append("search started")
+            return ToolResult(formatted_text="passages", query="whales", result_count=0)
+
+        def set_page_handler(arguments: dict[str, object]) -> ToolResult:
+            calls.append("set_page started")
+            time.sleep(0.05)
+            calls.append("set_page finished")
+            return ToolResult(formatted_text="Page set.", query="", result_count=0)
+
+        _, new_messages = RetrievalStrategy().execute(
+            provider,
+            [PromptMessage(role="user", content="I'm on page 5, find whales")],
+            [_search_tool()],
+            {"search_book": search_handler, "set_page": set_page_handler},
+        )
+
+        assert calls == ["set_page started", "set_page finished", "search started"]
+        assert [m.content for m in new_messages] == ["passages", "Page set."]
+
+    def test_read_only_tools_run_concurrently(self) -> None:
+        provider = FakeChatProvider(
+            [
+                ChatResponse(
+                    tool_invocations=[
+                        _search_invocation("tu_1", "whales"),
+                        ToolInvocation(
+                            tool_name="find_quote",
+                            tool_use_id="tu_2",
+                            arguments={"phrase": "Call me Ishmael"},
+                        ),
+                    ]
+                ),
+                ChatResponse(text="Done."),
+            ]
+        )
+        barrier = threading.Barrier(2, timeout=5)
+
+        def search_handler(arguments: dict[str, object]) -> ToolResult:
+            barrier.wait()
+            return ToolResult(formatted_text="passages", query="whales", result_count=0)
+
+        def find_quote_handler(arguments: dict[str, object]) -> ToolResult:
+            barrier.wait()
+            return ToolResult(formatted_text="quote", query="", result_count=0)
+
+        _, new_messages = RetrievalStrategy().execute(
+            provider,
+            [PromptMessage(role="user", content="Find whales and the opening line")],
+            [_search_tool()],
+            {"search_book": search_handler, "find_quote": find_quote_handler},
+        )
+
+        assert [m.content for m in new_messages] == ["passages", "quote"]
+
+    def test_unknown_tool_still_gets_a_result(self) -> None:
+        provider = FakeChatProvider(
+            [
+                ChatResponse(
+                    tool_invocations=[
+                        ToolInvocation(tool_name="mystery", tool_use_id="tu_1", arguments={}),
+                        _search_invocation("tu_2", "whales"),
+                    ]
+                ),
+                ChatResponse(text="Done."),
+            ]
+        )
+
+        _, new_messages = RetrievalStrategy().execute(
+            provider,
+            [PromptMessage(role="user", content="Hi")],
+            [_search_tool()],
+            FakeSearchHandler().as_handlers(),
+        )
+
+        assert new_messages[0].content == "Unknown tool: mystery"
+        assert new_messages[1].content == NO_CONTEXT_MESSAGE
+
+
+_AHAB_QUESTION = "Why is Ahab obsessed with the white whale?"
+
+
+def _set_page_invocation(tool_use_id: str, page: int) -> ToolInvocation:
+    return ToolInvocation(
+        tool_name="set_page", tool_use_id=tool_use_id, arguments={"page": page}
+    )
+
+
+class TestToolUseStrategySpeculative:
+    def _provider(self, query: str) -> FakeChatProvider:
+        return FakeChatProvider(
+            [
+                ChatResponse(tool_invocations=[_search_invocation("tu_1", query)]),
+                ChatResponse(text="Done."),
+            ]
+        )
+
+    def test_reuses_speculative_search_for_similar_model_query(self) -> None:
+        search = FakeSearchHandler()
+
+        _, new_messages = RetrievalStrategy(speculative=True).execute(
+            self._provider("Ahab obsession white whale"),
+            [PromptMessage(role="user", content=_AHAB_QUESTION)],
+            [_search_tool()],
+            search.as_handlers(),
+        )
+
+        assert search.captured_queries == [_AHAB_QUESTION]
+        assert new_messages[0].content == NO_CONTEXT_MESSAGE
+
+    def test_runs_model_query_when_not_similar(self) -> None:
+        search = FakeSearchHandler()
+
+        RetrievalStrategy(speculative=True).execute(
+            self._provider("Queequeg harpoon"),
+            [PromptMessage(role="user", content=_AHAB_QUESTION)],
+            [_search_tool()],
+            search.as_handlers(),
+        )
+
+        assert sorted(search.captured_queries) == [
+            "Queequeg harpoon",
+            _AHAB_QUESTION,
+        ]
+
+    def test_direct_reply_ignores_speculative_search(self) -> None:
+        search = FakeSearchHandler()
+
+        text, new_messages = RetrievalStrategy(speculative=True).execute(
+            FakeChatProvider([ChatResponse(text="Hello!")]),
+            [PromptMessage(role="user", content="Hi there")],
+            [_search_tool()],
+            search.as_handlers(),
+        )
+
+        assert text == "Hello!"
+        assert new_messages == []
+
+    @staticmethod
+    def _page_handlers() -> dict[str, Callable[[dict[str, object]], ToolResult]]:
+        page = [0]
+
+        def search_handler(arguments: dict[str, object]) -> ToolResult:
+            text = f"Searched up to page {page[0]}"
+            return ToolResult(formatted_text=text, query="", result_count=0)
+
+        def set_page_handler(arguments: dict[str, object]) -> ToolResult:
+            page[0] = int(str(arguments["page"]))
+            return ToolResult(formatted_text="Page set.", query="", result_count=0)
+
+        return {"search_book": search_handler, "set_page": set_page_handler}
+
+    def test_set_page_discards_speculative_search(self) -> None:
+        provider = FakeChatProvider(
+            [
+                ChatResponse(
+                    tool_invocations=[
+                        _set_page_invocation("tu_1", 200),
+                        _search_invocation("tu_2", _AHAB_QUESTION),
+                    ]
+                ),
+                ChatResponse(text="Done."),
+            ]
+        )
+
+        _, new_messages = RetrievalStrategy(speculative=True).execute(
+            provider,
+            [PromptMessage(role="user", content=_AHAB_QUESTION)],
+            [_search_tool()],
+            self._page_handlers(),
+        )
+
+        assert new_messages[1].content == "Searched up to page 200"
+
+    def test_set_page_in_an_earlier_round_discards_speculative_search(self) -> None:
+        provider = FakeChatProvider(
+            [
+                ChatResponse(tool_invocations=[_set_page_invocation("tu_1", 200)]),
+                ChatResponse(
+                    tool_invocations=[_search_invocation("tu_2", _AHAB_QUESTION)]
+                ),
+                ChatResponse(text="Done."),
+            ]
+        )
+
+        _, new_messages = RetrievalStrategy(speculative=True).execute(
+            provider,
+            [PromptMessage(role="user", content=_AHAB_QUESTION)],
+            [_search_tool()],
+            self._page_handlers(),
+        )
+
+        assert new_messages[1].content == "Searched up to page 200"
+
+    def test_off_by_default(self) -> None:
+        search = FakeSearchHandler()
+
+        RetrievalStrategy().execute(
+            self._provider("Queequeg harpoon"),
+            [PromptMessage(role="user", content="Tell me about Queequeg's harpoon")],
+            [_search_tool()],
+            search.as_handlers(),
+        )
+
+        assert search.captured_queries == ["Queequeg harpoon"]
+
+
+class TestToolUseStrategyStoredContent:
+    def test_model_sees_full_text_while_history_stores_reference(self) -> None:
+        provider = RecordingChatProvider(
+            [
+                ChatResponse(tool_invocations=[_search_invocation("tu_1", "whales")]),
+                ChatResponse(text="Done."),
+            ]
+        )
+        search = FakeSearchHandler(
+            [
+                SearchResult(
+                    chunk_id="c7",
+                    content="The whale surfaced.",
+                    start_page=12,
+                    end_page=13,
+                    distance=0.2,
+                )
+            ]
+        )
+
+        _, new_messages = RetrievalStrategy().execute(
+            provider,
+            [PromptMessage(role="user", content="Whales?")],
+            [_search_tool()],
+            search.as_handlers(),
+        )
+
+        assert "The whale surfaced." in provider.calls[1][-1].content
+        assert "The whale surfaced." not in new_messages[0].content
+        assert PassageReference.from_content(new_messages[0].content) is not None
+
+    def test_non_search_results_are_stored_verbatim(self) -> None:
+        provider = FakeChatProvider(
+            [
+                ChatResponse(
+                    tool_invocations=[
+                        ToolInvocation(
+                            tool_name="set_page", tool_use_id="tu_1", arguments={"page": 4}
+                        )
+                    ]
+                ),
+                ChatResponse(text="Done."),
+            ]
+        )
+
+        def set_page_handler(_arguments: dict[str, object]) -> ToolResult:
+            return ToolResult(formatted_text="Page set.", query="", result_count=0)
+
+        _, new_messages = RetrievalStrategy().execute(
+            provider,
+            [PromptMessage(role="user", content="I'm on page 4")],
+            [_search_tool()],
+            {"set_page": set_page_handler},
+        )
+
+        assert new_messages[0].content == "Page set."
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SlowChatProvider(FakeChatProvider):
+    """Advances a fake clock by ``seconds_per_call`` on every model call."""
+
+    def __init__(
+        self, responses: list[ChatResponse], clock: FakeClock, seconds_per_call: float
+    ) -> None:
+        super().__init__(responses)
+        self._clock = clock
+        self._seconds_per_call = seconds_per_call
+        self.tool_counts: list[int] = []
+
+    def chat_with_tools(
+        self,
+        messages: list[PromptMessage],
+        tools: list[ToolDefinition],
+        *,
+        deadline: Deadline | None = None,
+        purpose: CallPurpose = CallPurpose.ANSWER,
+    ) -> ChatResponse:
+        self._clock.now += self._seconds_per_call
+        self.tool_counts.append(len(tools))
+        return super().chat_with_tools(
+            messages, tools, deadline=deadline, purpose=purpose
+        )
+
+
+class RecordingSearchHandler(FakeSearchHandler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.arguments: list[dict[str, object]] = []
+
+    def __call__(self, arguments: dict[str, object]) -> ToolResult:
+        self.arguments.append(arguments)
+        return super().__call__(arguments)
+
+
+class TestToolUseStrategyDeadline:
+    def _searching(self, count: int) -> list[ChatResponse]:
+        return [
+            ChatResponse(tool_invocations=[_search_invocation(f"tu_{i}", f"q{i}")])
+            for i in range(count)
+        ]
+
+    def test_forces_final_answer_when_budget_runs_low(self) -> None:
+        clock = FakeClock()
+        provider = SlowChatProvider(
+            [*self._searching(2), ChatResponse(text="Best effort.")],
+            clock,
+            seconds_per_call=4.0,
+        )
+        events: list[ChatEvent] = []
+
+        text, _ = RetrievalStrategy().execute(
+            provider,
+            [PromptMessage(role="user", content="Tell me everything")],
+            [_search_tool()],
+            FakeSearchHandler().as_handlers(),
+            on_event=events.append,
+            deadline=Deadline(10.0, clock=clock),
+        )
+
+        assert text == "Best effort."
+        assert provider.tool_counts == [1, 1, 0]
+        kinds = [e.kind for e in events if isinstance(e, DegradationEvent)]
+        assert kinds == [
+            DegradationKind.REDUCE_TOP_K,
+            DegradationKind.FORCE_FINAL_ANSWER,
+        ]
+
+    def test_reduced_top_k_is_passed_to_search(self) -> None:
+        clock = FakeClock()
+        provider = SlowChatProvider(
+            [*self._searching(1), ChatResponse(text="Done.")],
+            clock,
+            seconds_per_call=6.0,
+        )
+        search = RecordingSearchHandler()
+
+        RetrievalStrategy().execute(
+            provider,
+            [PromptMessage(role="user", content="Question")],
+            [_search_tool()],
+            search.as_handlers(),
+            deadline=Deadline(10.0, clock=clock),
+        )
+
+        assert search.arguments == [{"query": "q0", "top_k": 2}]
+
+    def test_deadline_is_passed_to_every_model_call(self) -> None:
+        clock = FakeClock()
+        provider = SlowChatProvider(
+            [*self._searching(1), ChatResponse(text="Done.")],
+            clock,
+            seconds_per_call=0.0,
+        )
+        deadline = Deadline(10.0, clock=clock)
+        search = RecordingSearchHandler()
+
+        RetrievalStrategy().execute(
+            provider,
+            [PromptMessage(role="user", content="Question")],
+            [_search_tool()],
+            search.as_handlers(),
+            deadline=deadline,
+        )
+
+        assert provider.deadlines == [deadline, deadline]
+        assert search.arguments == [{"query": "q0"}]
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+
+from interactive_books.domain.book import Book
+from interactive_books.domain.cached_answer import CachedAnswer
+from interactive_books.domain.embedding_vector import float32_vector
+from interactive_books.infra.storage.answer_cache_repo import AnswerCacheRepository
+from interactive_books.infra.storage.book_repo import BookRepository
+from interactive_books.infra.storage.database import Database
+
+
+def _answer(
+    answer_id: str,
+    *,
+    book_id: str = "b1",
+    page_bucket: int = 1,
+    last_used_minutes: int = 0,
+) -> CachedAnswer:
+    used = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(
+        minutes=last_used_minutes
+    )
+    return CachedAnswer(
+        id=answer_id,
+        book_id=book_id,
+        page_bucket=page_bucket,
+        question="Who is O'Brien?",
+        question_embedding=float32_vector([0.5, -0.25, 1.0]),
+        answer="An Inner Party member.",
+        max_cited_page=12,
+        created_at=used,
+        last_used_at=used,
+    )
+
+
+def _repo(db: Database) -> AnswerCacheRepository:
+    BookRepository(db).save(Book(id="b1", title="1984"))
+    return AnswerCacheRepository(db)
+
+
+class TestAnswerCacheRepository:
+    def test_save_and_get_candidates_round_trip(self, db: Database) -> None:
+        repo = _repo(db)
+        repo.save(_answer("a1"))
+
+        [loaded] = repo.get_candidates("b1", 1)
+
+        assert loaded == _answer("a1")
+
+    def test_candidates_are_scoped_to_bucket(self, db: Database) -> None:
+        repo = _repo(db)
+        repo.save(_answer("a1", page_bucket=1))
+        repo.save(_answer("a2", page_bucket=2))
+
+        assert [a.id for a in repo.get_candidates("b1", 2)] == ["a2"]
+
+    def test_save_updates_hit_count(self, db: Database) -> None:
+        repo = _repo(db)
+        answer = _answer("a1")
+        repo.save(answer)
+
+        answer.record_hit()
+        repo.save(answer)
+
+        assert repo.get_candidates("b1", 1)[0].hit_count == 1
+
+    def test_evict_keeps_most_recently_used(self, db: Database) -> None:
+        repo = _repo(db)
+        for i in range(4):
+            repo.save(_answer(f"a{i}", last_used_minutes=i))
+
+        removed = repo.evict("b1", keep=2)
+
+        assert removed == 2
+        assert sorted(a.id for a in repo.get_candidates("b1", 1)) == ["a2", "a3"]
+
+    def test_delete_by_book(self, db: Database) -> None:
+        repo = _repo(db)
+        repo.save(_answer("a1"))
+
+        repo.delete_by_book("b1")
+
+        assert repo.get_candidates("b1", 1) == []
+
+    def test_book_delete_cascades(self, db: Database) -> None:
+        repo = _repo(db)
+        repo.save(_answer("a1"))
+
+        BookRepository(db).delete("b1")
+
+        assert repo.get_candidates("b1", 1) == []
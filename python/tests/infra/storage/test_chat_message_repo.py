@@ -1,3 +1,8 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
 from interactive_books.domain.book import Book
 from interactive_books.domain.chat import ChatMessage, MessageRole
 from interactive_books.domain.conversation import Conversation
@@ -14,6 +19,23 @@ def _seed_conversation(db: Database, conv_id: str = "c1") -> Conversation:
     return conv
 
 
+def _seed_messages(db: Database, count: int) -> ChatMessageRepository:
+    _seed_conversation(db)
+    repo = ChatMessageRepository(db)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        repo.save(
+            ChatMessage(
+                id=f"m{i}",
+                conversation_id="c1",
+                role=MessageRole.USER,
+                content=f"Message {i}",
+                created_at=start + timedelta(minutes=i),
+            )
+        )
+    return repo
+
+
 class TestChatMessageRepositorySave:
     def test_save_and_retrieve(self, db: Database) -> None:
         _seed_conversation(db)
@@ -45,6 +67,122 @@ class TestChatMessageRepositorySave:
         assert messages[0].role == MessageRole.TOOL_RESULT
 
 
+class TestChatMessageRepositorySaveMany:
+    def test_saves_all_messages(self, db: Database) -> None:
+        _seed_conversation(db)
+        repo = ChatMessageRepository(db)
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        repo.save_many(
+            [
+                ChatMessage(
+                    id=f"m{i}",
+                    conversation_id="c1",
+                    role=role,
+                    content=f"Message {i}",
+                    created_at=start + timedelta(seconds=i),
+                )
+                for i, role in enumerate(
+                    [MessageRole.USER, MessageRole.TOOL_RESULT, MessageRole.ASSISTANT]
+                )
+            ]
+        )
+
+        assert [m.id for m in repo.get_by_conversation("c1")] == ["m0", "m1", "m2"]
+
+    def test_failed_batch_saves_nothing(self, db: Database) -> None:
+        _seed_conversation(db)
+        repo = ChatMessageRepository(db)
+        message = ChatMessage(
+            id="m1", conversation_id="c1", role=MessageRole.USER, content="Q"
+        )
+
+        with pytest.raises(sqlite3.IntegrityError):
+            repo.save_many(
+                [
+                    ChatMessage(
+                        id="m0", conversation_id="c1", role=MessageRole.USER, content="Q"
+                    ),
+                    message,
+                    message,
+                ]
+            )
+        repo.save(
+            ChatMessage(
+                id="m2", conversation_id="c1", role=MessageRole.USER, content="Q"
+            )
+        )
+
+        assert [m.id for m in repo.get_by_conversation("c1")] == ["m2"]
+
+
+class TestChatMessageRepositoryGetRecent:
+    def test_returns_latest_messages_in_chronological_order(
+        self, db: Database
+    ) -> None:
+        repo = _seed_messages(db, 5)
+
+        messages = repo.get_recent("c1", 2)
+
+        assert [m.id for m in messages] == ["m3", "m4"]
+
+    def test_limit_larger_than_history_returns_all(self, db: Database) -> None:
+        repo = _seed_messages(db, 3)
+
+        assert [m.id for m in repo.get_recent("c1", 10)] == ["m0", "m1", "m2"]
+
+    def test_uses_conversation_created_at_index(self, db: Database) -> None:
+        plan = db.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM chat_messages WHERE conversation_id = ? "
+            "ORDER BY created_at DESC, id DESC LIMIT 5",
+            ("c1",),
+        ).fetchall()
+
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_chat_messages_conversation_created" in details
+        assert "TEMP B-TREE" not in details
+
+
+class TestChatMessageRepositoryGetAfter:
+    def test_returns_messages_after_the_key_in_order(self, db: Database) -> None:
+        repo = _seed_messages(db, 5)
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        messages = repo.get_after("c1", start + timedelta(minutes=2), "m2")
+
+        assert [m.id for m in messages] == ["m3", "m4"]
+
+    def test_ties_on_created_at_are_broken_by_id(self, db: Database) -> None:
+        _seed_conversation(db)
+        repo = ChatMessageRepository(db)
+        at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        repo.save_many(
+            [
+                ChatMessage(
+                    id=message_id,
+                    conversation_id="c1",
+                    role=MessageRole.USER,
+                    content=message_id,
+                    created_at=at,
+                )
+                for message_id in ("a", "b", "c")
+            ]
+        )
+
+        assert [m.id for m in repo.get_after("c1", at, "a")] == ["b", "c"]
+
+    def test_uses_conversation_created_at_index(self, db: Database) -> None:
+        plan = db.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM chat_messages WHERE conversation_id = ? "
+            "AND (created_at, id) > (?, ?) ORDER BY created_at ASC, id ASC",
+            ("c1", "2025-01-01T00:00:00+00:00", "m0"),
+        ).fetchall()
+
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_chat_messages_conversation_created" in details
+        assert "TEMP B-TREE" not in details
+
+
 class TestChatMessageRepositoryGetByConversation:
     def test_returns_chronological_order(self, db: Database) -> None:
         _seed_conversation(db)
@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+from interactive_books.domain.book import Book
+from interactive_books.domain.conversation import Conversation
+from interactive_books.domain.conversation_summary import ConversationSummary
+from interactive_books.infra.storage.book_repo import BookRepository
+from interactive_books.infra.storage.conversation_repo import ConversationRepository
+from interactive_books.infra.storage.conversation_summary_repo import (
+    ConversationSummaryRepository,
+)
+from interactive_books.infra.storage.database import Database
+
+
+def _seed_conversation(db: Database, conv_id: str = "c1") -> None:
+    BookRepository(db).save(Book(id="b1", title="Test Book"))
+    ConversationRepository(db).save(
+        Conversation(id=conv_id, book_id="b1", title="Test Conversation")
+    )
+
+
+def _summary(content: str, message_id: str, minute: int) -> ConversationSummary:
+    return ConversationSummary(
+        conversation_id="c1",
+        content=content,
+        covered_message_id=message_id,
+        covered_until=datetime(2025, 1, 1, 12, minute, tzinfo=timezone.utc),
+    )
+
+
+class TestConversationSummaryRepository:
+    def test_save_and_get(self, db: Database) -> None:
+        _seed_conversation(db)
+        repo = ConversationSummaryRepository(db)
+        repo.save(_summary("Asked about Ahab.", "m3", 5))
+
+        loaded = repo.get("c1")
+
+        assert loaded is not None
+        assert loaded.content == "Asked about Ahab."
+        assert loaded.covered_message_id == "m3"
+        assert loaded.covered_until == datetime(2025, 1, 1, 12, 5, tzinfo=timezone.utc)
+
+    def test_save_replaces_existing_summary(self, db: Database) -> None:
+        _seed_conversation(db)
+        repo = ConversationSummaryRepository(db)
+        repo.save(_summary("First.", "m3", 5))
+        repo.save(_summary("Second.", "m7", 9))
+
+        loaded = repo.get("c1")
+
+        assert loaded is not None
+        assert loaded.content == "Second."
+        assert loaded.covered_message_id == "m7"
+
+    def test_get_missing_returns_none(self, db: Database) -> None:
+        assert ConversationSummaryRepository(db).get("c1") is None
+
+    def test_deleted_with_conversation(self, db: Database) -> None:
+        _seed_conversation(db)
+        repo = ConversationSummaryRepository(db)
+        repo.save(_summary("First.", "m3", 5))
+
+        ConversationRepository(db).delete("c1")
+
+        assert repo.get("c1") is None
@@ -1,5 +1,5 @@
 import pytest
-from interactive_books.domain.embedding_vector import EmbeddingVector
+from interactive_books.domain.embedding_vector import EmbeddingVector, float32_vector
 from interactive_books.infra.storage.database import Database
 from interactive_books.infra.storage.embedding_repo import EmbeddingRepository
 
@@ -17,6 +17,30 @@ def repo(db: Database) -> EmbeddingRepository:
     return EmbeddingRepository(db)
 
 
+class TestTablePrefix:
+    def test_prefix_keeps_vectors_in_a_separate_table(self, db: Database) -> None:
+        chunks = EmbeddingRepository(db)
+        sections = EmbeddingRepository(db, table_prefix="section_embeddings")
+        for repo in (chunks, sections):
+            repo.ensure_table(PROVIDER, 3)
+        sections.save_embeddings(
+            PROVIDER,
+            3,
+            "book-1",
+            [
+                EmbeddingVector(
+                    chunk_id="s1",
+                    vector=float32_vector([1.0, 0.0, 0.0]),
+                    start_page=1,
+                    end_page=9,
+                )
+            ],
+        )
+
+        assert sections.has_embeddings("book-1", PROVIDER, 3)
+        assert not chunks.has_embeddings("book-1", PROVIDER, 3)
+
+
 class TestEnsureTable:
     def test_creates_virtual_table(
         self, repo: EmbeddingRepository, db: Database
@@ -39,8 +63,18 @@ class TestSaveEmbeddings:
         repo.ensure_table(PROVIDER, DIMENSION)
 
         embeddings = [
-            EmbeddingVector(chunk_id="chunk-1", vector=[0.1] * DIMENSION, start_page=1, end_page=5),
-            EmbeddingVector(chunk_id="chunk-2", vector=[0.2] * DIMENSION, start_page=6, end_page=10),
+            EmbeddingVector(
+                chunk_id="chunk-1",
+                vector=float32_vector([0.1] * DIMENSION),
+                start_page=1,
+                end_page=5,
+            ),
+            EmbeddingVector(
+                chunk_id="chunk-2",
+                vector=float32_vector([0.2] * DIMENSION),
+                start_page=6,
+                end_page=10,
+            ),
         ]
         repo.save_embeddings(PROVIDER, DIMENSION, "book-1", embeddings)
 
@@ -49,6 +83,22 @@ class TestSaveEmbeddings:
         )
         assert cursor.fetchone()[0] == 2
 
+    def test_vectors_are_stored_as_their_float32_bytes(
+        self, repo: EmbeddingRepository
+    ) -> None:
+        repo.ensure_table(PROVIDER, SEARCH_DIM)
+        vector = float32_vector([0.25, -1.5, 3.0])
+
+        repo.save_embeddings(
+            PROVIDER,
+            SEARCH_DIM,
+            "book-1",
+            [EmbeddingVector(chunk_id="c1", vector=vector, start_page=1, end_page=1)],
+        )
+
+        [(_, _, _, stored)] = repo.read_book(PROVIDER, SEARCH_DIM, "book-1")
+        assert stored == vector.tobytes()
+
 
 class TestDeleteByBook:
     def test_deletes_only_target_book(
@@ -57,10 +107,20 @@ class TestDeleteByBook:
         repo.ensure_table(PROVIDER, DIMENSION)
 
         book1_embeddings = [
-            EmbeddingVector(chunk_id="b1-c1", vector=[0.1] * DIMENSION, start_page=1, end_page=1),
+            EmbeddingVector(
+                chunk_id="b1-c1",
+                vector=float32_vector([0.1] * DIMENSION),
+                start_page=1,
+                end_page=1,
+            ),
         ]
         book2_embeddings = [
-            EmbeddingVector(chunk_id="b2-c1", vector=[0.2] * DIMENSION, start_page=1, end_page=1),
+            EmbeddingVector(
+                chunk_id="b2-c1",
+                vector=float32_vector([0.2] * DIMENSION),
+                start_page=1,
+                end_page=1,
+            ),
         ]
         repo.save_embeddings(PROVIDER, DIMENSION, "book-1", book1_embeddings)
         repo.save_embeddings(PROVIDER, DIMENSION, "book-2", book2_embeddings)
@@ -74,6 +134,8 @@ class TestDeleteByBook:
 
 
 SEARCH_DIM = 3
+X_AXIS = float32_vector([1.0, 0.0, 0.0])
+Y_AXIS = float32_vector([0.0, 1.0, 0.0])
 
 
 class TestSearch:
@@ -81,9 +143,24 @@ class TestSearch:
         """Seed 3 vectors in 3D space with known distances from [1,0,0]."""
         repo.ensure_table(PROVIDER, SEARCH_DIM)
         embeddings = [
-            EmbeddingVector(chunk_id="close", vector=[0.9, 0.0, 0.0], start_page=1, end_page=5),
-            EmbeddingVector(chunk_id="mid", vector=[0.5, 0.5, 0.0], start_page=6, end_page=10),
-            EmbeddingVector(chunk_id="far", vector=[0.0, 1.0, 0.0], start_page=11, end_page=15),
+            EmbeddingVector(
+                chunk_id="close",
+                vector=float32_vector([0.9, 0.0, 0.0]),
+                start_page=1,
+                end_page=5,
+            ),
+            EmbeddingVector(
+                chunk_id="mid",
+                vector=float32_vector([0.5, 0.5, 0.0]),
+                start_page=6,
+                end_page=10,
+            ),
+            EmbeddingVector(
+                chunk_id="far",
+                vector=float32_vector([0.0, 1.0, 0.0]),
+                start_page=11,
+                end_page=15,
+            ),
         ]
         repo.save_embeddings(PROVIDER, SEARCH_DIM, book_id, embeddings)
 
@@ -92,7 +169,7 @@ class TestSearch:
     ) -> None:
         self._seed_vectors(repo, "book-1")
 
-        results = repo.search(PROVIDER, SEARCH_DIM, "book-1", [1.0, 0.0, 0.0], top_k=3)
+        results = repo.search(PROVIDER, SEARCH_DIM, "book-1", X_AXIS, top_k=3)
 
         assert len(results) == 3
         chunk_ids = [r[0] for r in results]
@@ -101,12 +178,10 @@ class TestSearch:
         distances = [r[1] for r in results]
         assert distances[0] < distances[1] < distances[2]
 
-    def test_returns_page_ranges_with_results(
-        self, repo: EmbeddingRepository
-    ) -> None:
+    def test_returns_page_ranges_with_results(self, repo: EmbeddingRepository) -> None:
         self._seed_vectors(repo, "book-1")
 
-        results = repo.search(PROVIDER, SEARCH_DIM, "book-1", [1.0, 0.0, 0.0], top_k=3)
+        results = repo.search(PROVIDER, SEARCH_DIM, "book-1", X_AXIS, top_k=3)
 
         # Each result is (chunk_id, distance, start_page, end_page)
         assert len(results[0]) == 4
@@ -116,16 +191,64 @@ class TestSearch:
     def test_respects_top_k(self, repo: EmbeddingRepository) -> None:
         self._seed_vectors(repo, "book-1")
 
-        results = repo.search(PROVIDER, SEARCH_DIM, "book-1", [1.0, 0.0, 0.0], top_k=2)
+        results = repo.search(PROVIDER, SEARCH_DIM, "book-1", X_AXIS, top_k=2)
 
         assert len(results) == 2
         assert results[0][0] == "close"
         assert results[1][0] == "mid"
 
+    def test_max_page_drops_later_hits(self, repo: EmbeddingRepository) -> None:
+        self._seed_vectors(repo, "book-1")
+
+        results = repo.search(
+            PROVIDER, SEARCH_DIM, "book-1", X_AXIS, top_k=3, max_page=10
+        )
+
+        assert [r[0] for r in results] == ["close", "mid"]
+
+    def test_page_ranges_limit_the_ranked_rows(self, repo: EmbeddingRepository) -> None:
+        self._seed_vectors(repo, "book-1")
+
+        results = repo.search(
+            PROVIDER,
+            SEARCH_DIM,
+            "book-1",
+            X_AXIS,
+            top_k=1,
+            page_ranges=[(8, 9), (12, 20)],
+        )
+
+        assert [r[0] for r in results] == ["mid"]
+        assert results[0][1] == pytest.approx(
+            repo.search(PROVIDER, SEARCH_DIM, "book-1", X_AXIS, top_k=2)[1][1]
+        )
+
+    def test_page_ranges_combine_with_max_page(self, repo: EmbeddingRepository) -> None:
+        self._seed_vectors(repo, "book-1")
+
+        results = repo.search(
+            PROVIDER,
+            SEARCH_DIM,
+            "book-1",
+            Y_AXIS,
+            top_k=3,
+            max_page=10,
+            page_ranges=[(6, 20)],
+        )
+
+        assert [r[0] for r in results] == ["mid"]
+
+    def test_empty_page_ranges_match_nothing(self, repo: EmbeddingRepository) -> None:
+        self._seed_vectors(repo, "book-1")
+
+        assert (
+            repo.search(PROVIDER, SEARCH_DIM, "book-1", X_AXIS, 3, page_ranges=[]) == []
+        )
+
     def test_returns_empty_for_no_embeddings(self, repo: EmbeddingRepository) -> None:
         repo.ensure_table(PROVIDER, SEARCH_DIM)
 
-        results = repo.search(PROVIDER, SEARCH_DIM, "book-1", [1.0, 0.0, 0.0], top_k=5)
+        results = repo.search(PROVIDER, SEARCH_DIM, "book-1", X_AXIS, top_k=5)
 
         assert results == []
 
@@ -136,22 +259,80 @@ class TestSearch:
             PROVIDER,
             SEARCH_DIM,
             "book-2",
-            [EmbeddingVector(chunk_id="b2-close", vector=[0.99, 0.0, 0.0], start_page=1, end_page=1)],
+            [
+                EmbeddingVector(
+                    chunk_id="b2-close",
+                    vector=float32_vector([0.99, 0.0, 0.0]),
+                    start_page=1,
+                    end_page=1,
+                )
+            ],
         )
 
-        results = repo.search(PROVIDER, SEARCH_DIM, "book-1", [1.0, 0.0, 0.0], top_k=5)
+        results = repo.search(PROVIDER, SEARCH_DIM, "book-1", X_AXIS, top_k=5)
 
         chunk_ids = [r[0] for r in results]
         assert "b2-close" not in chunk_ids
         assert len(results) == 3  # only book-1's vectors
 
 
+class TestSearchMany:
+    _seed_vectors = TestSearch._seed_vectors
+
+    def test_returns_one_hit_list_per_query(self, repo: EmbeddingRepository) -> None:
+        self._seed_vectors(repo, "book-1")
+
+        results = repo.search_many(
+            PROVIDER,
+            SEARCH_DIM,
+            "book-1",
+            [X_AXIS, Y_AXIS],
+            top_k=2,
+        )
+
+        assert [[r[0] for r in hits] for hits in results] == [
+            ["close", "mid"],
+            ["far", "mid"],
+        ]
+        assert results[1][0][2:] == (11, 15)
+
+    def test_matches_single_query_search(self, repo: EmbeddingRepository) -> None:
+        self._seed_vectors(repo, "book-1")
+        query = float32_vector([0.6, 0.4, 0.0])
+
+        (many,) = repo.search_many(PROVIDER, SEARCH_DIM, "book-1", [query], top_k=3)
+
+        assert many == repo.search(PROVIDER, SEARCH_DIM, "book-1", query, top_k=3)
+
+    def test_respects_book_id_partition(self, repo: EmbeddingRepository) -> None:
+        self._seed_vectors(repo, "book-1")
+        self._seed_vectors(repo, "book-2")
+
+        results = repo.search_many(
+            PROVIDER, SEARCH_DIM, "book-2", [X_AXIS, Y_AXIS], top_k=5
+        )
+
+        assert [len(hits) for hits in results] == [3, 3]
+
+    def test_no_queries_returns_empty(self, repo: EmbeddingRepository) -> None:
+        repo.ensure_table(PROVIDER, SEARCH_DIM)
+
+        assert repo.search_many(PROVIDER, SEARCH_DIM, "book-1", [], top_k=5) == []
+
+
 class TestHasEmbeddings:
     def test_returns_true_when_embeddings_exist(
         self, repo: EmbeddingRepository
     ) -> None:
         repo.ensure_table(PROVIDER, DIMENSION)
-        embeddings = [EmbeddingVector(chunk_id="c1", vector=[0.1] * DIMENSION, start_page=1, end_page=1)]
+        embeddings = [
+            EmbeddingVector(
+                chunk_id="c1",
+                vector=float32_vector([0.1] * DIMENSION),
+                start_page=1,
+                end_page=1,
+            )
+        ]
         repo.save_embeddings(PROVIDER, DIMENSION, "book-1", embeddings)
 
         assert repo.has_embeddings("book-1", PROVIDER, DIMENSION) is True
@@ -163,7 +344,14 @@ class TestHasEmbeddings:
 
     def test_returns_false_after_deletion(self, repo: EmbeddingRepository) -> None:
         repo.ensure_table(PROVIDER, DIMENSION)
-        embeddings = [EmbeddingVector(chunk_id="c1", vector=[0.1] * DIMENSION, start_page=1, end_page=1)]
+        embeddings = [
+            EmbeddingVector(
+                chunk_id="c1",
+                vector=float32_vector([0.1] * DIMENSION),
+                start_page=1,
+                end_page=1,
+            )
+        ]
         repo.save_embeddings(PROVIDER, DIMENSION, "book-1", embeddings)
         repo.delete_by_book(PROVIDER, DIMENSION, "book-1")
 
@@ -0,0 +1,235 @@
+from array import array
+from collections.abc import Generator
+from pathlib import Path
+
+import numpy as np
+import pytest
+from interactive_books.domain.embedding_vector import EmbeddingVector, float32_vector
+from interactive_books.infra.storage.database import Database
+from interactive_books.infra.storage.embedding_repo import (
+    EmbeddingRepository as Vec0EmbeddingRepository,
+)
+from interactive_books.infra.storage.ivf_embedding_repo import EmbeddingRepository
+
+PROVIDER = "fake"
+DIMENSION = 8
+MIN_ROWS = 64
+BOOK = "book-1"
+OTHER_BOOK = "book-2"
+VECTOR_COUNT = 256
+NLIST = 16  # sqrt(VECTOR_COUNT)
+INDEX_DIR_NAME = f"embeddings_{PROVIDER}_{DIMENSION}"
+
+
+@pytest.fixture
+def db() -> Generator[Database]:
+    database = Database(":memory:", enable_vec=True)
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def repo(db: Database, tmp_path: Path) -> EmbeddingRepository:
+    repo = EmbeddingRepository(db, tmp_path, min_rows=MIN_ROWS, nprobe=1)
+    repo.ensure_table(PROVIDER, DIMENSION)
+    repo.save_embeddings(PROVIDER, DIMENSION, BOOK, _embeddings(VECTOR_COUNT))
+    return repo
+
+
+def _embeddings(count: int, seed: int = 0) -> list[EmbeddingVector]:
+    rng = np.random.default_rng(seed)
+    return [
+        EmbeddingVector(
+            chunk_id=f"s{seed}-c{i:04d}",
+            vector=float32_vector(rng.standard_normal(DIMENSION, np.float32).tobytes()),
+            start_page=i + 1,
+            end_page=i + 1,
+        )
+        for i in range(count)
+    ]
+
+
+def _queries(count: int = 3) -> list[array[float]]:
+    matrix = np.random.default_rng(99).standard_normal((count, DIMENSION), np.float32)
+    return [float32_vector(row.tobytes()) for row in matrix]
+
+
+def _index_files(tmp_path: Path) -> list[str]:
+    index_dir = tmp_path / INDEX_DIR_NAME
+    return sorted(p.name for p in index_dir.iterdir()) if index_dir.exists() else []
+
+
+class TestIndexing:
+    def test_small_books_stay_on_vec0(self, db: Database, tmp_path: Path) -> None:
+        repo = EmbeddingRepository(db, tmp_path, min_rows=MIN_ROWS)
+        repo.ensure_table(PROVIDER, DIMENSION)
+        repo.save_embeddings(PROVIDER, DIMENSION, BOOK, _embeddings(MIN_ROWS - 1))
+
+        hits = repo.search(PROVIDER, DIMENSION, BOOK, _queries(1)[0], 3)
+
+        assert len(hits) == 3
+        assert _index_files(tmp_path) == []
+
+    def test_save_indexes_the_book(
+        self, repo: EmbeddingRepository, tmp_path: Path
+    ) -> None:
+        assert _index_files(tmp_path) == [f"{BOOK}.meta.npz", f"{BOOK}.npy"]
+
+    def test_lists_are_sized_to_the_book(self, repo: EmbeddingRepository) -> None:
+        repo.save_embeddings(
+            PROVIDER, DIMENSION, OTHER_BOOK, _embeddings(4 * VECTOR_COUNT, seed=1)
+        )
+
+        small = repo._indexes[(PROVIDER, DIMENSION)].segment(BOOK)
+        large = repo._indexes[(PROVIDER, DIMENSION)].segment(OTHER_BOOK)
+        assert small is not None and large is not None
+        assert len(small.centroids) == NLIST
+        assert len(large.centroids) == 2 * NLIST
+
+    def test_search_does_not_build_an_index(self, db: Database, tmp_path: Path) -> None:
+        vec0 = Vec0EmbeddingRepository(db)
+        vec0.ensure_table(PROVIDER, DIMENSION)
+        vec0.save_embeddings(PROVIDER, DIMENSION, BOOK, _embeddings(VECTOR_COUNT))
+        repo = EmbeddingRepository(db, tmp_path, min_rows=MIN_ROWS)
+
+        hits = repo.search(PROVIDER, DIMENSION, BOOK, _queries(1)[0], 3)
+
+        assert len(hits) == 3
+        assert _index_files(tmp_path) == []
+
+    def test_re_embedding_below_the_threshold_drops_the_segment(
+        self, repo: EmbeddingRepository, tmp_path: Path
+    ) -> None:
+        repo.delete_by_book(PROVIDER, DIMENSION, BOOK)
+        repo.save_embeddings(PROVIDER, DIMENSION, BOOK, _embeddings(10, seed=1))
+
+        hits = repo.search(PROVIDER, DIMENSION, BOOK, _queries(1)[0], 20)
+
+        assert _index_files(tmp_path) == []
+        assert len(hits) == 10
+
+
+class TestSearch:
+    def test_full_probe_matches_vec0(self, db: Database, tmp_path: Path) -> None:
+        repo = EmbeddingRepository(db, tmp_path, min_rows=MIN_ROWS, nprobe=NLIST)
+        repo.ensure_table(PROVIDER, DIMENSION)
+        repo.save_embeddings(PROVIDER, DIMENSION, BOOK, _embeddings(VECTOR_COUNT))
+        vec0 = Vec0EmbeddingRepository(db)
+
+        ivf_hits = repo.search_many(PROVIDER, DIMENSION, BOOK, _queries(), 10)
+        vec0_hits = vec0.search_many(PROVIDER, DIMENSION, BOOK, _queries(), 10)
+
+        for ours, theirs in zip(ivf_hits, vec0_hits, strict=True):
+            assert [h[0] for h in ours] == [h[0] for h in theirs]
+            assert [h[1] for h in ours] == pytest.approx(
+                [h[1] for h in theirs], rel=1e-4
+            )
+
+    def test_wider_probe_raises_recall(self, db: Database, tmp_path: Path) -> None:
+        vec0 = Vec0EmbeddingRepository(db)
+        queries = _queries(20)
+
+        def recall(nprobe: int) -> float:
+            repo = EmbeddingRepository(db, tmp_path, min_rows=MIN_ROWS, nprobe=nprobe)
+            ivf_hits = repo.search_many(PROVIDER, DIMENSION, BOOK, queries, 10)
+            vec0_hits = vec0.search_many(PROVIDER, DIMENSION, BOOK, queries, 10)
+            found = sum(
+                len({h[0] for h in ours} & {h[0] for h in theirs})
+                for ours, theirs in zip(ivf_hits, vec0_hits, strict=True)
+            )
+            return found / (10 * len(queries))
+
+        indexing = EmbeddingRepository(db, tmp_path, min_rows=MIN_ROWS)
+        indexing.ensure_table(PROVIDER, DIMENSION)
+        indexing.save_embeddings(PROVIDER, DIMENSION, BOOK, _embeddings(VECTOR_COUNT))
+
+        assert recall(1) < recall(2) < recall(NLIST) == 1.0
+
+    def test_only_returns_the_requested_book(self, repo: EmbeddingRepository) -> None:
+        repo.save_embeddings(
+            PROVIDER, DIMENSION, OTHER_BOOK, _embeddings(VECTOR_COUNT, seed=1)
+        )
+
+        [hits] = repo.search_many(PROVIDER, DIMENSION, OTHER_BOOK, _queries(1), 10)
+
+        assert len(hits) == 10
+        assert all(h[0].startswith("s1-") for h in hits)
+
+    def test_page_filter_widens_probe_to_fill_top_k(
+        self, repo: EmbeddingRepository
+    ) -> None:
+        [hits] = repo.search_many(
+            PROVIDER, DIMENSION, BOOK, _queries(1), 5, max_page=20
+        )
+
+        assert len(hits) == 5
+        assert all(start_page <= 20 for _, _, start_page, _ in hits)
+        assert [h[1] for h in hits] == sorted(h[1] for h in hits)
+
+    def test_returns_fewer_hits_when_pages_allow_fewer(
+        self, repo: EmbeddingRepository
+    ) -> None:
+        [hits] = repo.search_many(
+            PROVIDER, DIMENSION, BOOK, _queries(1), 10, max_page=3
+        )
+
+        assert {h[0] for h in hits} == {"s0-c0000", "s0-c0001", "s0-c0002"}
+
+    def test_page_ranges_restrict_and_still_fill_top_k(
+        self, repo: EmbeddingRepository
+    ) -> None:
+        [hits] = repo.search_many(
+            PROVIDER, DIMENSION, BOOK, _queries(1), 5, page_ranges=[(50, 60)]
+        )
+
+        assert len(hits) == 5
+        assert all(50 <= start_page <= 60 for _, _, start_page, _ in hits)
+
+
+class TestPersistence:
+    def test_delete_removes_the_book_segment(
+        self, repo: EmbeddingRepository, tmp_path: Path
+    ) -> None:
+        repo.delete_by_book(PROVIDER, DIMENSION, BOOK)
+
+        assert _index_files(tmp_path) == []
+        assert repo.search(PROVIDER, DIMENSION, BOOK, _queries(1)[0], 3) == []
+
+    def test_later_sessions_memory_map_the_segment(
+        self, repo: EmbeddingRepository, db: Database, tmp_path: Path
+    ) -> None:
+        reopened = EmbeddingRepository(db, tmp_path, min_rows=MIN_ROWS, nprobe=1)
+
+        hits = reopened.search(PROVIDER, DIMENSION, BOOK, _queries(1)[0], 3)
+
+        segment = reopened._indexes[(PROVIDER, DIMENSION)].segment(BOOK)
+        assert segment is not None
+        assert isinstance(segment.matrix, np.memmap)
+        assert len(hits) == 3
+
+    def test_stale_segment_is_dropped_for_vec0(
+        self, repo: EmbeddingRepository, db: Database, tmp_path: Path
+    ) -> None:
+        # Re-embedded by another process that bypassed this repository.
+        vec0 = Vec0EmbeddingRepository(db)
+        vec0.delete_by_book(PROVIDER, DIMENSION, BOOK)
+        vec0.save_embeddings(PROVIDER, DIMENSION, BOOK, _embeddings(10, seed=1))
+        reopened = EmbeddingRepository(db, tmp_path, min_rows=MIN_ROWS, nprobe=1)
+
+        hits = reopened.search(PROVIDER, DIMENSION, BOOK, _queries(1)[0], 20)
+
+        assert len(hits) == 10
+        assert all(h[0].startswith("s1-") for h in hits)
+        assert _index_files(tmp_path) == []
+
+    def test_re_embedding_with_the_same_chunks_drops_the_segment(
+        self, repo: EmbeddingRepository, db: Database, tmp_path: Path
+    ) -> None:
+        vec0 = Vec0EmbeddingRepository(db)
+        vec0.delete_by_book(PROVIDER, DIMENSION, BOOK)
+        vec0.save_embeddings(PROVIDER, DIMENSION, BOOK, _embeddings(VECTOR_COUNT))
+        reopened = EmbeddingRepository(db, tmp_path, min_rows=MIN_ROWS, nprobe=1)
+
+        reopened.search(PROVIDER, DIMENSION, BOOK, _queries(1)[0], 3)
+
+        assert _index_files(tmp_path) == []
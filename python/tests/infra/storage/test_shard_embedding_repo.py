@@ -0,0 +1,110 @@
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from interactive_books.domain.embedding_vector import EmbeddingVector, float32_vector
+from interactive_books.infra.storage.shard_embedding_repo import (
+    EmbeddingRepository,
+    ShardPool,
+)
+
+PROVIDER = "fake"
+DIMENSION = 3
+
+
+@pytest.fixture
+def pool(tmp_path: Path) -> Generator[ShardPool]:
+    shard_pool = ShardPool(tmp_path / "shards", max_open=2)
+    yield shard_pool
+    shard_pool.close()
+
+
+@pytest.fixture
+def repo(pool: ShardPool) -> EmbeddingRepository:
+    repo = EmbeddingRepository(pool)
+    repo.ensure_table(PROVIDER, DIMENSION)
+    return repo
+
+
+def _embeddings(count: int = 3) -> list[EmbeddingVector]:
+    return [
+        EmbeddingVector(
+            chunk_id=f"c{i}",
+            vector=float32_vector([float(i), 1.0, 0.0]),
+            start_page=i + 1,
+            end_page=i + 1,
+        )
+        for i in range(count)
+    ]
+
+
+class TestShardStorage:
+    def test_vectors_are_written_to_the_books_own_file(
+        self, repo: EmbeddingRepository, pool: ShardPool
+    ) -> None:
+        repo.save_embeddings(PROVIDER, DIMENSION, "book-1", _embeddings())
+
+        assert pool.path("book-1").exists()
+        assert not pool.path("book-2").exists()
+
+    def test_search_reads_the_books_shard(self, repo: EmbeddingRepository) -> None:
+        repo.save_embeddings(PROVIDER, DIMENSION, "book-1", _embeddings())
+        repo.save_embeddings(PROVIDER, DIMENSION, "book-2", _embeddings(1))
+
+        hits = repo.search(
+            PROVIDER, DIMENSION, "book-1", float32_vector([2.0, 1.0, 0.0]), 2
+        )
+
+        assert [h[0] for h in hits] == ["c2", "c1"]
+
+    def test_book_without_shard_has_no_vectors(
+        self, repo: EmbeddingRepository, pool: ShardPool
+    ) -> None:
+        queries = [float32_vector([1.0, 0.0, 0.0])] * 2
+
+        assert repo.search_many(PROVIDER, DIMENSION, "book-1", queries, 3) == [[], []]
+        assert not repo.has_embeddings("book-1", PROVIDER, DIMENSION)
+        assert not pool.path("book-1").exists()
+
+
+class TestShardDeletion:
+    def test_deleting_the_last_vectors_unlinks_the_file(
+        self, repo: EmbeddingRepository, pool: ShardPool
+    ) -> None:
+        repo.save_embeddings(PROVIDER, DIMENSION, "book-1", _embeddings())
+
+        repo.delete_by_book(PROVIDER, DIMENSION, "book-1")
+
+        assert list(pool.path("book-1").parent.iterdir()) == []
+        assert not repo.has_embeddings("book-1", PROVIDER, DIMENSION)
+
+    def test_file_stays_while_other_vectors_remain(
+        self, repo: EmbeddingRepository, pool: ShardPool
+    ) -> None:
+        sections = EmbeddingRepository(pool, table_prefix="section_embeddings")
+        repo.save_embeddings(PROVIDER, DIMENSION, "book-1", _embeddings())
+        sections.save_embeddings(PROVIDER, DIMENSION, "book-1", _embeddings(1))
+
+        repo.delete_by_book(PROVIDER, DIMENSION, "book-1")
+
+        assert pool.path("book-1").exists()
+        assert sections.has_embeddings("book-1", PROVIDER, DIMENSION)
+
+
+class TestShardPool:
+    def test_least_recently_used_shard_is_closed(
+        self, repo: EmbeddingRepository, pool: ShardPool
+    ) -> None:
+        for book_id in ("book-1", "book-2", "book-3"):
+            repo.save_embeddings(PROVIDER, DIMENSION, book_id, _embeddings(1))
+
+        assert pool.open_count == 2
+        assert repo.has_embeddings("book-1", PROVIDER, DIMENSION)
+
+    def test_shard_in_use_is_not_closed(self, pool: ShardPool) -> None:
+        with pool.checkout("book-1") as held:
+            for book_id in ("book-2", "book-3", "book-4"):
+                with pool.checkout(book_id):
+                    pass
+
+            assert held.db.connection.execute("SELECT 1").fetchone() == (1,)
@@ -0,0 +1,209 @@
+from array import array
+from collections.abc import Generator
+from pathlib import Path
+
+import numpy as np
+import pytest
+from interactive_books.domain.embedding_vector import EmbeddingVector, float32_vector
+from interactive_books.infra.storage.database import Database
+from interactive_books.infra.storage.embedding_repo import (
+    EmbeddingRepository as Vec0EmbeddingRepository,
+)
+from interactive_books.infra.storage.snapshot_embedding_repo import (
+    MIN_SESSION_QUERIES,
+    MIN_SNAPSHOT_VECTORS,
+    EmbeddingRepository,
+    should_snapshot,
+)
+
+PROVIDER = "fake"
+DIMENSION = 8
+BOOK = "book-1"
+VECTOR_COUNT = MIN_SNAPSHOT_VECTORS
+
+
+@pytest.fixture
+def db() -> Generator[Database]:
+    database = Database(":memory:", enable_vec=True)
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def repo(db: Database, tmp_path: Path) -> EmbeddingRepository:
+    repo = EmbeddingRepository(db, tmp_path)
+    repo.ensure_table(PROVIDER, DIMENSION)
+    repo.save_embeddings(PROVIDER, DIMENSION, BOOK, _embeddings(VECTOR_COUNT))
+    return repo
+
+
+def _embeddings(count: int, seed: int = 0) -> list[EmbeddingVector]:
+    rng = np.random.default_rng(seed)
+    return [
+        EmbeddingVector(
+            chunk_id=f"c{i:04d}",
+            vector=float32_vector(rng.standard_normal(DIMENSION, np.float32).tobytes()),
+            start_page=i + 1,
+            end_page=i + 1,
+        )
+        for i in range(count)
+    ]
+
+
+def _queries(count: int = 3) -> list[array[float]]:
+    matrix = np.random.default_rng(99).standard_normal((count, DIMENSION), np.float32)
+    return [float32_vector(row.tobytes()) for row in matrix]
+
+
+def _warm(repo: EmbeddingRepository) -> None:
+    for _ in range(MIN_SESSION_QUERIES):
+        repo.search(PROVIDER, DIMENSION, BOOK, _queries(1)[0], 1)
+
+
+def _sidecars(tmp_path: Path) -> list[str]:
+    return sorted(p.name for p in tmp_path.iterdir())
+
+
+class TestPlanner:
+    def test_small_books_stay_on_vec0(self) -> None:
+        assert not should_snapshot(MIN_SNAPSHOT_VECTORS - 1, 100)
+
+    def test_first_query_stays_on_vec0(self) -> None:
+        assert not should_snapshot(100_000, 1)
+
+    def test_repeated_queries_on_large_book_snapshot(self) -> None:
+        assert should_snapshot(MIN_SNAPSHOT_VECTORS, MIN_SESSION_QUERIES)
+
+
+class TestSnapshotSearch:
+    def test_first_query_uses_vec0_without_sidecars(
+        self, repo: EmbeddingRepository, tmp_path: Path
+    ) -> None:
+        repo.search(PROVIDER, DIMENSION, BOOK, _queries(1)[0], 5)
+
+        assert _sidecars(tmp_path) == []
+
+    def test_snapshot_is_written_once_the_session_warms_up(
+        self, repo: EmbeddingRepository, tmp_path: Path
+    ) -> None:
+        _warm(repo)
+
+        assert _sidecars(tmp_path) == [
+            f"embeddings_{PROVIDER}_{DIMENSION}_{BOOK}.meta.npz",
+            f"embeddings_{PROVIDER}_{DIMENSION}_{BOOK}.npy",
+        ]
+
+    def test_matches_vec0_results(
+        self, repo: EmbeddingRepository, db: Database
+    ) -> None:
+        _warm(repo)
+        vec0 = Vec0EmbeddingRepository(db)
+
+        snapshot_hits = repo.search_many(PROVIDER, DIMENSION, BOOK, _queries(), 10)
+        vec0_hits = vec0.search_many(PROVIDER, DIMENSION, BOOK, _queries(), 10)
+
+        for ours, theirs in zip(snapshot_hits, vec0_hits, strict=True):
+            assert [h[0] for h in ours] == [h[0] for h in theirs]
+            assert [h[1] for h in ours] == pytest.approx(
+                [h[1] for h in theirs], rel=1e-4
+            )
+
+    def test_page_mask_returns_full_top_k_within_pages(
+        self, repo: EmbeddingRepository
+    ) -> None:
+        _warm(repo)
+
+        [hits] = repo.search_many(
+            PROVIDER, DIMENSION, BOOK, _queries(1), 5, max_page=20
+        )
+
+        assert len(hits) == 5
+        assert all(start_page <= 20 for _, _, start_page, _ in hits)
+
+    def test_returns_fewer_hits_when_pages_allow_fewer(
+        self, repo: EmbeddingRepository
+    ) -> None:
+        _warm(repo)
+
+        [hits] = repo.search_many(
+            PROVIDER, DIMENSION, BOOK, _queries(1), 10, max_page=3
+        )
+
+        assert {h[0] for h in hits} == {"c0000", "c0001", "c0002"}
+        assert [h[1] for h in hits] == sorted(h[1] for h in hits)
+
+    def test_page_ranges_match_vec0(
+        self, repo: EmbeddingRepository, db: Database
+    ) -> None:
+        _warm(repo)
+        vec0 = Vec0EmbeddingRepository(db)
+        ranges = [(10, 40), (200, 220)]
+
+        ours = repo.search_many(
+            PROVIDER, DIMENSION, BOOK, _queries(), 10, max_page=210, page_ranges=ranges
+        )
+        theirs = vec0.search_many(
+            PROVIDER, DIMENSION, BOOK, _queries(), 10, max_page=210, page_ranges=ranges
+        )
+
+        assert [[h[0] for h in hits] for hits in ours] == [
+            [h[0] for h in hits] for hits in theirs
+        ]
+        assert all(
+            10 <= start_page <= 40 or 200 <= start_page <= 210
+            for hits in ours
+            for _, _, start_page, _ in hits
+        )
+
+
+class TestSnapshotPersistence:
+    def test_later_sessions_memory_map_the_sidecar(
+        self, repo: EmbeddingRepository, db: Database, tmp_path: Path
+    ) -> None:
+        _warm(repo)
+        reopened = EmbeddingRepository(db, tmp_path)
+
+        hits = reopened.search(PROVIDER, DIMENSION, BOOK, _queries(1)[0], 3)
+
+        snapshot = reopened._snapshots[(PROVIDER, DIMENSION, BOOK)]
+        assert isinstance(snapshot.matrix, np.memmap)
+        assert len(hits) == 3
+
+    def test_writes_drop_the_snapshot(
+        self, repo: EmbeddingRepository, tmp_path: Path
+    ) -> None:
+        _warm(repo)
+
+        repo.delete_by_book(PROVIDER, DIMENSION, BOOK)
+
+        assert _sidecars(tmp_path) == []
+        assert repo.search(PROVIDER, DIMENSION, BOOK, _queries(1)[0], 3) == []
+
+    def test_stale_sidecar_is_ignored(
+        self, repo: EmbeddingRepository, db: Database, tmp_path: Path
+    ) -> None:
+        _warm(repo)
+        # Re-embedded by another process that bypassed this repository.
+        vec0 = Vec0EmbeddingRepository(db)
+        vec0.delete_by_book(PROVIDER, DIMENSION, BOOK)
+        vec0.save_embeddings(PROVIDER, DIMENSION, BOOK, _embeddings(10, seed=1))
+        reopened = EmbeddingRepository(db, tmp_path)
+
+        hits = reopened.search(PROVIDER, DIMENSION, BOOK, _queries(1)[0], 20)
+
+        assert len(hits) == 10
+
+    def test_re_embedding_with_the_same_chunks_invalidates_the_sidecar(
+        self, repo: EmbeddingRepository, db: Database, tmp_path: Path
+    ) -> None:
+        _warm(repo)
+        # Same count and chunk ids, new vectors, written by another process.
+        vec0 = Vec0EmbeddingRepository(db)
+        vec0.delete_by_book(PROVIDER, DIMENSION, BOOK)
+        vec0.save_embeddings(PROVIDER, DIMENSION, BOOK, _embeddings(VECTOR_COUNT, 1))
+        reopened = EmbeddingRepository(db, tmp_path)
+
+        [hits] = reopened.search_many(PROVIDER, DIMENSION, BOOK, _queries(1), 5)
+
+        [expected] = vec0.search_many(PROVIDER, DIMENSION, BOOK, _queries(1), 5)
+        assert [h[0] for h in hits] == [h[0] for h in expected]
@@ -0,0 +1,101 @@
+from interactive_books.domain.book import Book
+from interactive_books.domain.summary_batch import (
+    SummaryBatch,
+    SummaryBatchSection,
+    SummaryBatchStatus,
+)
+from interactive_books.infra.storage.book_repo import BookRepository
+from interactive_books.infra.storage.database import Database
+from interactive_books.infra.storage.summary_batch_repo import SummaryBatchRepository
+
+
+def _seed_book(db: Database, book_id: str = "b1") -> None:
+    BookRepository(db).save(Book(id=book_id, title="Test Book"))
+
+
+def _batch(batch_id: str = "batch-1") -> SummaryBatch:
+    return SummaryBatch(
+        id=batch_id,
+        provider_batch_id=f"msgbatch_{batch_id}",
+        sections=[
+            SummaryBatchSection(
+                custom_id="b1-0",
+                book_id="b1",
+                section_index=0,
+                start_page=1,
+                end_page=4,
+            ),
+            SummaryBatchSection(
+                custom_id="b1-1",
+                book_id="b1",
+                section_index=1,
+                start_page=5,
+                end_page=9,
+            ),
+        ],
+    )
+
+
+class TestSummaryBatchRepository:
+    def test_save_and_get_round_trip(self, db: Database) -> None:
+        _seed_book(db)
+        repo = SummaryBatchRepository(db)
+        repo.save(_batch())
+
+        loaded = repo.get("batch-1")
+
+        assert loaded is not None
+        assert loaded.provider_batch_id == "msgbatch_batch-1"
+        assert loaded.status == SummaryBatchStatus.SUBMITTED
+        assert [s.custom_id for s in loaded.sections] == ["b1-0", "b1-1"]
+        assert loaded.sections[1].start_page == 5
+
+    def test_get_by_provider_batch_id(self, db: Database) -> None:
+        _seed_book(db)
+        repo = SummaryBatchRepository(db)
+        repo.save(_batch())
+
+        loaded = repo.get("msgbatch_batch-1")
+
+        assert loaded is not None
+        assert loaded.id == "batch-1"
+
+    def test_get_missing_returns_none(self, db: Database) -> None:
+        assert SummaryBatchRepository(db).get("nope") is None
+
+    def test_save_updates_status(self, db: Database) -> None:
+        _seed_book(db)
+        repo = SummaryBatchRepository(db)
+        batch = _batch()
+        repo.save(batch)
+
+        batch.mark_ended()
+        repo.save(batch)
+
+        loaded = repo.get("batch-1")
+        assert loaded is not None
+        assert loaded.status == SummaryBatchStatus.ENDED
+        assert len(loaded.sections) == 2
+
+    def test_get_pending_excludes_ingested(self, db: Database) -> None:
+        _seed_book(db)
+        repo = SummaryBatchRepository(db)
+        done = _batch("done")
+        done.mark_ended()
+        done.mark_ingested()
+        repo.save(done)
+        repo.save(_batch("open"))
+
+        assert [b.id for b in repo.get_pending()] == ["open"]
+
+    def test_batch_loads_after_its_book_is_deleted(self, db: Database) -> None:
+        _seed_book(db)
+        repo = SummaryBatchRepository(db)
+        repo.save(_batch())
+
+        BookRepository(db).delete("b1")
+
+        loaded = repo.get("batch-1")
+        assert loaded is not None
+        assert loaded.sections == []
+        assert [b.id for b in repo.get_pending()] == ["batch-1"]
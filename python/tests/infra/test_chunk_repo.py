@@ -1,5 +1,6 @@
 from interactive_books.domain.book import Book
 from interactive_books.domain.chunk import Chunk
+from interactive_books.domain.chunk_batch import ChunkBatch
 from interactive_books.infra.storage.book_repo import BookRepository
 from interactive_books.infra.storage.chunk_repo import ChunkRepository
 from interactive_books.infra.storage.database import Database
@@ -73,6 +74,53 @@ class TestChunkRepository:
         assert repo.get_by_book("b1") == []
 
 
+class TestChunkBatch:
+    def _batch(self) -> ChunkBatch:
+        return ChunkBatch(
+            book_id="b1",
+            ids=["c2", "c1"],
+            contents=["Second whale", "First"],
+            start_pages=[2, 1],
+            end_pages=[3, 1],
+            chunk_indexes=[1, 0],
+        )
+
+    def test_get_batch_reads_columns_in_chunk_index_order(self, db: Database) -> None:
+        _make_book(db)
+        repo = ChunkRepository(db)
+        repo.save_batch(self._batch())
+
+        batch = repo.get_batch("b1")
+
+        assert list(batch.ids) == ["c1", "c2"]
+        assert list(batch.contents) == ["First", "Second whale"]
+        assert list(batch.start_pages) == [1, 2]
+        assert list(batch.end_pages) == [1, 3]
+        assert list(batch.chunk_indexes) == [0, 1]
+
+    def test_batch_rows_match_saved_chunks(self, db: Database) -> None:
+        _make_book(db)
+        repo = ChunkRepository(db)
+        repo.save_batch(self._batch())
+
+        loaded = repo.get_by_book("b1")
+
+        assert [(c.id, c.start_page, c.end_page) for c in loaded] == [
+            ("c1", 1, 1),
+            ("c2", 2, 3),
+        ]
+        assert loaded[0].created_at == loaded[1].created_at
+        assert [c.id for c, _ in repo.search_text("b1", "whale", top_k=5)] == ["c2"]
+
+    def test_get_batch_for_book_without_chunks_is_empty(self, db: Database) -> None:
+        _make_book(db)
+
+        batch = ChunkRepository(db).get_batch("b1")
+
+        assert len(batch) == 0
+        assert batch.book_id == "b1"
+
+
 class TestGetByPageRange:
     def test_single_page_returns_overlapping_chunks(self, db: Database) -> None:
         _make_book(db)
@@ -253,6 +301,34 @@ class TestGetByPageRange:
         assert result[1].chunk_index == 1
 
 
+class TestGetByIds:
+    def test_returns_only_requested_chunks_in_index_order(self, db: Database) -> None:
+        _make_book(db)
+        repo = ChunkRepository(db)
+        repo.save_chunks(
+            "b1",
+            [
+                Chunk(
+                    id=f"c{i}",
+                    book_id="b1",
+                    content=f"Chunk {i}",
+                    start_page=i + 1,
+                    end_page=i + 1,
+                    chunk_index=i,
+                )
+                for i in range(4)
+            ],
+        )
+
+        loaded = repo.get_by_ids(["c3", "c1", "missing"])
+
+        assert [c.id for c in loaded] == ["c1", "c3"]
+        assert loaded[1].content == "Chunk 3"
+
+    def test_empty_ids_returns_empty(self, db: Database) -> None:
+        assert ChunkRepository(db).get_by_ids([]) == []
+
+
 class TestDeleteByBook:
     def test_delete_by_book(self, db: Database) -> None:
         _make_book(db)
@@ -350,3 +426,113 @@ class TestChunkScoping:
         b1_chunks = repo.get_by_book("b1")
         assert len(b1_chunks) == 1
         assert b1_chunks[0].id == "c1"
+
+
+def _save_text_chunks(db: Database, book_id: str = "b1") -> ChunkRepository:
+    _make_book(db, book_id)
+    repo = ChunkRepository(db)
+    texts = [
+        (1, "Call me Ishmael. Some years ago, never mind how long precisely."),
+        (30, "The white whale swam ahead; Ahab watched from the deck."),
+        (60, "Ahab hunted across every sea, cursing the ocean."),
+    ]
+    repo.save_chunks(
+        book_id,
+        [
+            Chunk(
+                id=f"{book_id}-c{i}",
+                book_id=book_id,
+                content=content,
+                start_page=page,
+                end_page=page,
+                chunk_index=i,
+            )
+            for i, (page, content) in enumerate(texts)
+        ],
+    )
+    return repo
+
+
+class TestSearchText:
+    def test_ranks_chunks_matching_more_words_first(self, db: Database) -> None:
+        repo = _save_text_chunks(db)
+
+        results = repo.search_text("b1", "white whale Ahab", top_k=5)
+
+        assert [chunk.id for chunk, _ in results] == ["b1-c1", "b1-c2"]
+        assert results[0][1] < results[1][1]
+
+    def test_matches_stemmed_words(self, db: Database) -> None:
+        repo = _save_text_chunks(db)
+
+        results = repo.search_text("b1", "hunting", top_k=5)
+
+        assert [chunk.id for chunk, _ in results] == ["b1-c2"]
+
+    def test_query_syntax_is_treated_as_plain_words(self, db: Database) -> None:
+        repo = _save_text_chunks(db)
+
+        results = repo.search_text("b1", 'Ishmael AND "NEAR(', top_k=5)
+
+        assert [chunk.id for chunk, _ in results] == ["b1-c0"]
+
+    def test_max_page_and_top_k(self, db: Database) -> None:
+        repo = _save_text_chunks(db)
+
+        assert [c.id for c, _ in repo.search_text("b1", "Ahab", 5, max_page=40)] == [
+            "b1-c1"
+        ]
+        assert len(repo.search_text("b1", "Ahab", top_k=1)) == 1
+
+    def test_scoped_to_book(self, db: Database) -> None:
+        _save_text_chunks(db, "b1")
+        repo = _save_text_chunks(db, "b2")
+
+        results = repo.search_text("b2", "Ishmael", top_k=5)
+
+        assert [chunk.id for chunk, _ in results] == ["b2-c0"]
+
+    def test_no_words_returns_empty(self, db: Database) -> None:
+        repo = _save_text_chunks(db)
+
+        assert repo.search_text("b1", "?!", top_k=5) == []
+
+
+class TestFindPhrase:
+    def test_finds_exact_phrase_ignoring_case_and_punctuation(
+        self, db: Database
+    ) -> None:
+        repo = _save_text_chunks(db)
+
+        results = repo.find_phrase("b1", "call me, ISHMAEL", top_k=5)
+
+        assert [chunk.id for chunk in results] == ["b1-c0"]
+
+    def test_stemmed_variants_are_not_exact_matches(self, db: Database) -> None:
+        repo = _save_text_chunks(db)
+
+        assert repo.find_phrase("b1", "Ahab hunts", top_k=5) == []
+
+    def test_respects_max_page(self, db: Database) -> None:
+        repo = _save_text_chunks(db)
+
+        assert repo.find_phrase("b1", "white whale", 5, max_page=10) == []
+
+
+class TestFullTextIndexSync:
+    def test_deleted_chunks_leave_the_index(self, db: Database) -> None:
+        repo = _save_text_chunks(db)
+
+        repo.delete_by_book("b1")
+
+        assert repo.search_text("b1", "Ahab", top_k=5) == []
+        count = db.connection.execute("SELECT COUNT(*) FROM chunks_fts").fetchone()
+        assert count[0] == 0
+
+    def test_book_deletion_cascades_to_the_index(self, db: Database) -> None:
+        _save_text_chunks(db)
+
+        BookRepository(db).delete("b1")
+
+        count = db.connection.execute("SELECT COUNT(*) FROM chunks_fts").fetchone()
+        assert count[0] == 0
@@ -1,3 +1,4 @@
+import sqlite3
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -27,6 +28,19 @@ class TestDatabaseConnection:
         assert enabled == 1
         db.close()
 
+    def test_synchronous_normal_under_wal(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            db = Database(str(Path(tmpdir) / "test.db"))
+            cursor = db.connection.execute("PRAGMA synchronous")
+            assert cursor.fetchone()[0] == 1
+            db.close()
+
+    def test_busy_timeout_set(self) -> None:
+        db = Database(":memory:")
+        cursor = db.connection.execute("PRAGMA busy_timeout")
+        assert cursor.fetchone()[0] == 5000
+        db.close()
+
     def test_file_based_database(self) -> None:
         with TemporaryDirectory() as tmpdir:
             db_path = Path(tmpdir) / "test.db"
@@ -145,3 +159,175 @@ class TestMigrationRunner:
             cursor = db.connection.execute("SELECT COUNT(*) FROM schema_migrations")
             assert cursor.fetchone()[0] == 1
             db.close()
+
+    def test_records_newest_version_in_user_version(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir)
+            (schema_dir / "001_first.sql").write_text("SELECT 1;")
+            (schema_dir / "002_second.sql").write_text("SELECT 1;")
+
+            db = Database(":memory:")
+            db.run_migrations(schema_dir)
+
+            cursor = db.connection.execute("PRAGMA user_version")
+            assert cursor.fetchone()[0] == 2
+            db.close()
+
+    def test_current_user_version_skips_the_schema_dir(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir)
+            (schema_dir / "001_initial.sql").write_text("SELECT 1;")
+            db = Database(":memory:")
+            db.run_migrations(schema_dir)
+            (schema_dir / "002_add_test.sql").write_text(
+                "CREATE TABLE test (id TEXT PRIMARY KEY);"
+            )
+
+            db.run_migrations(schema_dir, expected_version=1)
+
+            cursor = db.connection.execute("SELECT COUNT(*) FROM schema_migrations")
+            assert cursor.fetchone()[0] == 1
+            db.close()
+
+    def test_stale_user_version_applies_new_migrations(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir)
+            (schema_dir / "001_initial.sql").write_text("SELECT 1;")
+            db = Database(":memory:")
+            db.run_migrations(schema_dir)
+            (schema_dir / "002_add_test.sql").write_text(
+                "CREATE TABLE test (id TEXT PRIMARY KEY);"
+            )
+
+            db.run_migrations(schema_dir, expected_version=2)
+
+            cursor = db.connection.execute("PRAGMA user_version")
+            assert cursor.fetchone()[0] == 2
+            db.close()
+
+
+class TestLazyVec:
+    def test_vec_is_not_loaded_by_default(self) -> None:
+        db = Database(":memory:")
+        with pytest.raises(sqlite3.OperationalError):
+            db.connection.execute("SELECT vec_version()")
+        db.close()
+
+    def test_load_vec_loads_into_writer_and_open_readers(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            db = Database(Path(tmpdir) / "test.db")
+            with db.reader():
+                pass
+
+            db.load_vec()
+
+            assert db.connection.execute("SELECT vec_version()").fetchone()[0]
+            with db.reader() as conn:
+                assert conn.execute("SELECT vec_version()").fetchone()[0]
+            db.close()
+
+
+def _count_from_other_connection(db_path: Path) -> int:
+    other = sqlite3.connect(db_path)
+    try:
+        return other.execute("SELECT COUNT(*) FROM test").fetchone()[0]
+    finally:
+        other.close()
+
+
+class TestBulkLoad:
+    def test_repository_commits_wait_for_the_block_to_end(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(db_path)
+            db.connection.execute("CREATE TABLE test (id TEXT PRIMARY KEY)")
+            db.connection.commit()
+
+            with db.bulk_load():
+                db.connection.execute("INSERT INTO test VALUES ('a')")
+                db.connection.commit()
+                assert _count_from_other_connection(db_path) == 0
+
+            assert _count_from_other_connection(db_path) == 1
+            db.close()
+
+    def test_exception_rolls_back_every_write(self) -> None:
+        db = Database(":memory:")
+        db.connection.execute("CREATE TABLE test (id TEXT PRIMARY KEY)")
+        db.connection.commit()
+
+        with pytest.raises(RuntimeError), db.bulk_load():
+            db.connection.execute("INSERT INTO test VALUES ('a')")
+            db.connection.commit()
+            raise RuntimeError("boom")
+
+        assert db.connection.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 0
+        db.close()
+
+    def test_nested_blocks_join_the_outer_one(self) -> None:
+        db = Database(":memory:")
+        db.connection.execute("CREATE TABLE test (id TEXT PRIMARY KEY)")
+        db.connection.commit()
+
+        with pytest.raises(RuntimeError), db.bulk_load():
+            with db.bulk_load():
+                db.connection.execute("INSERT INTO test VALUES ('a')")
+            raise RuntimeError("boom")
+
+        assert db.connection.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 0
+        db.close()
+
+
+class TestReaderPool:
+    def test_in_memory_database_reads_through_the_writer(self) -> None:
+        db = Database(":memory:")
+        with db.reader() as conn:
+            assert conn is db.connection
+        db.close()
+
+    def test_file_database_reads_through_a_read_only_connection(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            db = Database(Path(tmpdir) / "test.db")
+            db.connection.execute("CREATE TABLE test (id TEXT PRIMARY KEY)")
+            db.connection.commit()
+
+            with db.reader() as conn:
+                assert conn is not db.connection
+                with pytest.raises(sqlite3.OperationalError):
+                    conn.execute("INSERT INTO test VALUES ('a')")
+            db.close()
+
+    def test_readers_are_reused(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            db = Database(Path(tmpdir) / "test.db")
+            with db.reader() as first:
+                pass
+            with db.reader() as second:
+                assert second is first
+            db.close()
+
+    def test_concurrent_readers_get_their_own_connections(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            db = Database(Path(tmpdir) / "test.db", readers=2)
+            with db.reader() as first, db.reader() as second:
+                assert first is not second
+            db.close()
+
+    def test_bulk_load_reads_its_own_writes(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            db = Database(Path(tmpdir) / "test.db")
+            db.connection.execute("CREATE TABLE test (id TEXT PRIMARY KEY)")
+            db.connection.commit()
+
+            with db.bulk_load():
+                db.connection.execute("INSERT INTO test VALUES ('a')")
+                with db.reader() as conn:
+                    assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 1
+            db.close()
+
+    def test_readers_load_sqlite_vec(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            db = Database(Path(tmpdir) / "test.db", enable_vec=True)
+            with db.reader() as conn:
+                assert conn.execute("SELECT vec_version()").fetchone()[0]
+            db.close()
@@ -0,0 +1,24 @@
+-- 004_add_summary_batches.sql
+-- Tracks provider batch jobs submitted by `summarize --batch` so they can be
+-- polled and ingested later, even from a different process.
+
+CREATE TABLE IF NOT EXISTS summary_batches (
+    id                TEXT PRIMARY KEY NOT NULL,
+    provider_batch_id TEXT NOT NULL UNIQUE,
+    status            TEXT NOT NULL DEFAULT 'submitted'
+                      CHECK (status IN ('submitted', 'ended', 'ingested')),
+    created_at        TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS summary_batch_sections (
+    batch_id      TEXT NOT NULL REFERENCES summary_batches(id) ON DELETE CASCADE,
+    custom_id     TEXT NOT NULL,
+    book_id       TEXT NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    section_index INTEGER NOT NULL,
+    start_page    INTEGER NOT NULL CHECK (start_page >= 1),
+    end_page      INTEGER NOT NULL CHECK (end_page >= start_page),
+    PRIMARY KEY (batch_id, custom_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_summary_batch_sections_book_id
+    ON summary_batch_sections(book_id);
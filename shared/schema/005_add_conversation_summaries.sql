@@ -0,0 +1,15 @@
+-- 005_add_conversation_summaries.sql
+-- Rolling summaries of conversation turns that no longer fit the chat context
+-- budget, plus an index so the most recent messages can be read with LIMIT.
+
+CREATE INDEX IF NOT EXISTS idx_chat_messages_conversation_created
+    ON chat_messages(conversation_id, created_at, id);
+
+CREATE TABLE IF NOT EXISTS conversation_summaries (
+    conversation_id    TEXT PRIMARY KEY NOT NULL
+                       REFERENCES conversations(id) ON DELETE CASCADE,
+    content            TEXT NOT NULL CHECK (length(content) > 0),
+    covered_message_id TEXT NOT NULL,
+    covered_until      TEXT NOT NULL,
+    updated_at         TEXT NOT NULL
+);
@@ -0,0 +1,19 @@
+-- 006_add_answer_cache.sql
+-- Opt-in cache of chat answers, looked up by question embedding within a book
+-- and reading-position bucket. Rows are removed when the book is re-embedded.
+
+CREATE TABLE IF NOT EXISTS answer_cache (
+    id                 TEXT PRIMARY KEY NOT NULL,
+    book_id            TEXT NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    page_bucket        INTEGER NOT NULL CHECK (page_bucket >= 0),
+    question           TEXT NOT NULL,
+    question_embedding BLOB NOT NULL,
+    answer             TEXT NOT NULL CHECK (length(answer) > 0),
+    max_cited_page     INTEGER NOT NULL DEFAULT 0 CHECK (max_cited_page >= 0),
+    hit_count          INTEGER NOT NULL DEFAULT 0,
+    created_at         TEXT NOT NULL,
+    last_used_at       TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_answer_cache_book_bucket
+    ON answer_cache(book_id, page_bucket);
@@ -0,0 +1,33 @@
+-- 007_add_chunks_fts.sql
+-- Full-text index over chunk content for BM25 search and exact-quote lookup,
+-- kept in sync with chunks by triggers. The index stores its own copy of the
+-- text: chunks has no INTEGER PRIMARY KEY, so its rowids are not stable enough
+-- to back an external-content table. Rows share the chunk's rowid so deletes
+-- stay indexed; chunk_id is checked too and is what searches join on.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+    content,
+    chunk_id UNINDEXED,
+    book_id UNINDEXED,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS chunks_fts_after_insert AFTER INSERT ON chunks
+BEGIN
+    INSERT INTO chunks_fts (rowid, content, chunk_id, book_id)
+    VALUES (new.rowid, new.content, new.id, new.book_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS chunks_fts_after_delete AFTER DELETE ON chunks
+BEGIN
+    DELETE FROM chunks_fts WHERE rowid = old.rowid AND chunk_id = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS chunks_fts_after_update AFTER UPDATE OF content ON chunks
+BEGIN
+    UPDATE chunks_fts SET content = new.content
+    WHERE rowid = old.rowid AND chunk_id = old.id;
+END;
+
+INSERT INTO chunks_fts (rowid, content, chunk_id, book_id)
+SELECT rowid, content, id, book_id FROM chunks;